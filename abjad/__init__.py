@@ -23,63 +23,109 @@ try:
 except ImportError:
     pass
 
-# ensure that the ~/.abjad directory and friends are setup
-# and instantiate Abjad's configuration singleton
-from abjad.tools.systemtools.AbjadConfiguration import AbjadConfiguration
-abjad_configuration = AbjadConfiguration()
-del AbjadConfiguration
-
-# import all tools packages
-from abjad.tools import *
-from abjad.tools.abctools import *
-from abjad.tools.datastructuretools import *
-
-index = Pattern.index
-index_all = Pattern.index_all
-index_first = Pattern.index_first
-index_last = Pattern.index_last
-
-from abjad.tools.exceptiontools import *
-from abjad.tools.indicatortools import *
-from abjad.tools.instrumenttools import *
-from abjad.tools.lilypondfiletools import *
-from abjad.tools.lilypondnametools import *
-from abjad.tools.markuptools import *
-from abjad.tools.metertools import *
-from abjad.tools.pitchtools import *
-from abjad.tools.schemetools import *
-from abjad.tools.scoretools import *
-from abjad.tools.segmenttools import *
-from abjad.tools.spannertools import *
-from abjad.tools.systemtools import *
-from abjad.tools.topleveltools import *
-
-# import all the way down to module to satisfy mypy:
-from abjad.tools.mathtools.Enumerator import Enumerator
-from abjad.tools.mathtools.NonreducedFraction import NonreducedFraction
-from abjad.tools.mathtools.NonreducedRatio import NonreducedRatio
-from abjad.tools.mathtools.Ratio import Ratio
-
-# timespantools classes (but not functions)
-from abjad.tools.timespantools.AnnotatedTimespan import AnnotatedTimespan
-from abjad.tools.timespantools.Timespan import Timespan
-from abjad.tools.timespantools.TimespanInequality import TimespanInequality
-from abjad.tools.timespantools.TimespanList import TimespanList
-
-# rhythm-maker static methods
-from abjad.tools.rhythmmakertools.SilenceMask import SilenceMask
-from abjad.tools.rhythmmakertools.SustainMask import SustainMask
-silence = SilenceMask.silence
-sustain = SustainMask.sustain
-
 # import version information
 from abjad._version import __version_info__, __version__
 del _version
 
-from abjad import book
-from abjad import cli
-from abjad import demos
-from abjad import ly
+import typing
+if typing.TYPE_CHECKING:
+    from abjad._namespace import *  # noqa
+    from abjad import book, cli, demos, ly  # noqa
+    from abjad.tools.systemtools.AbjadConfiguration import AbjadConfiguration
+    abjad_configuration = AbjadConfiguration()
+del typing
+
+
+### LAZY NAMESPACE ###
+
+# Tools packages import one another circularly and load together the first
+# time any name other than those above is looked up on the abjad module.
+# Packages outside the tools tree and the configuration singleton load on
+# their own when first looked up.
+
+_deferred_module_names = (
+    'book',
+    'cli',
+    'demos',
+    'ly',
+    )
+
+_namespace_is_loaded = False
+
+
+def _load_namespace():
+    r'''Imports all tools packages and copies abjad._namespace into abjad
+    namespace.
+
+    Called on first lookup of name not yet in abjad namespace and whenever
+    abjad.tools is imported directly.
+    '''
+    global _namespace_is_loaded
+    if _namespace_is_loaded:
+        return
+    # set before import so that abjad.tools does not reenter
+    _namespace_is_loaded = True
+    try:
+        from abjad import _namespace
+    except Exception:
+        _namespace_is_loaded = False
+        raise
+    namespace = globals()
+    for name, value in vars(_namespace).items():
+        if not name.startswith('_'):
+            namespace[name] = value
+
+
+def __dir__():
+    _load_namespace()
+    names = set(globals())
+    names.update(_deferred_module_names)
+    names.add('abjad_configuration')
+    return sorted(names)
+
+
+def __getattr__(name):
+    r'''Looks up `name` in abjad namespace, loading namespace first.
+    '''
+    import importlib
+    namespace = globals()
+    if name == 'abjad_configuration':
+        # ensure that the ~/.abjad directory and friends are setup
+        # and instantiate Abjad's configuration singleton
+        from abjad.tools.systemtools.AbjadConfiguration import \
+            AbjadConfiguration
+        namespace[name] = AbjadConfiguration()
+        return namespace[name]
+    if name in _deferred_module_names:
+        return importlib.import_module('abjad.' + name)
+    if name == '__all__':
+        return [_ for _ in __dir__() if not _.startswith('_')]
+    if name.startswith('__'):
+        raise AttributeError(name)
+    _load_namespace()
+    if name in namespace:
+        return namespace[name]
+    message = 'module {!r} has no attribute {!r}.'
+    message = message.format(__name__, name)
+    raise AttributeError(message)
+
+
+# module-level __getattr__() and __dir__() are honored only from Python 3.7
+import sys
+if sys.version_info < (3, 7):
+    import types
+
+    class _LazyModule(types.ModuleType):
+
+        def __dir__(self):
+            return __dir__()
+
+        def __getattr__(self, name):
+            return __getattr__(name)
+
+    sys.modules[__name__].__class__ = _LazyModule
+    del types
+del sys
 
 # HOUSECLEANING HELPER: uncomment below and run tests;
 #                       checks for hasattr() calls against properties:
@@ -0,0 +1,45 @@
+# Abjad's top-level namespace, copied into the abjad module on first use.
+
+# import all tools packages
+from abjad.tools import *
+from abjad.tools.abctools import *
+from abjad.tools.datastructuretools import *
+
+index = Pattern.index
+index_all = Pattern.index_all
+index_first = Pattern.index_first
+index_last = Pattern.index_last
+
+from abjad.tools.exceptiontools import *
+from abjad.tools.indicatortools import *
+from abjad.tools.instrumenttools import *
+from abjad.tools.lilypondfiletools import *
+from abjad.tools.lilypondnametools import *
+from abjad.tools.markuptools import *
+from abjad.tools.metertools import *
+from abjad.tools.pitchtools import *
+from abjad.tools.schemetools import *
+from abjad.tools.scoretools import *
+from abjad.tools.segmenttools import *
+from abjad.tools.spannertools import *
+from abjad.tools.systemtools import *
+from abjad.tools.topleveltools import *
+
+# import all the way down to module to satisfy mypy:
+from abjad.tools.mathtools.Enumerator import Enumerator
+from abjad.tools.mathtools.NonreducedFraction import NonreducedFraction
+from abjad.tools.mathtools.NonreducedRatio import NonreducedRatio
+from abjad.tools.mathtools.Ratio import Ratio
+
+# timespantools classes (but not functions)
+from abjad.tools.timespantools.AnnotatedTimespan import AnnotatedTimespan
+from abjad.tools.timespantools.Timespan import Timespan
+from abjad.tools.timespantools.TimespanIndex import TimespanIndex
+from abjad.tools.timespantools.TimespanInequality import TimespanInequality
+from abjad.tools.timespantools.TimespanList import TimespanList
+
+# rhythm-maker static methods
+from abjad.tools.rhythmmakertools.SilenceMask import SilenceMask
+from abjad.tools.rhythmmakertools.SustainMask import SustainMask
+silence = SilenceMask.silence
+sustain = SustainMask.sustain
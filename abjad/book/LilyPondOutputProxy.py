@@ -102,7 +102,7 @@ class LilyPondOutputProxy(ImageOutputProxy):
         source = format(self.payload)
         with open(ly_file_path, 'w') as file_pointer:
             file_pointer.write(source)
-        systemtools.IOManager.run_lilypond(ly_file_path)
+        systemtools.PersistenceManager._render_cache(ly_file_path)
         pdf_file_path = os.path.join(
             temporary_directory,
             self.file_name_without_extension + '.pdf',
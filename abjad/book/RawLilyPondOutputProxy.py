@@ -76,7 +76,7 @@ class RawLilyPondOutputProxy(ImageOutputProxy):
         source = format(self.payload)
         with open(ly_file_path, 'w') as file_pointer:
             file_pointer.write(source)
-        systemtools.IOManager.run_lilypond(ly_file_path)
+        systemtools.PersistenceManager._render_cache(ly_file_path)
         pdf_file_path = os.path.join(
             temporary_directory,
             self.file_name_without_extension + '.pdf',
@@ -259,6 +259,7 @@ class ManageBuildTargetScript(ScorePackageScript):
         render_parts=None,
         render_preface=None,
         render_score=None,
+        jobs=None,
         ):
         build_target_path = self._build_path.joinpath(target_name)
         if not build_target_path.exists():
@@ -281,12 +282,14 @@ class ManageBuildTargetScript(ScorePackageScript):
             render_preface = True
             render_score = True
             open_score_only = True
+        lilypond_paths = []
         if render_music:
-            path = self._render_music(build_target_path)
-            paths_to_open.append(path)
+            lilypond_paths.append(self._render_music(build_target_path))
         if render_parts:
-            path = self._render_parts(build_target_path)
-            paths_to_open.append(path)
+            lilypond_paths.append(self._render_parts(build_target_path))
+        if lilypond_paths:
+            paths = self._run_lilypond(lilypond_paths, jobs=jobs)
+            paths_to_open.extend(paths)
         if render_preface:
             path = self._render_preface(build_target_path)
             paths_to_open.append(path)
@@ -326,6 +329,7 @@ class ManageBuildTargetScript(ScorePackageScript):
                 )
         if arguments.render:
             self._handle_render(
+                jobs=arguments.jobs,
                 render_back_cover=arguments.back_cover,
                 render_front_cover=arguments.front_cover,
                 render_music=arguments.music,
@@ -357,7 +361,7 @@ class ManageBuildTargetScript(ScorePackageScript):
         if not path.is_file():
             print('    Missing: {!s}'.format(path.relative_to(self._score_package_path)))
             sys.exit(1)
-        return self._run_lilypond(path)
+        return path
 
     def _render_parts(self, build_target_path):
         path = build_target_path.joinpath('parts.ly')
@@ -365,7 +369,7 @@ class ManageBuildTargetScript(ScorePackageScript):
         if not path.is_file():
             print('    Missing: {!s}'.format(path.relative_to(self._score_package_path)))
             sys.exit(1)
-        return self._run_lilypond(path)
+        return path
 
     def _render_preface(self, build_target_path):
         path = build_target_path.joinpath('preface.tex')
@@ -399,22 +403,24 @@ class ManageBuildTargetScript(ScorePackageScript):
                     sys.exit(1)
         return latex_path.with_suffix('.pdf')
 
-    def _run_lilypond(self, lilypond_path):
-        from abjad import abjad_configuration
-        command = '{} -dno-point-and-click -o {} {}'.format(
-            # not sure why abjad_configuration.get() returns none:
-            #abjad_configuration.get('lilypond_path', 'lilypond'),
-            'lilypond',
-            str(lilypond_path).replace('.ly', ''),
-            str(lilypond_path),
+    def _run_lilypond(self, lilypond_paths, jobs=None):
+        pool = systemtools.LilyPondRenderPool(
+            fail_fast=True,
+            worker_count=jobs,
             )
-        with systemtools.TemporaryDirectoryChange(str(lilypond_path.parent)):
-            exit_code = subprocess.call(command, shell=True)
-        if exit_code:
-            print('    Failed to render: {!s}'.format(
-                lilypond_path.relative_to(self._score_package_path)))
+        exit_codes = pool(str(_) for _ in lilypond_paths)
+        for lilypond_path, exit_code in zip(lilypond_paths, exit_codes):
+            log_path = lilypond_path.with_suffix('.log')
+            if exit_code:
+                print('    Failed to render: {!s}'.format(
+                    lilypond_path.relative_to(self._score_package_path)))
+                print('        See {!s}'.format(
+                    log_path.relative_to(self._score_package_path)))
+            elif exit_code == 0 and log_path.exists():
+                log_path.unlink()
+        if any(exit_codes):
             sys.exit(1)
-        return lilypond_path.with_suffix('.pdf')
+        return [_.with_suffix('.pdf') for _ in lilypond_paths]
 
     def _setup_argument_parser(self, parser):
         action_group = parser.add_argument_group('actions')
@@ -494,6 +500,12 @@ class ManageBuildTargetScript(ScorePackageScript):
             help='render the parts LilyPond source',
             action='store_true',
             )
+        render_group.add_argument(
+            '--jobs', '-j',
+            help='run at most JOBS LilyPond processes at once',
+            metavar='JOBS',
+            type=int,
+            )
         create_group = parser.add_argument_group('--new options')
         create_group.add_argument(
             '--paper-size',
@@ -125,7 +125,7 @@ class ManageMaterialScript(ScorePackageScript):
                 print('        {} [{}]'.format(material_name, class_.__name__))
         sys.exit(2)
 
-    def _handle_render(self, material_name):
+    def _handle_render(self, material_name, jobs=None):
         globbable_names = self._collect_globbable_names(material_name)
         print('Rendering candidates: {!r} ...'.format(
             ' '.join(globbable_names)))
@@ -133,10 +133,12 @@ class ManageMaterialScript(ScorePackageScript):
         if not matching_paths:
             print('    No matching materials.')
             self._handle_list()
+        ly_paths = [
+            self._render_one_material(material_directory=path)
+            for path in matching_paths
+            ]
+        self._write_lilypond_pdfs(ly_paths, jobs=jobs)
         for path in matching_paths:
-            self._render_one_material(
-                material_directory=path
-                )
             print('    Rendered {path!s}{sep}'.format(
                 path=path.relative_to(self._score_package_path.parent),
                 sep=os.path.sep))
@@ -181,7 +183,10 @@ class ManageMaterialScript(ScorePackageScript):
         if arguments.new:
             self._handle_create(force=arguments.force, material_name=arguments.new)
         if arguments.render is not None:
-            self._handle_render(material_name=arguments.render)
+            self._handle_render(
+                jobs=arguments.jobs,
+                material_name=arguments.render,
+                )
 
     def _render_one_material(self, material_directory):
         print('Rendering {path!s}{sep}'.format(
@@ -191,10 +196,7 @@ class ManageMaterialScript(ScorePackageScript):
         if not ly_path.is_file():
             print('    illustration.ly is missing or malformed.')
             sys.exit(1)
-        self._write_lilypond_pdf(
-            ly_path=ly_path,
-            output_directory=material_directory,
-            )
+        return ly_path
 
     def _setup_argument_parser(self, parser):
         action_group = parser.add_argument_group('actions')
@@ -257,3 +259,9 @@ class ManageMaterialScript(ScorePackageScript):
             action='store_true',
             help='force overwriting',
             )
+        common_group.add_argument(
+            '--jobs', '-j',
+            help='run at most JOBS LilyPond processes at once when rendering',
+            metavar='JOBS',
+            type=int,
+            )
@@ -191,7 +191,7 @@ class ManageSegmentScript(ScorePackageScript):
             print('    No segments available.')
         sys.exit(2)
 
-    def _handle_render(self, segment_name, unstaged=False):
+    def _handle_render(self, segment_name, unstaged=False, jobs=None):
         globbable_names = self._collect_globbable_names(segment_name)
         print('Rendering candidates: {!r} ...'.format(
             ' '.join(globbable_names)))
@@ -202,8 +202,12 @@ class ManageSegmentScript(ScorePackageScript):
         if not matching_paths:
             print('    No matching segments.')
             self._handle_list()
-        for path in matching_paths:
+        ly_paths = [
             self._render_one_segment(segment_directory=path)
+            for path in matching_paths
+            ]
+        self._write_lilypond_pdfs(ly_paths, jobs=jobs)
+        for path in matching_paths:
             print('    Rendered {path!s}{sep}'.format(
                 path=path.relative_to(self._score_package_path.parent),
                 sep=os.path.sep))
@@ -321,6 +325,7 @@ class ManageSegmentScript(ScorePackageScript):
             self._handle_create(force=arguments.force, segment_name=arguments.new)
         if arguments.render is not None:
             self._handle_render(
+                jobs=arguments.jobs,
                 segment_name=arguments.render,
                 unstaged=arguments.unstaged,
                 )
@@ -348,10 +353,7 @@ class ManageSegmentScript(ScorePackageScript):
         if not ly_path.is_file():
             print('    illustration.ly is missing or malformed.')
             sys.exit(1)
-        self._write_lilypond_pdf(
-            ly_path=ly_path,
-            output_directory=segment_directory,
-            )
+        return ly_path
 
     def _setup_argument_parser(self, parser):
         action_group = parser.add_argument_group('actions')
@@ -424,6 +426,12 @@ class ManageSegmentScript(ScorePackageScript):
             action='store_true',
             help='force overwriting',
             )
+        common_group.add_argument(
+            '--jobs', '-j',
+            help='run at most JOBS LilyPond processes at once when rendering',
+            metavar='JOBS',
+            type=int,
+            )
         common_group.add_argument(
             '-u', '--unstaged',
             help='Include segments not staged in segments{sep}metadata.json'.format(sep=os.path.sep),
@@ -418,27 +418,34 @@ class ScorePackageScript(CommandlineScript):
         ly_path,
         output_directory,
         ):
-        from abjad import abjad_configuration
-        pdf_path = output_directory.joinpath('illustration.pdf')
+        assert ly_path.parent == output_directory, repr(ly_path)
+        self._write_lilypond_pdfs([ly_path])
+
+    def _write_lilypond_pdfs(self, ly_paths, jobs=None):
         message = '    Writing {!s} ... '
-        message = message.format(
-            pdf_path.relative_to(self._score_repository_path)
-            )
-        print(message, end='')
-        command = '{} -dno-point-and-click -o {} {}'.format(
-            # not sure why the call to abjad_configuration.get() returns none:
-            #abjad_configuration.get('lilypond_path', 'lilypond'),
-            'lilypond',
-            str(ly_path).replace('.ly', ''),
-            str(ly_path),
+        pool = systemtools.LilyPondRenderPool(
+            fail_fast=True,
+            worker_count=jobs,
             )
         with systemtools.Timer() as timer:
-            with systemtools.TemporaryDirectoryChange(str(ly_path.parent)):
-                exit_code = subprocess.call(command, shell=True)
-        if exit_code:
-            print('Failed!')
+            exit_codes = pool(str(_) for _ in ly_paths)
+        for ly_path, exit_code in zip(ly_paths, exit_codes):
+            pdf_path = ly_path.with_suffix('.pdf')
+            log_path = ly_path.with_suffix('.log')
+            print(message.format(
+                pdf_path.relative_to(self._score_repository_path)), end='')
+            if exit_code is None:
+                print('Skipped.')
+            elif exit_code:
+                print('Failed!')
+                print('        See {!s}'.format(
+                    log_path.relative_to(self._score_repository_path)))
+            else:
+                print('OK!')
+                if log_path.exists():
+                    log_path.unlink()
+        if any(exit_codes):
             sys.exit(1)
-        print('OK!')
         self._report_time(timer, prefix='LilyPond runtime')
 
     def _write_score_metadata_json(self, score_path=None, verbose=True, **keywords):
@@ -67,6 +67,7 @@ class Test(ScorePackageScriptTestCase):
                     Abjad runtime: ... second...
                 Writing test_score/materials/test_material/illustration.ly ... OK!
                 Writing test_score/materials/test_material/illustration.pdf ... Failed!
+                    See test_score/materials/test_material/illustration.log
         '''.replace('/', os.path.sep))
         illustration_ly_path = material_path.joinpath('illustration.ly')
         assert illustration_ly_path.exists()
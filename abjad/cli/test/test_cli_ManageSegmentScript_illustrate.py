@@ -100,6 +100,7 @@ class Test(ScorePackageScriptTestCase):
                     Abjad runtime: ... second...
                 Writing test_score/segments/test_segment/illustration.ly ... OK!
                 Writing test_score/segments/test_segment/illustration.pdf ... Failed!
+                    See test_score/segments/test_segment/illustration.log
         '''.replace('/', os.path.sep))
         illustration_ly_path = segment_path.joinpath('illustration.ly')
         assert illustration_ly_path.exists()
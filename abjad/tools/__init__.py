@@ -27,3 +27,8 @@ from .import tonalanalysistools
 
 # singletons:
 tags = segmenttools.Tags()
+
+# fill top-level abjad namespace when tools are imported directly:
+import abjad
+abjad._load_namespace()
+del abjad
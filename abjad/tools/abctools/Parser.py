@@ -3,8 +3,8 @@ import logging
 import os
 import pickle
 import ply  # type: ignore
+import sys
 from ply import yacc  # type: ignore
-import traceback
 from abjad.tools.abctools.AbjadObject import AbjadObject
 
 
@@ -15,6 +15,14 @@ class Parser(AbjadObject):
     abstract properties `lexer_rules_object` and `parser_rules_object`.
 
     For most parsers these properties should simply return `self`.
+
+    Parsing tables are read from ``package_pickle_path`` when tables shipped
+    with Abjad match the parser's grammar, and otherwise from (or written to)
+    ``pickle_path`` in the Abjad configuration directory.
+
+    Parsers are expensive to build. Callers that parse repeatedly should
+    borrow idle instances from the process-wide pool with ``_acquire()`` and
+    give them back with ``_release()``, or use ``_call_pooled()``.
     '''
 
     ### CLASS VARIABLES ###
@@ -24,8 +32,15 @@ class Parser(AbjadObject):
         '_lexer',
         '_logger',
         '_parser',
+        '_pool_key',
         )
 
+    _idle_parsers: dict = {}
+
+    _lexers: dict = {}
+
+    _readable_pickle_paths: dict = {}
+
     ### INITIALIZER ###
 
     def __init__(self, debug=False):
@@ -33,6 +48,7 @@ class Parser(AbjadObject):
         self._debug = bool(debug)
         self._lexer = None
         self._parser = None
+        self._pool_key = None
 
         if self.debug:
             logging.basicConfig(
@@ -45,29 +61,13 @@ class Parser(AbjadObject):
         else:
             self._logger = yacc.NullLogger()
 
-        self._lexer = ply.lex.lex(
-            debug=self.debug,
-            debuglog=self.logger,
-            object=self.lexer_rules_object
-            )
-
-        if self.pickle_path and not os.path.exists(self.pickle_path):
-            try:
-                directory, _ = os.path.split(self.pickle_path)
-                if not os.path.exists(directory):
-                    os.makedirs(directory)
-                string = pickle.dumps(None)
-                with open(self.pickle_path, 'wb') as file_pointer:
-                    file_pointer.write(string)
-            except (IOError, OSError):
-                traceback.print_exc()
-
+        self._lexer = self._make_lexer()
         self._parser = ply.yacc.yacc(
             debug=self.debug,
             debuglog=self.logger,
             module=self.parser_rules_object,
             outputdir=self.output_path,
-            picklefile=self.pickle_path,
+            picklefile=self._get_readable_pickle_path(),
             )
 
     ### SPECIAL METHODS ###
@@ -94,8 +94,107 @@ class Parser(AbjadObject):
 
         return result
 
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _acquire(class_, **keywords):
+        r'''Gets idle parser of this class initialized with `keywords` from
+        process-wide pool.
+
+        Makes new parser when no such parser is idle, as when parsing
+        reenters the same parser class.
+
+        Give parser back with ``_release()`` when done.
+        '''
+        key = (class_, tuple(sorted(keywords.items())))
+        parsers = Parser._idle_parsers.get(key)
+        if parsers:
+            return parsers.pop()
+        parser = class_(**keywords)
+        parser._pool_key = key
+        return parser
+
+    @classmethod
+    def _call_pooled(class_, input_string, **keywords):
+        r'''Calls pooled parser of this class initialized with `keywords` on
+        `input_string`.
+        '''
+        parser = class_._acquire(**keywords)
+        try:
+            return parser(input_string)
+        finally:
+            parser._release()
+
+    def _get_grammar_signature(self):
+        module = self.parser_rules_object
+        dictionary = dict((_, getattr(module, _)) for _ in dir(module))
+        if '__file__' not in dictionary:
+            module_name = dictionary['__module__']
+            dictionary['__file__'] = sys.modules[module_name].__file__
+        reflection = yacc.ParserReflect(dictionary, log=yacc.NullLogger())
+        reflection.get_all()
+        return reflection.signature()
+
+    def _get_readable_pickle_path(self):
+        r'''Gets package pickle path when tables shipped with Abjad match
+        grammar; otherwise gets pickle path in configuration directory.
+        '''
+        if type(self) in Parser._readable_pickle_paths:
+            return Parser._readable_pickle_paths[type(self)]
+        path = self.package_pickle_path
+        if not os.path.isfile(path) or not self._is_current_pickle(path):
+            path = self.pickle_path
+        Parser._readable_pickle_paths[type(self)] = path
+        return path
+
+    def _is_current_pickle(self, path):
+        try:
+            with open(path, 'rb') as file_pointer:
+                tabversion = pickle.load(file_pointer)
+                pickle.load(file_pointer)
+                signature = pickle.load(file_pointer)
+        except Exception:
+            return False
+        if tabversion != yacc.__tabversion__:
+            return False
+        return signature == self._get_grammar_signature()
+
+    def _make_lexer(self):
+        r'''Clones lexer built once per parser class.
+        '''
+        if self.debug:
+            return ply.lex.lex(
+                debug=self.debug,
+                debuglog=self.logger,
+                object=self.lexer_rules_object
+                )
+        lexer = Parser._lexers.get(type(self))
+        if lexer is None:
+            lexer = ply.lex.lex(object=self.lexer_rules_object)
+            Parser._lexers[type(self)] = lexer
+        return lexer.clone(self.lexer_rules_object)
+
+    def _release(self):
+        r'''Resets parser and gives it back to process-wide pool.
+        '''
+        assert self._pool_key is not None, repr(self)
+        self.reset()
+        Parser._idle_parsers.setdefault(self._pool_key, []).append(self)
+
     ### PUBLIC METHODS ###
 
+    def reset(self):
+        r'''Resets lexer and parser state so that parser may be reused.
+        '''
+        self._lexer.begin('INITIAL')
+        self._lexer.lexstatestack = []
+        self._lexer.lineno = 1
+        try:
+            self._parser.restart()
+        except AttributeError:
+            # parser has not yet parsed anything
+            pass
+
     def tokenize(self, input_string):
         r'''Tokenize `input string` and print results.
         '''
@@ -160,6 +259,23 @@ class Parser(AbjadObject):
                 return None
         return output_path
 
+    @property
+    def package_pickle_path(self):
+        r'''The path of the parser's pickled parsing tables shipped with
+        Abjad.
+
+        Tables are generated at build time by ``scr/devel/prime-parser-tables
+        --package`` and are only ever read.
+        '''
+        from abjad import abjad_configuration
+        file_name = 'parse_tables_{}.pkl'.format(type(self).__name__)
+        return os.path.join(
+            abjad_configuration.abjad_directory,
+            'etc',
+            'parsers',
+            file_name,
+            )
+
     @property
     def parser(self):
         r'''The parser's PLY LRParser instance.
@@ -0,0 +1,51 @@
+import abjad
+
+
+def test_abctools_AbjadValueObject___eq___01():
+    r'''Compares and hashes initialization values.
+    '''
+
+    class Foo(abjad.AbjadValueObject):
+        def __init__(self, x, flavor=None):
+            self.x = x
+            self.flavor = flavor
+
+    assert Foo(7) == Foo(7)
+    assert Foo(7, 'cherry') == Foo(7, 'cherry')
+    assert Foo(7) != Foo(8)
+    assert Foo(7) != Foo(7, 'cherry')
+    assert hash(Foo(7, 'cherry')) == hash(Foo(7, 'cherry'))
+    assert len({Foo(7), Foo(7), Foo(8)}) == 2
+
+
+def test_abctools_AbjadValueObject___eq___02():
+    r'''Redefined class compares values of redefined initializer.
+    '''
+
+    class Foo(abjad.AbjadValueObject):
+        def __init__(self, x):
+            self.x = x
+            self.flavor = 'cherry'
+
+    assert Foo(7) == Foo(7)
+    assert repr(Foo(7)) == 'Foo(7)'
+
+    class Foo(abjad.AbjadValueObject):
+        def __init__(self, x, flavor=None):
+            self.x = x
+            self.flavor = flavor
+
+    assert Foo(7) != Foo(7, 'cherry')
+    assert repr(Foo(7, 'cherry')) == "Foo(7, flavor='cherry')"
+
+
+def test_abctools_AbjadValueObject___eq___03():
+    r'''Callers may change signature names without changing comparison.
+    '''
+
+    articulation = abjad.Articulation('accent')
+    agent = abjad.StorageFormatManager(articulation)
+    agent.signature_keyword_names.clear()
+    agent.signature_positional_names.append('foo')
+    assert articulation == abjad.Articulation('accent')
+    assert articulation != abjad.Articulation('accent', abjad.Up)
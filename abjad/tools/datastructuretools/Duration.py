@@ -1033,15 +1033,13 @@ class Duration(AbjadObject, Fraction):
 
         Returns new object of `durations` type.
         '''
-        durations = [Duration(x) for x in durations]
-        denominators = [duration.denominator for duration in durations]
-        lcd = mathtools.least_common_multiple(*denominators)
+        import abjad
+        array = abjad.DurationArray([Duration(x) for x in durations])
         nonreduced_fractions = [
-            mathtools.NonreducedFraction(x).with_denominator(lcd)
-            for x in durations
+            mathtools.NonreducedFraction(numerator, array.denominator)
+            for numerator in array.numerators
             ]
-        result = type(durations)(nonreduced_fractions)
-        return result
+        return nonreduced_fractions
 
     @staticmethod
     def from_lilypond_duration_string(lilypond_duration_string):
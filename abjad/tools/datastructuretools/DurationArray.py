@@ -0,0 +1,349 @@
+import bisect
+import itertools
+import math
+from abjad.tools.abctools.AbjadObject import AbjadObject
+
+
+class DurationArray(AbjadObject):
+    r'''Duration array.
+
+    ..  container:: example
+
+        Holds durations as integer numerators over least common denominator:
+
+        >>> array = abjad.DurationArray([(1, 4), (1, 8), (3, 16)])
+        >>> array.numerators
+        (4, 2, 3)
+
+        >>> array.denominator
+        16
+
+        >>> for duration in array:
+        ...     duration
+        ...
+        Duration(1, 4)
+        Duration(1, 8)
+        Duration(3, 16)
+
+    ..  container:: example
+
+        Adds, multiplies and sums in integer arithmetic:
+
+        >>> array = array * abjad.Multiplier(2, 3)
+        >>> array.numerators
+        (4, 2, 3)
+
+        >>> array.denominator
+        24
+
+        >>> sums = array.cumulative_sums(start=abjad.Offset(1))
+        >>> for duration in sums:
+        ...     duration
+        ...
+        Duration(1, 1)
+        Duration(7, 6)
+        Duration(5, 4)
+        Duration(11, 8)
+
+    ..  container:: example
+
+        Searches sorted duration arrays without making durations:
+
+        >>> sums.bisect_left(abjad.Duration(5, 4))
+        2
+
+        >>> sums.bisect_right(abjad.Duration(5, 4))
+        3
+
+    Duration arrays are meant for bulk arithmetic on many durations or
+    offsets: durations are made only when items are read.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        '_denominator',
+        '_item_class',
+        '_numerators',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, items=None, item_class=None):
+        import abjad
+        if item_class is None:
+            item_class = abjad.Duration
+        if isinstance(items, type(self)):
+            self._denominator = items.denominator
+            self._item_class = item_class
+            self._numerators = items.numerators
+            return
+        pairs = []
+        for item in items or ():
+            try:
+                pair = (item.numerator, item.denominator)
+            except AttributeError:
+                item = abjad.Duration(item)
+                pair = (item.numerator, item.denominator)
+            pairs.append(pair)
+        denominator = 1
+        for _, denominator_ in pairs:
+            gcd = math.gcd(denominator, denominator_)
+            denominator = denominator * denominator_ // gcd
+        self._denominator = denominator
+        self._item_class = item_class
+        self._numerators = tuple(
+            numerator * (denominator // denominator_)
+            for numerator, denominator_ in pairs
+            )
+
+    ### SPECIAL METHODS ###
+
+    def __add__(self, argument):
+        r'''Adds `argument` to each item in array.
+
+        ..  container:: example
+
+            Adds duration:
+
+            >>> array = abjad.DurationArray([(1, 4), (1, 8)])
+            >>> array = array + abjad.Duration(1, 16)
+            >>> list(array)
+            [Duration(5, 16), Duration(3, 16)]
+
+        ..  container:: example
+
+            Adds duration array of same length item by item:
+
+            >>> array = array + array
+            >>> list(array)
+            [Duration(5, 8), Duration(3, 8)]
+
+        Returns new duration array.
+        '''
+        if isinstance(argument, type(self)):
+            if len(argument) != len(self):
+                message = 'duration arrays must have same length: {!r}.'
+                message = message.format(argument)
+                raise ValueError(message)
+            numerators = argument._numerators
+            numerator, denominator = 0, argument._denominator
+        else:
+            numerators = None
+            numerator, denominator = self._to_pair(argument)
+        gcd = math.gcd(self._denominator, denominator)
+        lcm = self._denominator * denominator // gcd
+        self_factor = lcm // self._denominator
+        factor = lcm // denominator
+        if numerators is None:
+            addend = numerator * factor
+            numerators = [
+                _ * self_factor + addend
+                for _ in self._numerators
+                ]
+        else:
+            numerators = [
+                x * self_factor + y * factor
+                for x, y in zip(self._numerators, numerators)
+                ]
+        return self._from_numerators(numerators, lcm, self._item_class)
+
+    def __eq__(self, argument):
+        r'''Is true when `argument` is a duration array with items and item
+        class equal to those of this duration array. Otherwise false.
+
+        Returns true or false.
+        '''
+        if not isinstance(argument, type(self)):
+            return False
+        return (
+            self._numerators == argument._numerators and
+            self._denominator == argument._denominator and
+            self._item_class is argument._item_class
+            )
+
+    def __getitem__(self, argument):
+        r'''Gets item or slice identified by `argument`.
+
+        Returns item or new duration array.
+        '''
+        if isinstance(argument, slice):
+            return self._from_numerators(
+                self._numerators[argument],
+                self._denominator,
+                self._item_class,
+                )
+        numerator = self._numerators[argument]
+        return self._item_class(numerator, self._denominator)
+
+    def __hash__(self):
+        r'''Hashes duration array.
+
+        Required to be explicitly redefined on Python 3 if __eq__ changes.
+
+        Returns integer.
+        '''
+        return hash((
+            type(self),
+            self._numerators,
+            self._denominator,
+            self._item_class,
+            ))
+
+    def __iter__(self):
+        r'''Iterates duration array.
+
+        Returns generator.
+        '''
+        item_class = self._item_class
+        denominator = self._denominator
+        for numerator in self._numerators:
+            yield item_class(numerator, denominator)
+
+    def __len__(self):
+        r'''Gets length of duration array.
+
+        Returns nonnegative integer.
+        '''
+        return len(self._numerators)
+
+    def __mul__(self, argument):
+        r'''Multiplies each item in array by `argument`.
+
+        Returns new duration array.
+        '''
+        numerator, denominator = self._to_pair(argument)
+        numerators = [_ * numerator for _ in self._numerators]
+        denominator *= self._denominator
+        return self._from_numerators(numerators, denominator, self._item_class)
+
+    def __radd__(self, argument):
+        r'''Adds each item in array to `argument`.
+
+        Returns new duration array.
+        '''
+        return self.__add__(argument)
+
+    def __rmul__(self, argument):
+        r'''Multiplies `argument` by each item in array.
+
+        Returns new duration array.
+        '''
+        return self.__mul__(argument)
+
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _from_numerators(class_, numerators, denominator, item_class):
+        numerators = tuple(numerators)
+        gcd = denominator
+        for numerator in numerators:
+            if gcd == 1:
+                break
+            gcd = math.gcd(gcd, numerator)
+        if 1 < gcd:
+            numerators = tuple(_ // gcd for _ in numerators)
+            denominator //= gcd
+        array = class_.__new__(class_)
+        array._denominator = denominator
+        array._item_class = item_class
+        array._numerators = numerators
+        return array
+
+    @staticmethod
+    def _to_pair(argument):
+        import abjad
+        try:
+            return argument.numerator, argument.denominator
+        except AttributeError:
+            argument = abjad.Duration(argument)
+            return argument.numerator, argument.denominator
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def denominator(self):
+        r'''Gets least common denominator of items in array.
+
+        Returns positive integer.
+        '''
+        return self._denominator
+
+    @property
+    def item_class(self):
+        r'''Gets item class of duration array.
+
+        Returns duration class.
+        '''
+        return self._item_class
+
+    @property
+    def items(self):
+        r'''Gets items in duration array.
+
+        Returns tuple.
+        '''
+        return tuple(self)
+
+    @property
+    def numerators(self):
+        r'''Gets numerators of items in array over least common denominator.
+
+        Returns tuple of integers.
+        '''
+        return self._numerators
+
+    ### PUBLIC METHODS ###
+
+    def bisect_left(self, argument):
+        r'''Gets index at which `argument` would insert before equal items in
+        sorted duration array.
+
+        Returns nonnegative integer.
+        '''
+        numerator, denominator = self._to_pair(argument)
+        # least integer not less than argument over common denominator
+        numerator = -(-numerator * self._denominator // denominator)
+        return bisect.bisect_left(self._numerators, numerator)
+
+    def bisect_right(self, argument):
+        r'''Gets index at which `argument` would insert after equal items in
+        sorted duration array.
+
+        Returns nonnegative integer.
+        '''
+        numerator, denominator = self._to_pair(argument)
+        # greatest integer not more than argument over common denominator
+        numerator = numerator * self._denominator // denominator
+        return bisect.bisect_right(self._numerators, numerator)
+
+    def cumulative_sums(self, start=0):
+        r'''Gets cumulative sums of items in array, beginning at `start`.
+
+        ..  container:: example
+
+            >>> array = abjad.DurationArray([(1, 4), (1, 8), (3, 16)])
+            >>> list(array.cumulative_sums())
+            [Duration(0, 1), Duration(1, 4), Duration(3, 8), Duration(9, 16)]
+
+            >>> list(array.cumulative_sums(start=None))
+            [Duration(1, 4), Duration(3, 8), Duration(9, 16)]
+
+        Returns new duration array one item longer than duration array
+        unless `start` is none.
+        '''
+        if start is None:
+            sums = itertools.accumulate(self._numerators)
+            return self._from_numerators(
+                sums,
+                self._denominator,
+                self._item_class,
+                )
+        numerator, denominator = self._to_pair(start)
+        gcd = math.gcd(self._denominator, denominator)
+        lcm = self._denominator * denominator // gcd
+        factor = lcm // self._denominator
+        numerators = [numerator * (lcm // denominator)]
+        numerators.extend(_ * factor for _ in self._numerators)
+        sums = itertools.accumulate(numerators)
+        return self._from_numerators(sums, lcm, self._item_class)
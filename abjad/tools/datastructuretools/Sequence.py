@@ -848,6 +848,22 @@ class Sequence(abctools.AbjadValueObject, collections.Sequence):
             indicator += '+'
         return indicator
 
+    @staticmethod
+    def _get_partition_weights(sequence, weights):
+        r'''Gets item weights of `sequence` and target `weights` over their
+        least common denominator when all are rational; otherwise gets them
+        unchanged.
+        '''
+        import abjad
+        item_weights = [abs(_) for _ in sequence]
+        weights = list(weights)
+        numbers_ = item_weights + weights
+        if all(isinstance(_, numbers.Rational) for _ in numbers_):
+            numerators = abjad.DurationArray(numbers_).numerators
+            item_weights = list(numerators[:len(item_weights)])
+            weights = list(numerators[len(item_weights):])
+        return item_weights, weights
+
     @classmethod
     def _partition_sequence_cyclically_by_weights_at_least(
         class_,
@@ -855,20 +871,22 @@ class Sequence(abctools.AbjadValueObject, collections.Sequence):
         weights,
         overhang=False,
         ):
-        l_copy = list(sequence)
+        items = list(sequence)
+        item_weights, weights = class_._get_partition_weights(items, weights)
         result = []
         current_part = []
+        current_weight = 0
         target_weight_index = 0
         len_weights = len(weights)
-        while l_copy:
+        for item, item_weight in zip(items, item_weights):
             target_weight = weights[target_weight_index % len_weights]
-            item = l_copy.pop(0)
             current_part.append(item)
-            if target_weight <= mathtools.weight(current_part):
+            current_weight += item_weight
+            if target_weight <= current_weight:
                 result.append(current_part)
                 current_part = []
+                current_weight = 0
                 target_weight_index += 1
-        assert not l_copy
         if current_part:
             if overhang:
                 result.append(current_part)
@@ -883,29 +901,35 @@ class Sequence(abctools.AbjadValueObject, collections.Sequence):
         weights,
         overhang=False,
         ):
+        items = list(sequence)
+        item_weights, weights = class_._get_partition_weights(items, weights)
         result = []
         current_part = []
+        current_weight = 0
         current_target_weight_index = 0
         current_target_weight = weights[current_target_weight_index]
-        l_copy = list(sequence)
-        while l_copy:
+        index = 0
+        while index < len(items):
             current_target_weight = weights[
                 current_target_weight_index % len(weights)]
-            item = l_copy.pop(0)
-            current_part_weight = mathtools.weight(current_part)
-            candidate_part_weight = current_part_weight + mathtools.weight([item])
+            item = items[index]
+            candidate_part_weight = current_weight + item_weights[index]
+            index += 1
             if candidate_part_weight < current_target_weight:
                 current_part.append(item)
+                current_weight = candidate_part_weight
             elif candidate_part_weight == current_target_weight:
                 current_part.append(item)
                 result.append(current_part)
                 current_part = []
+                current_weight = 0
                 current_target_weight_index += 1
             elif current_target_weight < candidate_part_weight:
                 if current_part:
-                    l_copy.insert(0, item)
+                    index -= 1
                     result.append(current_part)
                     current_part = []
+                    current_weight = 0
                     current_target_weight_index += 1
                 else:
                     message = 'elements in sequence too big.'
@@ -927,28 +951,32 @@ class Sequence(abctools.AbjadValueObject, collections.Sequence):
         weights,
         overhang=False,
         ):
+        items = list(sequence)
+        item_weights, weights = class_._get_partition_weights(items, weights)
         result = []
         current_part = []
-        l_copy = list(sequence)
+        current_weight = 0
+        index = 0
         for num_weight, target_weight in enumerate(weights):
             while True:
-                try:
-                    item = l_copy.pop(0)
-                except IndexError:
+                if index == len(items):
                     if num_weight + 1 == len(weights):
                         if current_part:
                             result.append(current_part)
                             break
                     message = 'too few elements in sequence.'
                     raise Exception(message)
-                current_part.append(item)
-                if target_weight <= mathtools.weight(current_part):
+                current_part.append(items[index])
+                current_weight += item_weights[index]
+                index += 1
+                if target_weight <= current_weight:
                     result.append(current_part)
                     current_part = []
+                    current_weight = 0
                     break
-        if l_copy:
+        if items[index:]:
             if overhang:
-                result.append(l_copy)
+                result.append(items[index:])
         result = [class_(_) for _ in result]
         return class_(items=result)
 
@@ -959,30 +987,35 @@ class Sequence(abctools.AbjadValueObject, collections.Sequence):
         weights,
         overhang=False,
         ):
-        l_copy = list(sequence)
+        items = list(sequence)
+        item_weights, weights = class_._get_partition_weights(items, weights)
         result = []
         current_part = []
+        current_weight = 0
+        index = 0
         for target_weight in weights:
             while True:
-                try:
-                    item = l_copy.pop(0)
-                except IndexError:
+                if index == len(items):
                     message = 'too few elements in sequence.'
                     raise Exception(message)
-                current_weight = mathtools.weight(current_part)
-                candidate_weight = current_weight + mathtools.weight([item])
+                item = items[index]
+                candidate_weight = current_weight + item_weights[index]
+                index += 1
                 if candidate_weight < target_weight:
                     current_part.append(item)
+                    current_weight = candidate_weight
                 elif candidate_weight == target_weight:
                     current_part.append(item)
                     result.append(current_part)
                     current_part = []
+                    current_weight = 0
                     break
                 elif target_weight < candidate_weight:
                     if current_part:
                         result.append(current_part)
                         current_part = []
-                        l_copy.insert(0, item)
+                        current_weight = 0
+                        index -= 1
                         break
                     else:
                         message = 'elements in sequence too big.'
@@ -991,7 +1024,7 @@ class Sequence(abctools.AbjadValueObject, collections.Sequence):
                     message = 'candidate and target weights must compare.'
                     raise ValueError(message)
         if overhang:
-            left_over = current_part + l_copy
+            left_over = current_part + items[index:]
             if left_over:
                 result.append(left_over)
         #return result
@@ -91,7 +91,11 @@ class TypedList(TypedCollection, collections.MutableSequence):
 
         Returns none.
         '''
-        self._on_removal(self._collection[i])
+        if isinstance(i, slice):
+            for item in self._collection[i]:
+                self._on_removal(item)
+        else:
+            self._on_removal(self._collection[i])
         del(self._collection[i])
 
     def __getitem__(self, argument):
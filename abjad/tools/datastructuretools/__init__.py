@@ -21,6 +21,7 @@ del mathtools
 
 from .CyclicTuple import CyclicTuple
 from .Duration import Duration
+from .DurationArray import DurationArray
 from .Inequality import Inequality
 from .DurationInequality import DurationInequality
 from .Enumeration import Enumeration
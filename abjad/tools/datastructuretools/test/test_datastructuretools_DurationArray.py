@@ -0,0 +1,117 @@
+import abjad
+import pytest
+from fractions import Fraction
+
+
+def test_datastructuretools_DurationArray_01():
+    r'''Multiplies and adds duration arrays.
+    '''
+
+    array = abjad.DurationArray([(1, 4), (1, 3), (-1, 6), (1, 2)])
+    assert list(array) == [
+        abjad.Duration(1, 4),
+        abjad.Duration(1, 3),
+        abjad.Duration(-1, 6),
+        abjad.Duration(1, 2),
+        ]
+    assert array.denominator == 12
+    assert list(array * abjad.Multiplier(3, 4)) == [
+        abjad.Duration(3, 16),
+        abjad.Duration(1, 4),
+        abjad.Duration(-1, 8),
+        abjad.Duration(3, 8),
+        ]
+    assert list(array + array) == [
+        abjad.Duration(1, 2),
+        abjad.Duration(2, 3),
+        abjad.Duration(-1, 3),
+        abjad.Duration(1),
+        ]
+
+    array = abjad.DurationArray([])
+    assert list(array * 2) == []
+    assert list(array + array) == []
+
+
+def test_datastructuretools_DurationArray_02():
+    r'''Gets cumulative sums.
+    '''
+
+    array = abjad.DurationArray([(1, 4), (1, 3), (-1, 6), (1, 2)])
+    assert list(array.cumulative_sums()) == [
+        abjad.Duration(0),
+        abjad.Duration(1, 4),
+        abjad.Duration(7, 12),
+        abjad.Duration(5, 12),
+        abjad.Duration(11, 12),
+        ]
+    assert list(array.cumulative_sums(start=None)) == [
+        abjad.Duration(1, 4),
+        abjad.Duration(7, 12),
+        abjad.Duration(5, 12),
+        abjad.Duration(11, 12),
+        ]
+    assert list(array.cumulative_sums(start=(1, 8))) == [
+        abjad.Duration(1, 8),
+        abjad.Duration(3, 8),
+        abjad.Duration(17, 24),
+        abjad.Duration(13, 24),
+        abjad.Duration(25, 24),
+        ]
+
+    array = abjad.DurationArray([])
+    assert list(array.cumulative_sums()) == [abjad.Duration(0)]
+    assert list(array.cumulative_sums(start=None)) == []
+
+
+def test_datastructuretools_DurationArray_03():
+    r'''Cumulative sums equal those of fractions.
+    '''
+
+    fractions = [
+        Fraction(-7, 16),
+        Fraction(5, 6),
+        Fraction(0),
+        Fraction(3, 4),
+        Fraction(-2, 3),
+        Fraction(7, 8),
+        ]
+    array = abjad.DurationArray(fractions)
+    for start in (None, 0, Fraction(1, 3), Fraction(-5, 16)):
+        sums = abjad.mathtools.cumulative_sums(fractions, start=start)
+        assert list(array.cumulative_sums(start=start)) == sums
+
+
+def test_datastructuretools_DurationArray_04():
+    r'''Bisects sorted duration arrays.
+    '''
+
+    array = abjad.DurationArray([(1, 4), (1, 3), (1, 3), (1, 2)])
+    assert array.bisect_left(abjad.Duration(1, 3)) == 1
+    assert array.bisect_right(abjad.Duration(1, 3)) == 3
+    assert array.bisect_left(abjad.Duration(5, 16)) == 1
+    assert array.bisect_right(abjad.Duration(5, 16)) == 1
+    assert array.bisect_left(0) == 0
+    assert array.bisect_right(1) == 4
+
+
+def test_datastructuretools_DurationArray_05():
+    r'''Keeps item class and least common denominator.
+    '''
+
+    array = abjad.DurationArray([(1, 2), (3, 4)], item_class=abjad.Offset)
+    assert array[-1] == abjad.Offset(3, 4)
+    assert isinstance(array[0], abjad.Offset)
+    assert array[1:].denominator == 4
+    assert (array * 2)[:1].denominator == 1
+    assert array == abjad.DurationArray(array, item_class=abjad.Offset)
+    assert array != abjad.DurationArray(array)
+
+
+def test_datastructuretools_DurationArray_06():
+    r'''Adds only duration arrays of same length.
+    '''
+
+    array = abjad.DurationArray([(1, 2), (3, 4)])
+    with pytest.raises(ValueError):
+        array + array[:1]
@@ -0,0 +1,66 @@
+import abjad
+import pytest
+from fractions import Fraction
+
+
+def test_datastructuretools_Sequence_partition_by_weights_01():
+    r'''Partitions mixed integers, fractions and durations by fractional
+    weights.
+    '''
+
+    sequence = abjad.Sequence([
+        abjad.Duration(1, 4),
+        Fraction(-1, 6),
+        1,
+        abjad.Duration(1, 12),
+        Fraction(1, 3),
+        ])
+    parts = sequence.partition_by_weights(
+        [Fraction(5, 12), Fraction(1, 2)],
+        cyclic=True,
+        overhang=True,
+        allow_part_weights=abjad.More,
+        )
+    assert parts == abjad.Sequence([
+        abjad.Sequence([abjad.Duration(1, 4), Fraction(-1, 6)]),
+        abjad.Sequence([1]),
+        abjad.Sequence([abjad.Duration(1, 12), Fraction(1, 3)]),
+        ])
+    parts = sequence.partition_by_weights(
+        [Fraction(5, 12), Fraction(13, 12)],
+        overhang=True,
+        allow_part_weights=abjad.Less,
+        )
+    assert parts == abjad.Sequence([
+        abjad.Sequence([abjad.Duration(1, 4), Fraction(-1, 6)]),
+        abjad.Sequence([1, abjad.Duration(1, 12)]),
+        abjad.Sequence([Fraction(1, 3)]),
+        ])
+
+
+def test_datastructuretools_Sequence_partition_by_weights_02():
+    r'''Partitions floats without common denominator.
+    '''
+
+    sequence = abjad.Sequence([0.5, 1.25, 2.0, 0.25])
+    parts = sequence.partition_by_weights(
+        [1.75, 2.0],
+        cyclic=True,
+        allow_part_weights=abjad.Less,
+        overhang=True,
+        )
+    assert parts == abjad.Sequence([
+        abjad.Sequence([0.5, 1.25]),
+        abjad.Sequence([2.0]),
+        abjad.Sequence([0.25]),
+        ])
+
+
+def test_datastructuretools_Sequence_partition_by_weights_03():
+    r'''Raises exception when items are too big.
+    '''
+
+    sequence = abjad.Sequence([Fraction(3, 2)])
+    with pytest.raises(Exception) as exception_info:
+        sequence.partition_by_weights([1], allow_part_weights=abjad.Less)
+    assert str(exception_info.value) == 'elements in sequence too big.'
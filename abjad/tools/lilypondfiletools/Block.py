@@ -253,6 +253,43 @@ class Block(AbjadObject):
     def _get_lilypond_format(self):
         return '\n'.join(self._get_format_pieces())
 
+    def _iterate_format_pieces(self):
+        r'''Iterates LilyPond format pieces of block one piece at a time.
+
+        Formats containers in block with ``_iterate_format_pieces()``.
+        '''
+        import abjad
+        if not self.items:
+            yield from self._get_format_pieces()
+            return
+        indent = LilyPondFormatManager.indent
+        yield '{} {{'.format(self._escaped_name)
+        for item in self.items:
+            if isinstance(item, abjad.ContextBlock):
+                continue
+            if isinstance(item, (abjad.Leaf, abjad.Markup)):
+                item = [item]
+            yield from self._iterate_item_pieces(item)
+        for string in self._get_formatted_user_attributes():
+            yield indent + string
+        for string in self._formatted_context_blocks:
+            yield indent + string
+        yield '}'
+
+    def _iterate_item_pieces(self, item, depth=1):
+        import abjad
+        indent = LilyPondFormatManager.indent * depth
+        if isinstance(item, (list, tuple)):
+            yield indent + '{'
+            for x in item:
+                yield from self._iterate_item_pieces(x, depth=depth + 1)
+            yield indent + '}'
+        elif isinstance(item, abjad.Container):
+            for piece in item._iterate_format_pieces():
+                yield indent + piece
+        else:
+            yield from self._format_item(item, depth=depth)
+
     ### PUBLIC PROPERTIES ###
 
     @property
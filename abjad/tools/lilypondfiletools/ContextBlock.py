@@ -120,6 +120,9 @@ class ContextBlock(Block):
         result.append('}')
         return result
 
+    def _iterate_format_pieces(self):
+        yield from self._get_format_pieces()
+
     ### PUBLIC PROPERTIES ###
 
     @property
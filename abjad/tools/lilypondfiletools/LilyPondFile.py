@@ -476,26 +476,7 @@ class LilyPondFile(AbjadObject):
     ### PRIVATE METHODS ###
 
     def _get_format_pieces(self):
-        result = []
-        if self.date_time_token is not None:
-            string = f'% {self.date_time_token}'
-            result.append(string)
-        result.extend(self._get_formatted_comments())
-        includes = []
-        if self.lilypond_version_token is not None:
-            string = f'{self.lilypond_version_token}'
-            includes.append(string)
-        if self.lilypond_language_token is not None:
-            string = f'{self.lilypond_language_token}'
-            includes.append(string)
-        includes = '\n'.join(includes)
-        if includes:
-            result.append(includes)
-        if self.use_relative_includes:
-            string = "#(ly:set-option 'relative-includes #t)"
-            result.append(string)
-        result.extend(self._get_formatted_includes())
-        result.extend(self._get_formatted_scheme_settings())
+        result = self._get_formatted_preamble()
         result.extend(self._get_formatted_blocks())
         return result
 
@@ -547,6 +528,29 @@ class LilyPondFile(AbjadObject):
             result = ['\n'.join(result)]
         return result
 
+    def _get_formatted_preamble(self):
+        result = []
+        if self.date_time_token is not None:
+            string = f'% {self.date_time_token}'
+            result.append(string)
+        result.extend(self._get_formatted_comments())
+        includes = []
+        if self.lilypond_version_token is not None:
+            string = f'{self.lilypond_version_token}'
+            includes.append(string)
+        if self.lilypond_language_token is not None:
+            string = f'{self.lilypond_language_token}'
+            includes.append(string)
+        includes = '\n'.join(includes)
+        if includes:
+            result.append(includes)
+        if self.use_relative_includes:
+            string = "#(ly:set-option 'relative-includes #t)"
+            result.append(string)
+        result.extend(self._get_formatted_includes())
+        result.extend(self._get_formatted_scheme_settings())
+        return result
+
     def _get_formatted_scheme_settings(self):
         result = []
         default_paper_size = self.default_paper_size
@@ -565,6 +569,38 @@ class LilyPondFile(AbjadObject):
     def _get_lilypond_format(self):
         return '\n\n'.join(self._get_format_pieces())
 
+    def _iterate_format_pieces(self):
+        r'''Iterates LilyPond format pieces of LilyPond file one piece at a
+        time.
+
+        Joins with newlines to the same string as ``_get_lilypond_format()``.
+        '''
+        import abjad
+
+        def iterate_sections():
+            for string in self._get_formatted_preamble():
+                yield [string]
+            for item in self.items:
+                if ('_get_lilypond_format' not in dir(item) or
+                    isinstance(item, str)):
+                    yield [str(item)]
+                elif isinstance(item, abjad.Block):
+                    yield item._iterate_format_pieces()
+                elif isinstance(item, abjad.Container):
+                    yield item._iterate_lilypond_format()
+                else:
+                    string = item._get_lilypond_format()
+                    if string:
+                        yield [string]
+
+        is_first_piece = True
+        for section in iterate_sections():
+            for i, piece in enumerate(section):
+                if i == 0 and not is_first_piece:
+                    yield ''
+                is_first_piece = False
+                yield piece
+
     @staticmethod
     def _make_global_context_block(
         font_size=3,
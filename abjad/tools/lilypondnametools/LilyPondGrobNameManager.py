@@ -87,7 +87,7 @@ class LilyPondGrobNameManager(LilyPondNameManager):
         Returns none.
         '''
         # make sure attribute name is valid grob name before setting value
-        object.__setattr__(self, attribute, value)
+        LilyPondNameManager.__setattr__(self, attribute, value)
 
     ### PRIVATE METHODS ###
 
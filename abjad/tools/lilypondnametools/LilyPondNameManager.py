@@ -9,6 +9,15 @@ class LilyPondNameManager(object):
 
     ### SPECIAL METHODS ###
 
+    def __delattr__(self, attribute):
+        r'''Deletes attribute `attribute` of LilyPond name manager.
+
+        Returns none.
+        '''
+        import abjad
+        object.__delattr__(self, attribute)
+        abjad.UpdateManager._lilypond_name_manager_update_count += 1
+
     def __eq__(self, argument):
         r'''Is true when `argument` is a LilyPond name manager with attribute
         pairs equal to those of this LilyPond name manager. Otherwise false.
@@ -46,6 +55,15 @@ class LilyPondNameManager(object):
         body_string = ''.join(pairs)
         return '{}({})'.format(type(self).__name__, body_string)
 
+    def __setattr__(self, attribute, value):
+        r'''Sets attribute `attribute` of LilyPond name manager to `value`.
+
+        Returns none.
+        '''
+        import abjad
+        object.__setattr__(self, attribute, value)
+        abjad.UpdateManager._lilypond_name_manager_update_count += 1
+
     def __setstate__(self, state):
         r'''Sets object state.
         '''
@@ -396,7 +396,7 @@ class LilyPondLexicalDefinition(AbjadObject):
         from abjad.tools import lilypondparsertools
         #t.type = 'SCHEME_START'
         #t.lexer.push_state('INITIAL')
-        scheme_parser = lilypondparsertools.SchemeParser(debug=False)
+        scheme_parser = lilypondparsertools.SchemeParser._acquire()
         input_string = t.lexer.lexdata[t.lexpos+1:]
         #print 'PREPARSE'
         try:
@@ -414,6 +414,8 @@ class LilyPondLexicalDefinition(AbjadObject):
             #else:
             #    t.type = 'SCM_TOKEN'
             t.lexer.skip(scheme_parser.cursor_end + 1)
+        finally:
+            scheme_parser._release()
         return t
 
     # lexer.ll:387
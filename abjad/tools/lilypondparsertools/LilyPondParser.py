@@ -371,7 +371,7 @@ class LilyPondParser(abctools.Parser):
 
         Returns Abjad components.
         '''
-        self._reset_parser_variables()
+        self.reset()
         if self._debug:
             result = self._parser._lilypond_patch_parse_debug(
                 input_string,
@@ -852,10 +852,6 @@ class LilyPondParser(abctools.Parser):
     def _reset_parser_variables(self):
         from abjad.tools import lilypondparsertools
         import abjad
-        try:
-            self._parser.restart()
-        except:
-            pass
         self._scope_stack = [{}]
         self._chord_pitch_orders = {}
         self._lexer.push_state('notes')
@@ -1520,6 +1516,27 @@ class LilyPondParser(abctools.Parser):
             assert predicate.endswith('?')
         markup_functions[name] = tuple(signature)
 
+    def reset(self):
+        r'''Resets LilyPond parser.
+
+        Clears lexer state, variable scopes and chord memory left behind by
+        previous calls so that one parser may be called any number of times:
+
+        >>> parser = abjad.lilypondparsertools.LilyPondParser()
+        >>> for _ in range(3):
+        ...     container = parser("{ c'4 d'4 }")
+        ...
+        >>> parser.reset()
+        >>> parser._lexer.lexstatestack
+        ['INITIAL']
+
+        Called automatically on every call to parser.
+
+        Returns none.
+        '''
+        abctools.Parser.reset(self)
+        self._reset_parser_variables()
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -22,4 +22,4 @@ def parse_reduced_ly_syntax(string):
 
     Returns list.
     '''
-    return ReducedLyParser()(string)
+    return ReducedLyParser._call_pooled(string)
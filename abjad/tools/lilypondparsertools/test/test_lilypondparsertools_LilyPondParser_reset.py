@@ -0,0 +1,69 @@
+import abjad
+
+
+def test_lilypondparsertools_LilyPondParser_reset_01():
+    r'''Lexer state stack does not grow across calls.
+    '''
+
+    parser = abjad.lilypondparsertools.LilyPondParser()
+    for _ in range(10):
+        parser("{ c'4 d'4 }")
+    assert parser._lexer.lexstatestack == ['INITIAL']
+
+
+def test_lilypondparsertools_LilyPondParser_reset_02():
+    r'''Variables, chord memory and relative pitches do not leak from one
+    call into the next.
+    '''
+
+    parser = abjad.lilypondparsertools.LilyPondParser()
+    parser(r"foo = { c'4 } { <c' e' g'>8 q8 \foo }")
+    result = parser("{ c'2 }")
+    assert parser._scope_stack == [{}]
+    assert parser._last_chord is None
+    assert format(result) == abjad.String.normalize(
+        r'''
+        {
+            c'2
+        }
+        '''
+        )
+
+
+def test_lilypondparsertools_LilyPondParser_reset_03():
+    r'''Parsers given back to pool after failed parse are reusable.
+    '''
+
+    class_ = abjad.lilypondparsertools.LilyPondParser
+    try:
+        class_._call_pooled("{ c'4 ", default_language='english')
+    except Exception:
+        pass
+    parser = class_._acquire(default_language='english')
+    try:
+        result = parser("{ c'4 d'4 }")
+    finally:
+        parser._release()
+    assert format(result) == abjad.String.normalize(
+        r'''
+        {
+            c'4
+            d'4
+        }
+        '''
+        )
+
+
+def test_lilypondparsertools_LilyPondParser_reset_04():
+    r'''Pool reuses idle parsers and makes new parsers on reentry.
+    '''
+
+    class_ = abjad.lilypondparsertools.LilyPondParser
+    parser_1 = class_._acquire(default_language='nederlands')
+    parser_2 = class_._acquire(default_language='nederlands')
+    assert parser_1 is not parser_2
+    parser_1._release()
+    parser_2._release()
+    assert class_._acquire(default_language='nederlands') is parser_2
+    assert class_._acquire(default_language='nederlands') is parser_1
+    assert class_._acquire(default_language='english') is not parser_1
@@ -9,10 +9,29 @@ def cumulative_sums(argument, start=0):
         >>> abjad.mathtools.cumulative_sums([1, 2, 3, 4, 5, 6, 7, 8], start=None)
         [1, 3, 6, 10, 15, 21, 28, 36]
 
+    ..  container:: example
+
+        Sums durations in integer arithmetic:
+
+        >>> durations = [abjad.Duration(1, 4), abjad.Duration(1, 6)]
+        >>> abjad.mathtools.cumulative_sums(durations)
+        [0, Duration(1, 4), Duration(5, 12)]
+
     Raises exception when `argument` is not iterable.
 
     Returns new object of `argument` type.
     '''
+    import abjad
+    if (argument and
+        all(type(_) is abjad.Duration for _ in argument) and
+        type(start) in (type(None), int, abjad.Duration)):
+        sums = abjad.DurationArray(argument).cumulative_sums(start=start or 0)
+        result = list(sums)
+        if start is None:
+            result.pop(0)
+        else:
+            result[0] = start
+        return type(argument)(result)
     if start is None:
         result = []
     else:
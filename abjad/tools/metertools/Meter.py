@@ -244,6 +244,12 @@ class Meter(AbjadValueObject):
         '_root_node',
         )
 
+    _offset_table_cache: dict = {}
+
+    _rewrite_plan_cache: dict = {}
+
+    _rewrite_plan_cache_size = 1024
+
     ### INITIALIZER ###
 
     def __init__(
@@ -335,7 +341,7 @@ class Meter(AbjadValueObject):
 
         elif isinstance(argument, (str, rhythmtreetools.RhythmTreeContainer)):
             if isinstance(argument, str):
-                parsed = rhythmtreetools.RhythmTreeParser()(argument)
+                parsed = rhythmtreetools.RhythmTreeParser._call_pooled(argument)
                 assert len(parsed) == 1
                 root = parsed[0]
             else:
@@ -804,6 +810,20 @@ class Meter(AbjadValueObject):
         # return notes
         return notes
 
+    @staticmethod
+    def _get_offset_table(meter, prolation):
+        key = (meter.rtm_format, prolation)
+        table = Meter._offset_table_cache.get(key)
+        if table is None:
+            offset_inventory = []
+            for offsets in meter.depthwise_offset_inventory:
+                offsets = tuple(x * prolation for x in offsets)
+                offset_inventory.append(offsets)
+            # MeterManager extends the list with finer offsets on demand
+            table = (tuple(offset_inventory), offset_inventory, {})
+            Meter._offset_table_cache[key] = table
+        return table
+
     @staticmethod
     def _rewrite_meter(
         components,
@@ -819,23 +839,30 @@ class Meter(AbjadValueObject):
         if not isinstance(meter, abjad.Meter):
             meter = abjad.Meter(meter)
         boundary_depth = boundary_depth or meter.preferred_boundary_depth
+        def get_offsets_at_depth(depth):
+            offsets = abjad.MeterManager.get_offsets_at_depth(
+                depth,
+                offset_inventory,
+                )
+            if depth not in offset_sets:
+                offset_sets[depth] = frozenset(offsets)
+            return offsets, offset_sets[depth]
         def recurse(
             boundary_depth=None,
             boundary_offsets=None,
             depth=0,
             logical_tie=None,
+            logical_tie_start_offset=None,
             ):
-            offsets = abjad.MeterManager.get_offsets_at_depth(
-                depth,
-                offset_inventory,
-                )
+            offsets, offset_set = get_offsets_at_depth(depth)
             #print('DEPTH:', depth)
             logical_tie_duration = logical_tie._get_preprolated_duration()
-            logical_tie_timespan = abjad.inspect(logical_tie).get_timespan()
-            logical_tie_start_offset = logical_tie_timespan.start_offset
-            logical_tie_stop_offset = logical_tie_timespan.stop_offset
-            logical_tie_starts_in_offsets = logical_tie_start_offset in offsets
-            logical_tie_stops_in_offsets = logical_tie_stop_offset in offsets
+            logical_tie_stop_offset = logical_tie_start_offset + \
+                abjad.inspect(logical_tie).get_duration()
+            logical_tie_starts_in_offsets = \
+                logical_tie_start_offset in offset_set
+            logical_tie_stops_in_offsets = \
+                logical_tie_stop_offset in offset_set
             if not abjad.MeterManager.is_acceptable_logical_tie(
                 logical_tie_duration=logical_tie_duration,
                 logical_tie_starts_in_offsets=logical_tie_starts_in_offsets,
@@ -845,10 +872,6 @@ class Meter(AbjadValueObject):
                 #print('UNACCEPTABLE:', logical_tie, logical_tie_start_offset, logical_tie_stop_offset)
                 #print('\t', ' '.join([str(x) for x in offsets]))
                 split_offset = None
-                offsets = abjad.MeterManager.get_offsets_at_depth(
-                    depth,
-                    offset_inventory,
-                    )
                 # If the logical tie's start aligns, take the latest possible offset.
                 if logical_tie_starts_in_offsets:
                     offsets = reversed(offsets)
@@ -861,25 +884,22 @@ class Meter(AbjadValueObject):
                     split_offset -= logical_tie_start_offset
                     #print('\tREL:', split_offset)
                     #print()
-                    shards = abjad.mutate(logical_tie[:]).split(
-                        [split_offset],
-                        repeat_ties=repeat_ties,
+                    return split(
+                        boundary_depth=boundary_depth,
+                        boundary_offsets=boundary_offsets,
+                        depth=depth,
+                        logical_tie=logical_tie,
+                        logical_tie_start_offset=logical_tie_start_offset,
+                        split_offset=split_offset,
                         )
-                    logical_ties = [abjad.LogicalTie(_) for _ in shards]
-                    for logical_tie in logical_ties:
-                        recurse(
-                            boundary_depth=boundary_depth,
-                            boundary_offsets=boundary_offsets,
-                            depth=depth,
-                            logical_tie=logical_tie,
-                            )
                 else:
                     #print()
-                    recurse(
+                    return recurse(
                         boundary_depth=boundary_depth,
                         boundary_offsets=boundary_offsets,
                         depth=depth + 1,
                         logical_tie=logical_tie,
+                        logical_tie_start_offset=logical_tie_start_offset,
                         )
             elif abjad.MeterManager.is_boundary_crossing_logical_tie(
                 boundary_depth=boundary_depth,
@@ -901,23 +921,58 @@ class Meter(AbjadValueObject):
                 split_offset -= logical_tie_start_offset
                 #print('\tREL:', split_offset)
                 #print()
-                shards = abjad.mutate(logical_tie[:]).split(
-                    [split_offset],
-                    repeat_ties=repeat_ties,
+                return split(
+                    boundary_depth=boundary_depth,
+                    boundary_offsets=boundary_offsets,
+                    depth=depth,
+                    logical_tie=logical_tie,
+                    logical_tie_start_offset=logical_tie_start_offset,
+                    split_offset=split_offset,
                     )
-                logical_ties = [abjad.LogicalTie(shard) for shard in shards]
-                for logical_tie in logical_ties:
-                    recurse(
-                        boundary_depth=boundary_depth,
-                        boundary_offsets=boundary_offsets,
-                        depth=depth,
-                        logical_tie=logical_tie,
-                        )
             else:
                 #print('ACCEPTABLE:', logical_tie, logical_tie_start_offset, logical_tie_stop_offset)
                 #print('\t', ' '.join([str(x) for x in offsets]))
                 #print()
                 logical_tie[:]._fuse()
+        def replay(logical_tie, plan):
+            if plan is None:
+                logical_tie[:]._fuse()
+                return
+            split_offset, plans = plan
+            shards = abjad.mutate(logical_tie[:]).split(
+                [split_offset],
+                repeat_ties=repeat_ties,
+                )
+            assert len(shards) == len(plans)
+            for shard, plan in zip(shards, plans):
+                replay(abjad.LogicalTie(shard), plan)
+        def split(
+            boundary_depth=None,
+            boundary_offsets=None,
+            depth=0,
+            logical_tie=None,
+            logical_tie_start_offset=None,
+            split_offset=None,
+            ):
+            shards = abjad.mutate(logical_tie[:]).split(
+                [split_offset],
+                repeat_ties=repeat_ties,
+                )
+            start_offsets = [logical_tie_start_offset]
+            for shard in shards[:-1]:
+                duration = abjad.inspect(shard).get_duration()
+                start_offsets.append(start_offsets[-1] + duration)
+            plans = []
+            for shard, start_offset in zip(shards, start_offsets):
+                plan = recurse(
+                    boundary_depth=boundary_depth,
+                    boundary_offsets=boundary_offsets,
+                    depth=depth,
+                    logical_tie=abjad.LogicalTie(shard),
+                    logical_tie_start_offset=start_offset,
+                    )
+                plans.append(plan)
+            return split_offset, tuple(plans)
         # Validate arguments.
         assert abjad.select(components).are_contiguous_logical_voice()
         if not isinstance(meter, abjad.Meter):
@@ -930,60 +985,112 @@ class Meter(AbjadValueObject):
         if initial_offset is None:
             initial_offset = abjad.Offset(0)
         initial_offset = abjad.Offset(initial_offset)
-        first_start_offset = abjad.inspect(
-            components[0]).get_timespan().start_offset
-        last_start_offset = abjad.inspect(
-            components[-1]).get_timespan().start_offset
-        difference = last_start_offset - first_start_offset + initial_offset
+        # Components are contiguous, so durations give start offsets
+        # without updating offsets everywhere in score.
+        difference = sum(_._get_duration() for _ in components[:-1])
+        difference += initial_offset
         assert difference < meter.implied_time_signature.duration
-        # Build offset inventory, adjusted for initial offset and prolation.
-        first_offset = abjad.inspect(components[0]).get_timespan().start_offset
-        first_offset -= initial_offset
+        # Get offset inventory, adjusted for prolation. Offsets are measured
+        # from the start of the meter, so the first item starts at the
+        # initial offset.
         prolation = abjad.inspect(components[0]).get_parentage(
             include_self=False).prolation
-        offset_inventory = []
-        for offsets in meter.depthwise_offset_inventory:
-            offsets = [(x * prolation) + first_offset for x in offsets]
-            offset_inventory.append(tuple(offsets))
+        meter_offset_inventory, offset_inventory, offset_sets = \
+            Meter._get_offset_table(meter, prolation)
         # Build boundary offset inventory, if applicable.
         if boundary_depth is not None:
-            boundary_offsets = offset_inventory[boundary_depth]
+            boundary_offsets = meter_offset_inventory[boundary_depth]
         else:
             boundary_offsets = None
         # Cache results of iterator, as we'll be mutating the underlying collection
         iterator = abjad.MeterManager.iterate_rewrite_inputs(components)
         items = tuple(iterator)
+        # Describe items by duration; equal descriptions rewrite equally.
+        pattern, start_offsets = [], []
+        start_offset = initial_offset
         for item in items:
+            start_offsets.append(start_offset)
             if isinstance(item, abjad.LogicalTie):
+                leaf_durations = tuple(
+                    (
+                        leaf.written_duration,
+                        leaf._get_preprolated_duration(),
+                        leaf._get_duration(),
+                        )
+                    for leaf in item
+                    )
+                pattern.append(leaf_durations)
+                start_offset += sum(_[-1] for _ in leaf_durations)
+            else:
+                duration = item._get_duration()
+                pattern.append((
+                    isinstance(item, abjad.Tuplet),
+                    sum(x._get_preprolated_duration() for x in item),
+                    duration,
+                    ))
+                start_offset += duration
+        key = (
+            meter.rtm_format,
+            boundary_depth,
+            maximum_dot_count,
+            rewrite_tuplets,
+            initial_offset,
+            prolation,
+            tuple(pattern),
+            )
+        plans = Meter._rewrite_plan_cache.pop(key, None)
+        if plans is None:
+            plans = []
+            rewrite = True
+        else:
+            # reinsert so that least recently used plans are evicted first
+            Meter._rewrite_plan_cache[key] = plans
+            rewrite = False
+        for i, item in enumerate(items):
+            if isinstance(item, abjad.LogicalTie):
+                if not rewrite:
+                    replay(item, plans[i])
+                    continue
                 #print('RECURSING:', item)
-                recurse(
+                plan = recurse(
                     boundary_depth=boundary_depth,
                     boundary_offsets=boundary_offsets,
                     depth=0,
                     logical_tie=item,
+                    logical_tie_start_offset=start_offsets[i],
                     )
+                plans.append(plan)
             elif isinstance(item, abjad.Tuplet) and not rewrite_tuplets:
-                pass
+                if rewrite:
+                    plans.append(None)
             else:
-                #print('DESCENDING:', item)
-                preprolated_duration = sum(
-                    [x._get_preprolated_duration() for x in item]
-                    )
-                if preprolated_duration.numerator == 1:
-                    preprolated_duration = abjad.NonreducedFraction(
-                        preprolated_duration)
-                    preprolated_duration = preprolated_duration.with_denominator(
-                        preprolated_duration.denominator * 4)
-                sub_metrical_hierarchy = abjad.Meter(preprolated_duration)
-                sub_boundary_depth = 1
-                if boundary_depth is None:
-                    sub_boundary_depth = None
+                if not rewrite:
+                    sub_metrical_hierarchy, sub_boundary_depth = plans[i]
+                else:
+                    #print('DESCENDING:', item)
+                    preprolated_duration = pattern[i][1]
+                    if preprolated_duration.numerator == 1:
+                        preprolated_duration = abjad.NonreducedFraction(
+                            preprolated_duration)
+                        preprolated_duration = \
+                            preprolated_duration.with_denominator(
+                                preprolated_duration.denominator * 4)
+                    sub_metrical_hierarchy = abjad.Meter(preprolated_duration)
+                    sub_boundary_depth = 1
+                    if boundary_depth is None:
+                        sub_boundary_depth = None
+                    plans.append((sub_metrical_hierarchy, sub_boundary_depth))
                 Meter._rewrite_meter(
                     item[:],
                     sub_metrical_hierarchy,
                     boundary_depth=sub_boundary_depth,
                     maximum_dot_count=maximum_dot_count,
                     )
+        if rewrite:
+            cache = Meter._rewrite_plan_cache
+            cache[key] = tuple(plans)
+            while Meter._rewrite_plan_cache_size < len(cache):
+                del(cache[next(iter(cache))])
 
     ### PUBLIC METHODS ###
 
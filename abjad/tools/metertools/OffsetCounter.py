@@ -1,3 +1,4 @@
+import collections
 from abjad.tools import markuptools
 from abjad.tools.datastructuretools.TypedCounter import TypedCounter
 
@@ -43,7 +44,19 @@ class OffsetCounter(TypedCounter):
         import abjad
         TypedCounter.__init__(self, item_class=abjad.Offset)
         if items:
+            # tallies offsets first to coerce each distinct offset only once
+            offsets = collections.Counter()
             for item in items:
+                start_offset = getattr(item, 'start_offset', None)
+                stop_offset = getattr(item, 'stop_offset', None)
+                if (isinstance(start_offset, abjad.Offset) and
+                    isinstance(stop_offset, abjad.Offset)):
+                    offsets[start_offset] += 1
+                    offsets[stop_offset] += 1
+                    continue
+                for offset, count in offsets.items():
+                    self[offset] += count
+                offsets.clear()
                 try:
                     self[item.start_offset] += 1
                     self[item.stop_offset] += 1
@@ -54,6 +67,8 @@ class OffsetCounter(TypedCounter):
                     else:
                         offset = abjad.Offset(item)
                         self[offset] += 1
+            for offset, count in offsets.items():
+                self[offset] += count
 
     ### SPECIAL METHODS ###
 
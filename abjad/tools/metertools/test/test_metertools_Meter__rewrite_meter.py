@@ -0,0 +1,176 @@
+import abjad
+
+
+def test_metertools_Meter__rewrite_meter_01():
+    r'''Rewrites repeated measures the same way.
+    '''
+
+    string = "| 4/4 c'4. d'8 ~ d'4 e'4 || 4/4 r8 c'4. ~ c'8 d'4. |"
+    staff = abjad.Staff('abj: ' + 2 * string)
+    for measure in staff:
+        abjad.mutate(measure[:]).rewrite_meter(abjad.Meter((4, 4)))
+
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            {   % measure
+                \time 4/4
+                c'4.
+                d'4.
+                e'4
+            }   % measure
+            {   % measure
+                r8
+                c'8
+                ~
+                c'4.
+                d'4.
+            }   % measure
+            {   % measure
+                c'4.
+                d'4.
+                e'4
+            }   % measure
+            {   % measure
+                r8
+                c'8
+                ~
+                c'4.
+                d'4.
+            }   % measure
+        }
+        """
+        )
+    assert abjad.inspect(staff).is_well_formed()
+
+
+def test_metertools_Meter__rewrite_meter_02():
+    r'''Rewrites repeated measures the same way with boundary depth.
+    '''
+
+    string = "| 4/4 c'4. d'8 ~ d'4 e'4 || 4/4 r8 c'4. ~ c'8 d'4. |"
+    staff = abjad.Staff('abj: ' + 2 * string)
+    for measure in staff:
+        abjad.mutate(measure[:]).rewrite_meter((4, 4), boundary_depth=1)
+
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            {   % measure
+                \time 4/4
+                c'4
+                ~
+                c'8
+                d'8
+                ~
+                d'4
+                e'4
+            }   % measure
+            {   % measure
+                r8
+                c'8
+                ~
+                c'4
+                ~
+                c'8
+                d'8
+                ~
+                d'4
+            }   % measure
+            {   % measure
+                c'4
+                ~
+                c'8
+                d'8
+                ~
+                d'4
+                e'4
+            }   % measure
+            {   % measure
+                r8
+                c'8
+                ~
+                c'4
+                ~
+                c'8
+                d'8
+                ~
+                d'4
+            }   % measure
+        }
+        """
+        )
+    assert abjad.inspect(staff).is_well_formed()
+
+
+def test_metertools_Meter__rewrite_meter_03():
+    r'''Rewrites repeated measures the same way with tuplets.
+    '''
+
+    string = "| 4/4 c'4 2/3 { d'4 ~ d'8 ~ d'8 e'4 } f'4 |"
+    staff = abjad.Staff('abj: ' + 2 * string)
+    for measure in staff:
+        abjad.mutate(measure[:]).rewrite_meter(abjad.Meter((4, 4)))
+
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            {   % measure
+                \time 4/4
+                c'4
+                \times 2/3 {
+                    d'2
+                    e'4
+                }
+                f'4
+            }   % measure
+            {   % measure
+                c'4
+                \times 2/3 {
+                    d'2
+                    e'4
+                }
+                f'4
+            }   % measure
+        }
+        """
+        )
+    assert abjad.inspect(staff).is_well_formed()
+
+
+def test_metertools_Meter__rewrite_meter_04():
+    r'''Rewrites equal rhythms differently at different initial offsets.
+    '''
+
+    meter = abjad.Meter((4, 4))
+    measure = abjad.Measure((3, 4), "c'2 d'4")
+    abjad.mutate(measure[:]).rewrite_meter(meter)
+    assert format(measure) == abjad.String.normalize(
+        r"""
+        {   % measure
+            \time 3/4
+            c'2
+            d'4
+        }   % measure
+        """
+        )
+
+    measure = abjad.Measure((3, 4), "c'2 d'4")
+    initial_offset = abjad.Duration(1, 8)
+    abjad.mutate(measure[:]).rewrite_meter(meter, initial_offset=initial_offset)
+    assert format(measure) == abjad.String.normalize(
+        r"""
+        {   % measure
+            \time 3/4
+            c'8
+            ~
+            c'4.
+            d'8
+            ~
+            d'8
+        }   % measure
+        """
+        )
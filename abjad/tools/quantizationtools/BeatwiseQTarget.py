@@ -28,29 +28,16 @@ class BeatwiseQTarget(QTarget):
         ):
         import abjad
         voice = abjad.Voice()
-        # generate the first
-        beat = self.items[0]
-        components = beat.q_grid(beat.beatspan)
-        if attach_tempos:
-            attachment_target = components[0]
-            leaves = select(attachment_target).leaves()
-            if isinstance(attachment_target, abjad.Container):
-                attachment_target = leaves[0]
-            tempo = copy.copy(beat.tempo)
-            attach(tempo, attachment_target)
-        voice.extend(components)
-
-        # generate the rest pairwise, comparing tempi
-        for beat_one, beat_two in abjad.sequence(self.items).nwise():
-            components = beat_two.q_grid(beat_two.beatspan)
-            if (beat_two.tempo != beat_one.tempo) and attach_tempos:
-                attachment_target = components[0]
-                leaves = select(attachment_target).leaves()
-                if isinstance(attachment_target, abjad.Container):
-                    attachment_target = leaves[0]
-                tempo = copy.copy(beat_two.tempo)
-                attach(tempo, attachment_target)
-            voice.extend(components)
+
+        # generate beats, comparing tempi
+        previous_beat = None
+        for beat in self.items:
+            voice.extend(self._notate_item(
+                beat,
+                previous_beat,
+                attach_tempos=attach_tempos,
+                ))
+            previous_beat = beat
 
         # apply logical ties, pitches, grace containers
         self._notate_leaves(
@@ -63,6 +50,24 @@ class BeatwiseQTarget(QTarget):
 
         return voice
 
+    def _notate_item(self, beat, previous_beat=None, attach_tempos=True):
+        import abjad
+        components = beat.q_grid(beat.beatspan)
+        if attach_tempos and (
+            previous_beat is None or
+            beat.tempo != previous_beat.tempo
+            ):
+            attachment_target = components[0]
+            leaves = select(attachment_target).leaves()
+            if isinstance(attachment_target, abjad.Container):
+                attachment_target = leaves[0]
+            tempo = copy.copy(beat.tempo)
+            attach(tempo, attachment_target)
+        return components
+
+    def _optimize_attack_points(self, components, attack_point_optimizer):
+        attack_point_optimizer(select(components))
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -25,31 +25,15 @@ class MeasurewiseQTarget(QTarget):
         import abjad
         voice = abjad.Voice()
 
-        # generate the first
-        q_target_measure = self.items[0]
-        measure = abjad.Measure(q_target_measure.time_signature)
-        for beat in q_target_measure.beats:
-            measure.extend(beat.q_grid(beat.beatspan))
-        if attach_tempos:
-            tempo = copy.copy(q_target_measure.tempo)
-            #abjad.attach(tempo, measure)
-            leaf = abjad.inspect(measure).get_leaf(0)
-            abjad.attach(tempo, leaf)
-        voice.append(measure)
-
-        # generate the rest pairwise, comparing tempi
-        pairs = abjad.sequence(self.items).nwise()
-        for q_target_measure_one, q_target_measure_two in pairs:
-            measure = abjad.Measure(q_target_measure_two.time_signature)
-            for beat in q_target_measure_two.beats:
-                measure.extend(beat.q_grid(beat.beatspan))
-            if ((q_target_measure_two.tempo != q_target_measure_one.tempo) and
-                attach_tempos):
-                tempo = copy.copy(q_target_measure_two.tempo)
-                #abjad.attach(tempo, measure)
-                leaf = abjad.inspect(measure).get_leaf(0)
-                abjad.attach(tempo, leaf)
-            voice.append(measure)
+        # generate measures, comparing tempi
+        previous_q_target_measure = None
+        for q_target_measure in self.items:
+            voice.extend(self._notate_item(
+                q_target_measure,
+                previous_q_target_measure,
+                attach_tempos=attach_tempos,
+                ))
+            previous_q_target_measure = q_target_measure
 
         # apply logical ties, pitches, grace containers
         self._notate_leaves(
@@ -58,11 +42,34 @@ class MeasurewiseQTarget(QTarget):
             )
 
         # partition logical ties in each measure
-        for measure in voice:
-            attack_point_optimizer(measure)
+        self._optimize_attack_points(voice[:], attack_point_optimizer)
 
         return voice
 
+    def _notate_item(
+        self,
+        q_target_measure,
+        previous_q_target_measure=None,
+        attach_tempos=True,
+        ):
+        import abjad
+        measure = abjad.Measure(q_target_measure.time_signature)
+        for beat in q_target_measure.beats:
+            measure.extend(beat.q_grid(beat.beatspan))
+        if attach_tempos and (
+            previous_q_target_measure is None or
+            q_target_measure.tempo != previous_q_target_measure.tempo
+            ):
+            tempo = copy.copy(q_target_measure.tempo)
+            #abjad.attach(tempo, measure)
+            leaf = abjad.inspect(measure).get_leaf(0)
+            abjad.attach(tempo, leaf)
+        return [measure]
+
+    def _optimize_attack_points(self, components, attack_point_optimizer):
+        for measure in components:
+            attack_point_optimizer(measure)
+
     ### PUBLIC PROPERTIES ###
 
     @property
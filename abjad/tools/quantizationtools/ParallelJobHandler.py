@@ -1,3 +1,4 @@
+import math
 import multiprocessing
 import pickle
 from abjad.tools.quantizationtools.JobHandler import JobHandler
@@ -6,37 +7,212 @@ from abjad.tools.quantizationtools.JobHandler import JobHandler
 class ParallelJobHandler(JobHandler):
     r'''Parallel job-handler.
 
+    ..  container:: example
+
+        >>> job_handler = abjad.quantizationtools.ParallelJobHandler(
+        ...     worker_count=2,
+        ...     chunk_size=4,
+        ...     )
+        >>> job_handler
+        ParallelJobHandler(worker_count=2, chunk_size=4)
+
     Processes ``QuantizationJob`` instances in parallel, based on the number of
     CPUs available.
+
+    Starts worker processes on first call and reuses them on later calls
+    until closed. Pass the same job-handler to many quantizer calls to avoid
+    starting new worker processes each time:
+
+    ::
+
+        >>> with abjad.quantizationtools.ParallelJobHandler() as job_handler: # doctest: +SKIP
+        ...     for q_event_sequence in q_event_sequences:
+        ...         result = quantizer(q_event_sequence, job_handler=job_handler)
+        ...
+
+    Sends consecutive jobs to workers in chunks, pickled with the highest
+    pickle protocol available.
     '''
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ()
+    __slots__ = (
+        '_chunk_size',
+        '_job_timings',
+        '_pool',
+        '_start_method',
+        '_worker_count',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, worker_count=None, chunk_size=None, start_method=None):
+        if worker_count is not None:
+            assert isinstance(worker_count, int), repr(worker_count)
+            assert 0 < worker_count, repr(worker_count)
+        if chunk_size is not None:
+            assert isinstance(chunk_size, int), repr(chunk_size)
+            assert 0 < chunk_size, repr(chunk_size)
+        if start_method is not None:
+            start_methods = multiprocessing.get_all_start_methods()
+            assert start_method in start_methods, repr(start_method)
+        self._chunk_size = chunk_size
+        self._job_timings = ()
+        self._pool = None
+        self._start_method = start_method
+        self._worker_count = worker_count
 
     ### SPECIAL METHODS ###
 
     def __call__(self, jobs):
         r'''Calls parallel job handler.
+
+        Returns finished jobs in order of `jobs`.
         '''
         from abjad.tools import quantizationtools
         finished_jobs = []
-        job_queue = multiprocessing.JoinableQueue()
-        result_queue = multiprocessing.Queue()
-        workers = [quantizationtools.ParallelJobHandlerWorker(
-            job_queue, result_queue)
-            for i in range(multiprocessing.cpu_count() * 2)]
-        for worker in workers:
-            worker.start()
-        for job in jobs:
-            job_queue.put(pickle.dumps(job, protocol=0))
-        for i in range(len(jobs)):
-            finished_jobs.append(pickle.loads(result_queue.get()))
-        for worker in workers:
-            job_queue.put(None)
-        job_queue.join()
-        result_queue.close()
-        job_queue.close()
-        for worker in workers:
-            worker.join()
+        job_timings = []
+        if jobs:
+            pool = self._get_pool()
+            payloads = [
+                pickle.dumps(chunk, protocol=pickle.HIGHEST_PROTOCOL)
+                for chunk in self._get_chunks(jobs)
+                ]
+            results = pool.imap(
+                quantizationtools.ParallelJobHandlerWorker._process_jobs,
+                payloads,
+                )
+            for result in results:
+                finished_chunk, timings = pickle.loads(result)
+                finished_jobs.extend(finished_chunk)
+                job_timings.extend(timings)
+        self._job_timings = tuple(job_timings)
         return finished_jobs
+
+    def __enter__(self):
+        r'''Enters parallel job handler.
+
+        Returns parallel job handler.
+        '''
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        r'''Exits parallel job handler and closes worker processes.
+
+        Returns none.
+        '''
+        self.close()
+
+    def __getstate__(self):
+        r'''Gets state of parallel job handler without worker processes.
+
+        Returns dictionary.
+        '''
+        state = JobHandler.__getstate__(self)
+        state['_pool'] = None
+        return state
+
+    ### PRIVATE METHODS ###
+
+    def _get_chunks(self, jobs):
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            chunk_count = 4 * self._get_worker_count()
+            chunk_size = int(math.ceil(len(jobs) / chunk_count))
+        jobs = list(jobs)
+        for i in range(0, len(jobs), chunk_size):
+            yield jobs[i:i + chunk_size]
+
+    def _get_pool(self):
+        if self._pool is None:
+            context = multiprocessing.get_context(self.start_method)
+            self._pool = context.Pool(processes=self._get_worker_count())
+        return self._pool
+
+    def _get_worker_count(self):
+        if self.worker_count is not None:
+            return self.worker_count
+        return multiprocessing.cpu_count()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def chunk_size(self):
+        r'''Gets number of consecutive jobs sent to worker at once.
+
+        ..  container:: example
+
+            >>> job_handler = abjad.quantizationtools.ParallelJobHandler()
+            >>> job_handler.chunk_size is None
+            True
+
+        Defaults to none. Jobs are then split into about four chunks per
+        worker process.
+
+        Returns positive integer or none.
+        '''
+        return self._chunk_size
+
+    @property
+    def job_timings(self):
+        r'''Gets seconds elapsed per job during last call, in order of
+        finished jobs.
+
+        ..  container:: example
+
+            >>> job_handler = abjad.quantizationtools.ParallelJobHandler()
+            >>> job_handler.job_timings
+            ()
+
+        Returns tuple of floats.
+        '''
+        return self._job_timings
+
+    @property
+    def start_method(self):
+        r'''Gets multiprocessing start method of worker processes.
+
+        ..  container:: example
+
+            >>> job_handler = abjad.quantizationtools.ParallelJobHandler(
+            ...     start_method='spawn',
+            ...     )
+            >>> job_handler.start_method
+            'spawn'
+
+        Defaults to none. Worker processes then start with the default
+        multiprocessing start method of the platform.
+
+        Returns string or none.
+        '''
+        return self._start_method
+
+    @property
+    def worker_count(self):
+        r'''Gets number of worker processes.
+
+        ..  container:: example
+
+            >>> job_handler = abjad.quantizationtools.ParallelJobHandler()
+            >>> job_handler.worker_count is None
+            True
+
+        Defaults to none. Worker count then equals CPU count.
+
+        Returns positive integer or none.
+        '''
+        return self._worker_count
+
+    ### PUBLIC METHODS ###
+
+    def close(self):
+        r'''Closes worker processes of parallel job handler.
+
+        Parallel job handler starts new worker processes when next called.
+
+        Returns none.
+        '''
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
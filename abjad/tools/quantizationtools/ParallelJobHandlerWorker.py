@@ -7,6 +7,9 @@ class ParallelJobHandlerWorker(multiprocessing.Process):
 
     Worker process which runs ``QuantizationJobs``.
 
+    Reads pickled lists of jobs from job queue and puts pickled pairs of
+    finished jobs and seconds elapsed per job on result queue.
+
     Not composer-safe.
 
     Used internally by ``ParallelJobHandler``.
@@ -21,6 +24,19 @@ class ParallelJobHandlerWorker(multiprocessing.Process):
         self.job_queue = job_queue
         self.result_queue = result_queue
 
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _process_jobs(payload):
+        import abjad
+        jobs = pickle.loads(payload)
+        timings = []
+        for job in jobs:
+            with abjad.Timer() as timer:
+                job()
+            timings.append(timer.elapsed_time)
+        return pickle.dumps((jobs, timings), protocol=pickle.HIGHEST_PROTOCOL)
+
     ### PUBLIC METHODS ###
 
     def run(self):
@@ -29,15 +45,12 @@ class ParallelJobHandlerWorker(multiprocessing.Process):
         Returns none.
         '''
         while True:
-            job = self.job_queue.get()
-            if job is None:
+            payload = self.job_queue.get()
+            if payload is None:
                 # poison pill causes worker shutdown
-                #print '{}: Exiting'.format(process_name)
                 self.job_queue.task_done()
                 break
-            #print '{}: {!r}'.format(process_name, job)
-            job = pickle.loads(job)
-            job()
+            result = self._process_jobs(payload)
             self.job_queue.task_done()
-            self.result_queue.put(pickle.dumps(job, protocol=0))
+            self.result_queue.put(result)
         return
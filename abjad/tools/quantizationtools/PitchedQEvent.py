@@ -39,7 +39,10 @@ class PitchedQEvent(QEvent):
     def __init__(self, offset=0, pitches=None, attachments=None, index=None):
         QEvent.__init__(self, offset=offset, index=index)
         pitches = pitches or []
-        pitches = tuple([pitchtools.NamedPitch(x) for x in pitches])
+        pitches = tuple([
+            x if type(x) is pitchtools.NamedPitch else pitchtools.NamedPitch(x)
+            for x in pitches
+            ])
         if attachments is None:
             attachments = ()
         else:
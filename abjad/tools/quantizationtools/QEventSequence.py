@@ -64,6 +64,8 @@ class QEventSequence(AbjadObject):
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        '_offsets',
+        '_pitches',
         '_sequence',
         )
 
@@ -79,7 +81,9 @@ class QEventSequence(AbjadObject):
             quantizationtools.SilentQEvent,
             )
         #sequence = sequence or []
+        self._pitches = None
         if sequence is None:
+            self._offsets = ()
             self._sequence = ()
             return
         else:
@@ -91,6 +95,7 @@ class QEventSequence(AbjadObject):
             offsets = abjad.sequence(offsets)
             assert offsets.is_increasing(strict=False)
             assert 0 <= sequence[0].offset
+            self._offsets = tuple(offsets)
             self._sequence = tuple(sequence)
 
     ### SPECIAL METHODS ###
@@ -100,7 +105,7 @@ class QEventSequence(AbjadObject):
 
         Returns true or false.
         '''
-        return argument in self._sequence
+        return argument in self.sequence
 
     def __eq__(self, argument):
         r'''Is true when q-event sequence equals `argument`. Otherwise false.
@@ -168,7 +173,9 @@ class QEventSequence(AbjadObject):
 
         Returns item or slice.
         '''
-        return self._sequence.__getitem__(argument)
+        if isinstance(argument, slice):
+            return self.sequence.__getitem__(argument)
+        return self._get_q_event(argument)
 
     def __hash__(self):
         r'''Hashes q-event sequence.
@@ -184,18 +191,41 @@ class QEventSequence(AbjadObject):
 
         Yields items.
         '''
-        for x in self._sequence:
-            yield x
+        for i in range(len(self)):
+            yield self._get_q_event(i)
 
     def __len__(self):
         r'''Length of q-event sequence.
 
         Returns nonnegative integer.
         '''
-        return len(self._sequence)
+        return len(self._offsets)
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _from_columns(class_, offsets, pitches):
+        import abjad
+        assert 1 < len(offsets)
+        assert len(offsets) == len(pitches) + 1
+        assert 0 <= offsets[0]
+        assert all(x <= y for x, y in zip(offsets, offsets[1:]))
+        named_pitches = {}
+        pitch_column = []
+        for pitches_ in pitches:
+            if pitches_ is not None:
+                pitches_ = tuple(pitches_)
+                if pitches_ not in named_pitches:
+                    named_pitches[pitches_] = tuple(
+                        abjad.NamedPitch(_) for _ in pitches_)
+                pitches_ = named_pitches[pitches_]
+            pitch_column.append(pitches_)
+        q_event_sequence = class_()
+        q_event_sequence._offsets = tuple(abjad.Offset(_) for _ in offsets)
+        q_event_sequence._pitches = tuple(pitch_column)
+        q_event_sequence._sequence = [None] * len(offsets)
+        return q_event_sequence
+
     def _get_format_specification(self):
         values = []
         if self.sequence:
@@ -206,6 +236,24 @@ class QEventSequence(AbjadObject):
             storage_format_kwargs_names=[],
             )
 
+    def _get_q_event(self, index):
+        from abjad.tools import quantizationtools
+        index = range(len(self))[index]
+        q_event = self._sequence[index]
+        if q_event is None:
+            offset = self._offsets[index]
+            if index == len(self) - 1:
+                q_event = quantizationtools.TerminalQEvent(offset)
+            elif self._pitches[index] is None:
+                q_event = quantizationtools.SilentQEvent(offset)
+            else:
+                q_event = quantizationtools.PitchedQEvent(
+                    offset,
+                    self._pitches[index],
+                    )
+            self._sequence[index] = q_event
+        return q_event
+
     ### PUBLIC METHODS ###
 
     @classmethod
@@ -249,7 +297,6 @@ class QEventSequence(AbjadObject):
         Returns ``QEventSequence`` instance.
         '''
         import abjad
-        from abjad.tools import quantizationtools
         if fuse_silences:
             durations = [
                 x for x in
@@ -259,19 +306,9 @@ class QEventSequence(AbjadObject):
         else:
             durations = milliseconds
         offsets = mathtools.cumulative_sums([abs(x) for x in durations])
-        q_events = []
-        for pair in zip(offsets, durations):
-            offset = abjad.Offset(pair[0])
-            duration = pair[1]
-            # negative duration indicates silence
-            if duration < 0:
-                q_event = quantizationtools.SilentQEvent(offset)
-            else:
-                q_event = quantizationtools.PitchedQEvent(offset, [0])
-            q_events.append(q_event)
-        q_events.append(quantizationtools.TerminalQEvent(
-            abjad.Offset(offsets[-1])))
-        return class_(q_events)
+        # negative duration indicates silence
+        pitches = [None if x < 0 else (0,) for x in durations]
+        return class_._from_columns(offsets, pitches)
 
     @classmethod
     def from_millisecond_offsets(class_, offsets):
@@ -321,11 +358,8 @@ class QEventSequence(AbjadObject):
 
         Returns ``QEventSequence`` instance.
         '''
-        from abjad.tools import quantizationtools
-        q_events = [quantizationtools.PitchedQEvent(x, [0])
-            for x in offsets[:-1]]
-        q_events.append(quantizationtools.TerminalQEvent(offsets[-1]))
-        return class_(q_events)
+        pitches = [(0,)] * (len(offsets) - 1)
+        return class_._from_columns(offsets, pitches)
 
     @classmethod
     def from_millisecond_pitch_pairs(class_, pairs):
@@ -373,8 +407,6 @@ class QEventSequence(AbjadObject):
 
         Returns ``QEventSequence`` instance.
         '''
-        import abjad
-        from abjad.tools import quantizationtools
         assert isinstance(pairs, collections.Iterable)
         assert all(isinstance(x, collections.Iterable) for x in pairs)
         assert all(len(x) == 2 for x in pairs)
@@ -396,21 +428,17 @@ class QEventSequence(AbjadObject):
                 groups.append((duration, None))
         # find offsets
         offsets = mathtools.cumulative_sums([abs(x[0]) for x in groups])
-        # build QEvents
-        q_events = []
-        for pair in zip(offsets, groups):
-            offset = abjad.Offset(pair[0])
-            pitches = pair[1][1]
-            if isinstance(pitches, collections.Iterable):
-                assert all(isinstance(x, numbers.Number) for x in pitches)
-                q_events.append(quantizationtools.PitchedQEvent(offset, pitches))
-            elif isinstance(pitches, type(None)):
-                q_events.append(quantizationtools.SilentQEvent(offset))
-            elif isinstance(pitches, numbers.Number):
-                q_events.append(quantizationtools.PitchedQEvent(offset, [pitches]))
-        q_events.append(quantizationtools.TerminalQEvent(
-            abjad.Offset(offsets[-1])))
-        return class_(q_events)
+        # find pitches
+        pitches = []
+        for pair in groups:
+            if isinstance(pair[1], collections.Iterable):
+                assert all(isinstance(x, numbers.Number) for x in pair[1])
+                pitches.append(pair[1])
+            elif isinstance(pair[1], numbers.Number):
+                pitches.append((pair[1],))
+            else:
+                pitches.append(pair[1])
+        return class_._from_columns(offsets, pitches)
 
     @classmethod
     def from_tempo_scaled_durations(class_, durations, tempo=None):
@@ -591,7 +619,34 @@ class QEventSequence(AbjadObject):
         Return ``Duration`` instance.
         '''
         import abjad
-        return abjad.Duration(self[-1].offset)
+        return abjad.Duration(self._offsets[-1])
+
+    @property
+    def offsets(self):
+        r'''Offsets in milliseconds of q-events.
+
+        >>> durations = (1000, -500, 1250, -500, 750)
+        >>> sequence = \
+        ...     abjad.quantizationtools.QEventSequence.from_millisecond_durations(
+        ...     durations)
+
+        >>> for offset in sequence.offsets:
+        ...     offset
+        ...
+        Offset(0, 1)
+        Offset(1000, 1)
+        Offset(1500, 1)
+        Offset(2750, 1)
+        Offset(3250, 1)
+        Offset(4000, 1)
+
+        Q-event sequences made from millisecond durations, offsets or
+        pitch-pairs store offsets and pitches of q-events and make q-events
+        only when first accessed.
+
+        Returns tuple of offsets.
+        '''
+        return self._offsets
 
     @property
     def sequence(self):
@@ -635,4 +690,7 @@ class QEventSequence(AbjadObject):
 
         Returns tuple.
         '''
+        if self._pitches is not None:
+            self._sequence = tuple(self)
+            self._pitches = None
         return self._sequence
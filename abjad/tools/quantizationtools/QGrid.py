@@ -178,18 +178,22 @@ class QGrid(AbjadObject):
         assert all(isinstance(x, quantizationtools.QEventProxy)
             for x in q_event_proxies)
         leaves, offsets = self.leaves, self.offsets
+        pairs = [(_.numerator, _.denominator) for _ in offsets]
         for q_event_proxy in q_event_proxies:
-            idx = bisect.bisect_left(offsets, q_event_proxy.offset)
-            if q_event_proxy.offset == offsets[idx]:
+            offset = q_event_proxy.offset
+            idx = bisect.bisect_left(offsets, offset)
+            if offset == offsets[idx]:
+                leaves[idx].q_event_proxies.append(q_event_proxy)
+                continue
+            # compare distances to left and right offsets in integers:
+            # right - offset < offset - left
+            left_n, left_d = pairs[idx - 1]
+            right_n, right_d = pairs[idx]
+            if ((left_n * right_d + right_n * left_d) * offset.denominator <
+                2 * offset.numerator * left_d * right_d):
                 leaves[idx].q_event_proxies.append(q_event_proxy)
             else:
-                left, right = offsets[idx - 1], offsets[idx]
-                left_diff = abs(left - q_event_proxy.offset)
-                right_diff = abs(right - q_event_proxy.offset)
-                if right_diff < left_diff:
-                    leaves[idx].q_event_proxies.append(q_event_proxy)
-                else:
-                    leaves[idx - 1].q_event_proxies.append(q_event_proxy)
+                leaves[idx - 1].q_event_proxies.append(q_event_proxy)
 
     def sort_q_events_by_index(self):
         r'''Sort ``QEventProxies`` attached to each ``QGridLeaf`` in a
@@ -1,5 +1,4 @@
 import abc
-import bisect
 from abjad.tools import datastructuretools
 from abjad.tools import indicatortools
 from abjad.tools import scoretools
@@ -47,7 +46,9 @@ class QTarget(AbjadObject):
         heuristic=None,
         job_handler=None,
         attack_point_optimizer=None,
-        attach_tempos=True
+        attach_tempos=True,
+        beam_width=None,
+        quantizer=None,
         ):
         r'''Calls q-target.
         '''
@@ -76,36 +77,27 @@ class QTarget(AbjadObject):
 
         # if next-to-last QEvent is silent, pop the TerminalQEvent,
         # in order to prevent rest-tuplets
-        q_events = q_event_sequence
+        q_event_count = len(q_event_sequence)
         if isinstance(q_event_sequence[-2], quantizationtools.SilentQEvent):
-            q_events = q_event_sequence[:-1]
+            q_event_count -= 1
 
-        # parcel QEvents out to each beat
+        # parcel QEvents out to each beat in one pass over sorted offsets
         beats = self.beats
         offsets = sorted([beat.offset_in_ms for beat in beats])
-        for q_event in q_events:
-            index = bisect.bisect(offsets, q_event.offset) - 1
+        index = 0
+        for i, offset in enumerate(q_event_sequence.offsets[:q_event_count]):
+            while index + 1 < len(offsets) and offsets[index + 1] <= offset:
+                index += 1
             beat = beats[index]
-            beat.q_events.append(q_event)
-
-        # generate QuantizationJobs and process with the JobHandler
-        jobs = [beat(i) for i, beat in enumerate(beats)]
-        jobs = [job for job in jobs if job]
-        jobs = job_handler(jobs)
-        for job in jobs:
-            beats[job.job_id]._q_grids = job.q_grids
-
-        #for i, beat in enumerate(beats):
-        #    print i, len(beat.q_grids)
-        #    for q_event in beat.q_events:
-        #        print '\t{}'.format(q_event.offset)
-
-        # select the best QGrid for each beat, according to the Heuristic
-        beats = heuristic(beats)
-
-        # shift QEvents attached to each QGrid's "next downbeat"
-        # over to the next QGrid's first leaf - the real downbeat
-        self._shift_downbeat_q_events_to_next_q_grid()
+            beat.q_events.append(q_event_sequence[i])
+
+        # quantize each beat and shift QEvents on each next downbeat
+        self._quantize(
+            heuristic=heuristic,
+            job_handler=job_handler,
+            beam_width=beam_width,
+            quantizer=quantizer,
+            )
 
         #  TODO: handle a final QGrid with QEvents attached to its
         #        next_downbeat.
@@ -121,6 +113,40 @@ class QTarget(AbjadObject):
 
     ### PRIVATE METHODS ###
 
+    def _cache_q_grids(self, jobs, keys, quantizer, heuristic):
+        beats = self.beats
+        searched_beats = [beats[job.job_id] for job in jobs]
+        if searched_beats:
+            heuristic(searched_beats)
+        q_grids = {}
+        for beat, job in zip(searched_beats, jobs):
+            key = keys[job.job_id][0]
+            q_grids[key] = quantizer._cache_q_grid(key, beat.q_grid)
+        searched_job_ids = set(job.job_id for job in jobs)
+        for job_id, (key, job) in keys.items():
+            beat = beats[job_id]
+            if job_id in searched_job_ids or beat.q_grids:
+                continue
+            q_grid = quantizer._get_cached_q_grid(key, q_grids[key])
+            q_grid.fit_q_events(job.q_event_proxies)
+            beat._q_grids = (q_grid,)
+
+    @staticmethod
+    def _get_q_grid_cache_key(job, beat, heuristic, beam_width):
+        offsets = sorted(
+            (_.offset.numerator, _.offset.denominator)
+            for _ in job.q_event_proxies
+            )
+        search_tree = job.search_tree
+        return (
+            tuple(offsets),
+            type(search_tree).__name__,
+            repr(search_tree.definition),
+            beat.beatspan,
+            beam_width,
+            heuristic,
+            )
+
     @abc.abstractmethod
     def _notate(
         self,
@@ -180,6 +206,43 @@ class QTarget(AbjadObject):
                 abjad.detach(indicatortools.MetronomeMark, leaf)
                 abjad.attach(tempo, new_leaf)
 
+    def _quantize(
+        self,
+        heuristic=None,
+        job_handler=None,
+        beam_width=None,
+        quantizer=None,
+        ):
+        beats = self.beats
+
+        # generate QuantizationJobs and process with the JobHandler,
+        # reusing the quantizer's q-grids for beats with known attack patterns
+        jobs = [
+            beat(i, beam_width=beam_width)
+            for i, beat in enumerate(beats)
+            ]
+        jobs = [job for job in jobs if job]
+        if quantizer is not None:
+            jobs, keys = self._use_cached_q_grids(
+                jobs, quantizer, heuristic, beam_width)
+        jobs = job_handler(jobs)
+        for job in jobs:
+            beats[job.job_id]._q_grids = job.q_grids
+        if quantizer is not None:
+            self._cache_q_grids(jobs, keys, quantizer, heuristic)
+
+        #for i, beat in enumerate(beats):
+        #    print i, len(beat.q_grids)
+        #    for q_event in beat.q_events:
+        #        print '\t{}'.format(q_event.offset)
+
+        # select the best QGrid for each beat, according to the Heuristic
+        beats = heuristic(beats)
+
+        # shift QEvents attached to each QGrid's "next downbeat"
+        # over to the next QGrid's first leaf - the real downbeat
+        self._shift_downbeat_q_events_to_next_q_grid()
+
     def _shift_downbeat_q_events_to_next_q_grid(self):
         import abjad
         beats = self.beats
@@ -189,6 +252,28 @@ class QTarget(AbjadObject):
             while one_q_events:
                 two_q_events.append(one_q_events.pop())
 
+    def _use_cached_q_grids(self, jobs, quantizer, heuristic, beam_width):
+        beats = self.beats
+        heuristic = format(heuristic)
+        keys = {}
+        searched_keys = set()
+        searched_jobs = []
+        for job in jobs:
+            beat = beats[job.job_id]
+            key = self._get_q_grid_cache_key(
+                job, beat, heuristic, beam_width)
+            keys[job.job_id] = (key, job)
+            if key in searched_keys:
+                continue
+            q_grid = quantizer._get_cached_q_grid(key)
+            if q_grid is None:
+                searched_keys.add(key)
+                searched_jobs.append(job)
+                continue
+            q_grid.fit_q_events(job.q_event_proxies)
+            beat._q_grids = (q_grid,)
+        return searched_jobs, keys
+
     ### PUBLIC PROPERTIES ###
 
     @abc.abstractproperty
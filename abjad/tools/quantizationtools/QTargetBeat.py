@@ -96,7 +96,7 @@ class QTargetBeat(AbjadObject):
 
     ### SPECIAL METHODS ###
 
-    def __call__(self, job_id):
+    def __call__(self, job_id, beam_width=None):
         r'''Calls q-target beat.
 
         Returns quantization job.
@@ -106,16 +106,18 @@ class QTargetBeat(AbjadObject):
             return None
         assert all(isinstance(x, quantizationtools.QEvent)
             for x in self.q_events)
-        q_event_proxies = []
-        for q_event in self.q_events:
-            q_event_proxy = quantizationtools.QEventProxy(
-                q_event,
-                self.offset_in_ms,
-                self.offset_in_ms + self.duration_in_ms,
-                )
-            q_event_proxies.append(q_event_proxy)
+        minimum = self.offset_in_ms
+        maximum = minimum + self.duration_in_ms
+        q_event_proxies = [
+            quantizationtools.QEventProxy(q_event, minimum, maximum)
+            for q_event in self.q_events
+            ]
         return quantizationtools.QuantizationJob(
-            job_id, self.search_tree, q_event_proxies)
+            job_id,
+            self.search_tree,
+            q_event_proxies,
+            beam_width=beam_width,
+            )
 
     def __format__(self, format_specification=''):
         r'''Formats q-event.
@@ -44,6 +44,8 @@ class QuantizationJob(AbjadObject):
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        '_beam_width',
+        '_explored_node_count',
         '_job_id',
         '_q_event_proxies',
         '_q_grids',
@@ -58,6 +60,7 @@ class QuantizationJob(AbjadObject):
         search_tree=None,
         q_event_proxies=None,
         q_grids=None,
+        beam_width=None,
         ):
         from abjad.tools import quantizationtools
         search_tree = search_tree or quantizationtools.UnweightedSearchTree()
@@ -78,6 +81,11 @@ class QuantizationJob(AbjadObject):
                 for x in q_grids
                 )
             self._q_grids = tuple(q_grids)
+        if beam_width is not None:
+            assert isinstance(beam_width, int), repr(beam_width)
+            assert 0 < beam_width, repr(beam_width)
+        self._beam_width = beam_width
+        self._explored_node_count = 0
 
     ### SPECIAL METHODS ###
 
@@ -95,6 +103,10 @@ class QuantizationJob(AbjadObject):
 
         #print(format(q_grid))
 
+        if self.beam_width is not None:
+            self._q_grids = self._search_with_bounds(q_grid)
+            return
+
         old_q_grids = []
         new_q_grids = [q_grid]
 
@@ -111,6 +123,7 @@ class QuantizationJob(AbjadObject):
         #    print('\t', q_grid)
         #print()
 
+        self._explored_node_count = len(old_q_grids)
         self._q_grids = tuple(old_q_grids)
 
     def __eq__(self, argument):
@@ -137,8 +150,135 @@ class QuantizationJob(AbjadObject):
         '''
         return super(QuantizationJob, self).__hash__()
 
+    ### PRIVATE METHODS ###
+
+    def _get_lower_bound(self, q_grid):
+        # proxies between leaves which search tree can not subdivide keep
+        # their distance in every q-grid found by subdividing q-grid
+        indices, _ = \
+            self.search_tree._find_divisible_leaf_indices_and_subdivisions(
+                q_grid)
+        indices = set(indices)
+        count = 0
+        absolute_distance = 0
+        for i, (leaf, offset) in enumerate(zip(q_grid.leaves, q_grid.offsets)):
+            for q_event_proxy in leaf.q_event_proxies:
+                count += 1
+                if q_event_proxy.offset < offset:
+                    if i - 1 in indices:
+                        continue
+                elif i in indices:
+                    continue
+                absolute_distance += abs(q_event_proxy.offset - offset)
+        if count:
+            return absolute_distance / count
+        return 0
+
+    def _search_with_bounds(self, q_grid):
+        beam_width = self.beam_width
+        best_distance = None
+        candidates = []
+        explored_node_count = 0
+        new_q_grids = [q_grid]
+        rtm_formats = set()
+        while new_q_grids:
+            frontier = []
+            for q_grid in new_q_grids:
+                rtm_format = q_grid.rtm_format
+                if rtm_format in rtm_formats:
+                    continue
+                rtm_formats.add(rtm_format)
+                explored_node_count += 1
+                distance = q_grid.distance or 0
+                leaf_count = len(q_grid.leaves)
+                key = (distance, leaf_count, explored_node_count)
+                candidates.append((key, q_grid))
+                if best_distance is None or distance < best_distance:
+                    best_distance = distance
+                lower_bound = self._get_lower_bound(q_grid)
+                frontier.append(((lower_bound,) + key, q_grid))
+            candidates.sort(key=lambda x: x[0])
+            del(candidates[beam_width:])
+            frontier = [_ for _ in frontier if _[0][0] <= best_distance]
+            frontier.sort(key=lambda x: x[0])
+            del(frontier[beam_width:])
+            new_q_grids = []
+            for _, q_grid in frontier:
+                new_q_grids.extend(self.search_tree(q_grid))
+        self._explored_node_count = explored_node_count
+        return tuple(_[1] for _ in candidates)
+
     ### PUBLIC PROPERTIES ###
 
+    @property
+    def beam_width(self):
+        r'''Gets beam width of quantization job.
+
+        ..  container:: example
+
+            Keeps at most `beam_width` q-grids at each depth of search and
+            at most `beam_width` best q-grids found. Does not subdivide
+            q-grids whose distance can not become less than that of best
+            q-grid found, and skips q-grids with RTM format equal to that of
+            q-grid already found:
+
+            >>> q_event_a = abjad.quantizationtools.PitchedQEvent(250, [0, 1])
+            >>> q_event_b = abjad.quantizationtools.SilentQEvent(500)
+            >>> q_event_c = abjad.quantizationtools.PitchedQEvent(750, [3, 7])
+            >>> proxy_a = abjad.quantizationtools.QEventProxy(q_event_a, 0.25)
+            >>> proxy_b = abjad.quantizationtools.QEventProxy(q_event_b, 0.5)
+            >>> proxy_c = abjad.quantizationtools.QEventProxy(q_event_c, 0.75)
+
+            >>> definition = {2: {2: None}, 3: None, 5: None}
+            >>> search_tree = abjad.quantizationtools.UnweightedSearchTree(definition)
+
+            >>> job = abjad.quantizationtools.QuantizationJob(
+            ...     1, search_tree, [proxy_a, proxy_b, proxy_c], beam_width=2)
+            >>> job()
+            >>> for q_grid in job.q_grids:
+            ...     print(q_grid.rtm_format)
+            (1 ((1 (1 1)) (1 (1 1))))
+            (1 (1 1 1 1 1))
+
+            >>> job.explored_node_count
+            5
+
+        Defaults to none. Quantization job then keeps every q-grid found.
+
+        Returns positive integer or none.
+        '''
+        return self._beam_width
+
+    @property
+    def explored_node_count(self):
+        r'''Gets number of q-grids explored when quantization job was last
+        called.
+
+        ..  container:: example
+
+            >>> q_event_a = abjad.quantizationtools.PitchedQEvent(250, [0, 1])
+            >>> q_event_b = abjad.quantizationtools.SilentQEvent(500)
+            >>> q_event_c = abjad.quantizationtools.PitchedQEvent(750, [3, 7])
+            >>> proxy_a = abjad.quantizationtools.QEventProxy(q_event_a, 0.25)
+            >>> proxy_b = abjad.quantizationtools.QEventProxy(q_event_b, 0.5)
+            >>> proxy_c = abjad.quantizationtools.QEventProxy(q_event_c, 0.75)
+
+            >>> definition = {2: {2: None}, 3: None, 5: None}
+            >>> search_tree = abjad.quantizationtools.UnweightedSearchTree(definition)
+
+            >>> job = abjad.quantizationtools.QuantizationJob(
+            ...     1, search_tree, [proxy_a, proxy_b, proxy_c])
+            >>> job.explored_node_count
+            0
+
+            >>> job()
+            >>> job.explored_node_count
+            5
+
+        Returns nonnegative integer.
+        '''
+        return self._explored_node_count
+
     @property
     def job_id(self):
         r'''The job id of the ``QuantizationJob``.
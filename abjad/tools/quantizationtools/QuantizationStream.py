@@ -0,0 +1,232 @@
+import bisect
+import collections
+from abjad.tools.abctools.AbjadObject import AbjadObject
+
+
+class QuantizationStream(AbjadObject):
+    r'''Quantization stream.
+
+    ..  container:: example
+
+        Quantizes q-events one at a time:
+
+        >>> stream = abjad.quantizationtools.QuantizationStream()
+        >>> q_event_sequence = \
+        ...     abjad.quantizationtools.QEventSequence.from_millisecond_durations(
+        ...     [2000, 2000, 2000, 2000, 1000])
+        >>> for q_event in q_event_sequence:
+        ...     for measure in stream.push(q_event):
+        ...         abjad.f(measure)
+        ...
+        {   % measure
+            \time 4/4
+            \tempo 4=60
+            c'2
+            c'2
+        }   % measure
+
+        >>> for measure in stream.close():
+        ...     abjad.f(measure)
+        ...
+        {   % measure
+            \time 4/4
+            c'2
+            c'2
+        }   % measure
+        {   % measure
+            \time 4/4
+            c'4
+            r4
+            r4
+            r4
+        }   % measure
+
+    Makes target items of q-schema as q-events arrive. Quantizes and notates
+    each target item once a q-event arrives after it. Returns notated
+    components once no tie crosses from them into components not yet
+    returned, so that returned components equal those the quantizer makes
+    for the whole q-event sequence at once.
+
+    Holds only target items and components not yet returned.
+
+    Used internally by ``Quantizer.iterate()``.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        '_attach_tempos',
+        '_attack_point_optimizer',
+        '_beam_width',
+        '_grace_handler',
+        '_heuristic',
+        '_item_index',
+        '_item_offset_in_ms',
+        '_job_handler',
+        '_last_beat',
+        '_last_item',
+        '_last_q_event',
+        '_pending_items',
+        '_q_schema',
+        '_quantizer',
+        '_voice',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        q_schema=None,
+        grace_handler=None,
+        heuristic=None,
+        job_handler=None,
+        attack_point_optimizer=None,
+        attach_tempos=True,
+        beam_width=None,
+        quantizer=None,
+        ):
+        import abjad
+        from abjad.tools import quantizationtools
+        if q_schema is None:
+            q_schema = quantizationtools.MeasurewiseQSchema()
+        assert isinstance(q_schema, quantizationtools.QSchema)
+        if grace_handler is None:
+            grace_handler = quantizationtools.ConcatenatingGraceHandler()
+        assert isinstance(grace_handler, quantizationtools.GraceHandler)
+        if heuristic is None:
+            heuristic = quantizationtools.DistanceHeuristic()
+        assert isinstance(heuristic, quantizationtools.Heuristic)
+        if job_handler is None:
+            job_handler = quantizationtools.SerialJobHandler()
+        assert isinstance(job_handler, quantizationtools.JobHandler)
+        if attack_point_optimizer is None:
+            attack_point_optimizer = \
+                quantizationtools.NaiveAttackPointOptimizer()
+        assert isinstance(
+            attack_point_optimizer, quantizationtools.AttackPointOptimizer)
+        if quantizer is not None:
+            assert isinstance(quantizer, quantizationtools.Quantizer)
+        self._attach_tempos = bool(attach_tempos)
+        self._attack_point_optimizer = attack_point_optimizer
+        self._beam_width = beam_width
+        self._grace_handler = grace_handler
+        self._heuristic = heuristic
+        self._item_index = 0
+        self._item_offset_in_ms = abjad.Offset(0)
+        self._job_handler = job_handler
+        self._last_beat = None
+        self._last_item = None
+        self._last_q_event = None
+        self._pending_items = collections.deque()
+        self._q_schema = q_schema
+        self._quantizer = quantizer
+        self._voice = abjad.Voice()
+
+    ### PRIVATE METHODS ###
+
+    def _make_items(self, offset, include_offset=True):
+        q_schema = self._q_schema
+        while (self._item_offset_in_ms < offset or
+            (include_offset and self._item_offset_in_ms == offset)):
+            lookup = q_schema[self._item_index]
+            lookup['offset_in_ms'] = self._item_offset_in_ms
+            item = q_schema.target_item_class(**lookup)
+            self._pending_items.append(item)
+            self._item_offset_in_ms += item.duration_in_ms
+            self._item_index += 1
+
+    def _notate_item(self, item):
+        import abjad
+        q_target = self._q_schema.target_class([item])
+        q_target._quantize(
+            heuristic=self._heuristic,
+            job_handler=self._job_handler,
+            beam_width=self._beam_width,
+            quantizer=self._quantizer,
+            )
+        beats = q_target.beats
+        if self._last_beat is not None:
+            one_q_events = self._last_beat.q_grid.next_downbeat.q_event_proxies
+            two_q_events = beats[0].q_grid.leaves[0].q_event_proxies
+            while one_q_events:
+                two_q_events.append(one_q_events.pop())
+        components = q_target._notate_item(
+            item,
+            self._last_item,
+            attach_tempos=self._attach_tempos,
+            )
+        self._last_beat = beats[-1]
+        self._last_item = item
+        self._voice.extend(components)
+        q_target._notate_leaves(
+            grace_handler=self._grace_handler,
+            voice=abjad.select(components),
+            )
+        return q_target
+
+    def _pop_components(self, q_target, close=False):
+        import abjad
+        voice = self._voice
+        boundary = None
+        if not close:
+            for boundary in reversed(voice[1:]):
+                leaf = abjad.inspect(boundary).get_leaf(0)
+                if abjad.inspect(leaf).get_logical_tie().head is leaf:
+                    break
+            else:
+                return []
+        stop = len(voice) if boundary is None else voice.index(boundary)
+        q_target._optimize_attack_points(
+            voice[:stop],
+            self._attack_point_optimizer,
+            )
+        # attack-point optimizer may fuse leaves in front of boundary
+        stop = len(voice) if boundary is None else voice.index(boundary)
+        components = list(voice[:stop])
+        del(voice[:stop])
+        return components
+
+    ### PUBLIC METHODS ###
+
+    def close(self):
+        r'''Closes quantization stream.
+
+        Quantizes and notates remaining target items.
+
+        Returns list of components.
+        '''
+        q_target = None
+        while self._pending_items:
+            q_target = self._notate_item(self._pending_items.popleft())
+        if q_target is None:
+            return []
+        return self._pop_components(q_target, close=True)
+
+    def push(self, q_event):
+        r'''Pushes `q_event` onto quantization stream.
+
+        Q-events must be pushed in order of offset.
+
+        Returns list of components that q-event completes.
+        '''
+        from abjad.tools import quantizationtools
+        assert isinstance(q_event, quantizationtools.QEvent), repr(q_event)
+        if self._last_q_event is not None:
+            assert self._last_q_event.offset <= q_event.offset, repr(q_event)
+        is_terminal = isinstance(q_event, quantizationtools.TerminalQEvent)
+        self._make_items(q_event.offset, include_offset=not is_terminal)
+        # if last QEvent is silent, drop the TerminalQEvent,
+        # in order to prevent rest-tuplets
+        if self._pending_items and not (is_terminal and isinstance(
+            self._last_q_event, quantizationtools.SilentQEvent)):
+            beats = self._q_schema.target_class(
+                [self._pending_items[-1]]).beats
+            offsets = [beat.offset_in_ms for beat in beats]
+            index = bisect.bisect(offsets, q_event.offset) - 1
+            beats[index].q_events.append(q_event)
+        self._last_q_event = q_event
+        components = []
+        while 1 < len(self._pending_items):
+            q_target = self._notate_item(self._pending_items.popleft())
+            components.extend(self._pop_components(q_target))
+        return components
@@ -1,3 +1,5 @@
+import collections
+import copy
 from abjad.tools.abctools.AbjadObject import AbjadObject
 
 
@@ -232,6 +234,17 @@ class Quantizer(AbjadObject):
           Options currently include ``MeasurewiseAttackPointOptimizer``,
           ``NaiveAttackPointOptimizer`` and ``NullAttackPointOptimizer``.
 
+        * ``beam_width``: a positive integer bounds the search for ``QGrids``
+          in each beat, keeping at most that many ``QGrids`` at each depth of
+          the search tree. Defaults to none, searching every ``QGrid``.
+
+    Quantizers remember the winning ``QGrid`` of beats they have quantized,
+    keyed by the offsets of the attack-points in the beat, the search tree,
+    the beat duration, the beam width and the heuristic. Beats with the same
+    attack pattern reuse the remembered ``QGrid`` instead of searching again.
+    At most ``cache_size`` ``QGrids`` are remembered; the least recently used
+    are forgotten first.
+
     Refer to the reference pages for ``BeatwiseQSchema`` and
     ``MeasurewiseQSchema`` for more information on controlling the
     ``Quantizer``'s output, and to the reference on ``SearchTree`` for
@@ -240,12 +253,22 @@ class Quantizer(AbjadObject):
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ()
+    __slots__ = (
+        '_cache',
+        '_cache_hit_count',
+        '_cache_miss_count',
+        '_cache_size',
+        )
 
     ### INITIALIZER ###
 
-    def __init__(self):
-        pass
+    def __init__(self, cache_size=1024):
+        assert isinstance(cache_size, int), repr(cache_size)
+        assert 0 <= cache_size, repr(cache_size)
+        self._cache = collections.OrderedDict()
+        self._cache_hit_count = 0
+        self._cache_miss_count = 0
+        self._cache_size = cache_size
 
     ### SPECIAL METHODS ###
 
@@ -258,6 +281,7 @@ class Quantizer(AbjadObject):
         job_handler=None,
         attack_point_optimizer=None,
         attach_tempos=True,
+        beam_width=None,
         ):
         r'''Calls quantizer.
 
@@ -280,6 +304,216 @@ class Quantizer(AbjadObject):
             job_handler=job_handler,
             attack_point_optimizer=attack_point_optimizer,
             attach_tempos=attach_tempos,
+            beam_width=beam_width,
+            quantizer=self if self.cache_size else None,
             )
 
         return notation
+
+    ### PRIVATE METHODS ###
+
+    def _cache_q_grid(self, key, q_grid):
+        q_grid = copy.copy(q_grid)
+        for leaf in q_grid.leaves:
+            del(leaf.q_event_proxies[:])
+        self._cache[key] = q_grid
+        self._cache.move_to_end(key)
+        while self.cache_size < len(self._cache):
+            self._cache.popitem(last=False)
+        return q_grid
+
+    def _get_cached_q_grid(self, key, default=None):
+        q_grid = self._cache.get(key)
+        if q_grid is not None:
+            self._cache.move_to_end(key)
+        else:
+            q_grid = default
+        if q_grid is None:
+            self._cache_miss_count += 1
+            return None
+        self._cache_hit_count += 1
+        return copy.copy(q_grid)
+
+    def _make_stream(self, **keywords):
+        from abjad.tools import quantizationtools
+        return quantizationtools.QuantizationStream(
+            quantizer=self if self.cache_size else None,
+            **keywords
+            )
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def cache_hit_count(self):
+        r'''Gets number of beats quantized with remembered q-grid.
+
+        ..  container:: example
+
+            >>> quantizer = abjad.quantizationtools.Quantizer()
+            >>> durations = [250] * 16
+            >>> q_event_sequence = \
+            ...     abjad.quantizationtools.QEventSequence.from_millisecond_durations(
+            ...     durations)
+            >>> result = quantizer(q_event_sequence)
+            >>> quantizer.cache_hit_count
+            2
+
+            >>> quantizer.cache_miss_count
+            2
+
+        Returns nonnegative integer.
+        '''
+        return self._cache_hit_count
+
+    @property
+    def cache_miss_count(self):
+        r'''Gets number of beats quantized by searching q-grids.
+
+        Returns nonnegative integer.
+        '''
+        return self._cache_miss_count
+
+    @property
+    def cache_size(self):
+        r'''Gets maximum number of q-grids remembered by quantizer.
+
+        ..  container:: example
+
+            >>> quantizer = abjad.quantizationtools.Quantizer()
+            >>> quantizer.cache_size
+            1024
+
+        Set to zero to search q-grids of every beat.
+
+        Returns nonnegative integer.
+        '''
+        return self._cache_size
+
+    ### PUBLIC METHODS ###
+
+    def clear_cache(self):
+        r'''Forgets remembered q-grids and resets cache counts.
+
+        Returns none.
+        '''
+        self._cache.clear()
+        self._cache_hit_count = 0
+        self._cache_miss_count = 0
+
+    def iterate(
+        self,
+        q_events,
+        q_schema=None,
+        grace_handler=None,
+        heuristic=None,
+        job_handler=None,
+        attack_point_optimizer=None,
+        attach_tempos=True,
+        beam_width=None,
+        ):
+        r'''Iterates components quantized from `q_events` as q-events arrive.
+
+        ..  container:: example
+
+            >>> quantizer = abjad.quantizationtools.Quantizer()
+            >>> q_events = \
+            ...     abjad.quantizationtools.QEventSequence.from_millisecond_durations(
+            ...     [1500, 1500, 1500])
+            >>> for measure in quantizer.iterate(iter(q_events)):
+            ...     abjad.f(measure)
+            ...
+            {   % measure
+                \time 4/4
+                \tempo 4=60
+                c'4.
+                c'4.
+                c'4
+                ~
+            }   % measure
+            {   % measure
+                \time 4/4
+                c'8
+                r8
+                r4
+                r4
+                r4
+            }   % measure
+
+        Reads `q_events` one at a time, in order of offset. Yields each
+        component once later q-events can no longer change it. Components
+        equal those returned by calling quantizer on all q-events at once.
+
+        Holds only target items and components not yet yielded, so that
+        memory use does not grow with length of `q_events`.
+
+        Returns generator.
+        '''
+        stream = self._make_stream(
+            q_schema=q_schema,
+            grace_handler=grace_handler,
+            heuristic=heuristic,
+            job_handler=job_handler,
+            attack_point_optimizer=attack_point_optimizer,
+            attach_tempos=attach_tempos,
+            beam_width=beam_width,
+            )
+        for q_event in q_events:
+            yield from stream.push(q_event)
+        yield from stream.close()
+
+    async def iterate_async(
+        self,
+        q_events,
+        q_schema=None,
+        grace_handler=None,
+        heuristic=None,
+        job_handler=None,
+        attack_point_optimizer=None,
+        attach_tempos=True,
+        beam_width=None,
+        ):
+        r'''Iterates components quantized from asynchronous `q_events` as
+        q-events arrive.
+
+        ..  container:: example
+
+            >>> import asyncio
+            >>> quantizer = abjad.quantizationtools.Quantizer()
+            >>> q_event_sequence = \
+            ...     abjad.quantizationtools.QEventSequence.from_millisecond_durations(
+            ...     [1500, 1500, 1500])
+            >>> async def receive():
+            ...     for q_event in q_event_sequence:
+            ...         yield q_event
+            ...
+            >>> async def notate():
+            ...     measures = []
+            ...     async for measure in quantizer.iterate_async(receive()):
+            ...         measures.append(measure)
+            ...     return measures
+            ...
+            >>> loop = asyncio.new_event_loop()
+            >>> measures = loop.run_until_complete(notate())
+            >>> loop.close()
+            >>> len(measures)
+            2
+
+        Same as ``Quantizer.iterate()`` but reads `q_events` from asynchronous
+        iterable, such as q-events received from live input.
+
+        Returns asynchronous generator.
+        '''
+        stream = self._make_stream(
+            q_schema=q_schema,
+            grace_handler=grace_handler,
+            heuristic=heuristic,
+            job_handler=job_handler,
+            attack_point_optimizer=attack_point_optimizer,
+            attach_tempos=attach_tempos,
+            beam_width=beam_width,
+            )
+        async for q_event in q_events:
+            for component in stream.push(q_event):
+                yield component
+        for component in stream.close():
+            yield component
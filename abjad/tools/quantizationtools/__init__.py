@@ -30,6 +30,7 @@ from .QGridLeaf import QGridLeaf
 from .QTargetBeat import QTargetBeat
 from .QTargetMeasure import QTargetMeasure
 from .QuantizationJob import QuantizationJob
+from .QuantizationStream import QuantizationStream
 from .Quantizer import Quantizer
 from .SearchTree import SearchTree
 from .SerialJobHandler import SerialJobHandler
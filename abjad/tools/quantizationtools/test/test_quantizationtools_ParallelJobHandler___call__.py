@@ -87,3 +87,50 @@ def test_quantizationtools_ParallelJobHandler___call___02():
 
     assert sorted(a_jobs[0].q_grids, key=lambda x: x.root_node.rtm_format) == \
         sorted(b_jobs[0].q_grids, key=lambda x: x.root_node.rtm_format)
+
+
+def test_quantizationtools_ParallelJobHandler___call___03():
+    r'''Reuses worker processes across calls, keeps order of chunked jobs and
+    times each job.
+    '''
+
+    search_tree = quantizationtools.UnweightedSearchTree({2: None, 3: None})
+    jobs = []
+    for job_id in range(7):
+        q_event_proxies = [
+            quantizationtools.QEventProxy(
+                quantizationtools.SilentQEvent(0, index=1), 0, 1),
+            quantizationtools.QEventProxy(
+                quantizationtools.SilentQEvent((job_id + 1, 8), index=2), 0, 1),
+            ]
+        job = quantizationtools.QuantizationJob(
+            job_id, search_tree, q_event_proxies)
+        jobs.append(job)
+    serial_jobs = quantizationtools.SerialJobHandler()(
+        [abjad.new(_) for _ in jobs])
+    serial_rtms = [
+        [q_grid.root_node.rtm_format for q_grid in job.q_grids]
+        for job in serial_jobs
+        ]
+
+    job_handler = quantizationtools.ParallelJobHandler(
+        worker_count=2,
+        chunk_size=3,
+        )
+    with job_handler:
+        parallel_jobs = job_handler(jobs)
+        pool = job_handler._pool
+        finished_jobs = job_handler(jobs[:2])
+        assert job_handler._pool is pool
+        assert len(job_handler.job_timings) == 2
+    assert job_handler._pool is None
+
+    assert [_.job_id for _ in finished_jobs] == [0, 1]
+    assert [_.job_id for _ in parallel_jobs] == list(range(7))
+    parallel_rtms = [
+        [q_grid.root_node.rtm_format for q_grid in job.q_grids]
+        for job in parallel_jobs
+        ]
+    assert parallel_rtms == serial_rtms
+    assert job_handler([]) == []
+    assert job_handler.job_timings == ()
@@ -313,3 +313,25 @@ def test_quantizationtools_QEventSequence_from_millisecond_durations_03():
             abjad.Offset(600)
             )
     ))
+
+
+def test_quantizationtools_QEventSequence_from_millisecond_durations_04():
+    r'''Makes q-events only when first accessed.
+    '''
+
+    durations = [100, -100, 100, -100, 100]
+    q_events = quantizationtools.QEventSequence.from_millisecond_durations(
+        durations)
+
+    assert len(q_events) == 6
+    assert q_events.offsets == (0, 100, 200, 300, 400, 500)
+    assert q_events.duration_in_ms == 500
+    assert q_events[-1] == quantizationtools.TerminalQEvent(500)
+    assert q_events[-1] is q_events[5]
+    assert q_events[1:3] == (
+        quantizationtools.SilentQEvent(100),
+        quantizationtools.PitchedQEvent(200, [0]),
+        )
+    assert q_events[0].pitches[0] is q_events[2].pitches[0]
+    assert list(q_events) == list(q_events.sequence)
+    assert q_events == quantizationtools.QEventSequence(q_events.sequence)
@@ -26,3 +26,64 @@ def test_quantizationtools_QGrid_fit_q_events_01():
     assert q_grid.leaves[0].q_event_proxies == [a, b]
     assert q_grid.leaves[1].q_event_proxies == [c, d, e]
     assert q_grid.leaves[2].q_event_proxies == [g, f]
+
+
+def test_quantizationtools_QGrid_fit_q_events_02():
+    r'''Fits q-events to nearest leaf, and to left leaf when equally near.
+    '''
+
+    q_grid = quantizationtools.QGrid()
+    q_grid.subdivide_leaves([(0, (1, 1, 1))])
+    q_grid.subdivide_leaves([(1, (1, 1))])
+    assert q_grid.offsets == (
+        abjad.Offset(0),
+        abjad.Offset(1, 3),
+        abjad.Offset(1, 2),
+        abjad.Offset(2, 3),
+        abjad.Offset(1),
+        )
+
+    offsets = [
+        0, (1, 12), (1, 6), (1, 5), (1, 3), (5, 12),
+        (1, 2), (7, 12), (2, 3), (5, 6), (11, 12), 1,
+        ]
+    proxies = []
+    for offset in offsets:
+        q_event = quantizationtools.SilentQEvent(offset)
+        proxies.append(quantizationtools.QEventProxy(q_event, offset))
+    q_grid.fit_q_events(proxies)
+
+    assert q_grid.leaves[0].q_event_proxies == proxies[0:3]
+    assert q_grid.leaves[1].q_event_proxies == proxies[3:6]
+    assert q_grid.leaves[2].q_event_proxies == proxies[6:8]
+    assert q_grid.leaves[3].q_event_proxies == proxies[8:10]
+    assert q_grid.leaves[4].q_event_proxies == proxies[10:12]
+
+
+def test_quantizationtools_QGrid_fit_q_events_03():
+    r'''Fits q-events to nearest leaf of unevenly subdivided grid.
+    '''
+
+    q_grid = quantizationtools.QGrid()
+    q_grid.subdivide_leaves([(0, (1, 1))])
+    q_grid.subdivide_leaves([(0, (1, 1, 1))])
+    assert q_grid.offsets == (
+        abjad.Offset(0),
+        abjad.Offset(1, 6),
+        abjad.Offset(1, 3),
+        abjad.Offset(1, 2),
+        abjad.Offset(1),
+        )
+
+    offsets = [(1, 12), (1, 8), (1, 4), (1, 3), (5, 12), (3, 4), (4, 5), 1]
+    proxies = []
+    for offset in offsets:
+        q_event = quantizationtools.SilentQEvent(offset)
+        proxies.append(quantizationtools.QEventProxy(q_event, offset))
+    q_grid.fit_q_events(proxies)
+
+    assert q_grid.leaves[0].q_event_proxies == proxies[0:1]
+    assert q_grid.leaves[1].q_event_proxies == proxies[1:3]
+    assert q_grid.leaves[2].q_event_proxies == proxies[3:5]
+    assert q_grid.leaves[3].q_event_proxies == proxies[5:6]
+    assert q_grid.leaves[4].q_event_proxies == proxies[6:8]
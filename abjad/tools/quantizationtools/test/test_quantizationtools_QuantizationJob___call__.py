@@ -60,3 +60,52 @@ def test_quantizationtools_QuantizationJob___call___01():
         '(1 ((1 ((1 (1 1)) (1 (1 1)))) (1 (1 1 1))))',
         '(1 ((1 ((1 (1 1)) (1 (1 1)))) (1 ((1 (1 1)) (1 (1 1))))))'
         ], rtm_formats
+
+
+def test_quantizationtools_QuantizationJob___call___02():
+    r'''Bounded search keeps at most beam width q-grids, skips q-grids with
+    equal RTM format and counts explored q-grids.
+    '''
+
+    definition = {
+        2: {
+            2: {
+                2: None
+                },
+            3: None
+            },
+        3: {
+            2: None
+            },
+        5: None
+        }
+    search_tree = quantizationtools.UnweightedSearchTree(definition)
+    offsets = [0, (1, 5), (1, 4), (1, 3), (2, 5), (1, 2), (3, 4), 1]
+    q_event_proxies = [
+        quantizationtools.QEventProxy(
+            quantizationtools.SilentQEvent(offset, index=i), 0, 1)
+        for i, offset in enumerate(offsets)
+        ]
+
+    job = quantizationtools.QuantizationJob(1, search_tree, q_event_proxies)
+    job()
+    assert job.explored_node_count == len(job.q_grids)
+    best_q_grid = min(job.q_grids, key=lambda x: (x.distance, len(x.leaves)))
+
+    for beam_width in (1, 2, 4, 100):
+        bounded_job = quantizationtools.QuantizationJob(
+            1,
+            search_tree,
+            q_event_proxies,
+            beam_width=beam_width,
+            )
+        bounded_job()
+        rtm_formats = [_.rtm_format for _ in bounded_job.q_grids]
+        assert len(rtm_formats) == len(set(rtm_formats))
+        assert len(bounded_job.q_grids) <= beam_width
+        assert bounded_job.explored_node_count <= job.explored_node_count
+        assert best_q_grid.distance <= bounded_job.q_grids[0].distance
+        if beam_width == 1:
+            assert bounded_job.explored_node_count < job.explored_node_count
+        if beam_width == 100:
+            assert bounded_job.q_grids[0].rtm_format == best_q_grid.rtm_format
@@ -244,3 +244,59 @@ def test_quantizationtools_Quantizer___call___05():
         >>
         '''
         ), format(score)
+
+
+def test_quantizationtools_Quantizer___call___06():
+    milliseconds = [1500, 1500]
+    q_events = quantizationtools.QEventSequence.from_millisecond_durations(
+        milliseconds)
+    quantizer = quantizationtools.Quantizer()
+    result = quantizer(q_events, beam_width=1)
+    staff = abjad.Staff([result], lilypond_type='RhythmicStaff')
+    score = abjad.Score([staff])
+    assert format(score) == abjad.String.normalize(
+        r'''
+        \new Score
+        <<
+            \new RhythmicStaff
+            {
+                \new Voice
+                {
+                    {   % measure
+                        \time 4/4
+                        \tempo 4=60
+                        c'4.
+                        c'4.
+                        r4
+                    }   % measure
+                }
+            }
+        >>
+        '''
+        ), format(score)
+
+
+def test_quantizationtools_Quantizer___call___07():
+    r'''Quantizer reuses q-grids of beats with same attack pattern and
+    forgets least recently used q-grids first.
+    '''
+
+    milliseconds = [250, 250, 500, -250, 125, 125, 500] * 4
+    q_events = quantizationtools.QEventSequence.from_millisecond_durations(
+        milliseconds)
+    result = quantizationtools.Quantizer(cache_size=0)(q_events)
+    staff = abjad.Staff([result], lilypond_type='RhythmicStaff')
+
+    quantizer = quantizationtools.Quantizer(cache_size=2)
+    for _ in range(2):
+        result = quantizer(q_events)
+        staff_ = abjad.Staff([result], lilypond_type='RhythmicStaff')
+        assert format(staff_) == format(staff)
+    assert quantizer.cache_hit_count
+    assert quantizer.cache_miss_count
+    assert len(quantizer._cache) == 2
+
+    quantizer.clear_cache()
+    assert quantizer.cache_hit_count == 0
+    assert quantizer.cache_miss_count == 0
+    assert not quantizer._cache
@@ -0,0 +1,139 @@
+import abjad
+import asyncio
+from abjad.tools import quantizationtools
+
+
+def test_quantizationtools_Quantizer_iterate_01():
+    r'''Iterates measures.
+    '''
+
+    q_events = quantizationtools.QEventSequence.from_millisecond_durations(
+        [1500, -500, 750, 250, 1000, 2000, 1000, 250, 250, 500, -500])
+    q_schema = quantizationtools.MeasurewiseQSchema(
+        {1: {'time_signature': (3, 4)}, 2: {'tempo': ((1, 4), 120)}},
+        )
+    components = quantizationtools.Quantizer().iterate(
+        iter(q_events),
+        q_schema=q_schema,
+        )
+    voice = abjad.Voice(list(components))
+
+    assert format(voice) == abjad.String.normalize(
+        r'''
+        \new Voice
+        {
+            {   % measure
+                \time 4/4
+                \tempo 4=60
+                c'4.
+                r8
+                c'8.
+                c'16
+                c'4
+            }   % measure
+            {   % measure
+                \time 3/4
+                c'2
+                c'4
+            }   % measure
+            {   % measure
+                \tempo 4=120
+                c'8
+                c'8
+                c'4
+                r4
+            }   % measure
+        }
+        '''
+        )
+
+
+def test_quantizationtools_Quantizer_iterate_02():
+    r'''Iterates beats.
+    '''
+
+    q_events = quantizationtools.QEventSequence.from_millisecond_durations(
+        [1500, -500, 750, 250, 1000, 2000, 1000, 250, 250, 500, -1000])
+    components = quantizationtools.Quantizer().iterate(
+        iter(q_events),
+        q_schema=quantizationtools.BeatwiseQSchema(),
+        )
+    voice = abjad.Voice(list(components))
+
+    assert format(voice) == abjad.String.normalize(
+        r'''
+        \new Voice
+        {
+            \tempo 4=60
+            c'4.
+            r8
+            c'8.
+            c'16
+            c'4
+            c'2
+            c'4
+            c'16
+            c'16
+            c'8
+            r4
+        }
+        '''
+        )
+
+
+def test_quantizationtools_Quantizer_iterate_03():
+    r'''Iterated components equal components of quantizer call.
+    '''
+
+    q_events = quantizationtools.QEventSequence.from_millisecond_durations(
+        [1500, -500, 750, 250, 1000, 3100, -333, 1000])
+    q_schemas = (
+        quantizationtools.MeasurewiseQSchema(
+            {1: {'time_signature': (3, 4)}, 2: {'tempo': ((1, 4), 90)}},
+            ),
+        quantizationtools.BeatwiseQSchema(),
+        )
+    for q_schema in q_schemas:
+        result = quantizationtools.Quantizer()(q_events, q_schema=q_schema)
+        components = quantizationtools.Quantizer().iterate(
+            iter(q_events),
+            q_schema=q_schema,
+            )
+        voice = abjad.Voice(list(components))
+        assert format(voice) == format(result)
+
+
+def test_quantizationtools_Quantizer_iterate_04():
+    r'''Yields measures before last q-event arrives.
+    '''
+
+    q_events = quantizationtools.QEventSequence.from_millisecond_durations(
+        [1000] * 12)
+    stream = quantizationtools.QuantizationStream()
+    counts = [len(stream.push(q_event)) for q_event in q_events]
+    assert counts == [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0]
+    assert len(stream.close()) == 2
+
+
+def test_quantizationtools_Quantizer_iterate_05():
+    r'''Iterates asynchronous q-events.
+    '''
+
+    q_events = quantizationtools.QEventSequence.from_millisecond_durations(
+        [1500, -500, 750, 750, 2000])
+    quantizer = quantizationtools.Quantizer()
+
+    async def receive():
+        for q_event in q_events:
+            await asyncio.sleep(0)
+            yield q_event
+
+    async def notate():
+        return [_ async for _ in quantizer.iterate_async(receive())]
+
+    loop = asyncio.new_event_loop()
+    try:
+        components = loop.run_until_complete(notate())
+    finally:
+        loop.close()
+    assert format(abjad.Voice(components)) == format(quantizer(q_events))
@@ -126,6 +126,7 @@ class DurationSpecifier(AbjadValueObject):
             for component in contents:
                 component._parent = None
             selections.append(contents)
+        abjad.UpdateManager._parentage_update_count += 1
         return selections
 
     @staticmethod
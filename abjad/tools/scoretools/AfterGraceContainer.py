@@ -86,12 +86,14 @@ class AfterGraceContainer(Container):
             raise TypeError(message)
         leaf._after_grace_container = self
         self._carrier = leaf
+        leaf._update_later(offsets=True)
 
     def _detach(self):
         if self._carrier is not None:
             carrier = self._carrier
             carrier._after_grace_container = None
             self._carrier = None
+            carrier._update_later(offsets=True)
         return self
 
     def _format_open_brackets_slot(self, bundle):
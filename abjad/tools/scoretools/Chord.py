@@ -34,10 +34,7 @@ class Chord(Leaf):
         assert len(arguments) in (0, 1, 2)
         self._note_heads = abjad.NoteHeadList(client=self)
         if len(arguments) == 1 and isinstance(arguments[0], str):
-            string = '{{ {} }}'.format(arguments[0])
-            parsed = abjad.parse(string)
-            assert len(parsed) == 1 and isinstance(parsed[0], Leaf)
-            arguments = [parsed[0]]
+            arguments = [Leaf._parse_string(arguments[0])]
         are_cautionary = []
         are_forced = []
         are_parenthesized = []
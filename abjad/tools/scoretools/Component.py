@@ -14,19 +14,25 @@ class Component(AbjadObject):
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        '_index_in_parent',
         '_indicators_are_current',
         '_is_forbidden_to_update',
+        '_lilypond_format_cache',
+        '_lilypond_format_version',
         '_lilypond_grob_name_manager',
         '_lilypond_setting_name_manager',
         '_measure_number',
         '_offsets_are_current',
         '_offsets_in_seconds_are_current',
         '_parent',
+        '_parentage_cache',
         '_start_offset',
         '_start_offset_in_seconds',
         '_stop_offset',
         '_stop_offset_in_seconds',
+        '_subtree_offsets_are_current',
         '_timespan',
+        '_vertical_moment_timeline',
         '_wrappers',
         )
 
@@ -35,19 +41,25 @@ class Component(AbjadObject):
     @abc.abstractmethod
     def __init__(self, name=None):
         import abjad
+        self._index_in_parent = None
         self._indicators_are_current = False
         self._is_forbidden_to_update = False
+        self._lilypond_format_cache = None
+        self._lilypond_format_version = 0
         self._measure_number = None
         self._offsets_are_current = False
         self._offsets_in_seconds_are_current = False
         self._lilypond_grob_name_manager = None
         self._parent = None
+        self._parentage_cache = None
         self._lilypond_setting_name_manager = None
         self._start_offset = None
         self._start_offset_in_seconds = None
         self._stop_offset = None
         self._stop_offset_in_seconds = None
+        self._subtree_offsets_are_current = False
         self._timespan = abjad.Timespan()
+        self._vertical_moment_timeline = None
         self._wrappers = []
 
     ### SPECIAL METHODS ###
@@ -66,10 +78,10 @@ class Component(AbjadObject):
         import abjad
         new_component = type(self)(*self.__getnewargs__())
         if getattr(self, '_lilypond_grob_name_manager', None) is not None:
-            manager = copy.copy(abjad.override(self))
+            manager = copy.copy(self._lilypond_grob_name_manager)
             new_component._lilypond_grob_name_manager = manager
         if getattr(self, '_lilypond_setting_name_manager', None) is not None:
-            manager = copy.copy(abjad.setting(self))
+            manager = copy.copy(self._lilypond_setting_name_manager)
             new_component._lilypond_setting_name_manager = manager
         for wrapper in abjad.inspect(self).annotations():
             new_wrapper = copy.copy(wrapper)
@@ -102,6 +114,17 @@ class Component(AbjadObject):
         '''
         return ()
 
+    def __getstate__(self):
+        r'''Gets state of component.
+
+        Does not copy parentage cache.
+
+        Returns dictionary.
+        '''
+        state = AbjadObject.__getstate__(self)
+        state['_parentage_cache'] = None
+        return state
+
     def __illustrate__(self):
         r'''Illustrates component.
 
@@ -303,7 +326,8 @@ class Component(AbjadObject):
                 else:
                     return
         self._update_now(indicators=True)
-        candidate_wrappers = {}
+        # each source is a pair of sorted offsets and wrappers at each offset
+        sources = []
         parentage = abjad.inspect(self).get_parentage(
             include_self=True,
             grace_notes=True,
@@ -314,8 +338,6 @@ class Component(AbjadObject):
                 if wrapper.annotation:
                     continue
                 if isinstance(wrapper.indicator, prototype):
-                    #offset = wrapper.start_offset
-                    #candidate_wrappers.setdefault(offset, []).append(wrapper)
                     these_wrappers.append(wrapper)
             # activate indicator takes precendence over inactive indicator
             if (any(_.deactivate is True for _ in these_wrappers) and
@@ -323,27 +345,56 @@ class Component(AbjadObject):
                 these_wrappers = [
                     _ for _ in these_wrappers if _.deactivate is not True
                     ]
-            for wrapper in these_wrappers:
-                offset = wrapper.start_offset
-                candidate_wrappers.setdefault(offset, []).append(wrapper)
-            if not isinstance(component, abjad.Context):
-                continue
-            for wrapper in component._dependent_wrappers:
-                if wrapper.annotation:
-                    continue
-                if isinstance(wrapper.indicator, prototype):
+            if these_wrappers:
+                candidate_wrappers = {}
+                for wrapper in these_wrappers:
                     offset = wrapper.start_offset
                     candidate_wrappers.setdefault(offset, []).append(wrapper)
-        if not candidate_wrappers:
+                offsets = sorted(candidate_wrappers)
+                wrapper_lists = [candidate_wrappers[_] for _ in offsets]
+                sources.append((offsets, wrapper_lists))
+            if not isinstance(component, abjad.Context):
+                continue
+            offsets, wrapper_lists = component._get_dependent_wrapper_index(
+                prototype)
+            if offsets:
+                sources.append((offsets, wrapper_lists))
+        if not sources:
             return
-        all_offsets = sorted(candidate_wrappers)
         start_offset = abjad.inspect(self).get_timespan().start_offset
-        index = bisect.bisect(all_offsets, start_offset) - 1 + int(n)
-        if index < 0:
-            return
-        elif len(candidate_wrappers) <= index:
+        # find last offset at or before start offset in all sources
+        offset = None
+        for offsets, wrapper_lists in sources:
+            index = bisect.bisect(offsets, start_offset)
+            if index and (offset is None or offset < offsets[index - 1]):
+                offset = offsets[index - 1]
+        # step n distinct offsets forward or backward
+        for i in range(abs(int(n))):
+            next_offset = None
+            for offsets, wrapper_lists in sources:
+                if 0 < n:
+                    if offset is None:
+                        index = 0
+                    else:
+                        index = bisect.bisect_right(offsets, offset)
+                    if (index < len(offsets) and
+                        (next_offset is None or offsets[index] < next_offset)):
+                        next_offset = offsets[index]
+                elif offset is not None:
+                    index = bisect.bisect_left(offsets, offset) - 1
+                    if (0 <= index and
+                        (next_offset is None or next_offset < offsets[index])):
+                        next_offset = offsets[index]
+            offset = next_offset
+            if offset is None:
+                return
+        if offset is None:
             return
-        wrapper = candidate_wrappers[all_offsets[index]][0]
+        for offsets, wrapper_lists in sources:
+            index = bisect.bisect_left(offsets, offset)
+            if index < len(offsets) and offsets[index] == offset:
+                wrapper = wrapper_lists[index][0]
+                break
         if unwrap:
             return wrapper.indicator
         return wrapper
@@ -512,19 +563,17 @@ class Component(AbjadObject):
         import abjad
         assert abjad.mathtools.is_integer_equivalent(n)
         def next(component):
-            if component is not None:
-                for parent in abjad.inspect(component).get_parentage(
-                    include_self=True):
-                    next_sibling = parent._get_sibling(1)
-                    if next_sibling is not None:
-                        return next_sibling
+            while component is not None:
+                next_sibling = component._get_sibling(1)
+                if next_sibling is not None:
+                    return next_sibling
+                component = component._parent
         def previous(component):
-            if component is not None:
-                for parent in abjad.inspect(component).get_parentage(
-                    include_self=True):
-                    next_sibling = parent._get_sibling(-1)
-                    if next_sibling is not None:
-                        return next_sibling
+            while component is not None:
+                previous_sibling = component._get_sibling(-1)
+                if previous_sibling is not None:
+                    return previous_sibling
+                component = component._parent
         result = self
         if 0 < n:
             for i in range(n):
@@ -698,9 +747,11 @@ class Component(AbjadObject):
             for wrapper in component._dependent_wrappers[:]:
                 if wrapper.component is self:
                     component._dependent_wrappers.remove(wrapper)
+                    component._dependent_wrapper_index.clear()
         if self._parent is not None:
             self._parent._components.remove(self)
         self._parent = None
+        abjad.UpdateManager._parentage_update_count += 1
 
     def _remove_named_children_from_parentage(self, name_dictionary):
         import abjad
@@ -729,12 +780,16 @@ class Component(AbjadObject):
     def _set_parent(self, new_parent):
         r'''Not composer-safe.
         '''
+        import abjad
         named_children = self._cache_named_children()
         self._remove_named_children_from_parentage(named_children)
         self._remove_from_parent()
         self._parent = new_parent
+        abjad.UpdateManager._parentage_update_count += 1
         self._restore_named_children_to_parentage(named_children)
         self._update_later(offsets=True)
+        if isinstance(self, abjad.Container):
+            self._update_subtree_later()
 
     def _splice(
         self,
@@ -808,10 +863,36 @@ class Component(AbjadObject):
                     parent.__setitem__(slice(start, start), components)
             return components + [self]
 
-    def _update_later(self, offsets=False, offsets_in_seconds=False):
+    def _update_later(
+        self,
+        offsets=False,
+        offsets_in_seconds=False,
+        lilypond_format=False,
+        ):
+        r'''Invalidates offsets, offsets in seconds or LilyPond format of
+        component and of every component in parentage.
+
+        Updating offsets later also updates LilyPond format later and
+        invalidates cached parentage.
+        '''
         import abjad
-        assert offsets or offsets_in_seconds
-        for component in abjad.inspect(self).get_parentage(include_self=True):
+        assert offsets or offsets_in_seconds or lilypond_format
+        if offsets:
+            abjad.UpdateManager._parentage_update_count += 1
+            self._subtree_offsets_are_current = False
+            lilypond_format = True
+        if lilypond_format:
+            abjad.UpdateManager._lilypond_format_update_count += 1
+            if isinstance(self, abjad.Leaf):
+                for spanner in self._spanners:
+                    spanner._lilypond_format_version += 1
+        parentage = abjad.inspect(self).get_parentage(
+            include_self=True,
+            grace_notes=True,
+            )
+        for component in parentage:
+            if lilypond_format:
+                component._lilypond_format_version += 1
             if offsets:
                 component._offsets_are_current = False
             elif offsets_in_seconds:
@@ -836,3 +917,15 @@ class Component(AbjadObject):
             offsets_in_seconds=offsets_in_seconds,
             indicators=indicators,
             )
+
+    def _update_subtree_later(self):
+        r'''Invalidates LilyPond format of component, of every component in
+        parentage and of every component in subtree.
+        '''
+        import abjad
+        self._update_later(lilypond_format=True)
+        for component in abjad.iterate(self).components():
+            component._lilypond_format_version += 1
+            if isinstance(component, abjad.Leaf):
+                for spanner in component._spanners:
+                    spanner._lilypond_format_version += 1
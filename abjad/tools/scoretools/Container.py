@@ -1,4 +1,5 @@
 import collections
+import functools
 import typing
 from .Component import Component
 from .Selection import Selection
@@ -533,6 +534,42 @@ class Container(Component):
         result.append(('comments', bundle.closing.comments))
         return self._format_slot_contributions_with_indent(result)
 
+    def _format_component(self, pieces=False):
+        import abjad
+        if self._is_lilypond_format_cache_current():
+            contributions = self._lilypond_format_cache[-1]
+        else:
+            version = self._lilypond_format_version
+            update_count = abjad.UpdateManager._lilypond_format_update_count
+            name_count = \
+                abjad.UpdateManager._lilypond_name_manager_update_count
+            key = self._get_lilypond_format_key()
+            contributions = Component._format_component(self, pieces=True)
+            contributions = tuple(contributions)
+            dependencies = self._get_lilypond_format_dependencies()
+            if dependencies is None:
+                self._lilypond_format_cache = None
+            else:
+                spanners, neighbors, contexts = dependencies
+                if not any(
+                    _[0]._format_reads_effective_indicators
+                    for _ in spanners.values()
+                    ):
+                    update_count = None
+                self._lilypond_format_cache = (
+                    version,
+                    update_count,
+                    name_count,
+                    key,
+                    spanners,
+                    neighbors,
+                    contexts,
+                    contributions,
+                    )
+        if pieces:
+            return list(contributions)
+        return '\n'.join(contributions)
+
     def _format_content_pieces(self):
         import abjad
         indent = abjad.LilyPondFormatManager.indent
@@ -687,6 +724,63 @@ class Container(Component):
             #storage_format_kwargs_names=[],
             )
 
+    def _get_lilypond_format_dependencies(self):
+        r'''Gets spanners, neighbors and contexts on which LilyPond format
+        of container depends.
+
+        Neighbors are leaves and measures outside container; contexts are
+        contexts in container together with their LilyPond format keys.
+
+        Returns triple of dictionary, list and list, or none when a
+        container in container has no LilyPond format cache.
+        '''
+        import abjad
+        spanners, neighbors, contexts = {}, [], []
+
+        def add_cache(container):
+            cache = container._lilypond_format_cache
+            if cache is None:
+                return False
+            spanners.update(cache[4])
+            neighbors.extend(cache[5])
+            contexts.extend(cache[6])
+            if isinstance(container, abjad.Context):
+                contexts.append((container, cache[3]))
+            return True
+
+        last_index = len(self._components) - 1
+        for i, component in enumerate(self._components):
+            if isinstance(component, Container):
+                if not add_cache(component):
+                    return
+                continue
+            for spanner in component._spanners:
+                pair = (spanner, spanner._lilypond_format_version)
+                spanners[id(spanner)] = pair
+            for container in (
+                component._grace_container,
+                component._after_grace_container,
+                ):
+                if container is not None and not add_cache(container):
+                    return
+            if not component._spanners:
+                continue
+            if self.is_simultaneous or i in (0, last_index):
+                for n in (-1, 1):
+                    get_neighbor = functools.partial(component._get_leaf, n)
+                    neighbors.append(self._make_neighbor_record(get_neighbor))
+        outside_neighbors = []
+        for record in neighbors:
+            parent = record[1]
+            while parent is not None and parent is not self:
+                parent = parent._parent
+            if parent is None:
+                outside_neighbors.append(record)
+        return spanners, outside_neighbors, contexts
+
+    def _get_lilypond_format_key(self):
+        return (self.identifier, self.is_simultaneous, self.name)
+
     def _get_preprolated_duration(self):
         return self._get_contents_duration()
 
@@ -789,6 +883,38 @@ class Container(Component):
             message = message.format(components)
             raise TypeError(message)
 
+    def _is_lilypond_format_cache_current(self):
+        r'''Is true when no edit since container last formatted changes
+        LilyPond format of container.
+        '''
+        import abjad
+        cache = self._lilypond_format_cache
+        if cache is None:
+            return False
+        version, update_count, name_count, key = cache[:4]
+        spanners, neighbors, contexts = cache[4:-1]
+        if version != self._lilypond_format_version:
+            return False
+        if (name_count !=
+            abjad.UpdateManager._lilypond_name_manager_update_count):
+            return False
+        if (update_count is not None and
+            update_count != abjad.UpdateManager._lilypond_format_update_count):
+            return False
+        for spanner, version in spanners.values():
+            if spanner._lilypond_format_version != version:
+                return False
+        for get_neighbor, neighbor, version in neighbors:
+            if get_neighbor() is not neighbor:
+                return False
+            if (neighbor is not None and
+                neighbor._lilypond_format_version != version):
+                return False
+        for context, context_key in contexts:
+            if context._get_lilypond_format_key() != context_key:
+                return False
+        return key == self._get_lilypond_format_key()
+
     def _is_one_of_my_first_leaves(self, leaf):
         return leaf in self._get_descendants_starting_with()
 
@@ -804,14 +930,61 @@ class Container(Component):
             yield node
         return recurse(self)
 
+    def _iterate_content_pieces(self):
+        import abjad
+        indent = abjad.LilyPondFormatManager.indent
+        for component in self.components:
+            if isinstance(component, Container):
+                pieces = component._iterate_lilypond_format()
+            else:
+                string = component.__format__(format_specification='lilypond')
+                pieces = string.split('\n')
+            for piece in pieces:
+                yield indent + piece
+
+    def _iterate_format_pieces(self):
+        r'''Iterates LilyPond format pieces of container one piece at a
+        time.
+
+        Joins to the same string as ``_format_component()``. Reuses LilyPond
+        format caches that are current and formats containers of leaves
+        with cache. Formats other containers without cache.
+        '''
+        import abjad
+        if (self._is_lilypond_format_cache_current() or
+            not any(isinstance(_, Container) for _ in self._components)):
+            yield from self._format_component(pieces=True)
+            return
+        bundle = abjad.LilyPondFormatManager.bundle_format_contributions(self)
+        for format_slot in (
+            self._format_absolute_before_slot,
+            self._format_before_slot,
+            self._format_open_brackets_slot,
+            self._format_opening_slot,
+            ):
+            for contributor, contribution in format_slot(bundle):
+                yield from contribution
+        yield from self._iterate_content_pieces()
+        for format_slot in (
+            self._format_closing_slot,
+            self._format_close_brackets_slot,
+            self._format_after_slot,
+            self._format_absolute_after_slot,
+            ):
+            for contributor, contribution in format_slot(bundle):
+                yield from contribution
+
+    def _iterate_lilypond_format(self):
+        self._update_now(indicators=True)
+        yield from self._iterate_format_pieces()
+
     def _iterate_top_down(self):
-        def recurse(node):
+        stack = [self]
+        while stack:
+            node = stack.pop()
             yield node
             if isinstance(node, Container):
-                for x in node:
-                    for y in recurse(x):
-                        yield y
-        return recurse(self)
+                stack.extend(reversed(node._components))
 
     def _iterate_topmost(self):
         import abjad
@@ -824,6 +997,12 @@ class Container(Component):
                 assert isinstance(component, abjad.Container)
                 yield component
 
+    @staticmethod
+    def _make_neighbor_record(get_neighbor):
+        neighbor = get_neighbor()
+        version = getattr(neighbor, '_lilypond_format_version', None)
+        return (get_neighbor, neighbor, version)
+
     def _move_spanners_to_children(self):
         for spanner in inspect(self).get_spanners():
             i = spanner._index(self)
@@ -837,9 +1016,13 @@ class Container(Component):
         import abjad
         user_input = string.strip()
         if user_input.startswith('abj:'):
-            parser = abjad.lilypondparsertools.ReducedLyParser()
-            parsed = parser(user_input[4:])
-            if parser._toplevel_component_count == 1:
+            parser = abjad.lilypondparsertools.ReducedLyParser._acquire()
+            try:
+                parsed = parser(user_input[4:])
+                toplevel_component_count = parser._toplevel_component_count
+            finally:
+                parser._release()
+            if toplevel_component_count == 1:
                 parent = inspect(parsed).get_parentage().parent
                 if parent is None:
                     parsed = Container([parsed])
@@ -1256,6 +1439,7 @@ class Container(Component):
     def identifier(self, argument):
         assert isinstance(argument, (str, type(None))), repr(argument)
         self._identifier: typing.Optional[str] = argument
+        self._update_later(lilypond_format=True)
 
     @property
     def is_simultaneous(self) -> typing.Optional[bool]:
@@ -1400,6 +1584,7 @@ class Container(Component):
 
     @name.setter
     def name(self, argument):
+        import abjad
         assert isinstance(argument, (str, type(None)))
         old_name = self._name
         for parent in inspect(self).get_parentage(include_self=False):
@@ -1414,6 +1599,9 @@ class Container(Component):
                 else:
                     named_children[argument].append(self)
         self._name = argument
+        if argument != old_name:
+            abjad.UpdateManager._parentage_update_count += 1
+            self._update_subtree_later()
 
     ### PUBLIC METHODS ###
 
@@ -1542,13 +1730,23 @@ class Container(Component):
             3
 
         '''
-        for i, element in enumerate(self.components):
+        components = self._components
+        index = getattr(component, '_index_in_parent', None)
+        if (index is not None and
+            index < len(components) and
+            components[index] is component):
+            return index
+        # stale or missing: renumber all children so later lookups are O(1)
+        index = None
+        for i, element in enumerate(components):
+            element._index_in_parent = i
             if element is component:
-                return i
-        else:
+                index = i
+        if index is None:
             message = 'component {!r} not in Abjad container {!r}.'
             message = message.format(component, self)
             raise ValueError(message)
+        return index
 
     def insert(self, i, component, fracture_spanners=False) -> None:
         r'''Inserts `component` at index `i` in container.
@@ -31,6 +31,7 @@ class Context(Container):
     __slots__ = (
         '_lilypond_type',
         '_consists_commands',
+        '_dependent_wrapper_index',
         '_dependent_wrappers',
         '_remove_commands',
         )
@@ -70,6 +71,7 @@ class Context(Container):
         name=None,
         ):
         self._consists_commands = []
+        self._dependent_wrapper_index = {}
         self._dependent_wrappers = []
         self._remove_commands = []
         self.lilypond_type = lilypond_type
@@ -216,6 +218,36 @@ class Context(Container):
             result.append(string)
         return result
 
+    def _get_dependent_wrapper_index(self, prototype):
+        r'''Gets sorted start offsets of dependent wrappers with indicators of
+        type `prototype` together with the list of wrappers at each offset.
+
+        Caches one index per prototype. Cache is cleared when dependent
+        wrappers change and is ignored once offsets have been recomputed
+        anywhere.
+        '''
+        import abjad
+        if not self._dependent_wrappers:
+            return [], []
+        self._update_now(offsets=True)
+        offset_update_count = abjad.UpdateManager._offset_update_count
+        entry = self._dependent_wrapper_index.get(prototype)
+        if entry is not None and entry[0] == offset_update_count:
+            return entry[1], entry[2]
+        wrappers_by_offset = {}
+        for wrapper in self._dependent_wrappers:
+            if wrapper.annotation:
+                continue
+            if isinstance(wrapper.indicator, prototype):
+                offset = wrapper.start_offset
+                wrappers_by_offset.setdefault(offset, []).append(wrapper)
+        offsets = sorted(wrappers_by_offset)
+        wrapper_lists = [wrappers_by_offset[_] for _ in offsets]
+        offset_update_count = abjad.UpdateManager._offset_update_count
+        entry = (offset_update_count, offsets, wrapper_lists)
+        self._dependent_wrapper_index[prototype] = entry
+        return offsets, wrapper_lists
+
     def _get_format_pieces(self):
         return self._format_component(pieces=True)
 
@@ -223,6 +255,15 @@ class Context(Container):
         self._update_now(indicators=True)
         return self._format_component()
 
+    def _get_lilypond_format_key(self):
+        key = Container._get_lilypond_format_key(self)
+        key += (
+            self.lilypond_type,
+            tuple(self.consists_commands),
+            tuple(self.remove_commands),
+            )
+        return key
+
     def _get_persistent_wrappers(self):
         import abjad
         self._update_now(indicators=True)
@@ -297,6 +338,8 @@ class Context(Container):
         else:
             argument = str(argument)
         self._lilypond_type = argument
+        if hasattr(self, '_components'):
+            self._update_subtree_later()
 
     @property
     def lilypond_context(self):
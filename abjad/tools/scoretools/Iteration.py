@@ -324,6 +324,27 @@ class Iteration(abctools.AbjadObject):
             else:
                 return node
         assert isinstance(self.client, abjad.Component)
+        if (capped and
+            unique and
+            forbid is None and
+            getattr(self.client, '_carrier', None) is None):
+            container_class = abjad.Container
+            is_left = direction == abjad.Left
+            stack = [self.client]
+            while stack:
+                component = stack.pop()
+                yield component
+                if isinstance(component, container_class):
+                    if is_left:
+                        stack.extend(reversed(component._components))
+                    else:
+                        stack.extend(component._components)
+                elif is_left:
+                    if component._after_grace_container is not None:
+                        stack.append(component._after_grace_container)
+                    if component._grace_container is not None:
+                        stack.append(component._grace_container)
+            return
         component = self.client
         client_parent, node, rank = component._parent, component, 0
         queue = collections.deque([])
@@ -668,7 +689,7 @@ class Iteration(abctools.AbjadObject):
         import abjad
         prototype = prototype or abjad.Component
         parentage = abjad.inspect(self.client).get_parentage()
-        logical_voice = parentage.logical_voice
+        logical_voice = parentage._logical_voice
         if reverse:
             direction = abjad.Right
         else:
@@ -680,7 +701,7 @@ class Iteration(abctools.AbjadObject):
             if not isinstance(component, prototype):
                 continue
             parentage = abjad.inspect(component).get_parentage()
-            if parentage.logical_voice == logical_voice:
+            if parentage._logical_voice == logical_voice:
                 yield component
 
     ### PUBLIC PROPERTIES ###
@@ -854,77 +875,78 @@ class Iteration(abctools.AbjadObject):
         Returns generator.
         '''
         import abjad
-        argument = self.client
         prototype = prototype or abjad.Component
-        grace_container, after_grace_container = None, None
-        if grace_notes is not False and isinstance(argument, abjad.Leaf):
-            inspection = abjad.inspect(argument)
-            grace_container = inspection.get_grace_container()
-            after_grace_container = inspection.get_after_grace_container()
-        if not reverse:
-            if grace_notes is not False and grace_container:
-                for component in grace_container:
-                    for component_ in abjad.iterate(component).components(
-                        prototype,
-                        grace_notes=grace_notes,
-                        reverse=reverse,
-                        ):
-                        yield component_
-            if isinstance(argument, prototype):
-                if (grace_notes is None or
-                    (grace_notes is True and
-                    abjad.inspect(argument).is_grace_note()) or
-                    (grace_notes is False and
-                    not abjad.inspect(argument).is_grace_note())):
-                    yield argument
-            if grace_notes is not False and after_grace_container:
-                for component in after_grace_container:
-                    for component_ in abjad.iterate(component).components(
-                        prototype,
-                        grace_notes=grace_notes,
-                        reverse=reverse,
-                        ):
-                        yield component_
-            if isinstance(argument, collections.Iterable):
-                for item in argument:
-                    for component in abjad.iterate(item).components(
-                        prototype,
-                        grace_notes=grace_notes,
-                        reverse=reverse,
-                        ):
-                        yield component
-        else:
-            if grace_notes is not False and after_grace_container:
-                for component in reversed(after_grace_container):
-                    for component_ in abjad.iterate(component).components(
-                        prototype,
-                        grace_notes=grace_notes,
-                        reverse=reverse,
-                        ):
-                        yield component_
-            if isinstance(argument, prototype):
-                if (grace_notes is None or
-                    (grace_notes is True and
-                    abjad.inspect(argument).is_grace_note()) or
-                    (grace_notes is False and
-                    not abjad.inspect(argument).is_grace_note())):
-                    yield argument
-            if grace_notes is not False and grace_container:
-                for component in reversed(grace_container):
-                    for component_ in abjad.iterate(component).components(
-                        prototype,
-                        grace_notes=grace_notes,
-                        reverse=reverse,
-                        ):
-                        yield component_
-            if isinstance(argument, collections.Iterable):
-                for item in reversed(argument):
-                    for component in abjad.iterate(item).components(
-                        prototype,
-                        grace_notes=grace_notes,
-                        reverse=reverse,
-                        ):
-                        yield component
+        leaf_class, container_class = abjad.Leaf, abjad.Container
+        grace_prototype = (abjad.AfterGraceContainer, abjad.GraceContainer)
+        matches_by_class = {}
+        # stack items are (item, is_in_grace_container, expand) triples;
+        # leaves with grace notes are pushed again with expand set to false
+        stack = [(self.client, None, True)]
+        while stack:
+            item, is_in_grace_container, expand = stack.pop()
+            class_ = type(item)
+            if is_in_grace_container is None and grace_notes is not None:
+                is_in_grace_container = False
+                parent = getattr(item, '_parent', None)
+                while parent is not None:
+                    if isinstance(parent, grace_prototype):
+                        is_in_grace_container = True
+                        break
+                    parent = parent._parent
+            if (expand and
+                grace_notes is not False and
+                issubclass(class_, leaf_class) and
+                (item._grace_container or item._after_grace_container)):
+                if reverse:
+                    first = item._after_grace_container
+                    last = item._grace_container
+                else:
+                    first = item._grace_container
+                    last = item._after_grace_container
+                if last:
+                    items = last._components
+                    if not reverse:
+                        items = reversed(items)
+                    for item_ in items:
+                        stack.append((item_, True, True))
+                stack.append((item, is_in_grace_container, False))
+                if first:
+                    items = first._components
+                    if not reverse:
+                        items = reversed(items)
+                    for item_ in items:
+                        stack.append((item_, True, True))
+                continue
+            matches = matches_by_class.get(class_)
+            if matches is None:
+                matches = isinstance(item, prototype)
+                matches_by_class[class_] = matches
+            if matches:
+                if grace_notes is None:
+                    yield item
+                else:
+                    is_grace_note = bool(
+                        is_in_grace_container and
+                        issubclass(class_, leaf_class)
+                        )
+                    if grace_notes is is_grace_note:
+                        yield item
+            if issubclass(class_, container_class):
+                if grace_notes is not None:
+                    is_in_grace_container = (
+                        is_in_grace_container or
+                        issubclass(class_, grace_prototype)
+                        )
+                items = item._components
+            elif (not issubclass(class_, leaf_class) and
+                isinstance(item, collections.Iterable)):
+                items, is_in_grace_container = list(item), None
+            else:
+                continue
+            if not reverse:
+                items = reversed(items)
+            for item_ in items:
+                stack.append((item_, is_in_grace_container, True))
 
     def leaf_pairs(self):
         r'''Iterates leaf pairs.
@@ -2416,80 +2438,20 @@ class Iteration(abctools.AbjadObject):
         Returns generator.
         '''
         import abjad
-        def _buffer_components_starting_with(component, buffer, stop_offsets):
-            buffer.append(component)
-            stop_offset = abjad.inspect(component).get_timespan().stop_offset
-            stop_offsets.append(stop_offset)
-            if isinstance(component, abjad.Container):
-                if component.is_simultaneous:
-                    for component_ in component:
-                        _buffer_components_starting_with(
-                            component_,
-                            buffer,
-                            stop_offsets,
-                            )
-                elif component:
-                    _buffer_components_starting_with(
-                        component[0],
-                        buffer,
-                        stop_offsets,
-                        )
-        def _iterate_vertical_moments(argument):
-            governors = (argument,)
-            current_offset, stop_offsets, buffer = abjad.Offset(0), [], []
-            _buffer_components_starting_with(argument, buffer, stop_offsets)
-            while buffer:
+        if not reverse:
+            governors = (self.client,)
+            timeline = abjad.VerticalMoment._get_timeline(self.client)
+            for offset, components in zip(*timeline):
                 vertical_moment = abjad.VerticalMoment()
-                offset = abjad.Offset(current_offset)
-                components = list(buffer)
-                components.sort(
-                    key=lambda _: abjad.inspect(_).get_parentage().score_index
-                    )
-                vertical_moment._offset = offset
+                vertical_moment._offset = abjad.Offset(offset)
                 vertical_moment._governors = governors
-                vertical_moment._components = components
+                vertical_moment._components = list(components)
                 yield vertical_moment
-                current_offset, stop_offsets = min(stop_offsets), []
-                _update_buffer(current_offset, buffer, stop_offsets)
-        def _next_in_parent(component):
-            assert isinstance(component, abjad.Component), repr(component)
-            selection = abjad.select(component)
-            result = selection._get_parent_and_start_stop_indices()
-            parent, start, stop = result
-            assert start == stop
-            if parent is None:
-                raise StopIteration
-            if parent.is_simultaneous:
-                raise StopIteration
-            try:
-                return parent[start + 1]
-            except IndexError:
-                raise StopIteration
-        def _update_buffer(current_offset, buffer, stop_offsets):
-            for component in buffer[:]:
-                offset = abjad.inspect(component).get_timespan().stop_offset
-                if offset <= current_offset:
-                    buffer.remove(component)
-                    try:
-                        next_component = _next_in_parent(component)
-                        _buffer_components_starting_with(
-                            next_component,
-                            buffer,
-                            stop_offsets,
-                            )
-                    except StopIteration:
-                        pass
-                else:
-                    stop_offsets.append(offset)
-        if not reverse:
-            for x in _iterate_vertical_moments(self.client):
-                yield x
         else:
-            moments_in_governor = []
+            moments_in_governor = set()
             for component in self.components():
                 offset = abjad.inspect(component).get_timespan().start_offset
-                if offset not in moments_in_governor:
-                    moments_in_governor.append(offset)
-            moments_in_governor.sort()
+                moments_in_governor.add(offset)
+            moments_in_governor = sorted(moments_in_governor)
             for moment_in_governor in reversed(moments_in_governor):
                 yield self.client._get_vertical_moment_at(moment_in_governor)
@@ -1,5 +1,6 @@
 import abc
 import copy
+import re
 from abjad.tools.datastructuretools.Duration import Duration
 from abjad.tools.datastructuretools.Multiplier import Multiplier
 from abjad.tools.indicatortools.MetronomeMark import MetronomeMark
@@ -11,9 +12,7 @@ from abjad.tools.mathtools.Ratio import Ratio
 from abjad.tools.systemtools.LilyPondFormatManager import LilyPondFormatManager
 from abjad.tools.topleveltools.attach import attach
 from abjad.tools.topleveltools.detach import detach
-from abjad.tools.topleveltools.override import override
 from abjad.tools.topleveltools.select import select
-from abjad.tools.topleveltools.setting import setting
 from .Component import Component
 
 
@@ -33,6 +32,40 @@ class Leaf(Component):
         '_written_duration',
         )
 
+    _articulation_shorthands = {
+        '+': 'stopped',
+        '-': 'tenuto',
+        '.': 'staccato',
+        '>': 'accent',
+        '^': 'marcato',
+        '_': 'portato',
+        '|': 'staccatissimo',
+        }
+
+    _leaf_string_regex = re.compile(r'''
+        \A\s*
+        (?:
+            (?P<rest_name>[rs])
+            |
+            <(?P<chord_body>[^<>]*)>
+            |
+            (?P<note_head>[a-z]+(?:'+|,+)?!*\?*)
+        )
+        (?P<duration>\d+\.*)?
+        (?:\s*\*\s*(?P<numerator>\d+)(?:/(?P<denominator>\d+))?)?
+        (?P<articulations>(?:\s*[-^_][-+.>^_|])*)
+        \s*\Z
+        ''', re.VERBOSE)
+
+    _note_head_string_regex = re.compile(r'''
+        \A
+        (?P<name>[a-z]+)
+        (?P<octave>'+|,+)?
+        (?P<exclamations>!*)
+        (?P<questions>\?*)
+        \Z
+        ''', re.VERBOSE)
+
     ### INITIALIZER ###
 
     @abc.abstractmethod
@@ -83,6 +116,7 @@ class Leaf(Component):
         if id(spanner) in [id(_) for _ in self._spanners]:
             return
         self._spanners.append(spanner)
+        self._update_later(lilypond_format=True)
 
     def _as_graphviz_node(self):
         import abjad
@@ -109,10 +143,11 @@ class Leaf(Component):
 
     def _copy_override_and_set_from_leaf(self, leaf):
         if getattr(leaf, '_lilypond_grob_name_manager', None) is not None:
-            self._lilypond_grob_name_manager = copy.copy(override(leaf))
+            self._lilypond_grob_name_manager = copy.copy(
+                leaf._lilypond_grob_name_manager)
         if getattr(leaf, '_lilypond_setting_name_manager', None) is not None:
             self._lilypond_setting_name_manager = copy.copy(
-                setting(leaf))
+                leaf._lilypond_setting_name_manager)
         new_wrappers = []
         for wrapper in leaf._wrappers:
             new_wrapper = copy.copy(wrapper)
@@ -265,6 +300,9 @@ class Leaf(Component):
             new_component = component._get_nth_component_in_time_order_from(1)
             if new_component is None:
                 return
+            if (isinstance(new_component, Leaf) and
+                new_component._parent is component._parent):
+                return new_component
             candidates = new_component._get_descendants_starting_with()
             candidates = [
                 x for x in candidates if isinstance(x, Leaf)
@@ -278,6 +316,9 @@ class Leaf(Component):
             new_component = component._get_nth_component_in_time_order_from(-1)
             if new_component is None:
                 return
+            if (isinstance(new_component, Leaf) and
+                new_component._parent is component._parent):
+                return new_component
             candidates = new_component._get_descendants_stopping_with()
             candidates = [
                 x for x in candidates if isinstance(x, abjad.Leaf)
@@ -366,6 +407,110 @@ class Leaf(Component):
         spanners = self._get_spanners(prototype=prototype)
         return bool(spanners)
 
+    @staticmethod
+    def _parse_note_head_string(string):
+        r'''Parses note head string into pitch, is-cautionary and is-forced
+        triple.
+
+        Returns none when `string` needs LilyPond parser.
+        '''
+        import abjad
+        from abjad.ly import language_pitch_names
+        match = Leaf._note_head_string_regex.match(string)
+        if match is None:
+            return
+        pitch_class = language_pitch_names['english'].get(match.group('name'))
+        if not isinstance(pitch_class, abjad.NamedPitchClass):
+            return
+        octave = match.group('octave') or ''
+        pitch = abjad.NamedPitch(str(pitch_class) + octave)
+        is_cautionary = bool(match.group('questions'))
+        is_forced = bool(match.group('exclamations'))
+        return pitch, is_cautionary, is_forced
+
+    @staticmethod
+    def _parse_simple_string(string):
+        r'''Parses note, chord, rest or skip with optional duration,
+        multiplier and articulation shorthands without LilyPond parser.
+
+        Returns none when `string` needs LilyPond parser.
+        '''
+        import abjad
+        match = Leaf._leaf_string_regex.match(string)
+        if match is None:
+            return
+        duration = match.group('duration')
+        if duration is None:
+            duration = abjad.Duration(1, 4)
+        else:
+            try:
+                duration = abjad.Duration.from_lilypond_duration_string(
+                    duration)
+            except Exception:
+                return
+        indicators = []
+        if match.group('numerator') is not None:
+            numerator = int(match.group('numerator'))
+            denominator = int(match.group('denominator') or 1)
+            if denominator == 0:
+                return
+            indicators.append(abjad.Multiplier(numerator, denominator))
+        for direction, shorthand in re.findall(
+            r'([-^_])([-+.>^_|])',
+            match.group('articulations'),
+            ):
+            name = Leaf._articulation_shorthands[shorthand]
+            indicators.append(abjad.Articulation(name, direction=direction))
+        if match.group('rest_name') == 'r':
+            leaf = abjad.Rest(duration)
+        elif match.group('rest_name') == 's':
+            leaf = abjad.Skip(duration)
+        elif match.group('chord_body') is not None:
+            triples = []
+            for string_ in match.group('chord_body').split():
+                triple = Leaf._parse_note_head_string(string_)
+                if triple is None:
+                    return
+                triples.append(triple)
+            leaf = abjad.Chord([], duration)
+            for pitch, is_cautionary, is_forced in triples:
+                note_head = abjad.NoteHead(
+                    written_pitch=pitch,
+                    is_cautionary=is_cautionary,
+                    is_forced=is_forced,
+                    )
+                leaf.note_heads.append(note_head)
+        else:
+            triple = Leaf._parse_note_head_string(match.group('note_head'))
+            if triple is None:
+                return
+            pitch, is_cautionary, is_forced = triple
+            leaf = abjad.Note(pitch, duration)
+            leaf.note_head.is_cautionary = is_cautionary
+            leaf.note_head.is_forced = is_forced
+        for indicator in indicators:
+            # bypass attach() to avoid effective-indicator lookup;
+            # this works because leaf is new, has no parent
+            # and none of these indicators has a context:
+            wrapper = abjad.Wrapper(component=leaf, indicator=indicator)
+            leaf._wrappers.append(wrapper)
+        return leaf
+
+    @staticmethod
+    def _parse_string(string):
+        r'''Parses `string` into a single leaf.
+
+        Tries the regular-expression leaf tokenizer first and falls back to
+        LilyPond parser for anything the tokenizer does not recognize.
+        '''
+        import abjad
+        leaf = Leaf._parse_simple_string(string)
+        if leaf is None:
+            parsed = abjad.parse('{{ {} }}'.format(string))
+            assert len(parsed) == 1 and isinstance(parsed[0], Leaf)
+            leaf = parsed[0]
+        return leaf
+
     def _process_contribution_packet(self, contribution_packet):
         manager = LilyPondFormatManager
         indent = manager.indent
@@ -385,6 +530,7 @@ class Leaf(Component):
     def _remove_spanner(self, spanner):
         if id(spanner) not in [id(_) for _ in self._spanners]:
             raise Exception(f'{self!s} has no {spanner}.')
+        self._update_later(lilypond_format=True)
         spanners = [_ for _ in self._spanners if id(_) != id(spanner)]
         self._spanners = spanners
 
@@ -702,3 +848,4 @@ class Leaf(Component):
             message = message.format(rational)
             raise AssignabilityError(message)
         self._written_duration = rational
+        self._update_later(offsets=True)
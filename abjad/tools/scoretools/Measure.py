@@ -1,4 +1,5 @@
 import copy
+import functools
 from abjad.tools.exceptiontools import OverfullContainerError
 from abjad.tools.exceptiontools import UnderfullContainerError
 from .Container import Container
@@ -48,7 +49,7 @@ class Measure(Container):
         self._automatically_adjust_time_signature = False
         time_signature = time_signature or abjad.TimeSignature((4, 4))
         time_signature = abjad.TimeSignature(time_signature)
-        self.implicit_scaling = bool(implicit_scaling)
+        self._implicit_scaling = bool(implicit_scaling)
         Container.__init__(self, components, identifier=identifier)
         self._always_format_time_signature = False
         self._measure_number = None
@@ -301,27 +302,8 @@ class Measure(Container):
             return abjad.TimeSignature(duration)
 
     def _format_content_pieces(self):
-        import abjad
-        result = []
-        if (self.has_non_power_of_two_denominator and
-            type(self) is Measure and
-            self.implicit_scaling):
-            indent = abjad.LilyPondFormatManager.indent
-            string = "{}\\scaleDurations #'({} . {}) {{"
-            string = string.format(
-                indent,
-                self.implied_prolation.numerator,
-                self.implied_prolation.denominator,
-                )
-            result.append(string)
-            pieces = Container._format_content_pieces(self)
-            pieces = [indent + _ for _ in pieces]
-            result.extend(pieces)
-            result.append(indent + '}')
-        else:
-            result.extend(
-                Container._format_content_pieces(self))
-        return result
+        pieces = Container._format_content_pieces(self)
+        return list(self._scale_content_pieces(pieces))
 
     def _format_opening_slot(self, bundle):
         result = []
@@ -361,12 +343,54 @@ class Measure(Container):
         self._check_duration()
         return self._format_component()
 
+    def _get_lilypond_format_dependencies(self):
+        dependencies = Container._get_lilypond_format_dependencies(self)
+        if dependencies is not None and not self.always_format_time_signature:
+            get_previous_measure = self._get_previous_measure
+            parent = self._parent
+            if parent is not None and not parent.is_simultaneous:
+                index = parent._components.index(self)
+                get_previous_measure = functools.partial(
+                    self._get_previous_sibling_measure,
+                    parent,
+                    index,
+                    )
+            record = self._make_neighbor_record(get_previous_measure)
+            dependencies[1].append(record)
+        return dependencies
+
+    def _get_lilypond_format_key(self):
+        key = Container._get_lilypond_format_key(self)
+        key += (self.always_format_time_signature, self.implicit_scaling)
+        return key
+
     def _get_preprolated_duration(self):
         time_signature_prolation = 1
         if self.implicit_scaling:
             time_signature_prolation = self.time_signature.implied_prolation
         return time_signature_prolation * self._get_contents_duration()
 
+    def _get_previous_sibling_measure(self, parent, index):
+        r'''Gets previous measure in constant time when previous measure is
+        previous sibling at `index` - 1 in sequential `parent`.
+        '''
+        components = parent._components
+        if (self._parent is parent and
+            not parent.is_simultaneous and
+            0 < index < len(components) and
+            components[index] is self and
+            isinstance(components[index - 1], Measure)):
+            return components[index - 1]
+        return self._get_previous_measure()
+
+    def _iterate_content_pieces(self):
+        pieces = Container._iterate_content_pieces(self)
+        yield from self._scale_content_pieces(pieces)
+
+    def _iterate_lilypond_format(self):
+        self._check_duration()
+        yield from self._iterate_format_pieces()
+
     # TODO: see if self._scale can be combined with
     #       with self.scale_and_adjust_time_signature()
     def _scale(self, multiplier=None):
@@ -400,6 +424,25 @@ class Measure(Container):
         contents_multiplier = abjad.Multiplier(*pair)
         self._scale_contents(contents_multiplier)
 
+    def _scale_content_pieces(self, pieces):
+        import abjad
+        if (self.has_non_power_of_two_denominator and
+            type(self) is Measure and
+            self.implicit_scaling):
+            indent = abjad.LilyPondFormatManager.indent
+            string = "{}\\scaleDurations #'({} . {}) {{"
+            string = string.format(
+                indent,
+                self.implied_prolation.numerator,
+                self.implied_prolation.denominator,
+                )
+            yield string
+            for piece in pieces:
+                yield indent + piece
+            yield indent + '}'
+        else:
+            yield from pieces
+
     def _scale_denominator(self, factor):
         import abjad
         # save old time signature duration
@@ -443,6 +486,7 @@ class Measure(Container):
     def always_format_time_signature(self, argument):
         assert isinstance(argument, bool)
         self._always_format_time_signature = argument
+        self._update_later(lilypond_format=True)
 
     @property
     def automatically_adjust_time_signature(self):
@@ -538,6 +582,8 @@ class Measure(Container):
     def implicit_scaling(self, argument):
         assert isinstance(argument, bool)
         self._implicit_scaling = argument
+        self._update_later(offsets=True)
+        self._update_subtree_later()
 
     @property
     def implied_prolation(self):
@@ -725,6 +725,7 @@ class Mutation(abctools.AbjadObject):
             context = wrapper._find_correct_effective_context()
             if context is not None:
                 context._dependent_wrappers.append(wrapper)
+                context._dependent_wrapper_index.clear()
 
     # TODO: fix bug in function that causes tied notes to become untied
     def replace_measure_contents(self, new_contents):
@@ -32,14 +32,10 @@ class Note(Leaf):
     ### INITIALIZER ###
 
     def __init__(self, *arguments):
-        import abjad
         from abjad.ly import drums
         assert len(arguments) in (0, 1, 2)
         if len(arguments) == 1 and isinstance(arguments[0], str):
-            string = '{{ {} }}'.format(arguments[0])
-            parsed = abjad.parse(string)
-            assert len(parsed) == 1 and isinstance(parsed[0], Leaf)
-            arguments = [parsed[0]]
+            arguments = [Leaf._parse_string(arguments[0])]
         is_cautionary = False
         is_forced = False
         is_parenthesized = False
@@ -171,10 +167,12 @@ class Note(Leaf):
         if isinstance(argument, type(None)):
             self._note_head = None
         elif isinstance(argument, NoteHead):
+            argument._client = self
             self._note_head = argument
         else:
             note_head = NoteHead(client=self, written_pitch=argument)
             self._note_head = note_head
+        self._update_later(lilypond_format=True)
 
     @property
     def written_duration(self) -> Duration:
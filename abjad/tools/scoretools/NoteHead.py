@@ -58,7 +58,7 @@ class NoteHead(AbjadObject):
             written_pitch = note_head.written_pitch
             is_cautionary = note_head.is_cautionary
             is_forced = note_head.is_forced
-            tweak_pairs = note_head.tweak._get_attribute_pairs()
+            tweak_pairs = note_head._get_tweak_pairs()
         elif written_pitch is None:
             written_pitch = 0
         self.written_pitch = written_pitch
@@ -96,7 +96,7 @@ class NoteHead(AbjadObject):
             self.is_cautionary,
             self.is_forced,
             self.is_parenthesized,
-            self.tweak._get_attribute_pairs(),
+            self._get_tweak_pairs(),
             )
         return type(self)(*arguments)
 
@@ -184,7 +184,7 @@ class NoteHead(AbjadObject):
 
     def _get_format_specification(self):
         arguments = [repr(str(self))]
-        arguments.extend(self.tweak._get_attribute_pairs())
+        arguments.extend(self._get_tweak_pairs())
         arguments = ', '.join([str(x) for x in arguments])
         repr_text = '{}({})'.format(type(self).__name__, arguments)
         agent = systemtools.StorageFormatManager(self)
@@ -206,8 +206,8 @@ class NoteHead(AbjadObject):
         if self.is_parenthesized:
             result.append(r'\parenthesize')
         manager = abjad.LilyPondFormatManager
-        if isinstance(self._client, abjad.Chord):
-            for key, value in vars(self.tweak).items():
+        if isinstance(self._client, abjad.Chord) and self._tweak is not None:
+            for key, value in vars(self._tweak).items():
                 if not key.startswith('_'):
                     string = r'\tweak {} {}'
                     string = string.format(
@@ -245,6 +245,15 @@ class NoteHead(AbjadObject):
         result = '\n'.join(pieces)
         return result
 
+    def _get_tweak_pairs(self):
+        if self._tweak is None:
+            return ()
+        return self._tweak._get_attribute_pairs()
+
+    def _update_client_later(self):
+        if self.client is not None:
+            self.client._update_later(lilypond_format=True)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -328,6 +337,7 @@ class NoteHead(AbjadObject):
             assert isinstance(argument[1], str), repr(argument)
             assert isinstance(argument[2], str), repr(argument)
         self._alternative = argument
+        self._update_client_later()
 
     @property
     def client(self):
@@ -375,6 +385,7 @@ class NoteHead(AbjadObject):
         if argument is not None:
             argument = bool(argument)
         self._is_cautionary = argument
+        self._update_client_later()
 
     @property
     def is_forced(self) -> bool:
@@ -408,6 +419,7 @@ class NoteHead(AbjadObject):
         if argument is not None:
             argument = bool(argument)
         self._is_forced = argument
+        self._update_client_later()
 
     @property
     def is_parenthesized(self) -> bool:
@@ -443,6 +455,7 @@ class NoteHead(AbjadObject):
         if argument is not None:
             argument = bool(argument)
         self._is_parenthesized = argument
+        self._update_client_later()
 
     @property
     def named_pitch(self) -> NamedPitch:
@@ -494,5 +507,6 @@ class NoteHead(AbjadObject):
     def written_pitch(self, argument):
         written_pitch = NamedPitch(argument)
         self._written_pitch = written_pitch
+        self._update_client_later()
         if self.alternative is not None:
             self.alternative[0].written_pitch = written_pitch
@@ -74,8 +74,10 @@ class NoteHeadList(TypedList):
 
     def _on_insertion(self, item):
         item._client = self.client
+        item._update_client_later()
 
     def _on_removal(self, item):
+        item._update_client_later()
         item._client = None
 
     ### PRIVATE PROPERTIES ##
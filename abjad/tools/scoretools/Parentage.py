@@ -58,6 +58,7 @@ class Parentage(abctools.AbjadObject, collections.Sequence):
     __documentation_section__ = 'Selections'
 
     __slots__ = (
+        '_cache',
         '_component',
         '_components',
         '_root',
@@ -73,23 +74,23 @@ class Parentage(abctools.AbjadObject, collections.Sequence):
         ):
         import abjad
         assert isinstance(component, (abjad.Component, type(None)))
+        self._cache = None
         self._component = component
         if component is None:
             components = ()
         else:
-            components = []
             if include_self:
                 parent = component
             else:
                 parent = component._parent
-            prototype = (abjad.AfterGraceContainer, abjad.GraceContainer)
-            while parent is not None:
-                components.append(parent)
-                if grace_notes and isinstance(parent, prototype):
-                    parent = parent._carrier
-                else:
-                    parent = parent._parent
-            components = tuple(components)
+            if parent is not None and not grace_notes:
+                self._cache = self._get_cache(parent)
+                components = self._cache.get('components')
+                if components is None:
+                    components = self._get_components(parent)
+                    self._cache['components'] = components
+            else:
+                components = self._get_components(parent, grace_notes)
         self._components = components
 
     ### SPECIAL METHODS ###
@@ -110,6 +111,35 @@ class Parentage(abctools.AbjadObject, collections.Sequence):
 
     ### PRIVATE PROPERTIES ###
 
+    @property
+    def _logical_voice(self):
+        import abjad
+        if self._cache is not None and 'logical_voice' in self._cache:
+            return self._cache['logical_voice']
+        score, staff_group, staff, voice = '', '', '', ''
+        for component in self:
+            if isinstance(component, abjad.Voice):
+                if not voice:
+                    voice = self._id_string(component)
+            elif isinstance(component, abjad.Staff):
+                if not staff:
+                    staff = self._id_string(component)
+                    # explicit staff demands a nested voice:
+                    # if no explicit voice has been found,
+                    # create implicit voice here with random integer
+                    if not voice:
+                        voice = id(component)
+            elif isinstance(component, abjad.StaffGroup):
+                if not staff_group:
+                    staff_group = self._id_string(component)
+            elif isinstance(component, abjad.Score):
+                if not score:
+                    score = self._id_string(component)
+        logical_voice = (score, staff_group, staff, voice)
+        if self._cache is not None:
+            self._cache['logical_voice'] = logical_voice
+        return logical_voice
+
     @property
     def _prolations(self):
         import abjad
@@ -122,6 +152,29 @@ class Parentage(abctools.AbjadObject, collections.Sequence):
 
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _get_cache(component):
+        import abjad
+        version = abjad.UpdateManager._parentage_update_count
+        cache = component._parentage_cache
+        if cache is None or cache['version'] != version:
+            cache = {'version': version}
+            component._parentage_cache = cache
+        return cache
+
+    @staticmethod
+    def _get_components(component, grace_notes=False):
+        import abjad
+        components = []
+        prototype = (abjad.AfterGraceContainer, abjad.GraceContainer)
+        while component is not None:
+            components.append(component)
+            if grace_notes and isinstance(component, prototype):
+                component = component._carrier
+            else:
+                component = component._parent
+        return tuple(components)
+
     def _get_governor(self):
         import abjad
         for component in self:
@@ -139,6 +192,15 @@ class Parentage(abctools.AbjadObject, collections.Sequence):
         rhs = getattr(component, 'name', None) or id(component)
         return '{}-{!r}'.format(lhs, rhs)
 
+    def _is_current(self, score_index):
+        components = self.components
+        pairs = zip(components, components[1:])
+        for index, (child, parent) in zip(reversed(score_index), pairs):
+            children = parent._components
+            if len(children) <= index or children[index] is not child:
+                return False
+        return True
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -266,28 +328,8 @@ class Parentage(abctools.AbjadObject, collections.Sequence):
 
         Returns ordered dictionary.
         '''
-        from abjad.tools import scoretools
         keys = ('score', 'staff group', 'staff', 'voice')
-        logical_voice = collections.OrderedDict.fromkeys(keys, '')
-        for component in self:
-            if isinstance(component, scoretools.Voice):
-                if not logical_voice['voice']:
-                    logical_voice['voice'] = self._id_string(component)
-            elif isinstance(component, scoretools.Staff):
-                if not logical_voice['staff']:
-                    logical_voice['staff'] = self._id_string(component)
-                    # explicit staff demands a nested voice:
-                    # if no explicit voice has been found,
-                    # create implicit voice here with random integer
-                    if not logical_voice['voice']:
-                        logical_voice['voice'] = id(component)
-            elif isinstance(component, scoretools.StaffGroup):
-                if not logical_voice['staff group']:
-                    logical_voice['staff group'] = self._id_string(component)
-            elif isinstance(component, scoretools.Score):
-                if not logical_voice['score']:
-                    logical_voice['score'] = self._id_string(component)
-        return logical_voice
+        return collections.OrderedDict(zip(keys, self._logical_voice))
 
     @property
     def parent(self):
@@ -307,9 +349,14 @@ class Parentage(abctools.AbjadObject, collections.Sequence):
         Returns multiplier.
         '''
         import abjad
+        if self._cache is not None and 'prolation' in self._cache:
+            return self._cache['prolation']
         prolations = [abjad.Multiplier(1)] + self._prolations
         products = mathtools.cumulative_products(prolations)
-        return products[-1]
+        prolation = products[-1]
+        if self._cache is not None:
+            self._cache['prolation'] = prolation
+        return prolation
 
     @property
     def root(self):
@@ -409,6 +456,10 @@ class Parentage(abctools.AbjadObject, collections.Sequence):
 
         Returns tuple of zero or more nonnegative integers.
         '''
+        if self._cache is not None:
+            result = self._cache.get('score_index')
+            if result is not None and self._is_current(result):
+                return result
         result = []
         current = self[0]
         for parent in self[1:]:
@@ -416,6 +467,8 @@ class Parentage(abctools.AbjadObject, collections.Sequence):
             result.insert(0, index)
             current = parent
         result = tuple(result)
+        if self._cache is not None:
+            self._cache['score_index'] = result
         return result
 
     @property
@@ -455,6 +508,8 @@ class Parentage(abctools.AbjadObject, collections.Sequence):
         Returns nonnegative integer.
         '''
         from abjad.tools import scoretools
+        if self._cache is not None and 'tuplet_depth' in self._cache:
+            return self._cache['tuplet_depth']
         result = 0
         # should probably interate up to only first simultaneous container
         # in parentage.
@@ -463,6 +518,8 @@ class Parentage(abctools.AbjadObject, collections.Sequence):
         for parent in self[1:]:
             if isinstance(parent, scoretools.Tuplet):
                 result += 1
+        if self._cache is not None:
+            self._cache['tuplet_depth'] = result
         return result
 
     ### PUBLIC METHODS ###
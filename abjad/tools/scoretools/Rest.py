@@ -32,10 +32,7 @@ class Rest(Leaf):
         import abjad
         original_input = written_duration
         if isinstance(written_duration, str):
-            string = '{{ {} }}'.format(written_duration)
-            parsed = abjad.parse(string)
-            assert len(parsed) == 1 and isinstance(parsed[0], Leaf)
-            written_duration = parsed[0]
+            written_duration = Leaf._parse_string(written_duration)
         if isinstance(written_duration, Leaf):
             written_duration = written_duration.written_duration
         elif written_duration is None:
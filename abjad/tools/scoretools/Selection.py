@@ -1133,12 +1133,12 @@ class Selection(AbjadValueObject, collections.Sequence):
         if not isinstance(first, prototype):
             return False
         first_parentage = abjad_inspect(first).get_parentage()
-        first_logical_voice = first_parentage.logical_voice
+        first_logical_voice = first_parentage._logical_voice
         first_root = first_parentage.root
         previous = first
         for current in self[1:]:
             current_parentage = abjad_inspect(current).get_parentage()
-            current_logical_voice = current_parentage.logical_voice
+            current_logical_voice = current_parentage._logical_voice
             # false if wrong type of component found
             if not isinstance(current, prototype):
                 return False
@@ -1210,14 +1210,14 @@ class Selection(AbjadValueObject, collections.Sequence):
         if not abjad_inspect(first).get_parentage().is_orphan:
             orphan_components = False
         same_logical_voice = True
-        first_signature = abjad_inspect(first).get_parentage().logical_voice
+        first_signature = abjad_inspect(first).get_parentage()._logical_voice
         for component in self[1:]:
             parentage = abjad_inspect(component).get_parentage()
             if not parentage.is_orphan:
                 orphan_components = False
             if not allow_orphans and orphan_components:
                 return False
-            if parentage.logical_voice != first_signature:
+            if parentage._logical_voice != first_signature:
                 same_logical_voice = False
             if not allow_orphans and not same_logical_voice:
                 return False
@@ -177,10 +177,10 @@ class Tuplet(Container):
         return self._format_slot_contributions_with_indent(result)
 
     def _format_lilypond_fraction_command_string(self):
-        import abjad
         if self.hide:
             return ''
-        if 'text' in vars(abjad.override(self).tuplet_number):
+        manager = self._lilypond_grob_name_manager
+        if manager is not None and 'text' in vars(manager.tuplet_number):
             return ''
         if (self.augmentation() or
             not self._get_power_of_two_denominator() or
@@ -254,6 +254,16 @@ class Tuplet(Container):
         self._update_now(indicators=True)
         return self._format_component()
 
+    def _get_lilypond_format_key(self):
+        key = Container._get_lilypond_format_key(self)
+        key += (
+            self.denominator,
+            self.force_fraction,
+            self.hide,
+            self.multiplier,
+            )
+        return key
+
     def _get_multiplier_fraction_string(self):
         import abjad
         if self.denominator is not None:
@@ -382,6 +392,7 @@ class Tuplet(Container):
         elif not isinstance(argument, type(None)):
             raise TypeError(argument)
         self._denominator = argument
+        self._update_later(lilypond_format=True)
 
     @property
     def force_fraction(self) -> typing.Optional[bool]:
@@ -561,6 +572,7 @@ class Tuplet(Container):
     def force_fraction(self, argument):
         if isinstance(argument, (bool, type(None))):
             self._force_fraction = argument
+            self._update_later(lilypond_format=True)
         else:
             message = f'force fraction must be boolean (not {argument!r}).'
             raise TypeError(message)
@@ -638,6 +650,7 @@ class Tuplet(Container):
     def hide(self, argument):
         assert isinstance(argument, (bool, type(None))), repr(argument)
         self._hide = argument
+        self._update_later(lilypond_format=True)
 
     @property
     def implied_prolation(self) -> Multiplier:
@@ -719,6 +732,7 @@ class Tuplet(Container):
             raise ValueError(message)
         if 0 < rational:
             self._multiplier = rational
+            self._update_later(offsets=True)
         else:
             message = 'tuplet multiplier must be positive: {!r}.'
             message = message.format(argument)
@@ -1,4 +1,6 @@
+import bisect
 import collections
+import heapq
 from abjad.tools import abctools
 
 
@@ -75,8 +77,6 @@ class VerticalMoment(abctools.AbjadObject):
             self._governors = governors
             assert isinstance(components, collections.Iterable)
             components = list(components)
-            components.sort(
-                key=lambda _: abjad.inspect(_).get_parentage().score_index)
         self._components = components
 
     ### SPECIAL METHODS ###
@@ -132,27 +132,6 @@ class VerticalMoment(abctools.AbjadObject):
 
     ### PRIVATE METHODS ###
 
-    @staticmethod
-    def _find_index(container, offset):
-        r'''Based off of Python's bisect.bisect() function.
-        '''
-        import abjad
-        lo = 0
-        hi = len(container)
-        while lo < hi:
-            mid = (lo + hi) // 2
-            start_offset = abjad.inspect(container[mid]).get_timespan().start_offset
-            stop_offset = abjad.inspect(container[mid]).get_timespan().stop_offset
-            if start_offset <= offset < stop_offset:
-                lo = mid + 1
-            # if container[mid] is of nonzero duration
-            elif start_offset < stop_offset:
-                hi = mid
-            # container[mid] is of zero duration so we skip it
-            else:
-                lo = mid + 1
-        return lo - 1
-
     @staticmethod
     def _from_offset(argument, offset):
         import abjad
@@ -162,7 +141,15 @@ class VerticalMoment(abctools.AbjadObject):
         message = 'must be component or of Abjad components: {!r}.'
         message = message.format(argument)
         if isinstance(argument, abjad.Component):
-            governors.append(argument)
+            offsets, component_lists = VerticalMoment._get_timeline(argument)
+            index = bisect.bisect(offsets, offset) - 1
+            components = []
+            if 0 <= index:
+                for component in component_lists[index]:
+                    timespan = component._timespan
+                    if timespan.start_offset <= offset < timespan.stop_offset:
+                        components.append(component)
+            return (argument,), tuple(components)
         elif isinstance(argument, prototype):
             for x in argument:
                 if isinstance(x, abjad.Component):
@@ -176,7 +163,7 @@ class VerticalMoment(abctools.AbjadObject):
         governors = tuple(governors)
         components = []
         for governor in governors:
-            components.extend(VerticalMoment._recurse(governor, offset))
+            components.extend(VerticalMoment._from_offset(governor, offset)[1])
         components.sort(
             key=lambda x: abjad.inspect(x).get_parentage().score_index)
         components = tuple(components)
@@ -187,21 +174,86 @@ class VerticalMoment(abctools.AbjadObject):
         return abjad.FormatSpecification(client=self)
 
     @staticmethod
-    def _recurse(component, offset):
+    def _get_timeline(governor):
+        r'''Gets start offset and components of every vertical moment in
+        `governor`.
+
+        Caches timeline on `governor`. Cache is ignored once offsets have been
+        recomputed anywhere.
+
+        Returns list of offsets and list of component tuples.
+        '''
         import abjad
-        result = []
-        if (abjad.inspect(component).get_timespan().start_offset <=
-            offset < abjad.inspect(component).get_timespan().stop_offset):
-            result.append(component)
-            if hasattr(component, 'components'):
+        governor._update_now(offsets=True)
+        offset_update_count = abjad.UpdateManager._offset_update_count
+        entry = governor._vertical_moment_timeline
+        if (governor._offsets_are_current and
+            entry is not None and
+            entry[0] == offset_update_count):
+            return entry[1], entry[2]
+        offsets, component_lists = [], []
+        for offset, components in VerticalMoment._iterate_timeline(governor):
+            offsets.append(offset)
+            component_lists.append(components)
+        if governor._offsets_are_current:
+            entry = (offset_update_count, offsets, component_lists)
+            governor._vertical_moment_timeline = entry
+        return offsets, component_lists
+
+    @staticmethod
+    def _iterate_timeline(governor):
+        r'''Merges per-voice stop offsets in `governor` into vertical moments.
+
+        Keeps components in score order keyed by score index and pops
+        stopping components from a heap of stop offsets.
+
+        Yields offset and component tuple for each vertical moment.
+        '''
+        import abjad
+        score_indices, components, stop_offsets = [], [], []
+
+        def _buffer_components_starting_with(component, score_index):
+            i = bisect.bisect(score_indices, score_index)
+            score_indices.insert(i, score_index)
+            components.insert(i, component)
+            stop_offset = component._timespan.stop_offset
+            heapq.heappush(stop_offsets, (stop_offset, score_index, component))
+            if isinstance(component, abjad.Container):
                 if component.is_simultaneous:
-                    for x in component:
-                        result.extend(VerticalMoment._recurse(x, offset))
-                else:
-                    child = component[
-                        VerticalMoment._find_index(component, offset)]
-                    result.extend(VerticalMoment._recurse(child, offset))
-        return result
+                    for i, component_ in enumerate(component._components):
+                        score_index_ = score_index + (i,)
+                        _buffer_components_starting_with(
+                            component_,
+                            score_index_,
+                            )
+                elif component._components:
+                    _buffer_components_starting_with(
+                        component._components[0],
+                        score_index + (0,),
+                        )
+
+        score_index = abjad.inspect(governor).get_parentage().score_index
+        _buffer_components_starting_with(governor, score_index)
+        current_offset = abjad.Offset(0)
+        while components:
+            yield current_offset, tuple(components)
+            current_offset = stop_offsets[0][0]
+            stopped = []
+            while stop_offsets and stop_offsets[0][0] <= current_offset:
+                stopped.append(heapq.heappop(stop_offsets)[1:])
+            for score_index, component in stopped:
+                i = bisect.bisect_left(score_indices, score_index)
+                del score_indices[i]
+                del components[i]
+                parent = component._parent
+                if parent is None or parent.is_simultaneous:
+                    continue
+                i = parent.index(component) + 1
+                if i < len(parent):
+                    _buffer_components_starting_with(
+                        parent[i],
+                        score_index[:-1] + (i,),
+                        )
 
     ### PUBLIC PROPERTIES ###
 
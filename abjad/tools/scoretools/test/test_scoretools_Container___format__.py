@@ -0,0 +1,313 @@
+import abjad
+
+
+def test_scoretools_Container___format___01():
+    r'''Formats container again after override.
+    '''
+
+    staff = abjad.Staff([
+        abjad.Measure((2, 4), "c'8 d'8 e'8 f'8"),
+        abjad.Measure((2, 4), "g'8 a'8 b'8 c''8"),
+        ])
+    format(staff)
+    abjad.override(staff[1][0]).note_head.color = 'red'
+    abjad.override(staff[1]).beam.positions = (4, 4)
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff
+        {
+            {   % measure
+                \time 2/4
+                c'8
+                d'8
+                e'8
+                f'8
+            }   % measure
+            {   % measure
+                \override Beam.positions = #'(4 . 4)
+                \once \override NoteHead.color = #red
+                g'8
+                a'8
+                b'8
+                c''8
+                \revert Beam.positions
+            }   % measure
+        }
+        '''
+        )
+
+
+def test_scoretools_Container___format___02():
+    r'''Formats container again after setting.
+    '''
+
+    staff = abjad.Staff([
+        abjad.Measure((2, 4), "c'8 d'8 e'8 f'8"),
+        abjad.Measure((2, 4), "g'8 a'8 b'8 c''8"),
+        ])
+    format(staff)
+    abjad.setting(staff[1]).auto_beaming = False
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff
+        {
+            {   % measure
+                \time 2/4
+                c'8
+                d'8
+                e'8
+                f'8
+            }   % measure
+            {   % measure
+                \set autoBeaming = ##f
+                g'8
+                a'8
+                b'8
+                c''8
+            }   % measure
+        }
+        '''
+        )
+
+
+def test_scoretools_Container___format___03():
+    r'''Formats container again after tweak of attached markup.
+    '''
+
+    staff = abjad.Staff([
+        abjad.Measure((2, 4), "c'8 d'8 e'8 f'8"),
+        abjad.Measure((2, 4), "g'8 a'8 b'8 c''8"),
+        ])
+    format(staff)
+    markup = abjad.Markup('pizz.', direction=abjad.Up)
+    abjad.attach(markup, staff[1][0])
+    format(staff)
+    abjad.tweak(markup).color = 'red'
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff
+        {
+            {   % measure
+                \time 2/4
+                c'8
+                d'8
+                e'8
+                f'8
+            }   % measure
+            {   % measure
+                g'8
+                - \tweak color #red
+                ^ \markup { pizz. }
+                a'8
+                b'8
+                c''8
+            }   % measure
+        }
+        '''
+        )
+
+
+def test_scoretools_Container___format___04():
+    r'''Formats container again after indicator attach and replacement.
+    '''
+
+    staff = abjad.Staff([
+        abjad.Measure((2, 4), "c'8 d'8 e'8 f'8"),
+        abjad.Measure((2, 4), "g'8 a'8 b'8 c''8"),
+        ])
+    format(staff)
+    abjad.attach(abjad.Articulation('accent'), staff[1][2])
+    abjad.detach(abjad.TimeSignature, staff[1])
+    abjad.attach(abjad.TimeSignature((4, 8)), staff[1])
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff
+        {
+            {   % measure
+                \time 2/4
+                c'8
+                d'8
+                e'8
+                f'8
+            }   % measure
+            {   % measure
+                \time 4/8
+                g'8
+                a'8
+                b'8
+                -\accent
+                c''8
+            }   % measure
+        }
+        '''
+        )
+
+
+def test_scoretools_Container___format___05():
+    r'''Formats container again after indicator detach.
+    '''
+
+    staff = abjad.Staff([
+        abjad.Measure((2, 4), "c'8 d'8 e'8 f'8"),
+        abjad.Measure((2, 4), "g'8 a'8 b'8 c''8"),
+        ])
+    format(staff)
+    abjad.attach(abjad.Dynamic('p'), staff[1][0])
+    abjad.attach(abjad.Articulation('accent'), staff[0][3])
+    format(staff)
+    abjad.detach(abjad.Dynamic, staff[1][0])
+    abjad.detach(abjad.Articulation, staff[0][3])
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff
+        {
+            {   % measure
+                \time 2/4
+                c'8
+                d'8
+                e'8
+                f'8
+            }   % measure
+            {   % measure
+                g'8
+                a'8
+                b'8
+                c''8
+            }   % measure
+        }
+        '''
+        )
+
+
+def test_scoretools_Container___format___06():
+    r'''Formats container again after spanner edit.
+    '''
+
+    staff = abjad.Staff([
+        abjad.Measure((2, 4), "c'8 d'8 e'8 f'8"),
+        abjad.Measure((2, 4), "g'8 a'8 b'8 c''8"),
+        ])
+    format(staff)
+    abjad.attach(abjad.Slur(), abjad.select(staff).leaves()[2:6])
+    abjad.attach(abjad.Beam(), staff[1][2:])
+    format(staff)
+    slur = abjad.inspect(staff[0][2]).get_spanner(abjad.Slur)
+    slur._append(staff[1][2])
+    abjad.detach(abjad.Beam, staff[1][2])
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff
+        {
+            {   % measure
+                \time 2/4
+                c'8
+                d'8
+                e'8
+                (
+                f'8
+            }   % measure
+            {   % measure
+                g'8
+                a'8
+                b'8
+                )
+                c''8
+            }   % measure
+        }
+        '''
+        )
+
+
+def test_scoretools_Container___format___07():
+    r'''Formatting container again reuses LilyPond format of containers
+    unchanged since last format.
+    '''
+
+    staff = abjad.Staff([
+        abjad.Measure((2, 4), "c'8 d'8 e'8 f'8"),
+        abjad.Measure((2, 4), "g'8 a'8 b'8 c''8"),
+        abjad.Measure((2, 4), "d''8 e''8 f''8 g''8"),
+        ])
+    format(staff)
+    caches = [_._lilypond_format_cache for _ in staff]
+    staff[2][0].written_pitch = 'bf'
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff
+        {
+            {   % measure
+                \time 2/4
+                c'8
+                d'8
+                e'8
+                f'8
+            }   % measure
+            {   % measure
+                g'8
+                a'8
+                b'8
+                c''8
+            }   % measure
+            {   % measure
+                bf8
+                e''8
+                f''8
+                g''8
+            }   % measure
+        }
+        '''
+        )
+    assert staff[0]._lilypond_format_cache is caches[0]
+    assert staff[1]._lilypond_format_cache is caches[1]
+    assert staff[2]._lilypond_format_cache is not caches[2]
+
+
+def test_scoretools_Container___format___08():
+    r'''Getting overrides, settings and tweaks without changing them keeps
+    LilyPond format of containers.
+    '''
+
+    staff = abjad.Staff([
+        abjad.Measure((2, 4), "c'8 d'8 e'8 f'8"),
+        abjad.Measure((2, 4), "g'8 a'8 b'8 c''8"),
+        ])
+    format(staff)
+    caches = [_._lilypond_format_cache for _ in staff]
+    assert abjad.inspect(staff).is_well_formed()
+    abjad.override(staff[0][0])
+    abjad.setting(staff[1])
+    manager = abjad.override(staff[1][1])
+    staff[1][1].note_head.tweak
+    format(staff)
+    assert staff[0]._lilypond_format_cache is caches[0]
+    assert staff[1]._lilypond_format_cache is caches[1]
+
+    manager.stem.direction = abjad.Up
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff
+        {
+            {   % measure
+                \time 2/4
+                c'8
+                d'8
+                e'8
+                f'8
+            }   % measure
+            {   % measure
+                g'8
+                \once \override Stem.direction = #up
+                a'8
+                b'8
+                c''8
+            }   % measure
+        }
+        '''
+        )
@@ -1,4 +1,5 @@
 import abjad
+import pytest
 
 
 def test_scoretools_Container_index_01():
@@ -11,3 +12,36 @@ def test_scoretools_Container_index_01():
     assert container.index(container[1]) == 1
     assert container.index(container[2]) == 2
     assert container.index(container[3]) == 3
+
+
+def test_scoretools_Container_index_02():
+    r'''Indices stay correct after container is mutated.
+    '''
+
+    container = abjad.Container("c'4 d'4 e'4 f'4")
+    notes = container[:]
+
+    assert [container.index(_) for _ in notes] == [0, 1, 2, 3]
+
+    container.insert(0, abjad.Note("b4"))
+    del(container[2])
+    container.append(notes[1])
+
+    assert container.index(notes[0]) == 1
+    assert container.index(notes[2]) == 2
+    assert container.index(notes[3]) == 3
+    assert container.index(notes[1]) == 4
+
+
+def test_scoretools_Container_index_03():
+    r'''Raises value error on component not in container.
+    '''
+
+    container = abjad.Container("c'4 d'4")
+    other = abjad.Container("c'4 d'4")
+    other.index(other[1])
+
+    with pytest.raises(ValueError):
+        container.index(other[1])
+    with pytest.raises(ValueError):
+        container.index(abjad.Note("c'4"))
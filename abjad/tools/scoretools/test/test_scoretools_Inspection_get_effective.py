@@ -0,0 +1,62 @@
+import abjad
+
+
+def test_scoretools_Inspection_get_effective_01():
+    r'''Steps through effective indicators attached in different contexts.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8 g'8 a'8")
+    abjad.attach(abjad.Clef('alto'), staff[0])
+    abjad.attach(abjad.Clef('bass'), staff[2])
+    abjad.attach(abjad.Clef('treble'), staff[4], context='Staff')
+
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef, n=-2) is None
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef, n=-1) == \
+        abjad.Clef('alto')
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef) == \
+        abjad.Clef('bass')
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef, n=1) == \
+        abjad.Clef('treble')
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef, n=2) is None
+
+
+def test_scoretools_Inspection_get_effective_02():
+    r'''Effective indicators follow changes to offsets and attachments.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef('bass'), staff[2])
+
+    assert abjad.inspect(staff[1]).get_effective(abjad.Clef) is None
+    assert abjad.inspect(staff[2]).get_effective(abjad.Clef) == \
+        abjad.Clef('bass')
+
+    staff.insert(0, abjad.Note("b8"))
+
+    assert abjad.inspect(staff[2]).get_effective(abjad.Clef) is None
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef) == \
+        abjad.Clef('bass')
+
+    abjad.detach(abjad.Clef, staff[3])
+    abjad.attach(abjad.Clef('alto'), staff[1])
+
+    assert abjad.inspect(staff[0]).get_effective(abjad.Clef) is None
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef) == \
+        abjad.Clef('alto')
+
+
+def test_scoretools_Inspection_get_effective_03():
+    r'''Prototype may be tuple.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef('bass'), staff[0])
+    abjad.attach(abjad.TimeSignature((2, 8)), staff[2])
+    prototype = (abjad.Clef, abjad.TimeSignature)
+
+    assert abjad.inspect(staff[1]).get_effective(prototype) == \
+        abjad.Clef('bass')
+    assert abjad.inspect(staff[3]).get_effective(prototype) == \
+        abjad.TimeSignature((2, 8))
+    assert abjad.inspect(staff[3]).get_effective(prototype, n=-1) == \
+        abjad.Clef('bass')
@@ -142,3 +142,35 @@ def test_scoretools_Inspection_get_vertical_moment_at_02():
 
     moment = abjad.inspect(score).get_vertical_moment_at((99, 8))
     assert moment.leaves == ()
+
+
+def test_scoretools_Inspection_get_vertical_moment_at_03():
+    r'''Finds components that start after middle child of container.
+    Matches vertical moments iterated from score.
+    '''
+
+    score = abjad.Score([
+        abjad.Staff(r"c'8 d'8 e'4 \times 2/3 { c'4 d'4 e'4 } f'2"),
+        abjad.Staff(r"c'4. d'8 <e' g'>4 r4 s2"),
+        ])
+
+    moment = abjad.inspect(score).get_vertical_moment_at((1, 2))
+    assert moment.leaves == (score[0][3][0], score[1][2])
+
+    for moment in abjad.iterate(score).vertical_moments():
+        moment_ = abjad.inspect(score).get_vertical_moment_at(moment.offset)
+        assert moment_ == moment
+
+
+def test_scoretools_Inspection_get_vertical_moment_at_04():
+    r'''Vertical moments reflect changes to score.
+    '''
+
+    score = abjad.Score([abjad.Staff("c'4 d'4"), abjad.Staff("e'2")])
+    moment = abjad.inspect(score).get_vertical_moment_at((1, 4))
+    assert moment.leaves == (score[0][1], score[1][0])
+
+    score[0].insert(0, abjad.Note("b'8"))
+    moment = abjad.inspect(score).get_vertical_moment_at((1, 4))
+    assert moment.leaves == (score[0][1], score[1][0])
+    assert len(list(abjad.iterate(score).vertical_moments())) == 4
@@ -556,3 +556,71 @@ def test_scoretools_Iteration__depth_first_08():
     c'8
     Staff{5}
     '''
+
+
+def test_scoretools_Iteration__depth_first_09():
+    r'''Yields each container once when leaf carries empty grace container.
+    Yields components in same order as iteration.
+    '''
+
+    voice = abjad.Voice(r"c'8 d'8 \times 2/3 { e'8 f'8 g'8 }")
+    abjad.attach(abjad.GraceContainer(), voice[0])
+    abjad.attach(abjad.GraceContainer("cf''16 bf'16"), voice[1])
+    abjad.attach(abjad.AfterGraceContainer("af'16"), voice[1])
+
+    components = list(abjad.iterate(voice)._depth_first())
+    assert components == [
+        voice,
+        voice[0],
+        voice[0]._grace_container,
+        voice[1],
+        voice[1]._grace_container,
+        voice[1]._grace_container[0],
+        voice[1]._grace_container[1],
+        voice[1]._after_grace_container,
+        voice[1]._after_grace_container[0],
+        voice[2],
+        voice[2][0],
+        voice[2][1],
+        voice[2][2],
+        ]
+
+    prototype = (abjad.GraceContainer, abjad.AfterGraceContainer)
+    components = [_ for _ in components if not isinstance(_, prototype)]
+    components_ = list(abjad.iterate(voice).components())
+    assert set(map(id, components)) == set(map(id, components_))
+    leaves = list(abjad.iterate(voice).leaves(grace_notes=True))
+    assert leaves == [
+        voice[1]._grace_container[0],
+        voice[1]._grace_container[1],
+        voice[1]._after_grace_container[0],
+        ]
+    leaves = list(abjad.iterate(voice).leaves(reverse=True))
+    assert leaves == [
+        voice[2][2],
+        voice[2][1],
+        voice[2][0],
+        voice[1]._after_grace_container[0],
+        voice[1],
+        voice[1]._grace_container[1],
+        voice[1]._grace_container[0],
+        voice[0],
+        ]
+
+
+def test_scoretools_Iteration__depth_first_10():
+    r'''Yields each container once when container is empty.
+    '''
+
+    staff = abjad.Staff([abjad.Container("c'4"), abjad.Container()])
+    components = list(abjad.iterate(staff)._depth_first())
+    assert components == [staff, staff[0], staff[0][0], staff[1]]
+
+    staff = abjad.Staff([abjad.Container(), abjad.Container("c'4")])
+    components = list(abjad.iterate(staff)._depth_first())
+    assert components == [staff, staff[0], staff[1], staff[1][0]]
+
+    container = abjad.Container([abjad.Container()])
+    staff = abjad.Staff([container, abjad.Note("d'4")])
+    components = list(abjad.iterate(staff)._depth_first())
+    assert components == [staff, staff[0], staff[0][0], staff[1]]
@@ -0,0 +1,69 @@
+import abjad
+import pytest
+
+
+strings = [
+    "c'8",
+    "cs'8.",
+    "bf,,16",
+    "ctqs''4..",
+    "c!4",
+    "c?4",
+    "c'",
+    "c'8-.",
+    "c'8 -. ^> _-",
+    "c'4 * 1/2",
+    "c'4*3",
+    "<c' e' g'>4",
+    "<c'! e'?>8-.",
+    "<>4",
+    'r4',
+    'r8 * 3/4',
+    's2',
+    's',
+    ]
+
+
+@pytest.mark.parametrize('string', strings)
+def test_scoretools_Leaf__parse_string_01(string):
+    r'''Leaf tokenizer agrees with LilyPond parser.
+    '''
+
+    leaf = abjad.Leaf._parse_simple_string(string)
+    parsed = abjad.parse('{{ {} }}'.format(string))[0]
+
+    assert leaf is not None
+    assert type(leaf) is type(parsed)
+    assert format(leaf) == format(parsed)
+    assert abjad.inspect(leaf).get_indicators() == \
+        abjad.inspect(parsed).get_indicators()
+
+
+@pytest.mark.parametrize('string', [
+    "c'8 \\p",
+    "c'\\breve",
+    "c'4-1",
+    "c'4 \\rest",
+    'R1',
+    'aes4',
+    "c'3",
+    ])
+def test_scoretools_Leaf__parse_string_02(string):
+    r'''Leaf tokenizer leaves everything else to LilyPond parser.
+    '''
+
+    assert abjad.Leaf._parse_simple_string(string) is None
+
+
+def test_scoretools_Leaf__parse_string_03():
+    r'''Strings outside tokenizer grammar still initialize leaves.
+    '''
+
+    note = abjad.Note("c'8 \\p")
+
+    assert format(note) == abjad.String.normalize(
+        r'''
+        c'8
+        \p
+        '''
+        )
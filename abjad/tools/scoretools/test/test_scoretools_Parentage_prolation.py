@@ -0,0 +1,94 @@
+import abjad
+import copy
+
+
+def test_scoretools_Parentage_prolation_01():
+    r'''Cached prolation and tuplet depth follow tuplet changes.
+    '''
+
+    inner = abjad.Tuplet((2, 3), "c'8 d'8 e'8")
+    outer = abjad.Tuplet((4, 5), [inner, abjad.Note("f'8")])
+    staff = abjad.Staff([outer])
+    note = inner[0]
+
+    parentage = abjad.inspect(note).get_parentage()
+    assert parentage.prolation == abjad.Multiplier(8, 15)
+    assert parentage.tuplet_depth == 2
+    assert abjad.inspect(note).get_duration() == abjad.Duration(1, 15)
+
+    inner.multiplier = abjad.Multiplier(4, 5)
+    parentage = abjad.inspect(note).get_parentage()
+    assert parentage.prolation == abjad.Multiplier(16, 25)
+    assert abjad.inspect(note).get_duration() == abjad.Duration(2, 25)
+
+    staff.append(note)
+    parentage = abjad.inspect(note).get_parentage()
+    assert parentage.prolation == abjad.Multiplier(1)
+    assert parentage.tuplet_depth == 0
+    assert parentage.components == (note, staff)
+    assert abjad.inspect(note).get_duration() == abjad.Duration(1, 8)
+
+    abjad.mutate(staff[-1:]).wrap(abjad.Tuplet((2, 3), []))
+    parentage = abjad.inspect(note).get_parentage()
+    assert parentage.prolation == abjad.Multiplier(2, 3)
+    assert parentage.tuplet_depth == 1
+
+
+def test_scoretools_Parentage_prolation_02():
+    r'''Cached prolation follows measure implicit scaling.
+    '''
+
+    measure = abjad.Measure((4, 10), "c'8 d'8 e'8 f'8")
+    note = measure[0]
+
+    assert abjad.inspect(note).get_parentage().prolation == 1
+    measure.implicit_scaling = True
+    assert abjad.inspect(note).get_parentage().prolation == \
+        abjad.Multiplier(4, 5)
+
+
+def test_scoretools_Parentage_prolation_03():
+    r'''Cached score index and logical voice follow score changes.
+    '''
+
+    voice = abjad.Voice("c'8 d'8 e'8")
+    staff = abjad.Staff([voice])
+    note = voice[1]
+
+    parentage = abjad.inspect(note).get_parentage()
+    assert parentage.score_index == (0, 1)
+    logical_voice = parentage.logical_voice
+    assert logical_voice['voice'] == 'Voice-{!r}'.format(id(voice))
+
+    voice.insert(0, abjad.Note("b8"))
+    staff.insert(0, abjad.Voice("g'4"))
+    assert abjad.inspect(note).get_parentage().score_index == (1, 2)
+
+    voice.name = 'Upper_Voice'
+    logical_voice = abjad.inspect(note).get_parentage().logical_voice
+    assert logical_voice['voice'] == "Voice-'Upper_Voice'"
+    assert logical_voice['staff'] == 'Staff-{!r}'.format(id(staff))
+
+    logical_voice['voice'] = 'foo'
+    logical_voice = abjad.inspect(note).get_parentage().logical_voice
+    assert logical_voice['voice'] == "Voice-'Upper_Voice'"
+
+    del(voice[2])
+    assert abjad.inspect(note).get_parentage().components == (note,)
+    assert abjad.inspect(note).get_parentage().score_index == ()
+
+
+def test_scoretools_Parentage_prolation_04():
+    r'''Copied components do not reuse cached logical voice of original.
+    '''
+
+    staff = abjad.Staff("c'4 c'4 d'4")
+    logical_voice = abjad.inspect(staff[0]).get_parentage().logical_voice
+    assert logical_voice['staff'] == 'Staff-{!r}'.format(id(staff))
+
+    new_staff = copy.deepcopy(staff)
+    logical_voice = abjad.inspect(new_staff[0]).get_parentage().logical_voice
+    assert logical_voice['staff'] == 'Staff-{!r}'.format(id(new_staff))
+    assert abjad.select(new_staff[:]).are_logical_voice()
+    abjad.attach(abjad.Tie(), new_staff[:2])
+    assert len(abjad.inspect(new_staff[0]).get_logical_tie()) == 2
@@ -75,6 +75,8 @@ class ClefSpanner(Spanner):
         '_clef',
         )
 
+    _format_reads_effective_indicators = True
+
     ### INITIALIZER ###
 
     def __init__(
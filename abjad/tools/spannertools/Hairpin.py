@@ -290,6 +290,8 @@ class Hairpin(Spanner):
         '_trim',
         )
 
+    _format_reads_effective_indicators = True
+
     ### INITIALIZER ###
 
     def __init__(
@@ -1999,6 +1999,8 @@ class MetronomeMarkSpanner(Spanner):
         '_stem_height',
         )
 
+    _format_reads_effective_indicators = True
+
     ### INITIALIZER ###
 
     def __init__(
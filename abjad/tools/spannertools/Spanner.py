@@ -20,8 +20,6 @@ from abjad.tools.topleveltools.attach import attach
 from abjad.tools.topleveltools.inspect import inspect
 from abjad.tools.topleveltools.override import override
 from abjad.tools.topleveltools.select import select
-from abjad.tools.topleveltools.setting import setting
-from abjad.tools.topleveltools.tweak import tweak
 abjad_tags = Tags()
 
 
@@ -42,6 +40,7 @@ class Spanner(AbjadObject, collections.Sequence):
         '_ignore_before_attach',
         '_leaves',
         '_left_broken',
+        '_lilypond_format_version',
         '_lilypond_grob_name_manager',
         '_lilypond_setting_name_manager',
         '_lilypond_tweak_manager',
@@ -50,6 +49,8 @@ class Spanner(AbjadObject, collections.Sequence):
         '_wrappers',
         )
 
+    _format_reads_effective_indicators = False
+
     ### INITIALIZER ###
 
     def __init__(
@@ -58,6 +59,7 @@ class Spanner(AbjadObject, collections.Sequence):
         ) -> None:
         overrides = overrides or OrderedDict()
         self._contiguity_constraint = 'logical voice'
+        self._lilypond_format_version = 0
         self._apply_overrides(overrides)
         self._deactivate = None
         self._ignore_attachment_test = None
@@ -93,10 +95,14 @@ class Spanner(AbjadObject, collections.Sequence):
         '''
         new = type(self)(*self.__getnewargs__())
         if getattr(self, '_lilypond_grob_name_manager', None) is not None:
-            new._lilypond_grob_name_manager = copy.copy(override(self))
+            manager = self._lilypond_grob_name_manager
+            new._lilypond_grob_name_manager = copy.copy(manager)
         if getattr(self, '_lilypond_setting_name_manager', None) is not None:
-            new._lilypond_setting_name_manager = copy.copy(setting(self))
-        if getattr(self, '_lilypond_tweak_manager', None) is not None: new._lilypond_tweak_manager = copy.copy(tweak(self))
+            manager = self._lilypond_setting_name_manager
+            new._lilypond_setting_name_manager = copy.copy(manager)
+        if getattr(self, '_lilypond_tweak_manager', None) is not None:
+            manager = self._lilypond_tweak_manager
+            new._lilypond_tweak_manager = copy.copy(manager)
         self._copy_keyword_args(new)
         return new
 
@@ -366,19 +372,20 @@ class Spanner(AbjadObject, collections.Sequence):
 
     def _get_basic_lilypond_format_bundle(self, leaf):
         bundle = LilyPondFormatBundle()
+        manager = self._lilypond_grob_name_manager
         if leaf is self[-1]:
-            contributions = override(self)._list_format_contributions(
-                'revert',
-                )
+            contributions = manager._list_format_contributions('revert')
             bundle.grob_reverts.extend(contributions)
         if leaf is self[0]:
-            contributions = override(self)._list_format_contributions(
+            contributions = manager._list_format_contributions(
                 'override',
                 once=False,
                 )
             bundle.grob_overrides.extend(contributions)
-            contributions = tweak(self)._list_format_contributions()
-            bundle.right.spanner_starts.extend(contributions)
+            if self._lilypond_tweak_manager is not None:
+                manager = self._lilypond_tweak_manager
+                contributions = manager._list_format_contributions()
+                bundle.right.spanner_starts.extend(contributions)
         return bundle
 
     def _get_compact_summary(self):
@@ -656,7 +663,7 @@ class Spanner(AbjadObject, collections.Sequence):
     def overrides(self) -> OrderedDict:
         r'''Gets overrides.
         '''
-        manager = override(self)
+        manager = self._lilypond_grob_name_manager
         overrides = OrderedDict()
         for attribute_tuple in manager._get_attribute_tuples():
             attribute = '__'.join(attribute_tuple[:-1])
@@ -132,7 +132,8 @@ class TrillSpanner(Spanner):
             bundle.right.spanner_stops.extend(strings)
             return bundle
         if leaf is self[0]:
-            strings = abjad.override(self)._list_format_contributions(
+            manager = self._lilypond_grob_name_manager
+            strings = manager._list_format_contributions(
                 'override',
                 once=False,
                 )
@@ -166,7 +167,7 @@ class TrillSpanner(Spanner):
                     # TODO: use strings instead of override interface:
                     abjad.override(leaf).trill_pitch_head.stencil = scheme
         if leaf is self[-1]:
-            manager = abjad.override(self)
+            manager = self._lilypond_grob_name_manager
             strings = manager._list_format_contributions('revert')
             if self._right_broken:
                 strings = self._tag_hide(strings)
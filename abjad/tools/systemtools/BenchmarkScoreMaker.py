@@ -151,6 +151,39 @@ class BenchmarkScoreMaker(AbjadObject):
             abjad.attach(crescendo, part)
         return voice
 
+    def make_multistaff_score(
+        self,
+        staff_count=40,
+        measure_count=125,
+        notes_per_measure=4,
+        ):
+        r'''Makes score with `staff_count` staves of `measure_count` measures
+        each.
+
+        ..  container:: example
+
+            >>> maker = abjad.BenchmarkScoreMaker()
+            >>> score = maker.make_multistaff_score(2, 3, 2)
+            >>> len(abjad.select(score).leaves())
+            12
+
+        Defaults give a 40-staff, 20,000-leaf score.
+        '''
+        import abjad
+        score = abjad.Score()
+        for staff_index in range(staff_count):
+            voice = abjad.Voice()
+            for measure_index in range(measure_count):
+                notes = [
+                    abjad.Note(0, (1, 16)) for _ in range(notes_per_measure)
+                    ]
+                time_signature = abjad.TimeSignature((notes_per_measure, 16))
+                measure = abjad.Measure(time_signature, notes)
+                voice.append(measure)
+            staff = abjad.Staff([voice])
+            score.append(staff)
+        return score
+
     def make_score_00(self):
         r'''Make 200-note voice (with nothing else).
 
@@ -37,6 +37,18 @@ class IOManager(AbjadObject):
             input(message)
             os.makedirs(directory)
 
+    @staticmethod
+    def _get_lilypond_path():
+        import abjad
+        lilypond_path = abjad.abjad_configuration.get('lilypond_path')
+        if not lilypond_path:
+            lilypond_path = abjad.IOManager.find_executable('lilypond')
+            if lilypond_path:
+                lilypond_path = lilypond_path[0]
+            else:
+                lilypond_path = 'lilypond'
+        return lilypond_path
+
     @staticmethod
     def _make_score_package(
         score_package_path,
@@ -682,13 +694,7 @@ class IOManager(AbjadObject):
         '''
         import abjad
         ly_path = str(ly_path)
-        lilypond_path = abjad.abjad_configuration.get('lilypond_path')
-        if not lilypond_path:
-            lilypond_path = abjad.IOManager.find_executable('lilypond')
-            if lilypond_path:
-                lilypond_path = lilypond_path[0]
-            else:
-                lilypond_path = 'lilypond'
+        lilypond_path = IOManager._get_lilypond_path()
         lilypond_base, extension = os.path.splitext(ly_path)
         flags = flags or ''
         date = datetime.datetime.now().strftime('%c')
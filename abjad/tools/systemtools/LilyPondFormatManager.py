@@ -99,13 +99,15 @@ class LilyPondFormatManager(AbjadObject):
         import abjad
         result = []
         manager = LilyPondFormatManager
+        contextualizer = component._lilypond_setting_name_manager
+        if contextualizer is None:
+            contextualizer = abjad.LilyPondSettingNameManager()
         if isinstance(component, abjad.Context):
-            for name, value in vars(abjad.setting(component)).items():
+            for name, value in vars(contextualizer).items():
                 string = manager.format_lilypond_context_setting_in_with_block(
                     name, value)
                 result.append(string)
         else:
-            contextualizer = abjad.setting(component)
             variables = vars(contextualizer)
             for name, value in variables.items():
                 # if we've found a leaf context namespace
@@ -144,7 +146,9 @@ class LilyPondFormatManager(AbjadObject):
         import abjad
         result = []
         once = isinstance(component, abjad.Leaf)
-        grob = abjad.override(component)
+        grob = component._lilypond_grob_name_manager
+        if grob is None:
+            grob = abjad.LilyPondGrobNameManager()
         contributions = grob._list_format_contributions(
             'override',
             once=once,
@@ -166,7 +170,9 @@ class LilyPondFormatManager(AbjadObject):
     def _populate_grob_revert_format_contributions(component, bundle):
         import abjad
         if not isinstance(component, abjad.Leaf):
-            manager = abjad.override(component)
+            manager = component._lilypond_grob_name_manager
+            if manager is None:
+                return
             contributions = manager._list_format_contributions('revert')
             bundle.grob_reverts.extend(contributions)
 
@@ -0,0 +1,227 @@
+import concurrent.futures
+import datetime
+import multiprocessing
+import os
+import shlex
+import subprocess
+import threading
+from abjad.tools.abctools.AbjadObject import AbjadObject
+
+
+class LilyPondRenderPool(AbjadObject):
+    r'''LilyPond render pool.
+
+    ..  container:: example
+
+        >>> pool = abjad.LilyPondRenderPool(worker_count=4, fail_fast=True)
+        >>> pool
+        LilyPondRenderPool(worker_count=4, fail_fast=True)
+
+    Renders LilyPond files in concurrent LilyPond processes, running no more
+    than `worker_count` LilyPond processes at once:
+
+    ::
+
+        >>> ly_paths = [abjad.persist(_).as_ly()[0] for _ in staves] # doctest: +SKIP
+        >>> pool(ly_paths) # doctest: +SKIP
+        (0, 0, 0)
+
+    Writes the date and then the output of LilyPond to a log file next to
+    each LilyPond file. Rendering ``score.ly`` writes ``score.pdf`` and
+    ``score.log``.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Managers'
+
+    __slots__ = (
+        '_fail_fast',
+        '_flags',
+        '_lilypond_path',
+        '_worker_count',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        worker_count=None,
+        fail_fast=False,
+        flags=None,
+        lilypond_path=None,
+        ):
+        if worker_count is not None:
+            assert isinstance(worker_count, int), repr(worker_count)
+            assert 0 < worker_count, repr(worker_count)
+        if flags is not None:
+            assert isinstance(flags, str), repr(flags)
+        if lilypond_path is not None:
+            lilypond_path = str(lilypond_path)
+        self._fail_fast = bool(fail_fast)
+        self._flags = flags
+        self._lilypond_path = lilypond_path
+        self._worker_count = worker_count
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, ly_paths):
+        r'''Calls LilyPond render pool on `ly_paths`.
+
+        ..  container:: example
+
+            >>> pool = abjad.LilyPondRenderPool()
+            >>> pool([])
+            ()
+
+        Returns exit codes of LilyPond processes in order of `ly_paths`.
+
+        Exit code is none for LilyPond files left unrendered when pool fails
+        fast.
+        '''
+        ly_paths = [os.path.abspath(str(_)) for _ in ly_paths]
+        if not ly_paths:
+            return ()
+        failed = threading.Event()
+        lock = threading.Lock()
+        processes = set()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._get_worker_count(),
+            ) as executor:
+            futures = [
+                executor.submit(
+                    self._render,
+                    ly_path,
+                    failed,
+                    lock,
+                    processes,
+                    )
+                for ly_path in ly_paths
+                ]
+            exit_codes = tuple(_.result() for _ in futures)
+        return exit_codes
+
+    ### PRIVATE METHODS ###
+
+    def _get_command(self, ly_path):
+        import abjad
+        lilypond_path = self.lilypond_path
+        if lilypond_path is None:
+            lilypond_path = abjad.IOManager._get_lilypond_path()
+        command = [lilypond_path]
+        command.extend(shlex.split(self.flags or ''))
+        command.append('-dno-point-and-click')
+        command.extend(['-o', os.path.splitext(ly_path)[0]])
+        command.append(ly_path)
+        return command
+
+    def _get_worker_count(self):
+        if self.worker_count is not None:
+            return self.worker_count
+        return multiprocessing.cpu_count()
+
+    def _render(self, ly_path, failed, lock, processes):
+        if self.fail_fast and failed.is_set():
+            return None
+        base, extension = os.path.splitext(ly_path)
+        command = self._get_command(ly_path)
+        date = datetime.datetime.now().strftime('%c')
+        with open(base + '.log', 'w') as file_pointer:
+            file_pointer.write(date + '\n')
+            file_pointer.flush()
+            with lock:
+                if self.fail_fast and failed.is_set():
+                    return None
+                try:
+                    process = subprocess.Popen(
+                        command,
+                        cwd=os.path.dirname(ly_path),
+                        stdout=file_pointer,
+                        stderr=subprocess.STDOUT,
+                        )
+                except OSError as exception:
+                    # exit code of shell when command is not found
+                    file_pointer.write(str(exception) + '\n')
+                    process = None
+                else:
+                    processes.add(process)
+            if process is None:
+                exit_code = 127
+            else:
+                exit_code = process.wait()
+        with lock:
+            processes.discard(process)
+            if exit_code and self.fail_fast and not failed.is_set():
+                failed.set()
+                for running_process in processes:
+                    running_process.terminate()
+        try:
+            os.remove(base + '.ps')
+        except OSError:
+            pass
+        return exit_code
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def fail_fast(self):
+        r'''Is true when pool starts no LilyPond process after first failed
+        LilyPond process and terminates LilyPond processes still running.
+
+        ..  container:: example
+
+            >>> abjad.LilyPondRenderPool().fail_fast
+            False
+
+        Defaults to false.
+
+        Returns true or false.
+        '''
+        return self._fail_fast
+
+    @property
+    def flags(self):
+        r'''Gets command-line flags passed to LilyPond.
+
+        ..  container:: example
+
+            >>> pool = abjad.LilyPondRenderPool(flags='--png')
+            >>> pool.flags
+            '--png'
+
+        Defaults to none.
+
+        Returns string or none.
+        '''
+        return self._flags
+
+    @property
+    def lilypond_path(self):
+        r'''Gets path of LilyPond executable.
+
+        ..  container:: example
+
+            >>> abjad.LilyPondRenderPool().lilypond_path is None
+            True
+
+        Defaults to none. Pool then runs LilyPond executable found as in
+        ``IOManager.run_lilypond()``.
+
+        Returns string or none.
+        '''
+        return self._lilypond_path
+
+    @property
+    def worker_count(self):
+        r'''Gets maximum number of LilyPond processes running at once.
+
+        ..  container:: example
+
+            >>> abjad.LilyPondRenderPool().worker_count is None
+            True
+
+        Defaults to none. Worker count then equals CPU count.
+
+        Returns positive integer or none.
+        '''
+        return self._worker_count
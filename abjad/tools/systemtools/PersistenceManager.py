@@ -3,6 +3,7 @@ import re
 import shutil
 import tempfile
 from abjad.tools import abctools
+from abjad.tools.systemtools.RenderCache import RenderCache
 
 
 class PersistenceManager(abctools.AbjadObject):
@@ -26,11 +27,21 @@ class PersistenceManager(abctools.AbjadObject):
 
     _png_page_pattern = re.compile(r'.+page(\d+)\.png')
 
+    _render_cache = RenderCache()
+
     ### INITIALIZER ###
 
     def __init__(self, client=None):
         self._client = client
 
+    ### PRIVATE METHODS ###
+
+    def _run_lilypond(self, ly_file_path, flags=None, use_render_cache=True):
+        import abjad
+        if use_render_cache:
+            return self.render_cache(ly_file_path, flags=flags)
+        return abjad.IOManager.run_lilypond(ly_file_path, flags=flags)
+
     ### PUBLIC METHODS ###
 
     def as_ly(
@@ -44,6 +55,9 @@ class PersistenceManager(abctools.AbjadObject):
 
         Autogenerates file path when `ly_file_path` is none.
 
+        Writes LilyPond file one format piece at a time without first
+        building LilyPond format of client as a single string.
+
         ..  container:: example
 
             >>> staff = abjad.Staff("c'4 e'4 d'4 f'4")
@@ -73,25 +87,44 @@ class PersistenceManager(abctools.AbjadObject):
             ly_file_path = str(ly_file_path)
             ly_file_path = os.path.expanduser(ly_file_path)
         assert ly_file_path.endswith('.ly'), ly_file_path
-        timer = abjad.Timer()
-        with timer:
-            string = lilypond_file.__format__(
-                format_specification='lilypond',
-                )
-            if isinstance(strict, int):
-                string = abjad.LilyPondFormatManager.align_tags(string, strict)
-        abjad_formatting_time = timer.elapsed_time
         directory = os.path.dirname(ly_file_path)
         abjad.IOManager._ensure_directory_existence(directory)
-        with open(ly_file_path, 'w') as file_pointer:
-            file_pointer.write(string)
+        timer = abjad.Timer()
+        with timer, open(ly_file_path, 'w') as file_pointer:
+            if isinstance(lilypond_file, abjad.LilyPondFile):
+                pieces = lilypond_file._iterate_format_pieces()
+            else:
+                string = lilypond_file.__format__(
+                    format_specification='lilypond',
+                    )
+                pieces = [string]
+            for i, piece in enumerate(pieces):
+                if isinstance(strict, int):
+                    piece = abjad.LilyPondFormatManager.align_tags(
+                        piece,
+                        strict,
+                        )
+                if 0 < i:
+                    file_pointer.write('\n')
+                file_pointer.write(piece)
+        abjad_formatting_time = timer.elapsed_time
         return ly_file_path, abjad_formatting_time
 
-    def as_midi(self, midi_file_path=None, remove_ly=False, **keywords):
+    def as_midi(
+        self,
+        midi_file_path=None,
+        remove_ly=False,
+        use_render_cache=True,
+        **keywords
+        ):
         r'''Persists client as MIDI file.
 
         Autogenerates file path when `midi_file_path` is none.
 
+        Copies MIDI file from render cache when render cache holds MIDI file
+        rendered from same LilyPond file. Set `use_render_cache` to false to
+        always run LilyPond.
+
         ..  container:: example
 
             >>> staff = abjad.Staff("c'4 e'4 d'4 f'4")
@@ -122,7 +155,10 @@ class PersistenceManager(abctools.AbjadObject):
         ly_file_path, abjad_formatting_time = result
         timer = systemtools.Timer()
         with timer:
-            systemtools.IOManager.run_lilypond(ly_file_path)
+            self._run_lilypond(
+                ly_file_path,
+                use_render_cache=use_render_cache,
+                )
         lilypond_rendering_time = timer.elapsed_time
         if os.name == 'nt':
             extension = 'mid'
@@ -187,12 +223,17 @@ class PersistenceManager(abctools.AbjadObject):
         illustrate_function=None,
         remove_ly=False,
         strict=None,
+        use_render_cache=True,
         **keywords
         ):
         r'''Persists client as PDF.
 
         Autogenerates file path when `pdf_file_path` is none.
 
+        Copies PDF from render cache when render cache holds PDF rendered from
+        same LilyPond file. Set `use_render_cache` to false to always run
+        LilyPond.
+
         ..  container:: example
 
             >>> staff = abjad.Staff("c'4 e'4 d'4 f'4")
@@ -229,7 +270,10 @@ class PersistenceManager(abctools.AbjadObject):
         pdf_file_path = '{}.pdf'.format(without_extension)
         timer = systemtools.Timer()
         with timer:
-            success = systemtools.IOManager.run_lilypond(ly_file_path)
+            success = self._run_lilypond(
+                ly_file_path,
+                use_render_cache=use_render_cache,
+                )
         lilypond_rendering_time = timer.elapsed_time
         if remove_ly:
             os.remove(ly_file_path)
@@ -245,6 +289,7 @@ class PersistenceManager(abctools.AbjadObject):
         png_file_path=None,
         remove_ly=False,
         illustrate_function=None,
+        use_render_cache=True,
         **keywords
         ):
         r'''Persists client as PNG.
@@ -279,6 +324,10 @@ class PersistenceManager(abctools.AbjadObject):
 
         Autogenerates file path when `png_file_path` is none.
 
+        Copies PNGs from render cache when render cache holds PNGs rendered
+        from same LilyPond file. Set `use_render_cache` to false to always run
+        LilyPond.
+
         Returns output path(s), elapsed formatting time and elapsed rendering
         time.
         '''
@@ -310,9 +359,10 @@ class PersistenceManager(abctools.AbjadObject):
 
         timer = systemtools.Timer()
         with timer:
-            success = systemtools.IOManager.run_lilypond(
+            success = self._run_lilypond(
                 temporary_ly_file_path,
                 flags='--png',
+                use_render_cache=use_render_cache,
                 )
         lilypond_rendering_time = timer.elapsed_time
 
@@ -356,3 +406,16 @@ class PersistenceManager(abctools.AbjadObject):
         Returns component or selection.
         '''
         return self._client
+
+    @property
+    def render_cache(self):
+        r'''Gets render cache shared by all persistence managers.
+
+        ..  container:: example
+
+            >>> abjad.persist(abjad.Staff()).render_cache
+            RenderCache()
+
+        Returns render cache.
+        '''
+        return type(self)._render_cache
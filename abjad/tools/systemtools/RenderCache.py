@@ -0,0 +1,290 @@
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+from abjad.tools.abctools.AbjadObject import AbjadObject
+
+
+class RenderCache(AbjadObject):
+    r'''Render cache.
+
+    ..  container:: example
+
+        >>> cache = abjad.RenderCache(maximum_size=2**20)
+        >>> cache
+        RenderCache(maximum_size=1048576)
+
+    Runs LilyPond on LilyPond files not rendered before and copies previously
+    rendered artifacts next to LilyPond files rendered before:
+
+    ::
+
+        >>> ly_path = abjad.persist(staff).as_ly('/tmp/example.ly')[0] # doctest: +SKIP
+        >>> cache(ly_path) # doctest: +SKIP
+        True
+
+    Keys artifacts by hash of LilyPond file, LilyPond version, LilyPond flags
+    and contents of files LilyPond file includes. Ignores date-time tokens.
+    Evicts least recently used artifacts once artifacts exceed `maximum_size`
+    bytes.
+
+    Used by ``PersistenceManager.as_midi()``, ``as_pdf()`` and ``as_png()``.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Managers'
+
+    __slots__ = (
+        '_directory',
+        '_hit_count',
+        '_maximum_size',
+        '_miss_count',
+        )
+
+    _artifact_extensions = ('.eps', '.mid', '.midi', '.pdf', '.png', '.svg')
+
+    _artifact_name = 'artifact'
+
+    _date_time_pattern = re.compile(
+        br'^% \d{4}-\d{2}-\d{2} \d{2}:\d{2}$',
+        re.MULTILINE,
+        )
+
+    _include_pattern = re.compile(r'^\s*\\include\s+"([^"]+)"', re.MULTILINE)
+
+    ### INITIALIZER ###
+
+    def __init__(self, directory=None, maximum_size=None):
+        if directory is not None:
+            directory = os.path.expanduser(str(directory))
+        if maximum_size is not None:
+            assert isinstance(maximum_size, int), repr(maximum_size)
+            assert 0 <= maximum_size, repr(maximum_size)
+        self._directory = directory
+        self._hit_count = 0
+        self._maximum_size = maximum_size
+        self._miss_count = 0
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, ly_path, flags=None):
+        r'''Renders `ly_path` with LilyPond `flags` unless render cache holds
+        artifacts rendered from same LilyPond file, LilyPond version, flags
+        and included files.
+
+        Copies cached artifacts next to `ly_path` on cache hit.
+
+        Returns true when LilyPond succeeds or when render cache holds
+        artifacts.
+        '''
+        import abjad
+        ly_path = os.path.abspath(str(ly_path))
+        base = os.path.splitext(ly_path)[0]
+        entry_directory = os.path.join(
+            self._get_directory(),
+            self._get_key(ly_path, flags),
+            )
+        if self._restore_artifacts(entry_directory, base):
+            self._hit_count += 1
+            return True
+        self._miss_count += 1
+        states = self._get_artifact_states(base)
+        success = abjad.IOManager.run_lilypond(ly_path, flags=flags)
+        if success:
+            artifact_paths = [
+                path for path, state in self._get_artifact_states(base).items()
+                if states.get(path) != state
+                ]
+            if artifact_paths:
+                self._store_artifacts(entry_directory, base, artifact_paths)
+                self._evict(entry_directory)
+        return success
+
+    ### PRIVATE METHODS ###
+
+    def _evict(self, entry_directory):
+        entries = []
+        total_size = 0
+        for name in os.listdir(self._get_directory()):
+            path = os.path.join(self._get_directory(), name)
+            if not os.path.isdir(path) or name.startswith('.'):
+                continue
+            try:
+                size = sum(
+                    os.path.getsize(os.path.join(path, _))
+                    for _ in os.listdir(path)
+                    )
+                modification_time = os.path.getmtime(path)
+            except OSError:
+                continue
+            entries.append((modification_time, path, size))
+            total_size += size
+        entries.sort()
+        for modification_time, path, size in entries:
+            if total_size <= self._get_maximum_size():
+                break
+            if path == entry_directory:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total_size -= size
+
+    def _get_artifact_states(self, base):
+        directory, prefix = os.path.split(base)
+        states = {}
+        for name in os.listdir(directory):
+            if not name.startswith(prefix):
+                continue
+            if name[len(prefix):len(prefix) + 1] not in ('.', '-'):
+                continue
+            if os.path.splitext(name)[1] not in self._artifact_extensions:
+                continue
+            path = os.path.join(directory, name)
+            stat = os.stat(path)
+            states[path] = (stat.st_mtime, stat.st_size)
+        return states
+
+    def _get_directory(self):
+        import abjad
+        if self.directory is not None:
+            return self.directory
+        return os.path.join(
+            str(abjad.abjad_configuration.configuration_directory),
+            'render_cache',
+            )
+
+    def _get_key(self, ly_path, flags):
+        import abjad
+        hash_ = hashlib.sha256()
+        version = abjad.abjad_configuration.get_lilypond_version_string()
+        hash_.update(repr((version, flags or '')).encode('utf-8'))
+        self._update_hash(hash_, ly_path, set())
+        return hash_.hexdigest()
+
+    def _get_maximum_size(self):
+        if self.maximum_size is not None:
+            return self.maximum_size
+        return 256 * 2**20
+
+    def _restore_artifacts(self, entry_directory, base):
+        try:
+            names = os.listdir(entry_directory)
+        except OSError:
+            return False
+        if not names:
+            return False
+        try:
+            for name in names:
+                suffix = name[len(self._artifact_name):]
+                shutil.copyfile(
+                    os.path.join(entry_directory, name),
+                    base + suffix,
+                    )
+            os.utime(entry_directory, None)
+        except (IOError, OSError):
+            return False
+        return True
+
+    def _store_artifacts(self, entry_directory, base, artifact_paths):
+        os.makedirs(self._get_directory(), exist_ok=True)
+        temporary_directory = tempfile.mkdtemp(
+            dir=self._get_directory(),
+            prefix='.',
+            )
+        for path in artifact_paths:
+            name = self._artifact_name + path[len(base):]
+            shutil.copyfile(path, os.path.join(temporary_directory, name))
+        try:
+            os.rename(temporary_directory, entry_directory)
+        except OSError:
+            # another process stored same artifacts first
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+
+    def _update_hash(self, hash_, path, visited_paths):
+        visited_paths.add(path)
+        with open(path, 'rb') as file_pointer:
+            contents = file_pointer.read()
+        hash_.update(self._date_time_pattern.sub(b'', contents))
+        contents = contents.decode('utf-8', 'replace')
+        directory = os.path.dirname(path)
+        for include in self._include_pattern.findall(contents):
+            hash_.update(include.encode('utf-8'))
+            include_path = os.path.join(
+                directory,
+                os.path.expanduser(include),
+                )
+            include_path = os.path.abspath(include_path)
+            if include_path in visited_paths:
+                continue
+            if os.path.isfile(include_path):
+                self._update_hash(hash_, include_path, visited_paths)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory(self):
+        r'''Gets directory of render cache.
+
+        ..  container:: example
+
+            >>> abjad.RenderCache(directory='/tmp/cache').directory
+            '/tmp/cache'
+
+        Defaults to none. Render cache then keeps artifacts in
+        ``render_cache`` directory of Abjad configuration directory.
+
+        Returns string or none.
+        '''
+        return self._directory
+
+    @property
+    def hit_count(self):
+        r'''Gets number of calls that copied cached artifacts.
+
+        ..  container:: example
+
+            >>> abjad.RenderCache().hit_count
+            0
+
+        Returns nonnegative integer.
+        '''
+        return self._hit_count
+
+    @property
+    def maximum_size(self):
+        r'''Gets maximum size of render cache in bytes.
+
+        ..  container:: example
+
+            >>> abjad.RenderCache().maximum_size is None
+            True
+
+        Defaults to none. Render cache then holds at most 256 MB.
+
+        Returns nonnegative integer or none.
+        '''
+        return self._maximum_size
+
+    @property
+    def miss_count(self):
+        r'''Gets number of calls that ran LilyPond.
+
+        ..  container:: example
+
+            >>> abjad.RenderCache().miss_count
+            0
+
+        Returns nonnegative integer.
+        '''
+        return self._miss_count
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        r'''Removes all artifacts from render cache.
+
+        Returns none.
+        '''
+        if os.path.isdir(self._get_directory()):
+            shutil.rmtree(self._get_directory())
@@ -0,0 +1,637 @@
+import array
+import io
+import pickle
+import struct
+import sys
+from abjad.tools.abctools.AbjadObject import AbjadObject
+
+
+class ScoreSerializer(AbjadObject):
+    r'''Score serializer.
+
+    ..  container:: example
+
+        >>> serializer = abjad.ScoreSerializer()
+        >>> serializer
+        ScoreSerializer()
+
+    Dumps score trees to bytes and loads score trees from bytes:
+
+    >>> staff = abjad.Staff("c'8 ( d'8 e'8 f'8 )")
+    >>> abjad.attach(abjad.Clef('alto'), staff[0])
+    >>> data = serializer.dumps(staff)
+    >>> new_staff = serializer.loads(data)
+
+    >>> abjad.f(new_staff)
+    \new Staff
+    {
+        \clef "alto"
+        c'8
+        (
+        d'8
+        e'8
+        f'8
+        )
+    }
+
+    Packs classes, durations, pitches and tree structure of components as
+    arrays of integers. Writes each distinct indicator, wrapper and spanner
+    once. Restores parent links, wrappers and spanners on load.
+
+    Dumps and loads large scores faster than ``pickle`` and writes fewer bytes.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Managers'
+
+    __slots__ = ()
+
+    _flag_codes = {None: 0, False: 1, True: 2}
+
+    _flag_values = (None, False, True)
+
+    _magic = b'ABJS'
+
+    _structural_slots = (
+        '_after_grace_container',
+        '_components',
+        '_grace_container',
+        '_note_head',
+        '_note_heads',
+        '_parent',
+        '_spanners',
+        '_wrappers',
+        '_written_duration',
+        )
+
+    _transient_slots = (
+        '_dependent_wrapper_index',
+        '_dependent_wrappers',
+        '_index_in_parent',
+        '_indicators_are_current',
+        '_is_forbidden_to_update',
+        '_leaf_index',
+        '_lilypond_format_cache',
+        '_lilypond_format_version',
+        '_measure_number',
+        '_offsets_are_current',
+        '_offsets_in_seconds_are_current',
+        '_parentage_cache',
+        '_start_offset',
+        '_start_offset_in_seconds',
+        '_stop_offset',
+        '_stop_offset_in_seconds',
+        '_subtree_offsets_are_current',
+        '_timespan',
+        '_vertical_moment_timeline',
+        )
+
+    _typecodes = ('B', 'H', 'I', 'L', 'Q')
+
+    _version = 1
+
+    _wrapper_record_slots = (
+        '_alternate',
+        '_annotation',
+        '_context',
+        '_deactivate',
+        '_left_broken',
+        '_right_broken',
+        '_synthetic_offset',
+        '_tag',
+        )
+
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _get_extra_slots(class_, component_class, cache):
+        if component_class not in cache:
+            ignored_slots = class_._structural_slots + class_._transient_slots
+            slots = []
+            for class__ in component_class.__mro__:
+                for slot in getattr(class__, '__slots__', ()):
+                    if slot not in ignored_slots and slot not in slots:
+                        slots.append(slot)
+            cache[component_class] = tuple(slots)
+        return cache[component_class]
+
+    @staticmethod
+    def _get_kind(component_class):
+        import abjad
+        if issubclass(component_class, abjad.Context):
+            return 'context'
+        if issubclass(component_class, abjad.Container):
+            return 'container'
+        if issubclass(component_class, abjad.Note):
+            return 'note'
+        if issubclass(component_class, abjad.Chord):
+            return 'chord'
+        if issubclass(component_class, abjad.Leaf):
+            return 'leaf'
+        message = 'can not serialize {!r}.'.format(component_class)
+        raise TypeError(message)
+
+    @staticmethod
+    def _make_pickler(file_pointer, persistent_ids):
+        import abjad
+        prototype = (abjad.Component, abjad.Spanner)
+        class_checks = {}
+
+        def persistent_id(object_):
+            persistent_id_ = persistent_ids.get(id(object_))
+            if persistent_id_ is not None:
+                return persistent_id_
+            class_ = type(object_)
+            is_outside = class_checks.get(class_)
+            if is_outside is None:
+                is_outside = class_checks[class_] = issubclass(
+                    class_, prototype)
+            if is_outside:
+                return ('x', 0)
+            return None
+
+        pickler = pickle.Pickler(file_pointer, pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = persistent_id
+        return pickler
+
+    @staticmethod
+    def _make_unpickler(file_pointer, tables):
+
+        def persistent_load(persistent_id):
+            kind, index = persistent_id
+            if kind == 'x':
+                return None
+            return tables[kind][index]
+
+        unpickler = pickle.Unpickler(file_pointer)
+        unpickler.persistent_load = persistent_load
+        return unpickler
+
+    @classmethod
+    def _read_array(class_, file_pointer):
+        typecode = file_pointer.read(1).decode('ascii')
+        count, = struct.unpack('<Q', file_pointer.read(8))
+        integers = array.array(typecode)
+        integers.frombytes(file_pointer.read(count * integers.itemsize))
+        if sys.byteorder == 'big':
+            integers.byteswap()
+        return integers
+
+    @staticmethod
+    def _read_bytes(file_pointer):
+        count, = struct.unpack('<Q', file_pointer.read(8))
+        return file_pointer.read(count)
+
+    @classmethod
+    def _write_array(class_, file_pointer, integers):
+        maximum = max(integers) if integers else 0
+        for typecode in class_._typecodes:
+            integers_ = array.array(typecode)
+            if maximum < 2 ** (8 * integers_.itemsize):
+                break
+        integers_.extend(integers)
+        if sys.byteorder == 'big':
+            integers_.byteswap()
+        file_pointer.write(typecode.encode('ascii'))
+        file_pointer.write(struct.pack('<Q', len(integers_)))
+        file_pointer.write(integers_.tobytes())
+
+    @staticmethod
+    def _write_bytes(file_pointer, bytes_):
+        file_pointer.write(struct.pack('<Q', len(bytes_)))
+        file_pointer.write(bytes_)
+
+    ### PUBLIC METHODS ###
+
+    def dump(self, component, file_pointer):
+        r'''Dumps `component` to binary `file_pointer`.
+
+        ..  container:: example
+
+            >>> import io
+            >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+            >>> file_pointer = io.BytesIO()
+            >>> abjad.ScoreSerializer().dump(staff, file_pointer)
+            >>> file_pointer.getvalue()[:4]
+            b'ABJS'
+
+        Returns none.
+        '''
+        file_pointer.write(self.dumps(component))
+
+    def dumps(self, component):
+        r'''Dumps `component` to bytes.
+
+        ..  container:: example
+
+            >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+            >>> data = abjad.ScoreSerializer().dumps(staff)
+            >>> data[:4]
+            b'ABJS'
+
+        Dumps grace containers and after-grace containers together with
+        the leaves that carry them. Dumps spanners without leaves outside
+        `component`.
+
+        Returns bytes.
+        '''
+        import abjad
+        if not isinstance(component, abjad.Component):
+            message = 'must be component: {!r}.'.format(component)
+            raise TypeError(message)
+        components, stack = [], [component]
+        class_kinds = {}
+        while stack:
+            component_ = stack.pop()
+            components.append(component_)
+            class_ = type(component_)
+            kind = class_kinds.get(class_)
+            if kind is None:
+                kind = class_kinds[class_] = self._get_kind(class_)
+            if kind in ('container', 'context'):
+                stack.extend(reversed(component_._components))
+            else:
+                if component_._after_grace_container is not None:
+                    stack.append(component_._after_grace_container)
+                if component_._grace_container is not None:
+                    stack.append(component_._grace_container)
+        persistent_ids = {}
+        for i, component_ in enumerate(components):
+            persistent_ids[id(component_)] = ('c', i)
+        classes, class_ids, kinds = [], {}, {}
+        durations, duration_ids = [], {}
+        pitches, pitch_ids = [], {}
+        spanners, spanner_ids = [], {}
+        wrappers = []
+        component_class_ids, child_counts = [], []
+        leaf_duration_ids, leaf_grace_codes = [], []
+        leaf_spanner_counts, leaf_spanner_ids = [], []
+        note_head_counts, note_head_class_ids = [], []
+        note_head_flags, note_head_pitch_ids = [], []
+        note_head_extras = {}
+        wrapper_counts = []
+        extras, extra_slots = {}, {}
+
+        def get_class_id(class_):
+            class_id = class_ids.get(class_)
+            if class_id is None:
+                class_id = class_ids[class_] = len(classes)
+                classes.append(class_)
+            return class_id
+
+        for i, component_ in enumerate(components):
+            class_ = type(component_)
+            class_id = get_class_id(class_)
+            kinds[class_id] = class_kinds[class_]
+            component_class_ids.append(class_id)
+            wrapper_counts.append(len(component_._wrappers))
+            for wrapper in component_._wrappers:
+                persistent_ids[id(wrapper)] = ('w', len(wrappers))
+                wrappers.append(wrapper)
+            kind = kinds[class_id]
+            if kind in ('container', 'context'):
+                child_counts.append(len(component_._components))
+            else:
+                duration = component_._written_duration
+                key = (duration.numerator, duration.denominator)
+                duration_id = duration_ids.get(key)
+                if duration_id is None:
+                    duration_id = duration_ids[key] = len(durations)
+                    durations.append(key)
+                leaf_duration_ids.append(duration_id)
+                leaf_grace_codes.append(
+                    (component_._grace_container is not None) +
+                    2 * (component_._after_grace_container is not None)
+                    )
+                leaf_spanner_counts.append(len(component_._spanners))
+                for spanner in component_._spanners:
+                    spanner_id = spanner_ids.get(id(spanner))
+                    if spanner_id is None:
+                        spanner_id = spanner_ids[id(spanner)] = len(spanners)
+                        persistent_ids[id(spanner)] = ('s', spanner_id)
+                        spanners.append(spanner)
+                    leaf_spanner_ids.append(spanner_id)
+                if kind == 'note':
+                    note_heads = [component_._note_head]
+                    if note_heads[0] is None:
+                        note_heads = []
+                elif kind == 'chord':
+                    note_heads = component_._note_heads
+                else:
+                    note_heads = []
+                if kind in ('note', 'chord'):
+                    note_head_counts.append(len(note_heads))
+                for note_head in note_heads:
+                    pitch = note_head._written_pitch
+                    if type(pitch) is abjad.NamedPitch:
+                        key = (pitch._name, pitch._arrow)
+                    else:
+                        key = id(pitch)
+                    pitch_id = pitch_ids.get(key)
+                    if pitch_id is None:
+                        pitch_id = pitch_ids[key] = len(pitches)
+                        pitches.append(pitch)
+                    note_head_pitch_ids.append(pitch_id)
+                    note_head_class_ids.append(get_class_id(type(note_head)))
+                    note_head_flags.append(
+                        self._flag_codes[note_head._is_cautionary] +
+                        3 * self._flag_codes[note_head._is_forced] +
+                        9 * self._flag_codes[note_head._is_parenthesized]
+                        )
+                    extras_ = {}
+                    if note_head._alternative is not None:
+                        extras_['_alternative'] = note_head._alternative
+                    if note_head._tweak is not None:
+                        extras_['_tweak'] = note_head._tweak
+                    if extras_:
+                        note_head_extras[len(note_head_flags) - 1] = extras_
+            extras_ = {}
+            for slot in self._get_extra_slots(class_, extra_slots):
+                value = getattr(component_, slot, None)
+                if value is not None:
+                    extras_[slot] = value
+            if extras_:
+                extras[i] = extras_
+        spanner_class_ids, spanner_leaf_counts, spanner_leaf_ids = [], [], []
+        spanner_states = []
+        for spanner in spanners:
+            spanner_class_ids.append(get_class_id(type(spanner)))
+            leaf_ids = [
+                persistent_ids[id(_)][1] for _ in spanner._leaves
+                if persistent_ids.get(id(_), ('x',))[0] == 'c'
+                ]
+            spanner_leaf_counts.append(len(leaf_ids))
+            spanner_leaf_ids.extend(leaf_ids)
+            state = spanner.__getstate__()
+            del state['_leaves']
+            state['_lilypond_format_version'] = 0
+            state['_wrappers'] = [
+                _ for _ in spanner._wrappers
+                if _._component is spanner or id(_) in persistent_ids
+                ]
+            spanner_states.append(state)
+        indicators, indicator_ids = [], {}
+        wrapper_indicator_ids = []
+        records, record_ids = [], {}
+        wrapper_record_ids = []
+        buffer_ = io.BytesIO()
+        pickler = self._make_pickler(buffer_, persistent_ids)
+        for wrapper in wrappers:
+            buffer_.seek(0)
+            buffer_.truncate()
+            pickler.clear_memo()
+            pickler.dump(wrapper._indicator)
+            indicator = buffer_.getvalue()
+            indicator_id = indicator_ids.get(indicator)
+            if indicator_id is None:
+                indicator_id = indicator_ids[indicator] = len(indicators)
+                indicators.append(indicator)
+            wrapper_indicator_ids.append(indicator_id)
+            record = [getattr(wrapper, _) for _ in self._wrapper_record_slots]
+            spanner_id = None
+            if wrapper._spanner is not None:
+                spanner_id = spanner_ids.get(id(wrapper._spanner))
+            record.append(spanner_id)
+            key = []
+            for value in record:
+                if value is None or type(value) in (bool, int, str):
+                    key.append(value)
+                elif isinstance(value, abjad.Tag):
+                    key.append(('tag', str(value)))
+                else:
+                    key.append(id(value))
+            key = tuple(key)
+            record_id = record_ids.get(key)
+            if record_id is None:
+                record_id = record_ids[key] = len(records)
+                records.append(tuple(record))
+            wrapper_record_ids.append(record_id)
+        file_pointer = io.BytesIO()
+        file_pointer.write(self._magic)
+        file_pointer.write(struct.pack('<H', self._version))
+        tables = (classes, kinds, pitches)
+        self._write_bytes(
+            file_pointer,
+            pickle.dumps(tables, pickle.HIGHEST_PROTOCOL),
+            )
+        for integers in (
+            [_[0] for _ in durations],
+            [_[1] for _ in durations],
+            component_class_ids,
+            child_counts,
+            leaf_duration_ids,
+            leaf_grace_codes,
+            leaf_spanner_counts,
+            leaf_spanner_ids,
+            note_head_counts,
+            note_head_class_ids,
+            note_head_pitch_ids,
+            note_head_flags,
+            wrapper_counts,
+            wrapper_indicator_ids,
+            wrapper_record_ids,
+            spanner_class_ids,
+            spanner_leaf_counts,
+            spanner_leaf_ids,
+            ):
+            self._write_array(file_pointer, integers)
+        buffer_ = io.BytesIO()
+        pickler = self._make_pickler(buffer_, persistent_ids)
+        pickler.dump((
+            indicators,
+            records,
+            spanner_states,
+            extras,
+            note_head_extras,
+            ))
+        self._write_bytes(file_pointer, buffer_.getvalue())
+        return file_pointer.getvalue()
+
+    def load(self, file_pointer):
+        r'''Loads component from binary `file_pointer`.
+
+        ..  container:: example
+
+            >>> import io
+            >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+            >>> file_pointer = io.BytesIO()
+            >>> abjad.ScoreSerializer().dump(staff, file_pointer)
+            >>> file_pointer = io.BytesIO(file_pointer.getvalue())
+            >>> abjad.ScoreSerializer().load(file_pointer)
+            Staff("c'4 d'4 e'4 f'4")
+
+        Returns component.
+        '''
+        return self.loads(file_pointer.read())
+
+    def loads(self, data):
+        r'''Loads component from `data` bytes.
+
+        ..  container:: example
+
+            >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+            >>> data = abjad.ScoreSerializer().dumps(staff)
+            >>> abjad.ScoreSerializer().loads(data)
+            Staff("c'4 d'4 e'4 f'4")
+
+        Returns component.
+        '''
+        import abjad
+        file_pointer = io.BytesIO(data)
+        magic = file_pointer.read(len(self._magic))
+        version = struct.unpack('<H', file_pointer.read(2))[0]
+        if magic != self._magic or version != self._version:
+            message = 'not serialized score data: {!r}.'.format(data[:6])
+            raise ValueError(message)
+        classes, kinds, pitches = pickle.loads(
+            self._read_bytes(file_pointer))
+        numerators = self._read_array(file_pointer)
+        denominators = self._read_array(file_pointer)
+        durations = [abjad.Duration(_, __) for _, __ in zip(
+            numerators, denominators)]
+        component_class_ids = iter(self._read_array(file_pointer))
+        child_counts = iter(self._read_array(file_pointer))
+        leaf_duration_ids = iter(self._read_array(file_pointer))
+        leaf_grace_codes = iter(self._read_array(file_pointer))
+        leaf_spanner_counts = iter(self._read_array(file_pointer))
+        leaf_spanner_ids = iter(self._read_array(file_pointer))
+        note_head_counts = iter(self._read_array(file_pointer))
+        note_head_class_ids = iter(self._read_array(file_pointer))
+        note_head_pitch_ids = iter(self._read_array(file_pointer))
+        note_head_flags = iter(self._read_array(file_pointer))
+        wrapper_counts = iter(self._read_array(file_pointer))
+        wrapper_indicator_ids = self._read_array(file_pointer)
+        wrapper_record_ids = self._read_array(file_pointer)
+        spanner_class_ids = self._read_array(file_pointer)
+        spanner_leaf_counts = self._read_array(file_pointer)
+        spanner_leaf_ids = iter(self._read_array(file_pointer))
+        spanners = [classes[_].__new__(classes[_]) for _ in spanner_class_ids]
+        components, note_heads, wrappers = [], [], []
+        extra_slots = {}
+        flag_values = self._flag_values
+        template = abjad.Skip.__new__(abjad.Skip)
+        abjad.Component.__init__(template)
+        component_state = template.__getstate__()
+        timespan_state = component_state.pop('_timespan').__getstate__()
+        timespan_class = abjad.Timespan
+        wrapper_class = abjad.Wrapper
+
+        def make_note_head(client):
+            class_ = classes[next(note_head_class_ids)]
+            note_head = class_.__new__(class_)
+            flags = next(note_head_flags)
+            note_head._alternative = None
+            note_head._client = client
+            note_head._is_cautionary = flag_values[flags % 3]
+            note_head._is_forced = flag_values[flags // 3 % 3]
+            note_head._is_parenthesized = flag_values[flags // 9]
+            note_head._tweak = None
+            note_head._written_pitch = pitches[next(note_head_pitch_ids)]
+            note_heads.append(note_head)
+            return note_head
+
+        def make_component():
+            class_id = next(component_class_ids)
+            class_ = classes[class_id]
+            component = class_.__new__(class_)
+            for slot, value in component_state.items():
+                setattr(component, slot, value)
+            timespan = timespan_class.__new__(timespan_class)
+            timespan.__setstate__(timespan_state)
+            component._timespan = timespan
+            components.append(component)
+            for slot in self._get_extra_slots(class_, extra_slots):
+                setattr(component, slot, None)
+            wrappers_ = []
+            for _ in range(next(wrapper_counts)):
+                wrapper = wrapper_class.__new__(wrapper_class)
+                wrapper._component = component
+                wrapper._effective_context = None
+                wrappers_.append(wrapper)
+            wrappers.extend(wrappers_)
+            component._wrappers = wrappers_
+            kind = kinds[class_id]
+            if kind == 'context':
+                component._dependent_wrapper_index = {}
+                component._dependent_wrappers = []
+            if kind in ('container', 'context'):
+                children = [
+                    make_component() for _ in range(next(child_counts))
+                    ]
+                for child in children:
+                    child._parent = component
+                component._components = children
+                return component
+            component._leaf_index = None
+            component._written_duration = durations[next(leaf_duration_ids)]
+            component._spanners = [
+                spanners[next(leaf_spanner_ids)]
+                for _ in range(next(leaf_spanner_counts))
+                ]
+            if kind == 'note':
+                note_head = None
+                if next(note_head_counts):
+                    note_head = make_note_head(component)
+                component._note_head = note_head
+            elif kind == 'chord':
+                note_heads_ = abjad.NoteHeadList(client=component)
+                note_heads_._collection = [
+                    make_note_head(component)
+                    for _ in range(next(note_head_counts))
+                    ]
+                component._note_heads = note_heads_
+            grace_code = next(leaf_grace_codes)
+            component._grace_container = None
+            component._after_grace_container = None
+            if grace_code & 1:
+                component._grace_container = make_component()
+            if grace_code & 2:
+                component._after_grace_container = make_component()
+            return component
+
+        root = make_component()
+        for spanner, leaf_count in zip(spanners, spanner_leaf_counts):
+            spanner._leaves = [
+                components[next(spanner_leaf_ids)] for _ in range(leaf_count)
+                ]
+        tables = {'c': components, 's': spanners, 'w': wrappers}
+        unpickler = self._make_unpickler(
+            io.BytesIO(self._read_bytes(file_pointer)),
+            tables,
+            )
+        indicators, records, spanner_states, extras, note_head_extras = \
+            unpickler.load()
+        for spanner, state in zip(spanners, spanner_states):
+            spanner.__setstate__(state)
+            for wrapper in spanner._wrappers:
+                if wrapper._component is spanner:
+                    wrapper._effective_context = None
+        record_slots = self._wrapper_record_slots
+        for wrapper, indicator_id, record_id in zip(
+            wrappers,
+            wrapper_indicator_ids,
+            wrapper_record_ids,
+            ):
+            unpickler = self._make_unpickler(
+                io.BytesIO(indicators[indicator_id]),
+                tables,
+                )
+            wrapper._indicator = unpickler.load()
+            record = records[record_id]
+            for slot, value in zip(record_slots, record):
+                setattr(wrapper, slot, value)
+            spanner_id = record[-1]
+            if spanner_id is None:
+                wrapper._spanner = None
+            else:
+                wrapper._spanner = spanners[spanner_id]
+        for i, extras_ in extras.items():
+            component = components[i]
+            for slot, value in extras_.items():
+                setattr(component, slot, value)
+        for i, extras_ in note_head_extras.items():
+            note_head = note_heads[i]
+            for slot, value in extras_.items():
+                setattr(note_head, slot, value)
+        return root
@@ -2,6 +2,7 @@ import collections
 import importlib
 import inspect
 import types
+from abjad.tools.abctools.AbjadObject import AbjadObject
 from abjad.tools.abctools.AbjadValueObject import AbjadValueObject
 
 
@@ -22,6 +23,8 @@ class StorageFormatManager(AbjadValueObject):
         '_signature_positional_names',
         )
 
+    _class_name_prefix_cache: dict = {}
+
     _exclude_tools_package = (
         'datastructuretools',
         'indicatortools',
@@ -38,6 +41,10 @@ class StorageFormatManager(AbjadValueObject):
 
     _indented_whitespace = '    ', '\n', ',\n'
 
+    _signature_cache: dict = {}
+
+    _template_names_cache: dict = {}
+
     ### INITIALIZER ###
 
     def __init__(self, client=None):
@@ -48,7 +55,7 @@ class StorageFormatManager(AbjadValueObject):
             self._signature_keyword_names,
             self._signature_accepts_args,
             self._signature_accepts_kwargs,
-            ) = self.inspect_signature(self._client)
+            ) = self._get_signature(self._client)
 
     ### PRIVATE METHODS ###
 
@@ -186,7 +193,7 @@ class StorageFormatManager(AbjadValueObject):
 
     def _format_specced_object(self, as_storage_format=True):
         if hasattr(self._client, '_get_format_specification'):
-            specification = self._client._get_format_specification()
+            specification = self.format_specification
             if specification.storage_format_forced_override is not None:
                 return [specification.storage_format_forced_override]
         formatting_keywords = self._get_formatting_keywords(as_storage_format)
@@ -305,17 +312,17 @@ class StorageFormatManager(AbjadValueObject):
             if text is None:
                 text = spec.storage_format_text
         if kwargs_names is None:
-            kwargs_names = self.signature_keyword_names
+            kwargs_names = self._signature_keyword_names
         if args_values is None:
             args_values = tuple(
                 self._get(_)
-                for _ in self.signature_positional_names
+                for _ in self._signature_positional_names
                 )
         if args_values:
             kwargs_names = list(kwargs_names)
-            names = self.signature_positional_names
-            if not self.signature_accepts_args:
-                names += self.signature_keyword_names
+            names = self._signature_positional_names
+            if not self._signature_accepts_args:
+                names += self._signature_keyword_names
             names = names[:len(args_values)]
             for name in names:
                 if name in kwargs_names:
@@ -344,6 +351,50 @@ class StorageFormatManager(AbjadValueObject):
         parts.append(class_name)
         return parts
 
+    @classmethod
+    def _get_signature(class_, subject):
+        if not isinstance(subject, type):
+            subject = type(subject)
+        signature = class_._signature_cache.get(subject)
+        if signature is None:
+            signature = class_._inspect_signature(subject)
+            class_._signature_cache[subject] = signature
+        return signature
+
+    def _get_template_names(self):
+        if isinstance(self.client, type):
+            class_ = self.client
+        else:
+            class_ = type(self.client)
+        if self._has_default_format_specification():
+            kwargs_names = None
+        else:
+            specification = self.format_specification
+            if specification.template_names is not None:
+                template_names = specification.template_names
+                return template_names, tuple(sorted(set(template_names)))
+            kwargs_names = specification.storage_format_kwargs_names
+        if hasattr(self.client, '_get_storage_format_specification'):
+            # TODO: This will be factored out when SFS/SFM are removed.
+            template_names = list(self._signature_positional_names)
+            template_names.extend(self._signature_keyword_names)
+            specification = self.client._get_storage_format_specification()
+            template_names.extend(
+                specification._keyword_argument_names or ()
+                )
+            template_names = tuple(sorted(set(template_names)))
+            return template_names, template_names
+        key = (class_, kwargs_names)
+        result = self._template_names_cache.get(key)
+        if result is None:
+            template_names = list(self._signature_positional_names)
+            template_names.extend(self._signature_keyword_names)
+            template_names.extend(kwargs_names or ())
+            template_names = tuple(sorted(set(template_names)))
+            result = template_names, template_names
+            self._template_names_cache[key] = result
+        return result
+
     @staticmethod
     def _get_types(subject, result=None):
         r'''Gets all non-builtin types referenced in storage format.
@@ -395,8 +446,7 @@ class StorageFormatManager(AbjadValueObject):
                     arguments.append(value)
                 positional_argument_values = specification.positional_argument_values
                 if positional_argument_values is None:
-                    signature = agent.inspect_signature(subject)
-                    names, _, _, _ = signature
+                    names, _, _, _ = agent._get_signature(subject)
                     positional_argument_values = [
                         agent._get(name) for name in names]
                 arguments.extend(positional_argument_values)
@@ -436,6 +486,12 @@ class StorageFormatManager(AbjadValueObject):
             return self._indented_whitespace
         return self._unindented_whitespace
 
+    def _has_default_format_specification(self):
+        if isinstance(self.client, type):
+            return True
+        method = getattr(type(self.client), '_get_format_specification', None)
+        return method in (None, AbjadObject._get_format_specification)
+
     @staticmethod
     def _make_hashable(value):
         if isinstance(value, dict):
@@ -446,12 +502,48 @@ class StorageFormatManager(AbjadValueObject):
             value = tuple(value)
         return value
 
+    @staticmethod
+    def _inspect_signature(subject):
+        positional_names = []
+        keyword_names = []
+        accepts_args = False
+        accepts_kwargs = False
+        try:
+            signature = inspect.signature(subject)
+        except ValueError:
+            return (
+                tuple(positional_names),
+                tuple(keyword_names),
+                accepts_args,
+                accepts_kwargs,
+                )
+        for name, parameter in signature.parameters.items():
+            if parameter.kind == inspect._POSITIONAL_OR_KEYWORD:
+                if parameter.default == parameter.empty:
+                    positional_names.append(name)
+                else:
+                    keyword_names.append(name)
+            # Python 3 allow keyword only parameters:
+            elif (hasattr(inspect, '_KEYWORD_ONLY') and
+                parameter.kind == inspect._KEYWORD_ONLY):
+                keyword_names.append(name)
+            elif parameter.kind == inspect._VAR_POSITIONAL:
+                accepts_args = True
+            elif parameter.kind == inspect._VAR_KEYWORD:
+                accepts_kwargs = True
+        return (
+            tuple(positional_names),
+            tuple(keyword_names),
+            accepts_args,
+            accepts_kwargs,
+            )
+
     def _map_positional_values_to_names(self, values):
-        names = self.signature_positional_names
-        if not self.signature_accepts_args:
-            names += self.signature_keyword_names
+        names = self._signature_positional_names
+        if not self._signature_accepts_args:
+            names += self._signature_keyword_names
         names = names[:len(values)]
-        return names
+        return list(names)
 
     ### PUBLIC PROPERTIES ###
 
@@ -482,18 +574,18 @@ class StorageFormatManager(AbjadValueObject):
 
     @property
     def signature_keyword_names(self):
-        return self._signature_keyword_names
+        return list(self._signature_keyword_names)
 
     @property
     def signature_names(self):
-        return (
-            self.signature_positional_names +
-            self.signature_keyword_names
+        return list(
+            self._signature_positional_names +
+            self._signature_keyword_names
             )
 
     @property
     def signature_positional_names(self):
-        return self._signature_positional_names
+        return list(self._signature_positional_names)
 
     ### PUBLIC METHODS ###
 
@@ -502,20 +594,24 @@ class StorageFormatManager(AbjadValueObject):
         as_storage_format,
         include_root_package=None,
         ):
-        agent = StorageFormatManager(self._client)
         if not isinstance(self._client, type):
-            class_name = type(self._client).__name__
+            class_ = type(self._client)
         else:
-            class_name = self._client.__name__
+            class_ = self._client
+        class_name = class_.__name__
         if as_storage_format:
-            root_package_name = self.get_root_package_name()
-            root_package = importlib.import_module(root_package_name)
-            parts = [root_package_name]
-            if class_name not in dir(root_package):
-                tools_package_name = agent.get_tools_package_name()
-                parts.append(tools_package_name)
-            parts.append(class_name)
-            return '.'.join(parts)
+            prefix = self._class_name_prefix_cache.get(class_)
+            if prefix is None:
+                root_package_name = self.get_root_package_name()
+                root_package = importlib.import_module(root_package_name)
+                parts = [root_package_name]
+                if not hasattr(root_package, class_name):
+                    tools_package_name = self.get_tools_package_name()
+                    parts.append(tools_package_name)
+                parts.append(class_name)
+                prefix = '.'.join(parts)
+                self._class_name_prefix_cache[class_] = prefix
+            return prefix
         return class_name
 
     def get_hash_values(self):
@@ -524,8 +620,8 @@ class StorageFormatManager(AbjadValueObject):
             values.append(self._client)
         else:
             values.append(type(self._client))
-        template_items = sorted(self.get_template_dict().items())
-        values.extend(self._make_hashable(v) for k, v in template_items)
+        template_names = self._get_template_names()[1]
+        values.extend(self._make_hashable(self._get(_)) for _ in template_names)
         return tuple(values)
 
     def get_import_statements(self):
@@ -649,19 +745,7 @@ class StorageFormatManager(AbjadValueObject):
         return tuple(values)
 
     def get_template_dict(self):
-        template_names = self.format_specification.template_names
-        if template_names is None:
-            template_names = self.signature_names
-            # TODO: This will be factored out when SFS/SFM are removed.
-            if hasattr(self.client, '_get_storage_format_specification'):
-                specification = self.client._get_storage_format_specification()
-                template_names.extend(
-                    specification._keyword_argument_names or ()
-                    )
-            else:
-                template_names.extend(
-                    self.format_specification.storage_format_kwargs_names or ())
-            template_names = sorted(set(template_names))
+        template_names = self._get_template_names()[0]
         template_dict = collections.OrderedDict()
         for name in template_names:
             template_dict[name] = self._get(name)
@@ -678,38 +762,11 @@ class StorageFormatManager(AbjadValueObject):
 
     @classmethod
     def inspect_signature(class_, subject):
-        positional_names = []
-        keyword_names = []
-        accepts_args = False
-        accepts_kwargs = False
-        if not isinstance(subject, type):
-            subject = type(subject)
-        try:
-            signature = inspect.signature(subject)
-        except ValueError:
-            return (
-                positional_names,
-                keyword_names,
-                accepts_args,
-                accepts_kwargs,
-                )
-        for name, parameter in signature.parameters.items():
-            if parameter.kind == inspect._POSITIONAL_OR_KEYWORD:
-                if parameter.default == parameter.empty:
-                    positional_names.append(name)
-                else:
-                    keyword_names.append(name)
-            # Python 3 allow keyword only parameters:
-            elif (hasattr(inspect, '_KEYWORD_ONLY') and
-                parameter.kind == inspect._KEYWORD_ONLY):
-                keyword_names.append(name)
-            elif parameter.kind == inspect._VAR_POSITIONAL:
-                accepts_args = True
-            elif parameter.kind == inspect._VAR_KEYWORD:
-                accepts_kwargs = True
+        positional_names, keyword_names, accepts_args, accepts_kwargs = \
+            class_._get_signature(subject)
         return (
-            positional_names,
-            keyword_names,
+            list(positional_names),
+            list(keyword_names),
             accepts_args,
             accepts_kwargs,
             )
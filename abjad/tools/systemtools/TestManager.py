@@ -167,7 +167,12 @@ class TestManager(AbjadObject):
         '''
         import abjad
         agent_one = abjad.StorageFormatManager(object_one)
-        if agent_one.format_specification.coerce_for_equality:
+        if agent_one._has_default_format_specification():
+            coerce_for_equality = None
+        else:
+            specification = agent_one.format_specification
+            coerce_for_equality = specification.coerce_for_equality
+        if coerce_for_equality:
             try:
                 object_two = type(object_one)(object_two)
             except (
@@ -178,9 +183,13 @@ class TestManager(AbjadObject):
         elif not isinstance(object_two, type(object_one)):
             return False
         agent_two = abjad.StorageFormatManager(object_two)
-        template_1 = agent_one.get_template_dict()
-        template_2 = agent_two.get_template_dict()
-        return template_1 == template_2
+        template_names = agent_one._get_template_names()[0]
+        if template_names != agent_two._get_template_names()[0]:
+            return False
+        for name in template_names:
+            if not agent_one._get(name) == agent_two._get(name):
+                return False
+        return True
 
     @staticmethod
     def diff(object_a, object_b, title=None):
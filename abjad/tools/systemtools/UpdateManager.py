@@ -5,6 +5,24 @@ class UpdateManager(AbjadObject):
     '''Update manager.
 
     Updates start offset, stop offsets and indicators everywhere in score.
+
+    Updates offsets incrementally by default: only components at or after the
+    first invalidated component are recomputed, and only contexts that changed
+    have their leaf indices and measure numbers renumbered. Set
+    ``UpdateManager._incremental_offset_updates`` to false to recompute
+    offsets everywhere in score instead (as when benchmarking the two).
+
+    Counts offset updates in ``UpdateManager._offset_update_count`` so that
+    contexts can tell when their cached effective-indicator indices are
+    stale. Counts LilyPond format invalidations in
+    ``UpdateManager._lilypond_format_update_count`` so that containers can
+    tell when their cached LilyPond format depends on stale effective
+    indicators. Counts changes to overrides, settings and tweaks in
+    ``UpdateManager._lilypond_name_manager_update_count`` because LilyPond
+    name managers do not know the components to which they belong. Counts
+    changes to parents, prolations and names in
+    ``UpdateManager._parentage_update_count`` so that parentages can tell
+    when facts cached on components are stale.
     '''
 
     ### CLASS VARIABLES ###
@@ -13,6 +31,16 @@ class UpdateManager(AbjadObject):
 
     __slots__ = ()
 
+    _incremental_offset_updates = True
+
+    _lilypond_format_update_count = 0
+
+    _lilypond_name_manager_update_count = 0
+
+    _offset_update_count = 0
+
+    _parentage_update_count = 0
+
     ### PRIVATE METHODS ###
 
     @staticmethod
@@ -36,6 +64,24 @@ class UpdateManager(AbjadObject):
             offsets_in_seconds_are_current,
             )
 
+    @staticmethod
+    def _has_own_leaves_or_measures(context):
+        r'''Is true when at least one leaf or measure in `context` is not also
+        in a context nested in `context`.
+        '''
+        from abjad.tools import scoretools
+        def recurse(container):
+            for component in container:
+                if isinstance(component, (scoretools.Leaf, scoretools.Measure)):
+                    return True
+                if isinstance(component, scoretools.Context):
+                    continue
+                if isinstance(component, scoretools.Container):
+                    if recurse(component):
+                        return True
+            return False
+        return recurse(context)
+
     @staticmethod
     def _iterate_entire_score(score_root):
         import abjad
@@ -47,6 +93,34 @@ class UpdateManager(AbjadObject):
             )
         return components
 
+    def _update_affected_leaf_indices_and_measure_numbers(
+        self,
+        score_root,
+        contexts,
+        ):
+        r'''Renumbers leaves and measures only in `contexts` (and in the
+        contexts they contain).
+
+        Leaf indices and measure numbers are relative to the innermost context
+        containing each leaf or measure. So contexts without leaves or measures
+        of their own may be skipped.
+        '''
+        from abjad.tools import scoretools
+        from abjad.tools.topleveltools import iterate
+        if not isinstance(score_root, scoretools.Context):
+            self._update_all_leaf_indices_and_measure_numbers(score_root)
+            return
+        renumbered_contexts = set()
+        for context in contexts:
+            if id(context) in renumbered_contexts:
+                continue
+            if not self._has_own_leaves_or_measures(context):
+                continue
+            for context_ in iterate(context).components(scoretools.Context):
+                renumbered_contexts.add(id(context_))
+                self._update_context_leaf_indices_and_measure_numbers(
+                    context_)
+
     def _update_all_indicators(self, score_root):
         r'''Updating indicators does not update offsets.
         On the other hand, getting an effective indicator does update
@@ -61,8 +135,8 @@ class UpdateManager(AbjadObject):
                     wrapper._update_effective_context()
             component._indicators_are_current = True
 
-    @staticmethod
-    def _update_all_leaf_indices_and_measure_numbers(score_root):
+    @classmethod
+    def _update_all_leaf_indices_and_measure_numbers(class_, score_root):
         r'''Call only when updating offsets.
         No separate state flags exist for leaf indices or measure numbers.
         '''
@@ -71,19 +145,11 @@ class UpdateManager(AbjadObject):
         if isinstance(score_root, scoretools.Context):
             contexts = iterate(score_root).components(scoretools.Context)
             for context in contexts:
-                for leaf_index, leaf in enumerate(iterate(context).leaves()):
-                    leaf._leaf_index = leaf_index
-                for measure_index, measure in enumerate(
-                    iterate(context).components(scoretools.Measure)):
-                    measure_number = measure_index + 1
-                    measure._measure_number = measure_number
+                class_._update_context_leaf_indices_and_measure_numbers(
+                    context)
         else:
-            for leaf_index, leaf in enumerate(iterate(score_root).leaves()):
-                leaf._leaf_index = leaf_index
-            for measure_index, measure in enumerate(
-                iterate(score_root).components(scoretools.Measure)):
-                measure_number = measure_index + 1
-                measure._measure_number = measure_number
+            class_._update_context_leaf_indices_and_measure_numbers(
+                score_root)
 
     def _update_all_offsets(self, score_root):
         r'''Updating offsets does not update indicators.
@@ -92,6 +158,7 @@ class UpdateManager(AbjadObject):
         for component in self._iterate_entire_score(score_root):
             self._update_component_offsets(component)
             component._offsets_are_current = True
+            component._subtree_offsets_are_current = True
 
     def _update_all_offsets_in_seconds(self, score_root):
         for component in self._iterate_entire_score(score_root):
@@ -140,6 +207,58 @@ class UpdateManager(AbjadObject):
         except MissingMetronomeMarkError:
             pass
 
+    @staticmethod
+    def _update_context_leaf_indices_and_measure_numbers(context):
+        from abjad.tools import scoretools
+        from abjad.tools.topleveltools import iterate
+        leaf_index, measure_number = 0, 1
+        prototype = (scoretools.Leaf, scoretools.Measure)
+        for component in iterate(context).components(prototype):
+            if isinstance(component, scoretools.Leaf):
+                component._leaf_index = leaf_index
+                leaf_index += 1
+            else:
+                component._measure_number = measure_number
+                measure_number += 1
+
+    def _update_grace_container_offsets(self, leaf):
+        grace_containers = (
+            leaf._grace_container,
+            leaf._after_grace_container,
+            )
+        for grace_container in grace_containers:
+            if grace_container is None:
+                continue
+            for component in grace_container._iterate_top_down():
+                self._update_component_offsets(component)
+                component._offsets_are_current = True
+                component._subtree_offsets_are_current = True
+
+    def _update_leaf_offsets(self, leaves, start_offset, prolation):
+        r'''Updates offsets of consecutive `leaves` from `start_offset`.
+
+        Sums prolated leaf durations in integer arithmetic.
+
+        Returns stop offset of last leaf.
+        '''
+        import abjad
+        durations = [_._get_preprolated_duration() for _ in leaves]
+        durations = abjad.DurationArray(durations, item_class=abjad.Offset)
+        offsets = (durations * prolation).cumulative_sums(start=start_offset)
+        offsets = iter(offsets)
+        next(offsets)
+        for leaf in leaves:
+            stop_offset = next(offsets)
+            leaf._start_offset = start_offset
+            leaf._stop_offset = stop_offset
+            leaf._timespan._start_offset = start_offset
+            leaf._timespan._stop_offset = stop_offset
+            leaf._offsets_are_current = True
+            leaf._subtree_offsets_are_current = True
+            self._update_grace_container_offsets(leaf)
+            start_offset = stop_offset
+        return start_offset
+
     def _update_now(
         self,
         component,
@@ -164,15 +283,117 @@ class UpdateManager(AbjadObject):
             offsets_in_seconds_are_current,
             ) = self._get_score_tree_state_flags(parentage)
         score_root = parentage.root
+        prototype = (abjad.AfterGraceContainer, abjad.GraceContainer)
         if offsets and not offsets_are_current:
-            self._update_all_offsets(score_root)
-            self._update_all_leaf_indices_and_measure_numbers(score_root)
+            UpdateManager._offset_update_count += 1
+            if (self._incremental_offset_updates and
+                not isinstance(score_root, prototype)):
+                contexts = self._update_offsets_incrementally(score_root)
+                self._update_affected_leaf_indices_and_measure_numbers(
+                    score_root,
+                    contexts,
+                    )
+            else:
+                self._update_all_offsets(score_root)
+                self._update_all_leaf_indices_and_measure_numbers(score_root)
         if offsets_in_seconds and not offsets_in_seconds_are_current:
             self._update_all_offsets_in_seconds(score_root)
         if indicators and not indicators_are_current:
             self._update_all_indicators(score_root)
             self._update_all_offsets_in_seconds(score_root)
 
+    def _update_offsets_incrementally(self, score_root):
+        r'''Updates offsets from first invalidated component forward.
+
+        Skips any current component whose start offset has not changed,
+        together with everything the component contains. Recomputes everything
+        contained in components that have been moved, removed or changed
+        simultaneity since the last update.
+
+        Returns contexts that changed, in score order.
+        '''
+        import abjad
+        contexts = []
+        self._update_subtree_offsets(
+            score_root,
+            abjad.Offset(0),
+            abjad.Multiplier(1),
+            False,
+            contexts,
+            )
+        return contexts
+
+    def _update_subtree_offsets(
+        self,
+        component,
+        start_offset,
+        prolation,
+        recompute_all,
+        contexts,
+        ):
+        import abjad
+        if (not recompute_all and
+            component._offsets_are_current and
+            component._subtree_offsets_are_current and
+            component._start_offset == start_offset):
+            return component._stop_offset
+        if not component._subtree_offsets_are_current:
+            recompute_all = True
+        if isinstance(component, abjad.Context):
+            if recompute_all or not component._offsets_are_current:
+                contexts.append(component)
+        if isinstance(component, abjad.Container):
+            default = abjad.Multiplier(1)
+            prolation *= getattr(component, 'implied_prolation', default)
+            stop_offset = start_offset
+            if component.is_simultaneous:
+                for child in component:
+                    stop_offset_ = self._update_subtree_offsets(
+                        child,
+                        start_offset,
+                        prolation,
+                        recompute_all,
+                        contexts,
+                        )
+                    stop_offset = max(stop_offset, stop_offset_)
+            else:
+                children = component._components
+                index = 0
+                while index < len(children):
+                    child = children[index]
+                    if recompute_all and isinstance(child, abjad.Leaf):
+                        stop_index = index + 1
+                        while (stop_index < len(children) and
+                            isinstance(children[stop_index], abjad.Leaf)):
+                            stop_index += 1
+                        stop_offset = self._update_leaf_offsets(
+                            children[index:stop_index],
+                            stop_offset,
+                            prolation,
+                            )
+                        index = stop_index
+                        continue
+                    stop_offset = self._update_subtree_offsets(
+                        child,
+                        stop_offset,
+                        prolation,
+                        recompute_all,
+                        contexts,
+                        )
+                    index += 1
+        else:
+            duration = prolation * component._get_preprolated_duration()
+            stop_offset = start_offset + duration
+        component._start_offset = start_offset
+        component._stop_offset = stop_offset
+        component._timespan._start_offset = start_offset
+        component._timespan._stop_offset = stop_offset
+        component._offsets_are_current = True
+        component._subtree_offsets_are_current = True
+        if isinstance(component, abjad.Leaf):
+            self._update_grace_container_offsets(component)
+        return stop_offset
+
     ### EXPERIMENTAL ###
 
     @staticmethod
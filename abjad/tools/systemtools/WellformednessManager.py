@@ -1,3 +1,5 @@
+import collections
+import time
 from abjad.tools.abctools.AbjadObject import AbjadObject
 
 
@@ -17,6 +19,7 @@ class WellformednessManager(AbjadObject):
 
     __slots__ = (
         '_allow_percussion_clef',
+        '_timings',
         )
 
     _publish_storage_format = True
@@ -25,6 +28,7 @@ class WellformednessManager(AbjadObject):
 
     def __init__(self, allow_percussion_clef=None):
         self._allow_percussion_clef = allow_percussion_clef
+        self._timings = None
 
     ### SPECIAL METHODS ###
 
@@ -36,21 +40,350 @@ class WellformednessManager(AbjadObject):
         if argument is None:
             return
         check_names = [_ for _ in dir(self) if _.startswith('check_')]
+        return self._call_checks(argument, sorted(check_names))
+
+    ### PRIVATE METHODS ###
+
+    def _call_checks(self, argument, check_names):
+        import abjad
+        cache = {'allowable_clefs': {}, 'effective': {}, 'spanners': {}}
+        timings = collections.OrderedDict((_, 0.0) for _ in check_names)
+        checks = []
+        for check_name in check_names:
+            name = check_name.replace('check_', '_make_', 1) + '_check'
+            start_time = time.perf_counter()
+            prototype, visit, finish = getattr(self, name)(cache)
+            timings[check_name] += time.perf_counter() - start_time
+            checks.append((check_name, prototype, visit, finish))
+        visitors_by_class = {}
+
+        def dispatch(item):
+            class_ = type(item)
+            visitors = visitors_by_class.get(class_)
+            if visitors is None:
+                visitors = visitors_by_class[class_] = [
+                    (check_name, visit)
+                    for check_name, prototype, visit, finish in checks
+                    if issubclass(class_, prototype)
+                    ]
+            for check_name, visit in visitors:
+                start_time = time.perf_counter()
+                visit(item)
+                timings[check_name] += time.perf_counter() - start_time
+
+        visits_spanners = any(_[1] is abjad.Spanner for _ in checks)
+        spanners, spanner_ids = [], set()
+        for component in abjad.iterate(argument).components():
+            dispatch(component)
+            if visits_spanners and isinstance(component, abjad.Leaf):
+                for spanner in self._get_spanners(component, None, cache):
+                    if id(spanner) not in spanner_ids:
+                        spanner_ids.add(id(spanner))
+                        spanners.append(spanner)
+        for spanner in spanners:
+            dispatch(spanner)
         triples = []
-        for current_check_name in sorted(check_names):
-            current_check = getattr(self, current_check_name)
-            current_violators, current_total = current_check(argument=argument)
-            triple = (current_violators, current_total, current_check_name)
-            triples.append(triple)
+        for check_name, prototype, visit, finish in checks:
+            start_time = time.perf_counter()
+            violators, total = finish()
+            timings[check_name] += time.perf_counter() - start_time
+            triples.append((violators, total, check_name))
+        self._timings = timings
         return triples
 
-    ### PRIVATE METHODS ###
+    @staticmethod
+    def _get_effective(leaf, prototype, cache):
+        import abjad
+        key = (id(leaf), prototype)
+        if key not in cache['effective']:
+            effective = abjad.inspect(leaf).get_effective(prototype)
+            cache['effective'][key] = effective
+        return cache['effective'][key]
+
+    @staticmethod
+    def _get_spanners(leaf, prototype, cache):
+        spanners = cache['spanners'].get(id(leaf))
+        if spanners is None:
+            spanners = leaf._get_spanners()
+            cache['spanners'][id(leaf)] = spanners
+        if prototype is None:
+            return spanners
+        return [_ for _ in spanners if isinstance(_, prototype)]
+
+    def _make_beamed_long_notes_check(self, cache):
+        import abjad
+        violators, total = [], set()
+        duration = abjad.Duration(1, 4)
+        smart_beams = (
+            abjad.DuratedComplexBeam,
+            abjad.MultipartBeam,
+            )
+
+        def visit(leaf):
+            if leaf.written_duration < duration:
+                return
+            total.add(leaf)
+            beams = self._get_spanners(leaf, abjad.Beam, cache)
+            for beam in beams:
+                if isinstance(beam, smart_beams):
+                    continue
+                violators.append(leaf)
+
+        return abjad.Leaf, visit, lambda: (violators, len(total))
+
+    def _make_discontiguous_spanners_check(self, cache):
+        import abjad
+        violators, spanners = [], []
+
+        def visit(spanner):
+            spanners.append(spanner)
+            if spanner._contiguity_constraint == 'logical voice':
+                if not spanner[:].are_contiguous_logical_voice():
+                    violators.append(spanner)
+
+        return abjad.Spanner, visit, lambda: (violators, len(spanners))
+
+    def _make_duplicate_ids_check(self, cache):
+        import abjad
+        components = []
+
+        def visit(component):
+            components.append(component)
+
+        def finish():
+            counts = collections.Counter(id(_) for _ in components)
+            violators = [_ for _ in components if 1 < counts[id(_)]]
+            return violators, len(components)
+
+        return abjad.Component, visit, finish
+
+    def _make_empty_containers_check(self, cache):
+        import abjad
+        violators, containers = [], set()
+
+        def visit(container):
+            containers.add(container)
+            if len(container) == 0:
+                violators.append(container)
+
+        return abjad.Container, visit, lambda: (violators, len(containers))
+
+    def _make_misdurated_measures_check(self, cache):
+        import abjad
+        violators, total = [], set()
+
+        def visit(measure):
+            total.add(measure)
+            time_signature = measure.time_signature
+            if time_signature is not None:
+                duration = measure._get_preprolated_duration()
+                if duration != time_signature.duration:
+                    violators.append(measure)
+
+        return abjad.Measure, visit, lambda: (violators, len(total))
+
+    def _make_misfilled_measures_check(self, cache):
+        import abjad
+        violators, total = [], set()
+
+        def visit(measure):
+            total.add(measure)
+            if measure.is_misfilled:
+                violators.append(measure)
+
+        return abjad.Measure, visit, lambda: (violators, len(total))
+
+    def _make_mismatched_enchained_hairpins_check(self, cache):
+        import abjad
+        violators, total = [], set()
+
+        def visit(leaf):
+            hairpins = self._get_spanners(leaf, abjad.Hairpin, cache)
+            total.update(hairpins)
+            if len(hairpins) <= 1:
+                return
+            if 2 < len(hairpins):
+                raise Exception('too many hairpins')
+            assert len(hairpins) == 2
+            hairpins_are_enchained = False
+            if (hairpins[0]._is_my_last_leaf(leaf) and
+                hairpins[-1]._is_my_first_leaf(leaf)):
+                hairpins_are_enchained = True
+            if (hairpins[-1]._is_my_last_leaf(leaf) and
+                hairpins[0]._is_my_first_leaf(leaf)):
+                hairpins_are_enchained = True
+            if not hairpins_are_enchained:
+                return
+            if hairpins[0]._is_my_first_leaf(leaf):
+                first_hairpin = hairpins[-1]
+                second_hairpin = hairpins[0]
+            else:
+                first_hairpin = hairpins[0]
+                second_hairpin = hairpins[-1]
+            if first_hairpin.stop_dynamic != second_hairpin.start_dynamic:
+                violators.append(first_hairpin)
+                violators.append(second_hairpin)
+
+        return abjad.Leaf, visit, lambda: (violators, len(total))
+
+    def _make_mispitched_ties_check(self, cache):
+        import abjad
+        ties = set()
+
+        def visit(leaf):
+            ties.update(self._get_spanners(leaf, abjad.Tie, cache))
+
+        def finish():
+            violators = []
+            for tie in ties:
+                for first_leaf, second_leaf in abjad.sequence(tie).nwise():
+                    first_pitches = abjad.inspect(first_leaf).get_pitches()
+                    first_pitches = set([_.number for _ in first_pitches])
+                    second_pitches = abjad.inspect(second_leaf).get_pitches()
+                    second_pitches = set([_.number for _ in second_pitches])
+                    if not (first_pitches & second_pitches):
+                        violators.append(tie)
+                        break
+            return violators, len(ties)
+
+        return (abjad.Chord, abjad.Note), visit, finish
+
+    def _make_misrepresented_flags_check(self, cache):
+        import abjad
+        violators, total = [], set()
+
+        def visit(leaf):
+            total.add(leaf)
+            flags = leaf.written_duration.flag_count
+            setting = leaf._lilypond_setting_name_manager
+            left = getattr(setting, 'stem_left_beam_count', None)
+            right = getattr(setting, 'stem_right_beam_count', None)
+            if left is not None:
+                if (flags < left or
+                    (left < flags and right not in (flags, None))):
+                    if leaf not in violators:
+                        violators.append(leaf)
+            if right is not None:
+                if (flags < right or
+                    (right < flags and left not in (flags, None))):
+                    if leaf not in violators:
+                        violators.append(leaf)
+
+        return abjad.Leaf, visit, lambda: (violators, len(total))
+
+    def _make_missing_parents_check(self, cache):
+        import abjad
+        violators, total = [], set()
+
+        def visit(component):
+            if total and component._parent is None:
+                violators.append(component)
+            total.add(component)
+
+        return abjad.Component, visit, lambda: (violators, len(total))
+
+    def _make_nested_measures_check(self, cache):
+        import abjad
+        violators, total = [], set()
+
+        def visit(measure):
+            total.add(measure)
+            parent = measure._parent
+            while parent is not None:
+                if isinstance(parent, abjad.Measure):
+                    violators.append(measure)
+                    break
+                parent = parent._parent
+
+        return abjad.Measure, visit, lambda: (violators, len(total))
+
+    def _make_notes_on_wrong_clef_check(self, cache):
+        import abjad
+        violators, total = [], set()
+
+        def visit(leaf):
+            total.add(leaf)
+            instrument = self._get_effective(leaf, abjad.Instrument, cache)
+            if instrument is None:
+                return
+            clef = self._get_effective(leaf, abjad.Clef, cache)
+            if clef is None:
+                return
+            allowable_clefs = cache['allowable_clefs'].get(id(instrument))
+            if allowable_clefs is None:
+                allowable_clefs = [
+                    abjad.Clef(_) for _ in instrument.allowable_clefs
+                    ]
+                if self.allow_percussion_clef:
+                    allowable_clefs.append(abjad.Clef('percussion'))
+                cache['allowable_clefs'][id(instrument)] = allowable_clefs
+            if clef not in allowable_clefs:
+                violators.append(leaf)
+
+        return abjad.Leaf, visit, lambda: (violators, len(total))
+
+    def _make_out_of_range_notes_check(self, cache):
+        import abjad
+        violators, total = [], set()
+
+        def visit(leaf):
+            total.add(leaf)
+            instrument = self._get_effective(leaf, abjad.Instrument, cache)
+            if instrument is None:
+                return
+            if leaf not in instrument.pitch_range:
+                violators.append(leaf)
+
+        prototype = (abjad.Chord, abjad.Note)
+        return prototype, visit, lambda: (violators, len(total))
+
+    def _make_overlapping_beams_check(self, cache):
+        import abjad
+        violators, total = [], set()
+
+        def visit(leaf):
+            beams = self._get_spanners(leaf, abjad.Beam, cache)
+            total.update(beams)
+            if 1 < len(beams):
+                for beam in beams:
+                    if beam not in violators:
+                        violators.append(beam)
+
+        return abjad.Leaf, visit, lambda: (violators, len(total))
+
+    def _make_overlapping_glissandi_check(self, cache):
+        import abjad
+        return self._make_overlapping_spanners_check(cache, abjad.Glissando)
+
+    def _make_overlapping_hairpins_check(self, cache):
+        import abjad
+        return self._make_overlapping_spanners_check(cache, abjad.Hairpin)
+
+    def _make_overlapping_octavation_spanners_check(self, cache):
+        import abjad
+        violators, total = [], set()
+        prototype = abjad.OctavationSpanner
+
+        def visit(leaf):
+            spanners = self._get_spanners(leaf, prototype, cache)
+            total.update(spanners)
+            if 1 < len(spanners):
+                for spanner in spanners:
+                    if spanner not in violators:
+                        violators.append(spanner)
 
-    def _check_overlapping_spanners(self, argument, prototype=None):
+        return abjad.Leaf, visit, lambda: (violators, len(total))
+
+    def _make_overlapping_spanners_check(self, cache, prototype=None):
         import abjad
         violators, spanners = set(), set()
-        for leaf in abjad.iterate(argument).leaves():
-            spanners_ = list(abjad.inspect(leaf).get_spanners(prototype))
+        # first enchained pair of spanners ends check
+        is_stopped = []
+
+        def visit(leaf):
+            if is_stopped:
+                return
+            spanners_ = self._get_spanners(leaf, prototype, cache)
             spanners.update(spanners_)
             if 1 < len(spanners_):
                 if len(spanners_) == 2:
@@ -62,9 +395,43 @@ class WellformednessManager(AbjadObject):
                             spanners_[1].leaves[-1] is leaf) or
                             (spanners_[1].leaves[0] is leaf and
                             spanners_[0].leaves[-1] is leaf)):
-                            break
+                            is_stopped.append(True)
+                            return
                 violators.update(spanners_)
-        return violators, len(spanners)
+
+        return abjad.Leaf, visit, lambda: (violators, len(spanners))
+
+    def _make_overlapping_ties_check(self, cache):
+        import abjad
+        violators, total = [], set()
+
+        def visit(leaf):
+            spanners = self._get_spanners(leaf, abjad.Tie, cache)
+            total.update(spanners)
+            if 1 < len(spanners):
+                for spanner in spanners:
+                    if spanner not in violators:
+                        violators.append(spanner)
+
+        return abjad.Leaf, visit, lambda: (violators, len(total))
+
+    def _make_overlapping_trill_spanners_check(self, cache):
+        import abjad
+        return self._make_overlapping_spanners_check(
+            cache,
+            abjad.TrillSpanner,
+            )
+
+    def _make_tied_rests_check(self, cache):
+        import abjad
+        violators, total = [], set()
+
+        def visit(rest):
+            total.add(rest)
+            if self._get_spanners(rest, abjad.Tie, cache):
+                violators.append(rest)
+
+        return abjad.Rest, visit, lambda: (violators, len(total))
 
     ### PUBLIC PROPERTIES ###
 
@@ -76,6 +443,25 @@ class WellformednessManager(AbjadObject):
         '''
         return self._allow_percussion_clef
 
+    @property
+    def timings(self):
+        r'''Gets seconds spent in each check during last call.
+
+        ..  container:: example
+
+            >>> staff = abjad.Staff("c'8 d'8 e'8 f'8")
+            >>> manager = abjad.WellformednessManager()
+            >>> manager.timings is None
+            True
+
+            >>> triples = manager(staff)
+            >>> list(manager.timings) == [_[-1] for _ in triples]
+            True
+
+        Returns ordered dictionary or none.
+        '''
+        return self._timings
+
     ### PUBLIC METHODS ###
 
     def check_beamed_long_notes(self, argument=None):
@@ -97,22 +483,9 @@ class WellformednessManager(AbjadObject):
 
         Second item in pair is count of all long notes in `argument`.
         '''
-        import abjad
-        violators, total = [], set()
-        smart_beams = (
-            abjad.DuratedComplexBeam,
-            abjad.MultipartBeam,
-            )
-        for leaf in abjad.iterate(argument).leaves():
-            if leaf.written_duration < abjad.Duration(1, 4):
-                continue
-            total.add(leaf)
-            beams = abjad.inspect(leaf).get_spanners(abjad.Beam)
-            for beam in beams:
-                if isinstance(beam, smart_beams):
-                    continue
-                violators.append(leaf)
-        return violators, len(total)
+        check_names = ['check_beamed_long_notes']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_discontiguous_spanners(self, argument=None):
         r'''Checks discontiguous spanners.
@@ -125,32 +498,18 @@ class WellformednessManager(AbjadObject):
         Returns list of discontiguous spanners and nonnegative integer count of
         all spanners in `argument`.
         '''
-        import abjad
-        violators = []
-        descendants = abjad.inspect(argument).get_descendants()
-        spanners = abjad.inspect(descendants).get_spanners()
-        for spanner in spanners:
-            if spanner._contiguity_constraint == 'logical voice':
-                if not spanner[:].are_contiguous_logical_voice():
-                    violators.append(spanner)
-        return violators, len(spanners)
+        check_names = ['check_discontiguous_spanners']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_duplicate_ids(self, argument=None):
         r'''Checks duplicate IDs.
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        components = abjad.iterate(argument).components()
-        total_ids = [id(_) for _ in components]
-        unique_ids = abjad.sequence(total_ids).remove_repeats()
-        if len(unique_ids) < len(total_ids):
-            for current_id in unique_ids:
-                if 1 < total_ids.count(current_id):
-                    violators.extend([_ for _ in components
-                        if id(_) == current_id])
-        return violators, len(total_ids)
+        check_names = ['check_duplicate_ids']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_empty_containers(self, argument=None):
         r'''Checks empty containers.
@@ -179,42 +538,27 @@ class WellformednessManager(AbjadObject):
         Returns list of empty containers and count of all containers in
         `argument`.
         '''
-        import abjad
-        violators, containers = [], set()
-        for container in abjad.iterate(argument).components(abjad.Container):
-            containers.add(container)
-            if len(container) == 0:
-                violators.append(container)
-        return violators, len(containers)
+        check_names = ['check_empty_containers']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_misdurated_measures(self, argument=None):
         r'''Checks misdurated measures.
 
         Returns violators and total.
         '''
-        import abjad
-        violators, total = [], set()
-        for measure in abjad.iterate(argument).components(abjad.Measure):
-            total.add(measure)
-            time_signature = measure.time_signature
-            if time_signature is not None:
-                duration = measure._get_preprolated_duration()
-                if duration != time_signature.duration:
-                    violators.append(measure)
-        return violators, len(total)
+        check_names = ['check_misdurated_measures']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_misfilled_measures(self, argument=None):
         r'''Checks misfilled measures.
 
         Returns violators and total.
         '''
-        import abjad
-        violators, total = [], set()
-        for measure in abjad.iterate(argument).components(abjad.Measure):
-            total.add(measure)
-            if measure.is_misfilled:
-                violators.append(measure)
-        return violators, len(total)
+        check_names = ['check_misfilled_measures']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_mismatched_enchained_hairpins(self, argument=None):
         r'''Checks mismatched enchained hairpins.
@@ -254,38 +598,9 @@ class WellformednessManager(AbjadObject):
 
         Returns violators and total.
         '''
-        import abjad
-        violators, total = [], set()
-        for leaf in abjad.iterate(argument).leaves():
-            hairpins = abjad.inspect(leaf).get_spanners(abjad.Hairpin)
-            hairpins = list(hairpins)
-            total.update(hairpins)
-            if len(hairpins) <= 1:
-                continue
-            if 2 < len(hairpins):
-                raise Exception('too many hairpins')
-            assert len(hairpins) == 2
-            hairpins_are_enchained = False
-            if (hairpins[0]._is_my_last_leaf(leaf) and
-                hairpins[-1]._is_my_first_leaf(leaf)):
-                hairpins_are_enchained = True
-            if (hairpins[-1]._is_my_last_leaf(leaf) and
-                hairpins[0]._is_my_first_leaf(leaf)):
-                hairpins_are_enchained = True
-            if not hairpins_are_enchained:
-                continue
-            if hairpins[0]._is_my_first_leaf(leaf):
-                first_hairpin = hairpins[-1]
-                second_hairpin = hairpins[0]
-            else:
-                first_hairpin = hairpins[0]
-                second_hairpin = hairpins[-1]
-            if first_hairpin.stop_dynamic == second_hairpin.start_dynamic:
-                continue
-            else:
-                violators.append(first_hairpin)
-                violators.append(second_hairpin)
-        return violators, len(total)
+        check_names = ['check_mismatched_enchained_hairpins']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_mispitched_ties(self, argument=None):
         r'''Checks mispitched notes.
@@ -352,76 +667,36 @@ class WellformednessManager(AbjadObject):
 
         Returns violator ties together with total number of ties.
         '''
-        import abjad
-        violators, ties = [], set()
-        for leaf in abjad.iterate(argument).leaves(pitched=True):
-            ties_ = abjad.inspect(leaf).get_spanners(abjad.Tie)
-            ties.update(ties_)
-        for tie in ties:
-            for first_leaf, second_leaf in abjad.sequence(tie).nwise():
-                first_pitches = abjad.inspect(first_leaf).get_pitches()
-                first_pitches = set([_.number for _ in first_pitches])
-                second_pitches = abjad.inspect(second_leaf).get_pitches()
-                second_pitches = set([_.number for _ in second_pitches])
-                if not (first_pitches & second_pitches):
-                    violators.append(tie)
-                    break
-        return violators, len(ties)
+        check_names = ['check_mispitched_ties']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_misrepresented_flags(self, argument=None):
         r'''Checks misrepresented flags.
 
         Returns violators and total.
         '''
-        import abjad
-        violators, total = [], set()
-        for leaf in abjad.iterate(argument).leaves():
-            total.add(leaf)
-            flags = leaf.written_duration.flag_count
-            left = getattr(abjad.setting(leaf), 'stem_left_beam_count', None)
-            right = getattr(abjad.setting(leaf), 'stem_right_beam_count', None)
-            if left is not None:
-                if (flags < left or
-                    (left < flags and right not in (flags, None))):
-                    if leaf not in violators:
-                        violators.append(leaf)
-            if right is not None:
-                if (flags < right or
-                    (right < flags and left not in (flags, None))):
-                    if leaf not in violators:
-                        violators.append(leaf)
-        return violators, len(total)
+        check_names = ['check_misrepresented_flags']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_missing_parents(self, argument=None):
         r'''Checks missing parents.
 
         Returns violators and total.
         '''
-        import abjad
-        violators, total = [], set()
-        components = abjad.iterate(argument).components()
-        for i, component in enumerate(components):
-            total.add(component)
-            if 0 < i:
-                if abjad.inspect(component).get_parentage().parent is None:
-                    violators.append(component)
-        return violators, len(total)
+        check_names = ['check_missing_parents']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_nested_measures(self, argument=None):
         r'''Checks nested measures.
 
         Returns violators and total.
         '''
-        import abjad
-        violators, total = [], set()
-        for measure in abjad.iterate(argument).components(abjad.Measure):
-            total.add(measure)
-            parentage = abjad.inspect(measure).get_parentage(
-                include_self=False,
-                )
-            if parentage.get_first(abjad.Measure):
-                violators.append(measure)
-        return violators, len(total)
+        check_names = ['check_nested_measures']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_notes_on_wrong_clef(self, argument=None):
         r'''Checks notes and chords on wrong clef.
@@ -553,24 +828,9 @@ class WellformednessManager(AbjadObject):
 
         Returns true or false.
         '''
-        import abjad
-        violators, total = [], set()
-        for leaf in abjad.iterate(argument).leaves():
-            total.add(leaf)
-            instrument = abjad.inspect(leaf).get_effective(abjad.Instrument)
-            if instrument is None:
-                continue
-            clef = abjad.inspect(leaf).get_effective(abjad.Clef)
-            if clef is None:
-                continue
-            allowable_clefs = [
-                abjad.Clef(_) for _ in instrument.allowable_clefs
-                ]
-            if self.allow_percussion_clef:
-                allowable_clefs.append(abjad.Clef('percussion'))
-            if clef not in allowable_clefs:
-                violators.append(leaf)
-        return violators, len(total)
+        check_names = ['check_notes_on_wrong_clef']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_out_of_range_notes(self, argument=None):
         r'''Checks out-of-range notes.
@@ -622,16 +882,9 @@ class WellformednessManager(AbjadObject):
 
         Returns true or false.
         '''
-        import abjad
-        violators, total = [], set()
-        for leaf in abjad.iterate(argument).leaves(pitched=True):
-            total.add(leaf)
-            instrument = abjad.inspect(leaf).get_effective(abjad.Instrument)
-            if instrument is None:
-                continue
-            if leaf not in instrument.pitch_range:
-                violators.append(leaf)
-        return violators, len(total)
+        check_names = ['check_out_of_range_notes']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_overlapping_beams(self, argument=None):
         r'''Checks overlapping beams.
@@ -670,24 +923,18 @@ class WellformednessManager(AbjadObject):
         Returns list of overlapping beams and nonnegative integer count of
         total beams in score.
         '''
-        import abjad
-        violators, total = [], set()
-        for leaf in abjad.iterate(argument).leaves():
-            beams = abjad.inspect(leaf).get_spanners(abjad.Beam)
-            total.update(beams)
-            if 1 < len(beams):
-                for beam in beams:
-                    if beam not in violators:
-                        violators.append(beam)
-        return violators, len(total)
+        check_names = ['check_overlapping_beams']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_overlapping_glissandi(self, argument=None):
         r'''Checks overlapping glissandi.
 
         Returns violators and total.
         '''
-        import abjad
-        return self._check_overlapping_spanners(argument, abjad.Glissando)
+        check_names = ['check_overlapping_glissandi']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_overlapping_hairpins(self, argument=None):
         r'''Checks overlapping hairpins.
@@ -727,25 +974,18 @@ class WellformednessManager(AbjadObject):
 
         Returns violators and total.
         '''
-        import abjad
-        return self._check_overlapping_spanners(argument, abjad.Hairpin)
+        check_names = ['check_overlapping_hairpins']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_overlapping_octavation_spanners(self, argument=None):
         r'''Checks overlapping octavation spanners.
 
         Returns violators and total.
         '''
-        import abjad
-        violators, total = [], set()
-        prototype = abjad.OctavationSpanner
-        for leaf in abjad.iterate(argument).leaves():
-            spanners = abjad.inspect(leaf).get_spanners(prototype)
-            total.update(spanners)
-            if 1 < len(spanners):
-                for spanner in spanners:
-                    if spanner not in violators:
-                        violators.append(spanner)
-        return violators, len(total)
+        check_names = ['check_overlapping_octavation_spanners']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_overlapping_ties(self, argument=None):
         r'''Checks overlapping ties.
@@ -786,16 +1026,9 @@ class WellformednessManager(AbjadObject):
 
         Returns violators and count of total ties.
         '''
-        import abjad
-        violators, total = [], set()
-        for leaf in abjad.iterate(argument).leaves():
-            spanners = abjad.inspect(leaf).get_spanners(abjad.Tie)
-            total.update(spanners)
-            if 1 < len(spanners):
-                for spanner in spanners:
-                    if spanner not in violators:
-                        violators.append(spanner)
-        return violators, len(total)
+        check_names = ['check_overlapping_ties']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_overlapping_trill_spanners(self, argument=None):
         r'''Checks overlapping trill spanners.
@@ -878,18 +1111,15 @@ class WellformednessManager(AbjadObject):
 
         Returns violators and total.
         '''
-        import abjad
-        return self._check_overlapping_spanners(argument, abjad.TrillSpanner)
+        check_names = ['check_overlapping_trill_spanners']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
 
     def check_tied_rests(self, argument=None):
         r'''Checks tied rests.
 
         Returns violators and total.
         '''
-        import abjad
-        violators, total = [], set()
-        for rest in abjad.iterate(argument).leaves(abjad.Rest):
-            total.add(rest)
-            if abjad.inspect(rest).has_spanner(abjad.Tie):
-                violators.append(rest)
-        return violators, len(total)
+        check_names = ['check_tied_rests']
+        violators, total, _ = self._call_checks(argument, check_names)[0]
+        return violators, total
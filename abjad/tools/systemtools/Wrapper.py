@@ -611,6 +611,7 @@ class Wrapper(AbjadValueObject):
         self._unbind_effective_context()
         if correct_effective_context is not None:
             correct_effective_context._dependent_wrappers.append(self)
+            correct_effective_context._dependent_wrapper_index.clear()
         self._effective_context = correct_effective_context
         self._update_effective_context()
         if isinstance(self.indicator, abjad.MetronomeMark):
@@ -624,7 +625,21 @@ class Wrapper(AbjadValueObject):
         self._update_effective_context()
         if isinstance(self.indicator, abjad.MetronomeMark):
             self._component._update_later(offsets_in_seconds=True)
+        if self._changes_duration(component):
+            component._update_later(offsets=True)
         component._wrappers.append(self)
+        self._update_component_later()
+
+    def _changes_duration(self, component):
+        import abjad
+        if not isinstance(component, abjad.Component):
+            return False
+        prototype = (
+            abjad.Multiplier,
+            abjad.NonreducedFraction,
+            abjad.TimeSignature,
+            )
+        return isinstance(self.indicator, prototype)
 
     def _detach(self):
         self._unbind_component()
@@ -747,6 +762,9 @@ class Wrapper(AbjadValueObject):
             if hasattr(component, '_wrappers'):
                 if self in component._wrappers:
                     component._wrappers.remove(self)
+            if self._changes_duration(component):
+                component._update_later(offsets=True)
+            self._update_component_later()
         self._component = None
 
     def _unbind_effective_context(self):
@@ -756,8 +774,19 @@ class Wrapper(AbjadValueObject):
                 effective_context._dependent_wrappers.remove(self)
             except ValueError:
                 pass
+            effective_context._dependent_wrapper_index.clear()
         self._effective_context = None
 
+    def _update_component_later(self):
+        import abjad
+        component = self.component
+        if isinstance(component, abjad.Container):
+            component._update_subtree_later()
+        elif isinstance(component, abjad.Component):
+            component._update_later(lilypond_format=True)
+        elif isinstance(component, abjad.Spanner):
+            component._lilypond_format_version += 1
+
     def _update_effective_context(self):
         current_effective_context = self._effective_context
         correct_effective_context = self._find_correct_effective_context()
@@ -874,6 +903,7 @@ class Wrapper(AbjadValueObject):
     def deactivate(self, argument):
         assert argument in (True, False, None)
         self._deactivate: typing.Optional[bool] = argument
+        self._update_component_later()
 
     @property
     def indicator(self):
@@ -948,3 +978,4 @@ class Wrapper(AbjadValueObject):
             raise Exception(f'string or tag: {argument!r}.')
         tag = Tag(argument)
         self._tag = tag
+        self._update_component_later()
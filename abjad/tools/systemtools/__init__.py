@@ -9,10 +9,13 @@ from .ImportManager import ImportManager
 from .Wrapper import Wrapper
 from .LilyPondFormatBundle import LilyPondFormatBundle
 from .LilyPondFormatManager import LilyPondFormatManager
+from .LilyPondRenderPool import LilyPondRenderPool
 from .NullContextManager import NullContextManager
 from .PersistenceManager import PersistenceManager
 from .ProgressIndicator import ProgressIndicator
 from .RedirectedStreams import RedirectedStreams
+from .RenderCache import RenderCache
+from .ScoreSerializer import ScoreSerializer
 from .Signature import Signature
 from .SlotContributions import SlotContributions
 from .StorageFormatManager import StorageFormatManager
@@ -0,0 +1,114 @@
+import abjad
+import os
+import platform
+import pytest
+import stat
+import sys
+
+
+pytestmark = pytest.mark.skipif(
+    platform.system().lower() == 'windows',
+    reason='Stub LilyPond executable is a Python script.',
+    )
+
+stub_lilypond = '''#!{executable}
+import glob
+import os
+import sys
+import time
+output_base, ly_path = sys.argv[-2], sys.argv[-1]
+with open(ly_path) as file_pointer:
+    contents = file_pointer.read()
+running_path = output_base + '.running'
+open(running_path, 'w').close()
+running_count = len(glob.glob(os.path.join(
+    os.path.dirname(output_base), '*.running')))
+time.sleep(0.2)
+os.remove(running_path)
+print('Processing {{!r}}'.format(ly_path))
+print('Running LilyPond processes: {{}}'.format(running_count))
+if 'FAIL' in contents:
+    print('fatal error: failed files: {{!r}}'.format(ly_path))
+    sys.exit(1)
+with open(output_base + '.pdf', 'w') as file_pointer:
+    file_pointer.write(contents)
+'''
+
+
+def _make_files(directory, contents):
+    lilypond_path = os.path.join(directory, 'lilypond')
+    with open(lilypond_path, 'w') as file_pointer:
+        file_pointer.write(stub_lilypond.format(executable=sys.executable))
+    mode = os.stat(lilypond_path).st_mode
+    os.chmod(lilypond_path, mode | stat.S_IXUSR)
+    ly_paths = []
+    for i, string in enumerate(contents):
+        ly_path = os.path.join(directory, 'example-{}.ly'.format(i))
+        with open(ly_path, 'w') as file_pointer:
+            file_pointer.write(string)
+        ly_paths.append(ly_path)
+    return lilypond_path, ly_paths
+
+
+def _get_running_counts(ly_paths):
+    running_counts = []
+    for ly_path in ly_paths:
+        with open(ly_path.replace('.ly', '.log')) as file_pointer:
+            line = file_pointer.read().splitlines()[-1]
+        running_counts.append(int(line.split()[-1]))
+    return running_counts
+
+
+def test_systemtools_LilyPondRenderPool___call___01():
+    r'''Renders LilyPond files and writes one log file per LilyPond file.
+    '''
+
+    with abjad.TemporaryDirectory() as directory:
+        lilypond_path, ly_paths = _make_files(directory, ['{ c }'] * 6)
+        pool = abjad.LilyPondRenderPool(
+            lilypond_path=lilypond_path,
+            worker_count=3,
+            )
+        assert pool(ly_paths) == (0, 0, 0, 0, 0, 0)
+        for ly_path in ly_paths:
+            assert os.path.isfile(ly_path.replace('.ly', '.pdf'))
+            log_path = ly_path.replace('.ly', '.log')
+            with open(log_path) as file_pointer:
+                lines = file_pointer.read().splitlines()
+            assert lines[1] == 'Processing {!r}'.format(ly_path)
+        assert max(_get_running_counts(ly_paths)) <= 3
+
+
+def test_systemtools_LilyPondRenderPool___call___02():
+    r'''Renders all LilyPond files when LilyPond fails on some of them.
+    '''
+
+    contents = ['{ c }', 'FAIL', '{ c }', 'FAIL', '{ c }']
+    with abjad.TemporaryDirectory() as directory:
+        lilypond_path, ly_paths = _make_files(directory, contents)
+        pool = abjad.LilyPondRenderPool(
+            lilypond_path=lilypond_path,
+            worker_count=2,
+            )
+        assert pool(ly_paths) == (0, 1, 0, 1, 0)
+        assert os.path.isfile(ly_paths[4].replace('.ly', '.pdf'))
+        assert not os.path.isfile(ly_paths[3].replace('.ly', '.pdf'))
+        with open(ly_paths[3].replace('.ly', '.log')) as file_pointer:
+            assert 'fatal error' in file_pointer.read()
+
+
+def test_systemtools_LilyPondRenderPool___call___03():
+    r'''Fail-fast pool renders no LilyPond file after first failure.
+    '''
+
+    contents = ['FAIL', '{ c }', '{ c }']
+    with abjad.TemporaryDirectory() as directory:
+        lilypond_path, ly_paths = _make_files(directory, contents)
+        pool = abjad.LilyPondRenderPool(
+            fail_fast=True,
+            lilypond_path=lilypond_path,
+            worker_count=1,
+            )
+        assert pool(ly_paths) == (1, None, None)
+        assert not os.path.isfile(ly_paths[1].replace('.ly', '.pdf'))
+        assert not os.path.isfile(ly_paths[2].replace('.ly', '.pdf'))
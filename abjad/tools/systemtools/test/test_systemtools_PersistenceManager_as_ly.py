@@ -29,3 +29,38 @@ def test_systemtools_PersistenceManager_as_ly_02():
         assert os.path.isfile(ly_path)
         abjad.persist(note).as_ly(ly_path)
         assert os.path.isfile(ly_path)
+
+
+def test_systemtools_PersistenceManager_as_ly_03():
+    r'''Agent abjad.persists LilyPond file equal to LilyPond format of
+    LilyPond file.
+    '''
+
+    staff = abjad.Staff([
+        abjad.Measure((3, 8), "c'8 d'8 e'8"),
+        abjad.Measure((1, 4), [abjad.Tuplet((2, 3), "c'8 d'8 e'8")]),
+        abjad.Measure((3, 10), "c'8 d'8 e'8", implicit_scaling=True),
+        ])
+    abjad.attach(abjad.Slur(), abjad.select(staff).leaves()[:4])
+    abjad.attach(abjad.Markup('Allegro', abjad.Up), staff[0][0], tag='TAG')
+    score = abjad.Score([staff])
+    lilypond_file = abjad.LilyPondFile.new([score])
+    lilypond_file.items.append('% comment')
+    with abjad.FilesystemState(remove=[ly_path]):
+        abjad.persist(score).as_ly(
+            ly_path,
+            illustrate_function=lambda: lilypond_file,
+            )
+        with open(ly_path) as file_pointer:
+            assert file_pointer.read() == format(lilypond_file)
+        abjad.persist(score).as_ly(
+            ly_path,
+            illustrate_function=lambda: lilypond_file,
+            strict=40,
+            )
+        with open(ly_path) as file_pointer:
+            string = abjad.LilyPondFormatManager.align_tags(
+                format(lilypond_file),
+                40,
+                )
+            assert file_pointer.read() == string
@@ -0,0 +1,157 @@
+import abjad
+import os
+import platform
+import pytest
+import stat
+import sys
+from unittest import mock
+
+
+pytestmark = pytest.mark.skipif(
+    platform.system().lower() == 'windows',
+    reason='Stub LilyPond executable is a Python script.',
+    )
+
+stub_lilypond = '''#!{executable}
+import os
+import sys
+if '--version' in sys.argv:
+    print('GNU LilyPond 2.19.0')
+    sys.exit(0)
+output_base, ly_path = sys.argv[-2], sys.argv[-1]
+calls_path = os.path.join(os.path.dirname(sys.argv[0]), 'calls.txt')
+with open(calls_path, 'a') as file_pointer:
+    file_pointer.write(' '.join(sys.argv[1:]) + '\\n')
+with open(ly_path) as file_pointer:
+    contents = file_pointer.read()
+if '--png' in sys.argv:
+    for i in (1, 2):
+        png_path = '{{}}-page{{}}.png'.format(output_base, i)
+        with open(png_path, 'w') as file_pointer:
+            file_pointer.write(contents)
+else:
+    with open(output_base + '.pdf', 'w') as file_pointer:
+        file_pointer.write(contents)
+'''
+
+
+def _get_call_count(directory):
+    calls_path = os.path.join(directory, 'bin', 'calls.txt')
+    if not os.path.exists(calls_path):
+        return 0
+    with open(calls_path) as file_pointer:
+        return len(file_pointer.read().splitlines())
+
+
+def _patch_path(directory):
+    bin_directory = os.path.join(directory, 'bin')
+    os.mkdir(bin_directory)
+    lilypond_path = os.path.join(bin_directory, 'lilypond')
+    with open(lilypond_path, 'w') as file_pointer:
+        file_pointer.write(stub_lilypond.format(executable=sys.executable))
+    mode = os.stat(lilypond_path).st_mode
+    os.chmod(lilypond_path, mode | stat.S_IXUSR)
+    path = bin_directory + os.pathsep + os.environ.get('PATH', '')
+    return mock.patch.dict(os.environ, {'PATH': path})
+
+
+def _write(path, contents):
+    with open(path, 'w') as file_pointer:
+        file_pointer.write(contents)
+    return path
+
+
+def test_systemtools_RenderCache___call___01():
+    r'''Copies artifacts rendered from same LilyPond file.
+    '''
+
+    with abjad.TemporaryDirectory() as directory, _patch_path(directory):
+        cache = abjad.RenderCache(directory=os.path.join(directory, 'cache'))
+        one_path = _write(os.path.join(directory, 'one.ly'), '{ c }')
+        two_path = _write(os.path.join(directory, 'two.ly'), '{ c }')
+        assert cache(one_path)
+        assert cache(two_path)
+        assert _get_call_count(directory) == 1
+        assert (cache.hit_count, cache.miss_count) == (1, 1)
+        with open(os.path.join(directory, 'two.pdf')) as file_pointer:
+            assert file_pointer.read() == '{ c }'
+        _write(two_path, '% 2018-03-01 12:00\n{ c }')
+        _write(one_path, '% 2018-03-02 15:30\n{ c }')
+        assert cache(one_path)
+        assert cache(two_path)
+        assert _get_call_count(directory) == 2
+        assert cache(two_path, flags='--png')
+        assert _get_call_count(directory) == 3
+        assert os.path.exists(os.path.join(directory, 'two-page2.png'))
+
+
+def test_systemtools_RenderCache___call___02():
+    r'''Runs LilyPond again when included file changes.
+    '''
+
+    with abjad.TemporaryDirectory() as directory, _patch_path(directory):
+        cache = abjad.RenderCache(directory=os.path.join(directory, 'cache'))
+        ly_path = _write(
+            os.path.join(directory, 'example.ly'),
+            '\\include "stylesheet.ily"\n{ c }',
+            )
+        stylesheet_path = os.path.join(directory, 'stylesheet.ily')
+        _write(stylesheet_path, '\\include "stylesheet.ily"\n\\layout {}')
+        assert cache(ly_path)
+        assert cache(ly_path)
+        assert _get_call_count(directory) == 1
+        _write(stylesheet_path, '\\paper {}')
+        assert cache(ly_path)
+        assert _get_call_count(directory) == 2
+        assert (cache.hit_count, cache.miss_count) == (1, 2)
+
+
+def test_systemtools_RenderCache___call___03():
+    r'''Evicts least recently used artifacts.
+    '''
+
+    with abjad.TemporaryDirectory() as directory, _patch_path(directory):
+        cache_directory = os.path.join(directory, 'cache')
+        os.mkdir(cache_directory)
+        cache = abjad.RenderCache(directory=cache_directory, maximum_size=250)
+        ly_paths = {}
+        for name in ('one', 'two', 'three'):
+            ly_path = os.path.join(directory, name + '.ly')
+            _write(ly_path, '{{ {} }}'.format(name) + 100 * ' ')
+            ly_paths[name] = ly_path
+        for modification_time, name in enumerate(('one', 'two'), 1000):
+            entries = set(os.listdir(cache_directory))
+            assert cache(ly_paths[name])
+            entry, = set(os.listdir(cache_directory)) - entries
+            entry_directory = os.path.join(cache_directory, entry)
+            os.utime(entry_directory, (modification_time, modification_time))
+        assert cache(ly_paths['one'])
+        assert cache(ly_paths['three'])
+        assert len(os.listdir(cache_directory)) == 2
+        assert _get_call_count(directory) == 3
+        assert cache(ly_paths['one'])
+        assert _get_call_count(directory) == 3
+        assert cache(ly_paths['two'])
+        assert _get_call_count(directory) == 4
+
+
+def test_systemtools_RenderCache___call___04():
+    r'''Persistence manager renders through render cache unless
+    `use_render_cache` is false.
+    '''
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    with abjad.TemporaryDirectory() as directory, _patch_path(directory):
+        cache = abjad.RenderCache(directory=os.path.join(directory, 'cache'))
+        with mock.patch.object(abjad.PersistenceManager, '_render_cache', cache):
+            for name in ('one', 'two'):
+                pdf_path = os.path.join(directory, name + '.pdf')
+                result = abjad.persist(staff).as_pdf(pdf_path)
+                assert result[0] == pdf_path
+                assert result[-1] is True
+                assert os.path.exists(pdf_path)
+            assert _get_call_count(directory) == 1
+            pdf_path = os.path.join(directory, 'three.pdf')
+            abjad.persist(staff).as_pdf(pdf_path, use_render_cache=False)
+            assert _get_call_count(directory) == 2
+            assert (cache.hit_count, cache.miss_count) == (1, 1)
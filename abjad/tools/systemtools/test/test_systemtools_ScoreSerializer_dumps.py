@@ -0,0 +1,103 @@
+import abjad
+import io
+import pickle
+
+
+def _make_score():
+    voice = abjad.Voice(
+        r"c'8 <d' f'>8 r8 \times 2/3 { e'8 f'8 g'8 } s8 c''4",
+        name='Voice_1',
+        )
+    leaves = abjad.select(voice).leaves()
+    abjad.attach(abjad.Clef('bass'), leaves[0])
+    abjad.attach(abjad.TimeSignature((3, 4)), leaves[0])
+    abjad.attach(abjad.Articulation('accent'), leaves[0])
+    abjad.attach(abjad.Articulation('accent'), leaves[1])
+    abjad.attach(abjad.GraceContainer("cs'16 ds'16"), leaves[1])
+    leaves[1].note_heads[0].is_cautionary = True
+    leaves[1].note_heads[1].tweak.color = 'red'
+    abjad.attach(abjad.Slur(), leaves[:4])
+    abjad.attach(abjad.Hairpin('p < f'), leaves)
+    text_spanner = abjad.TextSpanner()
+    abjad.attach(text_spanner, leaves[3:6])
+    text_spanner.attach(abjad.Markup('pont.'), leaves[3])
+    staff = abjad.Staff([voice], name='Staff_1')
+    measure = abjad.Measure((3, 8), "c'8 d'8 e'8")
+    return abjad.Score([staff, abjad.Staff([measure])], name='Score')
+
+
+def test_systemtools_ScoreSerializer_dumps_01():
+    r'''Loads score with same format, parent links, wrappers and spanners.
+    '''
+
+    score = _make_score()
+    serializer = abjad.ScoreSerializer()
+    new_score = serializer.loads(serializer.dumps(score))
+
+    assert format(new_score) == format(score)
+    assert abjad.inspect(new_score).is_well_formed()
+    components = list(abjad.iterate(new_score).components())
+    for component in components:
+        if component._parent is not None:
+            assert component in component._parent
+        for wrapper in component._wrappers:
+            assert wrapper.component is component
+    leaves = abjad.select(new_score['Voice_1']).leaves()
+    grace_container = abjad.inspect(leaves[1]).get_grace_container()
+    assert grace_container._carrier is leaves[1]
+    assert grace_container[0]._parent is grace_container
+    spanners = abjad.inspect(leaves[3]).get_spanners()
+    assert [type(_) for _ in spanners] == [
+        abjad.Slur,
+        abjad.Hairpin,
+        abjad.TextSpanner,
+        ]
+    assert spanners[0].leaves == leaves[:4]
+    text_spanner = spanners[-1]
+    wrapper, = text_spanner._wrappers
+    assert wrapper.component is leaves[3]
+    assert wrapper.spanner is text_spanner
+    assert wrapper in leaves[3]._wrappers
+    assert abjad.inspect(leaves[-1]).get_effective(abjad.Clef) == \
+        abjad.Clef('bass')
+    assert new_score['Staff_1'].name == 'Staff_1'
+    assert new_score['Voice_1'] is leaves[0]._parent
+
+
+def test_systemtools_ScoreSerializer_dumps_02():
+    r'''Loaded score updates like score built from scratch.
+    '''
+
+    score = _make_score()
+    serializer = abjad.ScoreSerializer()
+    file_pointer = io.BytesIO()
+    serializer.dump(score, file_pointer)
+    file_pointer.seek(0)
+    new_score = serializer.load(file_pointer)
+
+    voice = new_score['Voice_1']
+    voice.append("e'4")
+    abjad.attach(abjad.Clef('treble'), voice[-1])
+    assert abjad.inspect(voice[-2]).get_effective(abjad.Clef) == \
+        abjad.Clef('bass')
+    assert abjad.inspect(voice[-1]).get_effective(abjad.Clef) == \
+        abjad.Clef('treble')
+    assert abjad.inspect(voice[-1]).get_timespan().start_offset == \
+        abjad.Offset(1)
+    assert format(score['Voice_1']) != format(voice)
+
+
+def test_systemtools_ScoreSerializer_dumps_03():
+    r'''Writes fewer bytes than pickle.
+    '''
+
+    pitches = ["c'", "d'", "ef''", 'bf']
+    notes = [abjad.Note(pitches[i % 4], (1, 8)) for i in range(200)]
+    staff = abjad.Staff(notes)
+    for i in range(0, len(staff), 8):
+        abjad.attach(abjad.Articulation('accent'), staff[i])
+        abjad.attach(abjad.Beam(), staff[i:i + 4])
+    data = abjad.ScoreSerializer().dumps(staff)
+
+    assert len(data) < len(pickle.dumps(staff, pickle.HIGHEST_PROTOCOL)) / 4
+    assert format(abjad.ScoreSerializer().loads(data)) == format(staff)
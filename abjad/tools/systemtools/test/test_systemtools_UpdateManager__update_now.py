@@ -0,0 +1,115 @@
+import abjad
+
+
+def _get_offsets_and_numbers(argument):
+    abjad.inspect(argument).get_timespan()
+    result = []
+    for component in abjad.iterate(argument).components():
+        timespan = abjad.inspect(component).get_timespan()
+        result.append((
+            timespan.start_offset,
+            timespan.stop_offset,
+            getattr(component, '_leaf_index', None),
+            component._measure_number,
+            ))
+    return result
+
+
+def _update_all_offsets(argument):
+    incremental = abjad.UpdateManager._incremental_offset_updates
+    abjad.UpdateManager._incremental_offset_updates = False
+    try:
+        copied_argument = abjad.mutate(argument).copy()
+        return _get_offsets_and_numbers(copied_argument)
+    finally:
+        abjad.UpdateManager._incremental_offset_updates = incremental
+
+
+def test_systemtools_UpdateManager__update_now_01():
+    r'''Incremental update after editing one measure in one voice matches
+    whole-score update.
+    '''
+
+    maker = abjad.BenchmarkScoreMaker()
+    score = maker.make_multistaff_score(3, 4, 2)
+    abjad.inspect(score).get_timespan()
+    measure = score[1][0][2]
+    measure.append(abjad.Note("d'16"))
+
+    assert abjad.inspect(score[1][0][3]).get_timespan() == abjad.Timespan(
+        abjad.Offset(7, 16),
+        abjad.Offset(9, 16),
+        )
+    assert _get_offsets_and_numbers(score) == _update_all_offsets(score)
+
+
+def test_systemtools_UpdateManager__update_now_02():
+    r'''Incremental update recomputes durations of components moved into
+    a tuplet.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    container = abjad.Container("g'8 a'8")
+    staff.append(container)
+    abjad.inspect(staff).get_timespan()
+    tuplet = abjad.Tuplet((2, 3), [])
+    abjad.mutate(container).wrap(tuplet)
+
+    assert abjad.inspect(container[1]).get_timespan() == abjad.Timespan(
+        abjad.Offset(7, 12),
+        abjad.Offset(2, 3),
+        )
+    assert _get_offsets_and_numbers(staff) == _update_all_offsets(staff)
+
+
+def test_systemtools_UpdateManager__update_now_03():
+    r'''Incremental update follows changes to written duration and tuplet
+    multiplier.
+    '''
+
+    staff = abjad.Staff(r"c'8 \times 2/3 { d'8 e'8 f'8 } g'8")
+    abjad.inspect(staff).get_timespan()
+    staff[0].written_duration = abjad.Duration(1, 4)
+    staff[1].multiplier = abjad.Multiplier(4, 5)
+
+    assert abjad.inspect(staff[-1]).get_timespan() == abjad.Timespan(
+        abjad.Offset(11, 20),
+        abjad.Offset(27, 40),
+        )
+    assert _get_offsets_and_numbers(staff) == _update_all_offsets(staff)
+
+
+def test_systemtools_UpdateManager__update_now_04():
+    r'''Incremental update renumbers leaves when grace notes attach.
+    '''
+
+    voice = abjad.Voice("c'4 d'4 e'4 f'4")
+    abjad.inspect(voice).get_timespan()
+    assert voice[2]._leaf_index == 2
+
+    grace_container = abjad.GraceContainer("c'16 d'16")
+    abjad.attach(grace_container, voice[1])
+
+    assert abjad.inspect(grace_container[0]).get_timespan() == abjad.Timespan(
+        abjad.Offset(1, 4, grace_displacement=abjad.Duration(-1, 8)),
+        abjad.Offset(1, 4, grace_displacement=abjad.Duration(-1, 16)),
+        )
+    assert voice[2]._leaf_index == 4
+    assert _get_offsets_and_numbers(voice) == _update_all_offsets(voice)
+
+
+def test_systemtools_UpdateManager__update_now_05():
+    r'''Incremental update leaves unchanged contexts alone.
+    '''
+
+    score = abjad.Score([
+        abjad.Staff("c'4 d'4 e'4 f'4"),
+        abjad.Staff("c'4 d'4 e'4 f'4"),
+        ])
+    abjad.inspect(score).get_timespan()
+    score[0].insert(0, abjad.Note("b4"))
+    score[1][-1]._leaf_index = 'unchanged'
+    abjad.inspect(score[0][-1]).get_timespan()
+
+    assert score[0][-1]._leaf_index == 4
+    assert score[1][-1]._leaf_index == 'unchanged'
@@ -0,0 +1,56 @@
+import abjad
+
+
+def _make_score():
+    staff = abjad.Staff("c'4 ~ c'4 r4 r4 d'4 e'4 f'4 g'4")
+    abjad.attach(abjad.Violin(), staff[0])
+    abjad.attach(abjad.Clef('bass'), staff[0])
+    abjad.attach(abjad.Hairpin('p < f'), staff[:3])
+    abjad.attach(abjad.Hairpin('f > p'), staff[2:5])
+    abjad.attach(abjad.Beam(), staff[:2])
+    abjad.attach(abjad.Beam(), staff[1:3])
+    abjad.attach(abjad.TrillSpanner(), staff[4:6])
+    abjad.attach(abjad.TrillSpanner(), staff[5:7])
+    abjad.attach(abjad.GraceContainer("c'16 d'16"), staff[3])
+    staff.append(abjad.Measure((3, 4), "c'4"))
+    return abjad.Score([staff])
+
+
+def test_systemtools_WellformednessManager___call___01():
+    r'''Calling manager gives same triples as calling checks one by one.
+    '''
+
+    score = _make_score()
+    manager = abjad.WellformednessManager()
+    triples = manager(score)
+
+    check_names = sorted(_ for _ in dir(manager) if _.startswith('check_'))
+    assert [_[-1] for _ in triples] == check_names
+    for violators, total, check_name in triples:
+        check = getattr(manager, check_name)
+        assert check(score) == (violators, total)
+
+    counts = dict((_[-1], (len(_[0]), _[1])) for _ in triples)
+    assert counts['check_beamed_long_notes'] == (4, 9)
+    assert counts['check_misfilled_measures'] == (1, 1)
+    assert counts['check_notes_on_wrong_clef'] == (11, 11)
+    assert counts['check_overlapping_beams'] == (2, 2)
+    assert counts['check_overlapping_hairpins'] == (0, 2)
+    assert counts['check_overlapping_trill_spanners'] == (0, 2)
+    assert not abjad.inspect(score).is_well_formed()
+
+
+def test_systemtools_WellformednessManager___call___02():
+    r'''Times each check in last call.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    manager = abjad.WellformednessManager()
+    assert manager.timings is None
+
+    triples = manager(staff)
+    assert list(manager.timings) == [_[-1] for _ in triples]
+    assert all(0 <= _ for _ in manager.timings.values())
+
+    manager.check_tied_rests(staff)
+    assert list(manager.timings) == ['check_tied_rests']
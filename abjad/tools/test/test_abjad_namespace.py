@@ -0,0 +1,63 @@
+import abjad
+import os
+import pytest
+import subprocess
+import sys
+
+
+def _run(statement):
+    return subprocess.check_output(
+        [sys.executable, '-c', statement],
+        cwd=os.path.dirname(abjad.__path__[0]),
+        universal_newlines=True,
+        ).strip()
+
+
+def test_abjad_namespace_01():
+    r'''Importing abjad imports no tools packages and reads no configuration.
+    '''
+
+    statement = 'import abjad, sys; '
+    statement += 'print("abjad.tools" in sys.modules, '
+    statement += '"abjad_configuration" in vars(abjad))'
+    assert _run(statement) == 'False False'
+
+
+def test_abjad_namespace_02():
+    r'''First lookup loads namespace.
+    '''
+
+    statement = 'import abjad; abjad.TimespanList; '
+    statement += 'print(abjad.Note.__module__)'
+    assert _run(statement) == 'abjad.tools.scoretools.Note'
+
+
+def test_abjad_namespace_03():
+    r'''Importing tools package directly loads namespace.
+    '''
+
+    statement = 'import abjad.tools.timespantools, abjad; '
+    statement += 'print("Note" in vars(abjad))'
+    assert _run(statement) == 'True'
+
+
+def test_abjad_namespace_04():
+    r'''Namespace matches star imports of tools packages.
+    '''
+
+    assert abjad.Infinity is abjad.datastructuretools.Infinity
+    assert abjad.index == abjad.Pattern.index
+    assert abjad.silence == abjad.SilenceMask.silence
+    assert abjad.tags is abjad.tools.tags
+    assert abjad.book is sys.modules['abjad.book']
+    assert 'Note' in dir(abjad)
+    assert 'Note' in abjad.__all__
+
+
+def test_abjad_namespace_05():
+    r'''Unknown names raise attribute error.
+    '''
+
+    with pytest.raises(AttributeError):
+        abjad.NoSuchName
+    assert not hasattr(abjad, 'NoSuchName')
@@ -0,0 +1,564 @@
+import bisect
+import itertools
+import math
+from abjad.tools.abctools.AbjadObject import AbjadObject
+
+
+class TimespanIndex(AbjadObject):
+    r'''Timespan index.
+
+    ..  container:: example
+
+        Indexes timespans by start offset:
+
+        >>> index = abjad.TimespanIndex([
+        ...     abjad.Timespan(0, 16),
+        ...     abjad.Timespan(5, 12),
+        ...     abjad.Timespan(-2, 8),
+        ...     abjad.Timespan(15, 20),
+        ...     abjad.Timespan(24, 30),
+        ...     ])
+
+        >>> for timespan in index:
+        ...     timespan
+        ...
+        Timespan(start_offset=Offset(-2, 1), stop_offset=Offset(8, 1))
+        Timespan(start_offset=Offset(0, 1), stop_offset=Offset(16, 1))
+        Timespan(start_offset=Offset(5, 1), stop_offset=Offset(12, 1))
+        Timespan(start_offset=Offset(15, 1), stop_offset=Offset(20, 1))
+        Timespan(start_offset=Offset(24, 1), stop_offset=Offset(30, 1))
+
+    ..  container:: example
+
+        Finds timespans that intersect timespan:
+
+        >>> for timespan in index.get_timespans_that_intersect_timespan(
+        ...     abjad.Timespan(10, 15),
+        ...     ):
+        ...     timespan
+        ...
+        Timespan(start_offset=Offset(0, 1), stop_offset=Offset(16, 1))
+        Timespan(start_offset=Offset(5, 1), stop_offset=Offset(12, 1))
+
+    Timespan index keeps start offsets in sorted order together with a tree
+    of greatest stop offsets; index holds offsets as integers over least
+    common denominator. Index finds timespans that start during,
+    intersect or contain a timespan in time proportional to the logarithm of
+    the number of indexed timespans plus the number of timespans found.
+
+    Timespan index reads offsets of each timespan when timespan is added.
+    Remove and add timespans again when offsets change.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Timespans'
+
+    __slots__ = (
+        '_denominator',
+        '_start_keys',
+        '_stop_key_tree',
+        '_stop_keys',
+        '_timespans',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, timespans=None):
+        self._denominator = 1
+        self._start_keys = []
+        self._stop_key_tree = None
+        self._stop_keys = []
+        self._timespans = []
+        triples = []
+        for timespan in timespans or ():
+            start_offset, stop_offset = self._get_offsets(timespan)
+            triples.append((start_offset, stop_offset, timespan))
+        self._fit_denominator(_[0] for _ in triples)
+        self._fit_denominator(_[1] for _ in triples)
+        triples = [
+            (self._get_key(_[0]), self._get_key(_[1]), _[2])
+            for _ in triples
+            ]
+        triples.sort(key=lambda _: _[0])
+        self._start_keys = [_[0] for _ in triples]
+        self._stop_keys = [_[1] for _ in triples]
+        self._timespans = [_[2] for _ in triples]
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, timespan):
+        r'''Is true when timespan index contains `timespan`. Otherwise false.
+
+        Returns true or false.
+        '''
+        try:
+            self._find(timespan)
+        except ValueError:
+            return False
+        return True
+
+    def __iter__(self):
+        r'''Iterates timespans in order of start offset.
+
+        Returns generator.
+        '''
+        return iter(self._timespans)
+
+    def __len__(self):
+        r'''Gets number of timespans in index.
+
+        Returns nonnegative integer.
+        '''
+        return len(self._timespans)
+
+    ### PRIVATE METHODS ###
+
+    def _find(self, timespan):
+        start_offset, _ = self._get_offsets(timespan)
+        self._fit_denominator([start_offset])
+        key = self._get_key(start_offset)
+        start = bisect.bisect_left(self._start_keys, key)
+        stop = bisect.bisect_right(self._start_keys, key)
+        for i in range(start, stop):
+            if self._timespans[i] is timespan:
+                return i
+        for i in range(start, stop):
+            if self._timespans[i] == timespan:
+                return i
+        message = 'timespan not in index: {!r}.'
+        message = message.format(timespan)
+        raise ValueError(message)
+
+    def _fit_denominator(self, offsets):
+        r'''Rescales keys to least common denominator of keys and
+        `offsets`.
+        '''
+        denominator = self._denominator
+        for offset in offsets:
+            grace_displacement = getattr(offset, 'grace_displacement', None)
+            for value in (offset, grace_displacement):
+                denominator_ = getattr(value, 'denominator', None)
+                if denominator_ is None or denominator % denominator_ == 0:
+                    continue
+                gcd = math.gcd(denominator, denominator_)
+                denominator = denominator * denominator_ // gcd
+        if denominator == self._denominator:
+            return
+        factor = denominator // self._denominator
+        self._denominator = denominator
+        self._start_keys = [(x * factor, y * factor) for x, y in
+            self._start_keys]
+        self._stop_keys = [(x * factor, y * factor) for x, y in
+            self._stop_keys]
+        self._stop_key_tree = None
+
+    def _get_indices(self, start_bounds, stop_bounds):
+        lower, upper = start_bounds
+        start, stop = 0, len(self._start_keys)
+        if lower is not None:
+            key, is_strict = lower
+            if is_strict:
+                start = bisect.bisect_right(self._start_keys, key)
+            else:
+                start = bisect.bisect_left(self._start_keys, key)
+        if upper is not None:
+            key, is_strict = upper
+            if is_strict:
+                stop = bisect.bisect_left(self._start_keys, key)
+            else:
+                stop = bisect.bisect_right(self._start_keys, key)
+        if stop <= start:
+            return []
+        lower, upper = stop_bounds
+        if lower is None:
+            indices = range(start, stop)
+        else:
+            indices = self._get_indices_by_stop_key(start, stop, *lower)
+        if upper is None:
+            return list(indices)
+        key, is_strict = upper
+        stop_keys = self._stop_keys
+        if is_strict:
+            return [_ for _ in indices if stop_keys[_] < key]
+        return [_ for _ in indices if stop_keys[_] <= key]
+
+    def _get_indices_by_stop_key(self, start, stop, key, is_strict):
+        r'''Gets indices between `start` and `stop` of timespans that stop
+        after `key`; descends only into subtrees whose greatest stop key
+        is after `key`.
+        '''
+        tree = self._get_stop_key_tree()
+        size = len(tree) // 2
+        indices = []
+        nodes = [(1, 0, size)]
+        while nodes:
+            node, node_start, node_stop = nodes.pop()
+            if node_stop <= start or stop <= node_start:
+                continue
+            if is_strict:
+                if tree[node] <= key:
+                    continue
+            elif tree[node] < key:
+                continue
+            if size <= node:
+                indices.append(node - size)
+                continue
+            middle = (node_start + node_stop) // 2
+            nodes.append((2 * node + 1, middle, node_stop))
+            nodes.append((2 * node, node_start, middle))
+        return indices
+
+    def _get_key(self, offset):
+        r'''Gets offset as integer pair over least common denominator;
+        second integer is grace displacement.
+        '''
+        try:
+            numerator, denominator = offset.numerator, offset.denominator
+        except AttributeError:
+            return (float(offset), 0)
+        numerator *= self._denominator // denominator
+        grace_displacement = getattr(offset, 'grace_displacement', None)
+        if not grace_displacement:
+            return (numerator, 0)
+        grace_numerator = grace_displacement.numerator
+        grace_numerator *= self._denominator // grace_displacement.denominator
+        return (numerator, grace_numerator)
+
+    def _get_keys(self, timespan):
+        start_offset, stop_offset = self._get_offsets(timespan)
+        self._fit_denominator([start_offset, stop_offset])
+        return self._get_key(start_offset), self._get_key(stop_offset)
+
+    @staticmethod
+    def _get_offsets(timespan):
+        import abjad
+        try:
+            return timespan.start_offset, timespan.stop_offset
+        except AttributeError:
+            return abjad.Timespan._get_offsets(timespan)
+
+    def _get_stop_key_tree(self):
+        if self._stop_key_tree is not None:
+            return self._stop_key_tree
+        size = 1
+        while size < len(self._stop_keys):
+            size *= 2
+        padding = (-math.inf, 0)
+        tree = [padding] * size
+        tree.extend(self._stop_keys)
+        tree.extend([padding] * (size - len(self._stop_keys)))
+        for node in reversed(range(1, size)):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self._stop_key_tree = tree
+        return tree
+
+    @staticmethod
+    def _parse_inequality(inequality):
+        r'''Parses `inequality` into disjunction of conjunctions of bounds
+        on offsets of timespan 2.
+
+        Returns list of lists of (name, operator, name) triples; or none
+        when index can not evaluate `inequality`.
+        '''
+        from abjad.tools import timespantools
+        operators = {
+            '<': '>',
+            '<=': '>=',
+            '==': '==',
+            '>': '<',
+            '>=': '<=',
+            }
+        if isinstance(inequality, timespantools.TimespanInequality):
+            words = inequality.template.split()
+            if len(words) != 3 or words[1] not in operators:
+                return None
+            left, operator, right = words
+            if left.startswith('timespan_1.'):
+                left, operator, right = right, operators[operator], left
+            if not left.startswith('timespan_2.'):
+                return None
+            if not right.startswith('timespan_1.'):
+                return None
+            return [[(left[11:], operator, right[11:])]]
+        if not isinstance(inequality, timespantools.CompoundInequality):
+            return None
+        parsed_items = []
+        for item in inequality:
+            parsed_item = TimespanIndex._parse_inequality(item)
+            if parsed_item is None:
+                return None
+            parsed_items.append(parsed_item)
+        if inequality.logical_operator == 'or':
+            return list(itertools.chain(*parsed_items))
+        if inequality.logical_operator == 'and':
+            return [
+                list(itertools.chain(*_))
+                for _ in itertools.product(*parsed_items)
+                ]
+        return None
+
+    def _query(self, start_bounds, stop_bounds):
+        indices = self._get_indices(start_bounds, stop_bounds)
+        return [self._timespans[_] for _ in indices]
+
+    def _query_time_relation(self, time_relation):
+        r'''Gets timespans that satisfy `time_relation` by searching index.
+
+        Returns list; or none when index can not evaluate `time_relation`.
+        '''
+        import abjad
+        if not isinstance(
+            time_relation,
+            abjad.timespantools.TimespanTimespanTimeRelation,
+            ):
+            return None
+        timespan = time_relation.timespan_1
+        if timespan is None:
+            return None
+        conjunctions = self._parse_inequality(time_relation.inequality)
+        if conjunctions is None:
+            return None
+        start_key, stop_key = self._get_keys(timespan)
+        keys = {
+            'start_offset': start_key,
+            'stop_offset': stop_key,
+            }
+        indices = set()
+        for conjunction in conjunctions:
+            bounds = {
+                'start_offset': [None, None],
+                'stop_offset': [None, None],
+                }
+            for name, operator, offset_name in conjunction:
+                key = keys[offset_name]
+                if operator in ('>', '>=', '=='):
+                    bound = (key, operator == '>')
+                    self._tighten(bounds[name], 0, bound)
+                if operator in ('<', '<=', '=='):
+                    bound = (key, operator == '<')
+                    self._tighten(bounds[name], 1, bound)
+            indices.update(self._get_indices(
+                bounds['start_offset'],
+                bounds['stop_offset'],
+                ))
+        return [self._timespans[_] for _ in sorted(indices)]
+
+    @staticmethod
+    def _tighten(bounds, i, bound):
+        if bounds[i] is None:
+            bounds[i] = bound
+            return
+        key, is_strict = bound
+        old_key, old_is_strict = bounds[i]
+        if key == old_key:
+            bounds[i] = (key, is_strict or old_is_strict)
+        elif (i == 0) == (old_key < key):
+            bounds[i] = bound
+
+    ### PUBLIC METHODS ###
+
+    def add(self, timespan):
+        r'''Adds `timespan` to index.
+
+        ..  container:: example
+
+            >>> index = abjad.TimespanIndex([abjad.Timespan(0, 4)])
+            >>> index.add(abjad.Timespan(2, 6))
+            >>> index.add(abjad.Timespan(-2, 1))
+            >>> for timespan in index:
+            ...     timespan
+            ...
+            Timespan(start_offset=Offset(-2, 1), stop_offset=Offset(1, 1))
+            Timespan(start_offset=Offset(0, 1), stop_offset=Offset(4, 1))
+            Timespan(start_offset=Offset(2, 1), stop_offset=Offset(6, 1))
+
+        Adds timespans that start with timespans already in index after
+        those timespans.
+
+        Returns none.
+        '''
+        start_key, stop_key = self._get_keys(timespan)
+        i = bisect.bisect_right(self._start_keys, start_key)
+        self._start_keys.insert(i, start_key)
+        self._stop_keys.insert(i, stop_key)
+        self._timespans.insert(i, timespan)
+        tree = self._stop_key_tree
+        if tree is None:
+            return
+        size = len(tree) // 2
+        if i != len(self._timespans) - 1 or size <= i:
+            self._stop_key_tree = None
+            return
+        node = size + i
+        tree[node] = stop_key
+        while 1 < node:
+            node //= 2
+            if tree[node] < stop_key:
+                tree[node] = stop_key
+
+    def get_timespans_that_contain_timespan(self, timespan):
+        r'''Gets timespans in index that contain `timespan`.
+
+        ..  container:: example
+
+            >>> index = abjad.TimespanIndex([
+            ...     abjad.Timespan(0, 16),
+            ...     abjad.Timespan(5, 12),
+            ...     abjad.Timespan(-2, 8),
+            ...     ])
+            >>> for timespan in index.get_timespans_that_contain_timespan(
+            ...     abjad.Timespan(5, 8),
+            ...     ):
+            ...     timespan
+            ...
+            Timespan(start_offset=Offset(-2, 1), stop_offset=Offset(8, 1))
+            Timespan(start_offset=Offset(0, 1), stop_offset=Offset(16, 1))
+            Timespan(start_offset=Offset(5, 1), stop_offset=Offset(12, 1))
+
+        Same as timespans that satisfy
+        ``timespan_2_contains_timespan_1_improperly``.
+
+        Returns list of timespans in order of start offset.
+        '''
+        start_key, stop_key = self._get_keys(timespan)
+        return self._query(
+            (None, (start_key, False)),
+            ((stop_key, False), None),
+            )
+
+    def get_timespans_that_intersect_timespan(self, timespan):
+        r'''Gets timespans in index that intersect `timespan`.
+
+        ..  container:: example
+
+            >>> index = abjad.TimespanIndex([
+            ...     abjad.Timespan(0, 3),
+            ...     abjad.Timespan(3, 6),
+            ...     abjad.Timespan(6, 10),
+            ...     ])
+            >>> for timespan in index.get_timespans_that_intersect_timespan(
+            ...     abjad.Timespan(2, 6),
+            ...     ):
+            ...     timespan
+            ...
+            Timespan(start_offset=Offset(0, 1), stop_offset=Offset(3, 1))
+            Timespan(start_offset=Offset(3, 1), stop_offset=Offset(6, 1))
+
+        Same as timespans that satisfy ``timespan_2_intersects_timespan_1``.
+
+        Returns list of timespans in order of start offset.
+        '''
+        start_key, stop_key = self._get_keys(timespan)
+        indices = set(self._get_indices(
+            (None, (start_key, False)),
+            ((start_key, True), None),
+            ))
+        indices.update(self._get_indices(
+            ((start_key, False), (stop_key, True)),
+            (None, None),
+            ))
+        return [self._timespans[_] for _ in sorted(indices)]
+
+    def get_timespans_that_satisfy_time_relation(self, time_relation):
+        r'''Gets timespans in index that satisfy `time_relation`.
+
+        ..  container:: example
+
+            >>> index = abjad.TimespanIndex([
+            ...     abjad.Timespan(0, 3),
+            ...     abjad.Timespan(3, 6),
+            ...     abjad.Timespan(6, 10),
+            ...     ])
+            >>> time_relation = \
+            ...     abjad.timespantools.timespan_2_stops_during_timespan_1(
+            ...     timespan_1=abjad.Timespan(2, 6),
+            ...     )
+            >>> for timespan in index.get_timespans_that_satisfy_time_relation(
+            ...     time_relation,
+            ...     ):
+            ...     timespan
+            ...
+            Timespan(start_offset=Offset(0, 1), stop_offset=Offset(3, 1))
+            Timespan(start_offset=Offset(3, 1), stop_offset=Offset(6, 1))
+
+        Searches index when `time_relation` is a timespan-timespan time
+        relation with loaded `timespan_1` and with inequalities joined by
+        ``and`` or ``or``. Tests each timespan in index otherwise.
+
+        Returns list of timespans in order of start offset.
+        '''
+        from abjad.tools import timespantools
+        result = self._query_time_relation(time_relation)
+        if result is not None:
+            return result
+        result = []
+        for timespan in self:
+            if isinstance(
+                time_relation,
+                timespantools.TimespanTimespanTimeRelation):
+                if time_relation(timespan_2=timespan):
+                    result.append(timespan)
+            elif isinstance(
+                time_relation,
+                timespantools.OffsetTimespanTimeRelation):
+                if time_relation(timespan=timespan):
+                    result.append(timespan)
+            else:
+                message = 'unknown time relation: {!r}.'
+                message = message.format(time_relation)
+                raise ValueError(message)
+        return result
+
+    def get_timespans_that_start_during_timespan(self, timespan):
+        r'''Gets timespans in index that start during `timespan`.
+
+        ..  container:: example
+
+            >>> index = abjad.TimespanIndex([
+            ...     abjad.Timespan(0, 3),
+            ...     abjad.Timespan(3, 6),
+            ...     abjad.Timespan(6, 10),
+            ...     ])
+            >>> for timespan in index.get_timespans_that_start_during_timespan(
+            ...     abjad.Timespan(2, 8),
+            ...     ):
+            ...     timespan
+            ...
+            Timespan(start_offset=Offset(3, 1), stop_offset=Offset(6, 1))
+            Timespan(start_offset=Offset(6, 1), stop_offset=Offset(10, 1))
+
+        Same as timespans that satisfy ``timespan_2_starts_during_timespan_1``.
+
+        Returns list of timespans in order of start offset.
+        '''
+        start_key, stop_key = self._get_keys(timespan)
+        return self._query(
+            ((start_key, False), (stop_key, True)),
+            (None, None),
+            )
+
+    def remove(self, timespan):
+        r'''Removes `timespan` from index.
+
+        ..  container:: example
+
+            >>> timespan = abjad.Timespan(2, 6)
+            >>> index = abjad.TimespanIndex([abjad.Timespan(0, 4), timespan])
+            >>> index.remove(timespan)
+            >>> list(index)
+            [Timespan(start_offset=Offset(0, 1), stop_offset=Offset(4, 1))]
+
+        Removes `timespan` itself when index contains `timespan`; otherwise
+        removes first timespan in index equal to `timespan`.
+
+        Raises value error when index contains no timespan equal to
+        `timespan`.
+
+        Returns none.
+        '''
+        i = self._find(timespan)
+        del(self._start_keys[i])
+        del(self._stop_keys[i])
+        del(self._timespans[i])
+        self._stop_key_tree = None
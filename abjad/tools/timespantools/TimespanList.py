@@ -113,6 +113,41 @@ class TimespanList(TypedList):
                 ]
             )
 
+    ..  container:: example
+
+        Indexed timespan list:
+
+        >>> timespans = abjad.TimespanList(
+        ...     [
+        ...         abjad.Timespan(0, 16),
+        ...         abjad.Timespan(5, 12),
+        ...         abjad.Timespan(-2, 8),
+        ...         ],
+        ...     indexed=True,
+        ...     )
+
+        >>> abjad.f(timespans)
+        abjad.TimespanList(
+            [
+                abjad.Timespan(
+                    start_offset=abjad.Offset(0, 1),
+                    stop_offset=abjad.Offset(16, 1),
+                    ),
+                abjad.Timespan(
+                    start_offset=abjad.Offset(5, 1),
+                    stop_offset=abjad.Offset(12, 1),
+                    ),
+                abjad.Timespan(
+                    start_offset=abjad.Offset(-2, 1),
+                    stop_offset=abjad.Offset(8, 1),
+                    ),
+                ],
+            indexed=True,
+            )
+
+        Indexed timespan lists keep a timespan index of their timespans and
+        search that index for timespans that satisfy time relations.
+
     Operations on timespan currently work in place.
     '''
 
@@ -120,7 +155,29 @@ class TimespanList(TypedList):
 
     __documentation_section__ = 'Timespans'
 
-    __slots__ = ()
+    __slots__ = (
+        '_index',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        items=None,
+        item_class=None,
+        keep_sorted=False,
+        indexed=False,
+        ):
+        from abjad.tools import timespantools
+        self._index = None
+        TypedList.__init__(
+            self,
+            items=items,
+            item_class=item_class,
+            keep_sorted=keep_sorted,
+            )
+        if indexed:
+            self._index = timespantools.TimespanIndex(self._collection)
 
     ### SPECIAL METHODS ###
 
@@ -353,9 +410,10 @@ class TimespanList(TypedList):
     @property
     def _item_coercer(self):
         def _coerce(argument):
-            if timespantools.Timespan._implements_timespan_interface(argument):
+            if isinstance(argument, timespantools.Timespan):
                 return argument
-            elif isinstance(argument, timespantools.Timespan):
+            elif timespantools.Timespan._implements_timespan_interface(
+                argument):
                 return argument
             elif isinstance(argument, tuple) and len(argument) == 2:
                 return timespantools.Timespan(*argument)
@@ -367,6 +425,93 @@ class TimespanList(TypedList):
 
     ### PRIVATE METHODS ###
 
+    def _all_are_well_formed_timespans(self):
+        import abjad
+        for timespan in self:
+            if not isinstance(timespan, abjad.Timespan):
+                return False
+            if not timespan.start_offset < timespan.stop_offset:
+                return False
+        return True
+
+    def _get_exclusive_fragments(self):
+        r'''Sweeps sorted offsets of well-formed timespans and gets maximal
+        fragments of each timespan that no other timespan covers.
+
+        Returns list of timespans in order of start offset.
+        '''
+        import abjad
+        index = abjad.TimespanIndex(self)
+        start_keys = index._start_keys
+        stop_keys = index._stop_keys
+        timespans = index._timespans
+        offsets = {}
+        for timespan, start_key, stop_key in zip(
+            timespans, start_keys, stop_keys):
+            offsets[start_key] = timespan.start_offset
+            offsets[stop_key] = timespan.stop_offset
+        keys = sorted(offsets)
+        stop_order = sorted(range(len(timespans)), key=stop_keys.__getitem__)
+        i, j = 0, 0
+        active = set()
+        fragments = []
+        for key, next_key in zip(keys, keys[1:]):
+            while j < len(stop_order) and stop_keys[stop_order[j]] == key:
+                active.discard(stop_order[j])
+                j += 1
+            while i < len(start_keys) and start_keys[i] == key:
+                active.add(i)
+                i += 1
+            if len(active) != 1:
+                continue
+            owner = next(iter(active))
+            if fragments and fragments[-1][0] == owner and \
+                fragments[-1][2] == key:
+                fragments[-1][2] = next_key
+            else:
+                fragments.append([owner, key, next_key])
+        result = []
+        for owner, start_key, stop_key in fragments:
+            timespan = timespans[owner]
+            if start_key == start_keys[owner] and stop_key == stop_keys[owner]:
+                result.append(timespan)
+                continue
+            timespan = abjad.new(
+                timespan,
+                start_offset=offsets[start_key],
+                stop_offset=offsets[stop_key],
+                )
+            result.append(timespan)
+        return result
+
+    def _get_format_specification(self):
+        from abjad.tools import systemtools
+        agent = systemtools.StorageFormatManager(self)
+        names = list(agent.signature_keyword_names)
+        if 'items' in names:
+            names.remove('items')
+        if 'keep_sorted' in names:
+            names.remove('keep_sorted')
+        if not self.indexed and 'indexed' in names:
+            names.remove('indexed')
+        return systemtools.FormatSpecification(
+            self,
+            repr_is_indented=False,
+            storage_format_args_values=[self._collection],
+            storage_format_kwargs_names=names,
+            )
+
+    @staticmethod
+    def _fuse(timespan, start_offset, stop_offset, is_fused):
+        import abjad
+        if not is_fused:
+            return timespan
+        return abjad.new(
+            timespan,
+            start_offset=start_offset,
+            stop_offset=stop_offset,
+            )
+
     def _get_offsets(self, argument):
         try:
             return argument.start_offset, argument.stop_offset
@@ -455,6 +600,14 @@ class TimespanList(TypedList):
         markup = abjad.Markup.column([fraction_markup, lines_markup])
         return markup
 
+    def _on_insertion(self, item):
+        if self._index is not None:
+            self._index.add(item)
+
+    def _on_removal(self, item):
+        if self._index is not None:
+            self._index.remove(item)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -708,6 +861,23 @@ class TimespanList(TypedList):
         else:
             return abjad.Duration(0)
 
+    @property
+    def indexed(self):
+        r'''Is true when timespan list keeps timespan index of its timespans.
+        Otherwise false.
+
+        ..  container:: example
+
+            >>> abjad.TimespanList([abjad.Timespan(0, 4)]).indexed
+            False
+
+            >>> abjad.TimespanList([abjad.Timespan(0, 4)], indexed=True).indexed
+            True
+
+        Returns true or false.
+        '''
+        return self._index is not None
+
     @property
     def is_sorted(self):
         r'''Is true when timespans are in time order.
@@ -1143,7 +1313,20 @@ class TimespanList(TypedList):
 
         Operates in place and returns timespan list.
         '''
-        if 1 < len(self):
+        import abjad
+        if 1 < len(self) and self._all_are_well_formed_timespans():
+            start_offset = max(_.start_offset for _ in self)
+            stop_offset = min(_.stop_offset for _ in self)
+            if start_offset < stop_offset:
+                result = abjad.new(
+                    self[0],
+                    start_offset=start_offset,
+                    stop_offset=stop_offset,
+                    )
+                self[:] = [result]
+            else:
+                self[:] = []
+        elif 1 < len(self):
             result = self[0]
             for timespan in self:
                 if not timespan.intersects_timespan(result):
@@ -1266,15 +1449,55 @@ class TimespanList(TypedList):
 
         Operates in place and returns timespan list.
         '''
+        import abjad
+        if not all(isinstance(_, abjad.Timespan) for _ in self):
+            timespans = []
+            if self:
+                timespans = [self[0]]
+                for timespan in self[1:]:
+                    if timespans[-1]._can_fuse(timespan):
+                        timespans_ = timespans[-1] | timespan
+                        timespans[-1:] = timespans_[:]
+                    else:
+                        timespans.append(timespan)
+            self[:] = timespans
+            return self
+        # fuses into last timespan, making each fused timespan only once
         timespans = []
-        if self:
-            timespans = [self[0]]
-            for timespan in self[1:]:
-                if timespans[-1]._can_fuse(timespan):
-                    timespans_ = timespans[-1] | timespan
-                    timespans[-1:] = timespans_[:]
-                else:
-                    timespans.append(timespan)
+        last_timespan, start_offset, stop_offset = None, None, None
+        is_fused = False
+        for timespan in self:
+            if last_timespan is not None:
+                if isinstance(timespan, type(last_timespan)) and (
+                    (
+                        timespan.start_offset <= start_offset and
+                        start_offset < timespan.stop_offset
+                    ) or (
+                        start_offset <= timespan.start_offset and
+                        timespan.start_offset < stop_offset
+                    ) or
+                    stop_offset == timespan.start_offset
+                    ):
+                    start_offset = min(start_offset, timespan.start_offset)
+                    stop_offset = max(stop_offset, timespan.stop_offset)
+                    is_fused = True
+                    continue
+                timespans.append(self._fuse(
+                    last_timespan,
+                    start_offset,
+                    stop_offset,
+                    is_fused,
+                    ))
+            last_timespan = timespan
+            start_offset, stop_offset = timespan.offsets
+            is_fused = False
+        if last_timespan is not None:
+            timespans.append(self._fuse(
+                last_timespan,
+                start_offset,
+                stop_offset,
+                is_fused,
+                ))
         self[:] = timespans
         return self
 
@@ -1450,6 +1673,9 @@ class TimespanList(TypedList):
 
         Operates in place and returns timespan list.
         '''
+        if self._all_are_well_formed_timespans():
+            self[:] = self._get_exclusive_fragments()
+            return self
         all_fragments = []
         for i, timespan_1 in enumerate(self):
             timespan_1_fragments = [timespan_1]
@@ -1594,10 +1820,16 @@ class TimespanList(TypedList):
         '''
         import abjad
         mapping = collections.OrderedDict()
+        index = self._index
+        if index is None:
+            index = abjad.TimespanIndex(self)
         offsets = abjad.sequence(sorted(self.count_offsets()))
         for start_offset, stop_offset in offsets.nwise():
             timespan = abjad.Timespan(start_offset, stop_offset)
-            overlap_factor = self.compute_overlap_factor(timespan=timespan)
+            timespans = index.get_timespans_that_intersect_timespan(timespan)
+            total_overlap = abjad.Duration(sum(
+                x.get_overlap_with_timespan(timespan) for x in timespans))
+            overlap_factor = total_overlap / timespan.duration
             mapping[timespan] = overlap_factor
         return mapping
 
@@ -1973,6 +2205,7 @@ class TimespanList(TypedList):
 
         Returns timespan lists.
         '''
+        import abjad
         assert isinstance(inventory_count, (type(None), int))
         if isinstance(inventory_count, int):
             assert 0 < inventory_count
@@ -1980,25 +2213,35 @@ class TimespanList(TypedList):
         global_overlap_factors = []
         empty_timespans_pairs = []
         result_timespan_lists = []
+        result_timespan_indices = []
         if inventory_count is not None:
             for i in range(inventory_count):
                 global_overlap_factors.append(0)
                 result_timespans = type(self)([])
                 empty_timespans_pairs.append((i, result_timespans))
                 result_timespan_lists.append(result_timespans)
+                result_timespan_indices.append(abjad.TimespanIndex())
         for current_timespan in self:
             current_overlap_factor = \
                 current_timespan.duration / bounding_timespan.duration
             if empty_timespans_pairs:
                 i, empty_timespans = empty_timespans_pairs.pop()
                 empty_timespans.append(current_timespan)
+                result_timespan_indices[i].add(current_timespan)
                 global_overlap_factors[i] = current_overlap_factor
                 continue
             nonoverlapping_timespan_lists = []
             overlapping_timespan_lists = []
-            for i, result_timespans in enumerate(result_timespan_lists):
-                local_overlap_factor = result_timespans.compute_overlap_factor(
+            for i, index in enumerate(result_timespan_indices):
+                timespans = index.get_timespans_that_intersect_timespan(
                     current_timespan)
+                total_overlap = abjad.Duration(sum(
+                    min(x.stop_offset, current_timespan.stop_offset) -
+                    max(x.start_offset, current_timespan.start_offset)
+                    for x in timespans
+                    ))
+                local_overlap_factor = \
+                    total_overlap / current_timespan.duration
                 global_overlap_factor = global_overlap_factors[i]
                 if not local_overlap_factor:
                     nonoverlapping_timespan_lists.append(
@@ -2012,6 +2255,8 @@ class TimespanList(TypedList):
                 result_timespans = type(self)([current_timespan])
                 global_overlap_factors.append(current_overlap_factor)
                 result_timespan_lists.append(result_timespans)
+                index = abjad.TimespanIndex([current_timespan])
+                result_timespan_indices.append(index)
                 continue
             if nonoverlapping_timespan_lists:
                 i = nonoverlapping_timespan_lists[0][0]
@@ -2019,6 +2264,7 @@ class TimespanList(TypedList):
                 i = overlapping_timespan_lists[0][0]
             result_timespans = result_timespan_lists[i]
             result_timespans.append(current_timespan)
+            result_timespan_indices[i].add(current_timespan)
             global_overlap_factors[i] += current_overlap_factor
         return tuple(result_timespan_lists)
 
@@ -2103,9 +2349,44 @@ class TimespanList(TypedList):
                     ]
                 )
 
+        ..  container:: example
+
+            Searches timespan index of indexed timespan list:
+
+            >>> timespans = abjad.TimespanList(
+            ...     [
+            ...         abjad.Timespan(6, 10),
+            ...         abjad.Timespan(3, 6),
+            ...         abjad.Timespan(0, 3),
+            ...         ],
+            ...     indexed=True,
+            ...     )
+            >>> result = timespans.get_timespans_that_satisfy_time_relation(
+            ...     time_relation)
+
+            >>> abjad.f(result)
+            abjad.TimespanList(
+                [
+                    abjad.Timespan(
+                        start_offset=abjad.Offset(3, 1),
+                        stop_offset=abjad.Offset(6, 1),
+                        ),
+                    abjad.Timespan(
+                        start_offset=abjad.Offset(6, 1),
+                        stop_offset=abjad.Offset(10, 1),
+                        ),
+                    ]
+                )
+
+            Returns timespans in order of start offset.
+
         Returns new timespan list.
         '''
         from abjad.tools import timespantools
+        if self._index is not None:
+            result = self._index.get_timespans_that_satisfy_time_relation(
+                time_relation)
+            return type(self)(result)
         result = []
         for timespan in self:
             if isinstance(
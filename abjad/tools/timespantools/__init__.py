@@ -3,6 +3,7 @@ from .AnnotatedTimespan import AnnotatedTimespan
 from .CompoundInequality import CompoundInequality
 from .TimeRelation import TimeRelation
 from .OffsetTimespanTimeRelation import OffsetTimespanTimeRelation
+from .TimespanIndex import TimespanIndex
 from .TimespanInequality import TimespanInequality
 from .TimespanList import TimespanList
 from .TimespanTimespanTimeRelation import TimespanTimespanTimeRelation
@@ -0,0 +1,160 @@
+import abjad
+
+
+def test_timespantools_TimespanIndex_01():
+    r'''Indexed timespan list finds same timespans as unindexed timespan list
+    for every timespan-timespan time relation.
+    '''
+
+    timespans = [
+        abjad.Timespan(0, 4),
+        abjad.Timespan(2, 6),
+        abjad.Timespan(3, 3),
+        abjad.Timespan(5, 10),
+        abjad.Timespan(6, 8),
+        abjad.Timespan(-2, 1),
+        abjad.Timespan(6, 8),
+        ]
+    timespan_list = abjad.TimespanList(timespans)
+    indexed_timespan_list = abjad.TimespanList(timespans, indexed=True)
+    functions = [
+        getattr(abjad.timespantools, _)
+        for _ in dir(abjad.timespantools)
+        if _.startswith('timespan_2_')
+        ]
+    for timespan_1 in (
+        abjad.Timespan(3, 6),
+        abjad.Timespan(4, 4),
+        abjad.Timespan(-4, 12),
+        ):
+        for function in functions:
+            time_relation = function(timespan_1=timespan_1)
+            result = timespan_list.get_timespans_that_satisfy_time_relation(
+                time_relation)
+            result = sorted(result, key=lambda _: _.start_offset)
+            indexed_result = \
+                indexed_timespan_list.get_timespans_that_satisfy_time_relation(
+                    time_relation)
+            assert [id(_) for _ in result] == [id(_) for _ in indexed_result]
+
+
+def test_timespantools_TimespanIndex_02():
+    r'''Index sorts timespans by start offset.
+    '''
+
+    index = abjad.TimespanIndex([
+        abjad.Timespan(0, 4),
+        abjad.Timespan(2, 6),
+        abjad.Timespan(3, 3),
+        abjad.Timespan(5, 10),
+        abjad.Timespan(6, 8),
+        abjad.Timespan(-2, 1),
+        ])
+    assert list(index) == [
+        abjad.Timespan(-2, 1),
+        abjad.Timespan(0, 4),
+        abjad.Timespan(2, 6),
+        abjad.Timespan(3, 3),
+        abjad.Timespan(5, 10),
+        abjad.Timespan(6, 8),
+        ]
+
+
+def test_timespantools_TimespanIndex_03():
+    r'''Gets timespans that contain, intersect or start during timespan.
+    '''
+
+    index = abjad.TimespanIndex([
+        abjad.Timespan(0, 4),
+        abjad.Timespan(2, 6),
+        abjad.Timespan(3, 3),
+        abjad.Timespan(5, 10),
+        abjad.Timespan(6, 8),
+        abjad.Timespan(-2, 1),
+        ])
+    timespan = abjad.Timespan(3, 6)
+    assert index.get_timespans_that_contain_timespan(timespan) == [
+        abjad.Timespan(2, 6),
+        ]
+    assert index.get_timespans_that_intersect_timespan(timespan) == [
+        abjad.Timespan(0, 4),
+        abjad.Timespan(2, 6),
+        abjad.Timespan(3, 3),
+        abjad.Timespan(5, 10),
+        ]
+    assert index.get_timespans_that_start_during_timespan(timespan) == [
+        abjad.Timespan(3, 3),
+        abjad.Timespan(5, 10),
+        ]
+
+    timespan = abjad.Timespan(4, 4)
+    assert index.get_timespans_that_intersect_timespan(timespan) == [
+        abjad.Timespan(2, 6),
+        ]
+    assert index.get_timespans_that_start_during_timespan(timespan) == []
+
+
+def test_timespantools_TimespanIndex_04():
+    r'''Indexed timespan list keeps index of its timespans on append, insert,
+    pop, remove, item assignment and item deletion.
+    '''
+
+    timespan_list = abjad.TimespanList(indexed=True)
+    timespan = abjad.Timespan(3, 7)
+
+    def get_intersecting_timespans():
+        assert sorted(id(_) for _ in timespan_list._index) == \
+            sorted(id(_) for _ in timespan_list)
+        time_relation = abjad.timespantools.timespan_2_intersects_timespan_1(
+            timespan_1=timespan,
+            )
+        result = timespan_list.get_timespans_that_satisfy_time_relation(
+            time_relation)
+        return list(result)
+
+    timespan_list.append(abjad.Timespan(6, 9))
+    timespan_list.append(abjad.Timespan(0, 2))
+    assert get_intersecting_timespans() == [abjad.Timespan(6, 9)]
+
+    timespan_list.insert(1, abjad.Timespan(2, 4))
+    assert get_intersecting_timespans() == [
+        abjad.Timespan(2, 4),
+        abjad.Timespan(6, 9),
+        ]
+
+    timespan_list.pop(0)
+    assert get_intersecting_timespans() == [abjad.Timespan(2, 4)]
+
+    timespan_list[1:2] = [abjad.Timespan(7, 8), abjad.Timespan(5, 5)]
+    assert get_intersecting_timespans() == [
+        abjad.Timespan(2, 4),
+        abjad.Timespan(5, 5),
+        ]
+
+    timespan_list.remove(abjad.Timespan(2, 4))
+    assert get_intersecting_timespans() == [abjad.Timespan(5, 5)]
+
+    del(timespan_list[1:])
+    assert get_intersecting_timespans() == []
+    assert list(timespan_list) == [abjad.Timespan(7, 8)]
+
+
+def test_timespantools_TimespanIndex_05():
+    r'''Index keeps timespans with equal start offsets in order of addition
+    and removes identical timespan before equal timespan.
+    '''
+
+    timespan_1 = abjad.Timespan(0, 4)
+    timespan_2 = abjad.Timespan(0, 4)
+    timespan_3 = abjad.Timespan(0, 2)
+    index = abjad.TimespanIndex([timespan_1, timespan_2])
+    index.add(timespan_3)
+    assert [id(_) for _ in index] == [
+        id(timespan_1),
+        id(timespan_2),
+        id(timespan_3),
+        ]
+    index.remove(timespan_2)
+    assert [id(_) for _ in index] == [id(timespan_1), id(timespan_3)]
+    assert timespan_2 in index
+    assert abjad.Timespan(0, 1) not in index
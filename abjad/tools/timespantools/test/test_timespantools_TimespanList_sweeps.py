@@ -0,0 +1,250 @@
+import abjad
+
+
+def test_timespantools_TimespanList_sweeps_01():
+    r'''Logical AND keeps the first timespan, cropped to the overlap of all
+    timespans.
+    '''
+
+    timespans = abjad.TimespanList([
+        abjad.AnnotatedTimespan(0, 8, annotation='foo'),
+        abjad.Timespan(2, 10),
+        abjad.Timespan(4, 6),
+        ])
+    timespans.compute_logical_and()
+
+    assert format(timespans) == abjad.String.normalize(
+        r'''
+        abjad.TimespanList(
+            [
+                abjad.AnnotatedTimespan(
+                    start_offset=abjad.Offset(4, 1),
+                    stop_offset=abjad.Offset(6, 1),
+                    annotation='foo',
+                    ),
+                ]
+            )
+        ''')
+
+
+def test_timespantools_TimespanList_sweeps_02():
+    r'''Logical AND of disjoint timespans is empty.
+    '''
+
+    timespans = abjad.TimespanList([
+        abjad.Timespan(0, 4),
+        abjad.AnnotatedTimespan(2, 6, annotation='foo'),
+        abjad.Timespan(8, 10),
+        ])
+    timespans.compute_logical_and()
+
+    assert timespans == abjad.TimespanList([])
+
+
+def test_timespantools_TimespanList_sweeps_03():
+    r'''Logical AND with degenerate timespans.
+    '''
+
+    timespans = abjad.TimespanList([
+        abjad.Timespan(0, 4),
+        abjad.Timespan(2, 2),
+        abjad.Timespan(4, 8),
+        ])
+    timespans.compute_logical_and()
+    assert timespans == abjad.TimespanList([])
+
+    timespans = abjad.TimespanList([abjad.Timespan(0, 0)])
+    timespans.compute_logical_and()
+    assert list(timespans) == [abjad.Timespan(0, 0)]
+
+
+def test_timespantools_TimespanList_sweeps_04():
+    r'''Logical OR fuses overlapping timespans into the first of each fused
+    group.
+
+    Annotated timespans fuse only with annotated timespans.
+    '''
+
+    timespans = abjad.TimespanList([
+        abjad.Timespan(0, 4),
+        abjad.AnnotatedTimespan(2, 6, annotation='foo'),
+        abjad.AnnotatedTimespan(8, 10, annotation='bar'),
+        abjad.AnnotatedTimespan(9, 12, annotation='baz'),
+        abjad.Timespan(11, 14),
+        ])
+    timespans.compute_logical_or()
+
+    assert format(timespans) == abjad.String.normalize(
+        r'''
+        abjad.TimespanList(
+            [
+                abjad.Timespan(
+                    start_offset=abjad.Offset(0, 1),
+                    stop_offset=abjad.Offset(6, 1),
+                    ),
+                abjad.AnnotatedTimespan(
+                    start_offset=abjad.Offset(8, 1),
+                    stop_offset=abjad.Offset(12, 1),
+                    annotation='bar',
+                    ),
+                abjad.Timespan(
+                    start_offset=abjad.Offset(11, 1),
+                    stop_offset=abjad.Offset(14, 1),
+                    ),
+                ]
+            )
+        ''')
+
+
+def test_timespantools_TimespanList_sweeps_05():
+    r'''Logical OR with degenerate timespans.
+    '''
+
+    timespans = abjad.TimespanList([
+        abjad.Timespan(0, 4),
+        abjad.Timespan(2, 2),
+        abjad.Timespan(4, 8),
+        ])
+    timespans.compute_logical_or()
+    assert list(timespans) == [abjad.Timespan(0, 8)]
+
+    timespans = abjad.TimespanList([abjad.Timespan(0, 0)])
+    timespans.compute_logical_or()
+    assert list(timespans) == [abjad.Timespan(0, 0)]
+
+
+def test_timespantools_TimespanList_sweeps_06():
+    r'''Logical XOR keeps timespans that no other timespan intersects.
+    '''
+
+    timespan_1 = abjad.Timespan(0, 4)
+    timespan_2 = abjad.Timespan(2, 6)
+    timespan_3 = abjad.Timespan(8, 10)
+    timespans = abjad.TimespanList([timespan_3, timespan_2, timespan_1])
+    timespans.compute_logical_xor()
+    assert list(timespans) == [
+        abjad.Timespan(0, 2),
+        abjad.Timespan(4, 6),
+        abjad.Timespan(8, 10),
+        ]
+    assert timespans[-1] is timespan_3
+
+
+def test_timespantools_TimespanList_sweeps_07():
+    r'''Logical XOR keeps annotations of uncovered segments.
+    '''
+
+    timespans = abjad.TimespanList([
+        abjad.AnnotatedTimespan(0, 8, annotation='foo'),
+        abjad.Timespan(2, 10),
+        abjad.Timespan(4, 6),
+        ])
+    timespans.compute_logical_xor()
+
+    assert format(timespans) == abjad.String.normalize(
+        r'''
+        abjad.TimespanList(
+            [
+                abjad.AnnotatedTimespan(
+                    start_offset=abjad.Offset(0, 1),
+                    stop_offset=abjad.Offset(2, 1),
+                    annotation='foo',
+                    ),
+                abjad.Timespan(
+                    start_offset=abjad.Offset(8, 1),
+                    stop_offset=abjad.Offset(10, 1),
+                    ),
+                ]
+            )
+        ''')
+
+
+def test_timespantools_TimespanList_sweeps_08():
+    r'''Logical XOR with degenerate timespans.
+    '''
+
+    timespans = abjad.TimespanList([
+        abjad.Timespan(0, 4),
+        abjad.Timespan(2, 2),
+        abjad.Timespan(4, 8),
+        ])
+    timespans.compute_logical_xor()
+    assert list(timespans) == [
+        abjad.Timespan(0, 2),
+        abjad.Timespan(2, 4),
+        abjad.Timespan(4, 8),
+        ]
+
+    timespans = abjad.TimespanList([abjad.Timespan(0, 0)])
+    timespans.compute_logical_xor()
+    assert list(timespans) == [abjad.Timespan(0, 0)]
+
+
+def test_timespantools_TimespanList_sweeps_09():
+    r'''Counts offsets of timespans and of other objects.
+    '''
+
+    timespans = abjad.TimespanList([
+        abjad.Timespan(0, 4),
+        abjad.AnnotatedTimespan(2, 6, annotation='foo'),
+        abjad.Timespan(4, 8),
+        abjad.Timespan(2, 2),
+        ])
+    counter = timespans.count_offsets()
+    assert sorted(counter.items()) == [
+        (abjad.Offset(0), 1),
+        (abjad.Offset(2), 3),
+        (abjad.Offset(4), 2),
+        (abjad.Offset(6), 1),
+        (abjad.Offset(8), 1),
+        ]
+
+    counter = abjad.OffsetCounter(
+        [abjad.Timespan(0, 4), 1, (1, 2), abjad.Timespan(1, 2)])
+    assert sorted(counter.items()) == [
+        (abjad.Offset(0), 1),
+        (abjad.Offset(1, 2), 1),
+        (abjad.Offset(1), 2),
+        (abjad.Offset(2), 1),
+        (abjad.Offset(4), 1),
+        ]
+
+
+def test_timespantools_TimespanList_sweeps_10():
+    r'''Explodes timespans into nonoverlapping timespan lists.
+    '''
+
+    timespans = abjad.TimespanList([
+        abjad.Timespan(0, 4),
+        abjad.Timespan(2, 6),
+        abjad.Timespan(4, 8),
+        abjad.Timespan(6, 10),
+        abjad.Timespan(0, 10),
+        ])
+
+    result = timespans.explode()
+    assert [list(_) for _ in result] == [
+        [abjad.Timespan(0, 4), abjad.Timespan(4, 8)],
+        [abjad.Timespan(2, 6), abjad.Timespan(6, 10)],
+        [abjad.Timespan(0, 10)],
+        ]
+    assert result[0][0] is timespans[0]
+
+
+def test_timespantools_TimespanList_sweeps_11():
+    r'''Explodes timespans into a fixed number of timespan lists.
+    '''
+
+    timespans = abjad.TimespanList([
+        abjad.Timespan(0, 4),
+        abjad.Timespan(2, 6),
+        abjad.Timespan(4, 8),
+        abjad.Timespan(6, 10),
+        abjad.Timespan(0, 10),
+        ])
+
+    result = timespans.explode(inventory_count=2)
+    assert [list(_) for _ in result] == [
+        [abjad.Timespan(2, 6), abjad.Timespan(6, 10), abjad.Timespan(0, 10)],
+        [abjad.Timespan(0, 4), abjad.Timespan(4, 8)],
+        ]
@@ -1,8 +1,4 @@
-from typing import Dict  # noqa
-from abjad.tools.lilypondparsertools.LilyPondParser import LilyPondParser  # noqa
-
-
-_lilypond_parsers_by_language = {}  # type: Dict[str, LilyPondParser]
+from abjad.tools.lilypondparsertools.LilyPondParser import LilyPondParser
 
 
 def parse(string, language='english'):
@@ -33,7 +29,7 @@ def parse(string, language='english'):
         return lilypondparsertools.parse_reduced_ly_syntax(string[4:])
     elif string.startswith('rtm:'):
         return rhythmtreetools.parse_rtm_syntax(string[4:])
-    if language not in _lilypond_parsers_by_language:
-        parser = lilypondparsertools.LilyPondParser(default_language=language)
-        _lilypond_parsers_by_language[language] = parser
-    return _lilypond_parsers_by_language[language](string)
+    return LilyPondParser._call_pooled(
+        string,
+        default_language=language,
+        )